@@ -0,0 +1,34 @@
+"""Turn checkpointing
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Session-level checkpoint state (turn layout, combat state, characters)
+    op.add_column(
+        'sessions',
+        sa.Column('checkpoint_state', postgresql.JSONB(astext_type=sa.Text()), nullable=True)
+    )
+
+    # One row per turn per session - checkpoints upsert on this key
+    op.create_unique_constraint('uix_session_turn', 'turn_contexts', ['session_id', 'turn_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uix_session_turn', 'turn_contexts', type_='unique')
+    op.drop_column('sessions', 'checkpoint_state')
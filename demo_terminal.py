@@ -6,8 +6,6 @@ Uses simplified demo methods that bypass GD agent and state management for demo
 """
 
 import asyncio
-import shutil
-import tempfile
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from pathlib import Path
@@ -36,10 +34,9 @@ class DemoTerminal:
     Provides simple command-line interaction with the DM using demo methods.
     """
 
-    def __init__(self, session_manager: 'SessionManager', temp_character_dir: Optional[str] = None, logger=None):
+    def __init__(self, session_manager: 'SessionManager', logger=None):
         self.session_manager = session_manager
         self.session_active = True
-        self.temp_character_dir = temp_character_dir  # For cleanup on exit
         self.logger = logger  # For logging session close on exit
 
         # Usage tracking
@@ -149,7 +146,7 @@ class DemoTerminal:
                 import traceback
                 traceback.print_exc()
 
-        # Cleanup temp character directory
+        # Close the logger
         self.cleanup()
 
         print("\n[SYSTEM] Demo session ended. Farewell!")
@@ -1013,7 +1010,7 @@ class DemoTerminal:
         print("[SYSTEM] Use /character to view character status")
 
     def cleanup(self):
-        """Clean up temporary character directory and close logger on exit."""
+        """Close the logger on exit."""
         # Close logger session first
         if self.logger:
             try:
@@ -1022,16 +1019,8 @@ class DemoTerminal:
             except Exception as e:
                 print(f"[SYSTEM] Warning: Could not close logger: {e}")
 
-        # Clean up temp directory
-        if self.temp_character_dir and Path(self.temp_character_dir).exists():
-            try:
-                shutil.rmtree(self.temp_character_dir)
-                print(f"[SYSTEM] Cleaned up temporary character data")
-            except Exception as e:
-                print(f"[SYSTEM] Warning: Could not clean up temp directory: {e}")
-
 
-def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging=True) -> tuple['SessionManager', str, any]:
+def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging=True) -> tuple['SessionManager', any]:
     """
     Create a session manager configured for demo purposes.
 
@@ -1041,7 +1030,8 @@ def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging
         enable_logging: Whether to enable file logging (default True)
 
     Returns:
-        Tuple of (SessionManager, temp character directory path, GameLogger or None)
+        Tuple of (SessionManager, GameLogger or None).
+        Characters live in a copy-on-write overlay, so no directory is created.
     """
     # Local imports to avoid heavy SDK/module import at module load time
     print("Starting imports for demo session manager...")
@@ -1057,21 +1047,9 @@ def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging
     if not api_key:
         raise ValueError("API key is required for demo session manager")
 
-    # Create temporary directory for character state (prevents modifying source files)
-    # Must be created FIRST so state_manager can use the path
-    temp_dir = tempfile.mkdtemp(prefix="dnd_demo_")
-    print(f"[SYSTEM] Created temporary character directory: {temp_dir}")
-
-    # Copy character JSON files from source to temp directory
-    source_char_dir = Path("src/characters")
-    temp_char_dir = Path(temp_dir)
-    character_files = ["fighter.json", "wizard.json", "cleric.json"]
-
-    for char_file in character_files:
-        source_file = source_char_dir / char_file
-        if source_file.exists():
-            shutil.copy2(source_file, temp_char_dir / char_file)
-            print(f"[SYSTEM] Copied {char_file} to temp directory")
+    # Per-session copy-on-write view of the shared pregen sheets (source files are never modified)
+    from src.characters.character_overlay import CharacterOverlay
+    character_overlay = CharacterOverlay()
 
     # Create logger if enabled
     logger = None
@@ -1105,8 +1083,9 @@ def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging
     lance_service = create_lance_rules_service()
     rules_cache_service = create_rules_cache_service()
 
-    # Create state manager with temp directory (needed for monster spawner)
-    state_manager = create_state_manager(character_data_path=str(temp_char_dir) + "/")
+    # Create state manager over the overlay (needed for monster spawner).
+    # Session state lives in memory; file logs would land in the shared sheet directory.
+    state_manager = create_state_manager(overlay=character_overlay, enable_logging=False)
 
     # Create monster spawner for DM to select monsters from templates
     monster_spawner = create_monster_spawner(state_manager=state_manager)
@@ -1132,13 +1111,8 @@ def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging
     # Store dm_deps for passing to process_message()
     dm_agent.dm_deps = dm_deps
 
-    # Create player character registry in a subdirectory (not in character_data_path)
-    # This prevents StateManager from trying to load registry as a character file
-    registry_dir = temp_char_dir / "registry"
-    registry_dir.mkdir(exist_ok=True)
-    registry_path = str(registry_dir / "player_character_registry.json")
-    player_registry = create_player_character_registry(registry_file_path=registry_path)
-    print(f"[SYSTEM] Created per-session player registry: {registry_path}")
+    # Per-session player registry, kept in memory (session snapshots persist the mappings)
+    player_registry = create_player_character_registry(registry_file_path=None)
 
     # Create state extraction orchestrator
     from src.agents.state_extraction_orchestrator import create_state_extraction_orchestrator
@@ -1164,7 +1138,7 @@ def create_demo_session_manager(dm_model_name=None, api_key=None, enable_logging
         logger=logger  # For tracing and debugging
     )
 
-    return session_manager, temp_dir, logger
+    return session_manager, logger
 
 
 async def main():
@@ -1184,16 +1158,16 @@ async def main():
 
     print("\n[SYSTEM] Creating demo session...")
 
-    # Create session manager with temp directory, API key, and logger
-    session_manager, temp_dir, logger = create_demo_session_manager(
+    # Create session manager with API key and logger
+    session_manager, logger = create_demo_session_manager(
         dm_model_name='gemini-2.5-flash',
         api_key=api_key,
         enable_logging=True
     )
     print("[SYSTEM] Demo session manager created.")
 
-    # Create and run terminal with temp directory and logger for cleanup
-    terminal = DemoTerminal(session_manager, temp_character_dir=temp_dir, logger=logger)
+    # Create and run terminal with the logger for cleanup
+    terminal = DemoTerminal(session_manager, logger=logger)
     print("[SYSTEM] Starting demo terminal...")
     await terminal.run()
 
@@ -4,12 +4,45 @@ Render all D&D rule files from src/db/rules/ to markdown and metadata.
 This script processes all the filtered rule JSON files and generates:
 1. Clean markdown files for vector embeddings (src/db/rendered_rules/)
 2. Structured metadata JSON files for knowledge graph construction (src/db/metadata/)
+
+Rendering runs in parallel: large input files are split into shards of
+--shard-size entries and a pool of --jobs renderer processes (one
+`node render-to-markdown.js` per shard, so one per core at a time) works
+through all shards. Inputs whose JSON (and renderer script) hash matches the
+last successful render, recorded in src/db/rendered_rules/.render_manifest.json,
+are skipped unless --force is given. --json prints progress as JSON lines.
+
+Usage:
+    uv run python render_rules.py [--jobs 8] [--shard-size 200] [--force] [--json]
 """
 
-import subprocess
+import argparse
+import hashlib
+import json
+import os
 import re
 import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+RULE_FILES = [
+    'filtered_actions.json',
+    'filtered_conditions.json',
+    'filtered_feats.json',
+    'filtered_items.json',
+    'filtered_objects.json',
+    'filtered_optionalfeatures.json',
+    'filtered_senses.json',
+    'filtered_variant_rules.json',
+    'spells_ALL_COMBINED.json'
+]
+
+DEFAULT_SHARD_SIZE = 200  # Entries per renderer process
+MANIFEST_NAME = '.render_manifest.json'
 
 
 def parse_renderer_output(output):
@@ -28,133 +61,291 @@ def parse_renderer_output(output):
     return {'found': 0, 'success': 0, 'errors': 0}
 
 
-def render_file(input_file, output_dir, renderer_script):
+def render_file(input_file, output_dir, renderer_command: Sequence[str]):
     """Render a single file using the Node.js renderer."""
     result = subprocess.run(
-        ['node', str(renderer_script), '--input', str(input_file), '--output-dir', str(output_dir)],
+        [*renderer_command, '--input', str(input_file), '--output-dir', str(output_dir)],
         capture_output=True,
         text=True,
         check=True
     )
-    return parse_renderer_output(result.stdout)
+    stats = parse_renderer_output(result.stdout)
+    # Count what was written rather than trusting the log format alone
+    written = sum(1 for path in Path(output_dir).rglob('*.md'))
+    if written and not stats['success']:
+        stats['success'] = stats['found'] = written
+    return stats
 
 
-def main():
-    # Setup paths
-    rules_dir = Path('src/db/rules')
-    rendered_rules_dir = Path('src/db/rendered_rules')
-    metadata_dir = Path('src/db/metadata')
-    renderer_script = Path('external/5etools-renderer/render-to-markdown.js')
+def input_hash(input_file: Path, renderer_script: Optional[Path] = None) -> str:
+    """Hash of an input file and the renderer (a new renderer re-renders everything)."""
+    digest = hashlib.sha256(input_file.read_bytes())
+    if renderer_script is not None and renderer_script.exists():
+        digest.update(renderer_script.read_bytes())
+    return digest.hexdigest()
 
-    # Use temporary directory for rendering, then move metadata
-    temp_output_dir = Path('output/temp_render')
-
-    rule_files = [
-        'filtered_actions.json',
-        'filtered_conditions.json',
-        'filtered_feats.json',
-        'filtered_items.json',
-        'filtered_objects.json',
-        'filtered_optionalfeatures.json',
-        'filtered_senses.json',
-        'filtered_variant_rules.json',
-        'spells_ALL_COMBINED.json'
-    ]
 
-    print("=" * 70)
-    print("D&D RULES RENDERING PIPELINE")
-    print("=" * 70)
-    print(f"\nInput directory: {rules_dir}")
-    print(f"Markdown output: {rendered_rules_dir}")
-    print(f"Metadata output: {metadata_dir}")
-    print(f"Files to process: {len(rule_files)}")
-    print()
-
-    # Track statistics
-    total_success = 0
-    total_errors = 0
-    results = []
-
-    # Process each file
-    for i, filename in enumerate(rule_files, 1):
-        input_file = rules_dir / filename
+def load_manifest(manifest_path: Path) -> Dict[str, str]:
+    """Input file name -> hash of its last successful render."""
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return {}
 
-        if not input_file.exists():
-            print(f"[{i}/{len(rule_files)}] ⚠️  SKIPPED: {filename} (file not found)")
-            results.append({
-                'file': filename,
-                'status': 'skipped',
-                'reason': 'not found'
-            })
-            continue
 
-        print(f"[{i}/{len(rule_files)}] Processing: {filename}")
+def shard_input(input_file: Path, shard_dir: Path, shard_size: int) -> List[Path]:
+    """
+    Split an input into shards of shard_size entries.
 
-        try:
-            # Render the file to temporary directory
-            stats = render_file(input_file, temp_output_dir, renderer_script)
+    5etools files hold their entries in one top-level list ({"spell": [...]});
+    each shard keeps that shape and the original file name. Anything else is
+    rendered as a single shard.
+    """
+    data = json.loads(input_file.read_text())
+    lists = [key for key, value in data.items() if isinstance(value, list)] if isinstance(data, dict) else []
+    if len(lists) != 1 or len(data[lists[0]]) <= shard_size:
+        return [input_file]
 
-            success = stats['success']
-            errors = stats['errors']
+    key = lists[0]
+    entries = data[key]
+    shards = []
+    for number, start in enumerate(range(0, len(entries), shard_size)):
+        shard = shard_dir / f"{number:03d}" / input_file.name
+        shard.parent.mkdir(parents=True, exist_ok=True)
+        shard.write_text(json.dumps({**data, key: entries[start:start + shard_size]}))
+        shards.append(shard)
+    return shards
 
-            total_success += success
-            total_errors += errors
 
-            status = "✅" if errors == 0 else "⚠️"
-            print(f"    {status} Rendered {success} entries successfully")
-            if errors > 0:
-                print(f"    ⚠️  {errors} errors")
+@dataclass
+class ShardJob:
+    """One renderer invocation."""
+    file: str
+    shard: int
+    input_file: Path
+    output_dir: Path
 
-            results.append({
-                'file': filename,
-                'status': 'success',
-                'entries': success,
-                'errors': errors
-            })
 
-        except Exception as e:
-            print(f"    ❌ ERROR: {e}")
-            results.append({
-                'file': filename,
-                'status': 'error',
-                'reason': str(e)
-            })
+class Progress:
+    """Human-readable or JSON-lines progress output."""
 
-    # Move rendered files to final locations
-    print("\n" + "=" * 70)
-    print("ORGANIZING OUTPUT")
-    print("=" * 70)
+    def __init__(self, as_json: bool):
+        self.as_json = as_json
+
+    def emit(self, event: str, message: str, **data) -> None:
+        if self.as_json:
+            print(json.dumps({"event": event, **data}), flush=True)
+        elif message:
+            print(message, flush=True)
+
+
+def render_all(
+    rules_dir: Path,
+    rendered_rules_dir: Path,
+    metadata_dir: Path,
+    renderer_command: Sequence[str],
+    renderer_script: Optional[Path] = None,
+    rule_files: Sequence[str] = RULE_FILES,
+    jobs: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    force: bool = False,
+    temp_output_dir: Path = Path('output/temp_render'),
+    progress: Optional[Progress] = None
+) -> List[Dict]:
+    """
+    Render rule files in parallel, skipping unchanged inputs.
+
+    Args:
+        rules_dir: Directory with the input JSON files
+        rendered_rules_dir: Markdown output (one directory per entry type)
+        metadata_dir: Metadata output (one directory per entry type)
+        renderer_command: Renderer invocation without --input/--output-dir
+        renderer_script: Renderer source, part of the input hash
+        rule_files: Input file names
+        jobs: Renderer processes at once (default: CPU count)
+        shard_size: Entries per renderer process
+        force: Re-render unchanged inputs
+        temp_output_dir: Scratch directory for shards and shard output
+        progress: Progress output (default: human-readable)
 
-    # Move content directories to rendered_rules
-    for type_dir in temp_output_dir.iterdir():
-        if type_dir.is_dir() and type_dir.name != 'metadata':
-            target_dir = rendered_rules_dir / type_dir.name
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            shutil.move(str(type_dir), str(target_dir))
-            print(f"  ✓ Moved {type_dir.name} to rendered_rules/")
-
-    # Move metadata directory
-    temp_metadata = temp_output_dir / 'metadata'
-    if temp_metadata.exists():
-        for type_dir in temp_metadata.iterdir():
-            if type_dir.is_dir():
-                target_dir = metadata_dir / type_dir.name
-                if target_dir.exists():
-                    shutil.rmtree(target_dir)
-                shutil.move(str(type_dir), str(target_dir))
-                print(f"  ✓ Moved {type_dir.name} metadata to metadata/")
+    Returns:
+        One result per input file: status "success", "unchanged", "skipped" or "error"
+    """
+    progress = progress or Progress(as_json=False)
+    jobs = jobs or os.cpu_count() or 1
+    manifest_path = rendered_rules_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+
+    if temp_output_dir.exists():
+        shutil.rmtree(temp_output_dir)
+
+    # Plan: hash every input, shard the changed ones
+    results: Dict[str, Dict] = {}
+    hashes: Dict[str, str] = {}
+    shard_jobs: List[ShardJob] = []
+    for filename in rule_files:
+        input_file = rules_dir / filename
+        if not input_file.exists():
+            results[filename] = {'file': filename, 'status': 'skipped', 'reason': 'not found'}
+            progress.emit("file_skipped", f"  ⚠️  SKIPPED: {filename} (file not found)", file=filename)
+            continue
+
+        hashes[filename] = input_hash(input_file, renderer_script)
+        if not force and manifest.get(filename) == hashes[filename]:
+            results[filename] = {'file': filename, 'status': 'unchanged'}
+            progress.emit("file_unchanged", f"  ⏭️  UNCHANGED: {filename}", file=filename)
+            continue
+
+        stem = input_file.stem
+        shards = shard_input(input_file, temp_output_dir / 'shards' / stem, shard_size)
+        results[filename] = {'file': filename, 'status': 'success', 'entries': 0, 'errors': 0,
+                             'shards': len(shards), 'seconds': 0.0}
+        shard_jobs.extend(
+            ShardJob(filename, number, shard, temp_output_dir / 'out' / stem / f"{number:03d}")
+            for number, shard in enumerate(shards)
+        )
+
+    progress.emit(
+        "start",
+        f"Rendering {len(shard_jobs)} shards from "
+        f"{sum(result['status'] == 'success' for result in results.values())} files with {jobs} renderer processes",
+        shards=len(shard_jobs), jobs=jobs
+    )
+
+    # Render every shard in a pool of renderer processes
+    def run(job: ShardJob) -> Dict:
+        start = time.perf_counter()
+        stats = render_file(job.input_file, job.output_dir, renderer_command)
+        return {**stats, 'seconds': time.perf_counter() - start}
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run, job): job for job in shard_jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            result = results[job.file]
+            done += 1
+            try:
+                stats = future.result()
+            except Exception as e:
+                reason = e.stderr.strip() if isinstance(e, subprocess.CalledProcessError) and e.stderr else str(e)
+                result.update(status='error', reason=reason)
+                progress.emit("shard_error", f"  ❌ [{done}/{len(shard_jobs)}] {job.file} shard {job.shard}: {reason}",
+                              file=job.file, shard=job.shard, reason=reason, done=done, total=len(shard_jobs))
+                continue
+            result['entries'] += stats['success']
+            result['errors'] += stats['errors']
+            result['seconds'] += stats['seconds']
+            progress.emit(
+                "shard_done",
+                f"  ✓ [{done}/{len(shard_jobs)}] {job.file} shard {job.shard}: "
+                f"{stats['success']} entries, {stats['errors']} errors ({stats['seconds']:.1f}s)",
+                file=job.file, shard=job.shard, entries=stats['success'], errors=stats['errors'],
+                seconds=round(stats['seconds'], 3), done=done, total=len(shard_jobs)
+            )
+
+    # Move rendered files to final locations (only for fully rendered inputs)
+    for job_file in dict.fromkeys(job.file for job in shard_jobs):
+        result = results[job_file]
+        if result['status'] != 'success':
+            continue
+        shard_dirs = [job.output_dir for job in shard_jobs if job.file == job_file]
+        for type_name in _merge_shards(shard_dirs, rendered_rules_dir, metadata_dir):
+            progress.emit("moved", f"  ✓ Moved {type_name} to rendered_rules/ and metadata/",
+                          file=job_file, type=type_name)
+        if result['errors'] == 0:
+            manifest[job_file] = hashes[job_file]
+        else:
+            manifest.pop(job_file, None)  # Retry the failed entries next time
+
+    rendered_rules_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
 
     # Clean up temp directory
     if temp_output_dir.exists():
         shutil.rmtree(temp_output_dir)
 
+    return [results[filename] for filename in rule_files]
+
+
+def _merge_shards(shard_dirs: List[Path], rendered_rules_dir: Path, metadata_dir: Path) -> List[str]:
+    """Replace each entry type's output with the files of all shards. Returns the type names."""
+    replaced = []
+    for shard_dir in shard_dirs:
+        if not shard_dir.exists():
+            continue
+        for source_root, target_root in ((shard_dir, rendered_rules_dir), (shard_dir / 'metadata', metadata_dir)):
+            if not source_root.exists():
+                continue
+            for type_dir in source_root.iterdir():
+                if not type_dir.is_dir() or (source_root == shard_dir and type_dir.name == 'metadata'):
+                    continue
+                target_dir = target_root / type_dir.name
+                key = f"{target_root}/{type_dir.name}"
+                if key not in replaced:
+                    if target_dir.exists():
+                        shutil.rmtree(target_dir)
+                    replaced.append(key)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                for path in type_dir.iterdir():
+                    shutil.move(str(path), str(target_dir / path.name))
+    return list(dict.fromkeys(Path(key).name for key in replaced))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=None, help="Renderer processes at once (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="Entries per renderer process")
+    parser.add_argument("--force", action="store_true", help="Re-render inputs that have not changed")
+    parser.add_argument("--json", action="store_true", help="Print progress as JSON lines")
+    args = parser.parse_args()
+
+    # Setup paths
+    rules_dir = Path('src/db/rules')
+    rendered_rules_dir = Path('src/db/rendered_rules')
+    metadata_dir = Path('src/db/metadata')
+    renderer_script = Path('external/5etools-renderer/render-to-markdown.js')
+    progress = Progress(as_json=args.json)
+
+    if not args.json:
+        print("=" * 70)
+        print("D&D RULES RENDERING PIPELINE")
+        print("=" * 70)
+        print(f"\nInput directory: {rules_dir}")
+        print(f"Markdown output: {rendered_rules_dir}")
+        print(f"Metadata output: {metadata_dir}")
+        print(f"Files to process: {len(RULE_FILES)}")
+        print()
+
+    start = time.perf_counter()
+    results = render_all(
+        rules_dir,
+        rendered_rules_dir,
+        metadata_dir,
+        renderer_command=['node', str(renderer_script)],
+        renderer_script=renderer_script,
+        jobs=args.jobs,
+        shard_size=args.shard_size,
+        force=args.force,
+        progress=progress
+    )
+    seconds = time.perf_counter() - start
+
+    total_success = sum(result.get('entries', 0) for result in results)
+    total_errors = sum(result.get('errors', 0) for result in results)
+
+    if args.json:
+        progress.emit("summary", "", entries=total_success, errors=total_errors, seconds=round(seconds, 3),
+                      files=results)
+        return
+
     # Print summary
     print("\n" + "=" * 70)
     print("RENDERING COMPLETE")
     print("=" * 70)
     print(f"\nTotal entries rendered: {total_success}")
     print(f"Total errors: {total_errors}")
+    print(f"Time: {seconds:.1f}s")
     print(f"\nOutput structure:")
     print(f"  - Markdown files: {rendered_rules_dir}/{{type}}/{{name}}_{{source}}.md")
     print(f"  - Metadata files: {metadata_dir}/{{type}}/{{name}}_{{source}}.json")
@@ -165,7 +356,9 @@ def main():
     print("-" * 70)
     for result in results:
         if result['status'] == 'success':
-            print(f"  ✅ {result['file']}: {result['entries']} entries")
+            print(f"  ✅ {result['file']}: {result['entries']} entries ({result['shards']} shards)")
+        elif result['status'] == 'unchanged':
+            print(f"  ⏭️  {result['file']}: unchanged since last render")
         elif result['status'] == 'skipped':
             print(f"  ⚠️  {result['file']}: SKIPPED ({result['reason']})")
         else:
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: character sheet load/save paths on large multiclass sheets.
+
+This script:
+- Builds a large multiclass character by inflating the bundled wizard sheet
+  (three classes, many features, spells, items and active effects)
+- Times each load path: json.load + model_validate (previous StateManager
+  behaviour), model_validate_json on raw bytes, trusted snapshot restore and
+  the msgpack binary cache (when msgpack is installed)
+- Times each save path: model_dump + indented json.dump (previous behaviour)
+  and model_dump_json
+- Runs StateManager load/save end to end against a temp directory
+
+No API calls are made.
+
+Usage:
+    uv run python scripts/benchmark_character_serialization.py [--scale 10] [--iterations 200]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+
+def build_large_sheet(scale: int) -> dict:
+    """Inflate the wizard sheet into a high-level multiclass character."""
+    data = json.loads(Path("src/characters/wizard.json").read_text())
+    data["character_id"] = "archmage"
+    data["info"]["classes"] = [
+        {"class_name": "Wizard", "subclass": "School of Evocation", "level": 10},
+        {"class_name": "Cleric", "subclass": "Knowledge Domain", "level": 6},
+        {"class_name": "Fighter", "subclass": "Eldritch Knight", "level": 4},
+    ]
+    data["info"]["total_level"] = 20
+
+    def copies(items, tag):
+        return [dict(item, name=f"{item['name']} ({tag} {i})") for i in range(scale) for item in items]
+
+    data["features_and_traits"] = copies(data["features_and_traits"], "Feature")
+    data["equipment"] = copies(data["equipment"], "Item")
+    data["attacks_and_spellcasting"] = copies(data["attacks_and_spellcasting"], "Attack")
+    data["spells"] = {level: copies(spells, "Variant") for level, spells in data["spells"].items()}
+    data["active_effects"] = [
+        {"name": f"Effect {i}", "effect_type": "buff", "duration_type": "rounds",
+         "duration_remaining": 10, "source": "benchmark", "description": "Benchmark effect"}
+        for i in range(scale * 2)
+    ]
+    return data
+
+
+def time_op(fn, iterations: int) -> float:
+    """Median seconds per call."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def us(seconds: float) -> str:
+    return f"{seconds * 1_000_000:9.1f} µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10, help="Copies of each list entry in the sheet")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per path")
+    args = parser.parse_args()
+
+    from src.characters.charactersheet import Character
+    from src.characters.character_codec import (
+        CharacterBinaryCache,
+        character_from_json,
+        character_from_snapshot,
+        character_to_json,
+    )
+    from src.memory.state_manager import StateManager
+
+    print("=" * 70)
+    print("BENCHMARK: CHARACTER SERIALIZATION")
+    print("=" * 70)
+
+    raw = json.dumps(build_large_sheet(args.scale), indent=2).encode("utf-8")
+    character = character_from_json(raw)
+    snapshot = character.model_dump()
+    print(f"\nSheet: {len(raw):,} bytes, {len(character.features_and_traits)} features, "
+          f"{len(character.equipment)} items, {len(character.active_effects)} effects")
+
+    temp_dir = tempfile.mkdtemp(prefix="dnd_bench_")
+    try:
+        sheet_path = os.path.join(temp_dir, "archmage.json")
+        Path(sheet_path).write_bytes(raw)
+
+        print("\nLoad")
+        legacy_load = time_op(lambda: Character.model_validate(json.loads(raw)), args.iterations)
+        print(f"  json.load + model_validate:   {us(legacy_load)}")
+        fast_load = time_op(lambda: character_from_json(raw), args.iterations)
+        print(f"  model_validate_json (bytes):  {us(fast_load)}  ({legacy_load / fast_load:.1f}x)")
+        trusted = time_op(lambda: character_from_snapshot(snapshot), args.iterations)
+        print(f"  trusted snapshot restore:     {us(trusted)}  ({legacy_load / trusted:.1f}x)")
+        if CharacterBinaryCache.available:
+            cache = CharacterBinaryCache(os.path.join(temp_dir, "cache"))
+            cache.store("archmage", sheet_path, character)
+            cached = time_op(lambda: cache.load("archmage", sheet_path), args.iterations)
+            size = os.path.getsize(os.path.join(temp_dir, "cache", "archmage.msgpack"))
+            print(f"  msgpack cache hit:            {us(cached)}  ({legacy_load / cached:.1f}x, {size:,} bytes)")
+        else:
+            print("  msgpack cache hit:            skipped (msgpack not installed)")
+
+        print("\nSave")
+        legacy_save = time_op(
+            lambda: json.dumps(character.model_dump(), indent=2, ensure_ascii=False), args.iterations
+        )
+        print(f"  model_dump + json.dump:       {us(legacy_save)}")
+        fast_save = time_op(lambda: character_to_json(character), args.iterations)
+        print(f"  model_dump_json (indent=2):   {us(fast_save)}  ({legacy_save / fast_save:.1f}x)")
+        compact_save = time_op(lambda: character_to_json(character, indent=None), args.iterations)
+        print(f"  model_dump_json (compact):    {us(compact_save)}  ({legacy_save / compact_save:.1f}x)")
+
+        print("\nStateManager end to end")
+        manager = StateManager(character_data_path=temp_dir + "/", enable_logging=False)
+        load = time_op(lambda: manager.load_character("archmage"), args.iterations)
+        save = time_op(lambda: manager.save_character("archmage"), args.iterations)
+        print(f"  load_character:               {us(load)}")
+        print(f"  save_character:               {us(save)}")
+        assert manager.load_character("archmage").model_dump() == snapshot, "Round trip changed the sheet"
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print("\n✓ Round trip preserved the sheet")
+
+
+if __name__ == "__main__":
+    main()
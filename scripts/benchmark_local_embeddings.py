@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: offline local query embeddings vs Gemini embeddings.
+
+This script:
+- Runs a fixed set of rules questions against the built rules table with
+  both embedding providers: "gemini" (API, "vector" column) and "local"
+  (hashed n-gram TF-IDF, "local_vector" column)
+- Reports retrieval quality per provider for pure vector search and for
+  hybrid search (vector + FTS, what LanceRulesService.search() runs):
+  hit@1, hit@k and MRR of the expected entry (matched by name, any source)
+- Reports how many of Gemini's top-k vector results the local provider
+  also returns (overlap@k)
+- Reports query embedding latency (p50/p95) per provider
+
+Gemini queries need GEMINI_API_KEY or GOOGLE_API_KEY (one embedding call
+per query and mode). With --offline only the local provider is measured.
+
+Usage:
+    uv run python scripts/benchmark_local_embeddings.py [--k 5] [--offline]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.chdir(project_root)
+
+# (question, name of the entry that answers it)
+FIXED_QUERIES = [
+    ("How does fireball work?", "Fireball"),
+    ("What happens when I'm grappled?", "Grappled"),
+    ("Can I move while restrained", "Restrained"),
+    ("effects of being poisoned", "Poisoned"),
+    ("What does the prone condition do", "Prone"),
+    ("how much damage does magic missile do", "Magic Missile"),
+    ("reaction spell that adds 5 to AC", "Shield"),
+    ("heal an ally with a touch spell", "Cure Wounds"),
+    ("bless my allies attack rolls", "Bless"),
+    ("turn invisible", "Invisibility"),
+    ("invisible condition", "Invisible"),
+    ("what does the dodge action do", "Dodge"),
+    ("disengage to avoid opportunity attacks", "Disengage"),
+    ("help another creature with a task", "Help"),
+    ("drinking a healing potion", "Potion of Healing"),
+    ("longsword damage", "Longsword"),
+    ("exhaustion levels", "Exhaustion"),
+    ("stunned creature", "Stunned"),
+    ("frightened of a monster", "Frightened"),
+    ("hold person paralyzes a humanoid", "Hold Person"),
+    ("counter an enemy spellcaster", "Counterspell"),
+    ("teleport a short distance", "Misty Step"),
+    ("concentrating on a spell", "Concentration"),
+    ("falling from a height", "Falling"),
+]
+
+
+def evaluate(names_per_query, expected, k):
+    """hit@1, hit@k and MRR of the expected names."""
+    ranks = []
+    for names, target in zip(names_per_query, expected):
+        ranks.append(names.index(target) + 1 if target in names else None)
+    return {
+        "hit@1": sum(rank == 1 for rank in ranks) / len(ranks),
+        f"hit@{k}": sum(rank is not None for rank in ranks) / len(ranks),
+        "mrr": sum(1 / rank for rank in ranks if rank) / len(ranks),
+    }
+
+
+def run_provider(service, queries, k):
+    """Embed every query and run vector-only and hybrid search."""
+    table = service.table
+    column = service.embedding_provider.vector_column
+    latencies, vector_results, hybrid_results = [], [], []
+    for query in queries:
+        start = time.perf_counter()
+        embedding = service.embedding_provider.embed_query(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        vector_results.append([
+            row["name"] for row in
+            table.search(embedding, vector_column_name=column).select(["name"]).limit(k).to_list()
+        ])
+        hybrid_results.append([
+            row["name"] for row in
+            table.search(query_type="hybrid", vector_column_name=column)
+            .vector(embedding).text(query).select(["name"]).limit(k).to_list()
+        ])
+    return latencies, vector_results, hybrid_results
+
+
+def latency(samples) -> str:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"p50 {statistics.median(samples):8.3f} ms, p95 {p95:8.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-path", default="src/db/lancedb", help="LanceDB database path")
+    parser.add_argument("--k", type=int, default=5, help="Results per query")
+    parser.add_argument("--offline", action="store_true", help="Skip the Gemini provider")
+    args = parser.parse_args()
+
+    from src.db.lance_rules_service import LanceRulesService
+
+    print("=" * 70)
+    print("BENCHMARK: LOCAL VS GEMINI QUERY EMBEDDINGS")
+    print("=" * 70)
+
+    queries = [query for query, _ in FIXED_QUERIES]
+    expected = [name for _, name in FIXED_QUERIES]
+    providers = ["local"] if args.offline else ["local", "gemini"]
+
+    results = {}
+    for provider in providers:
+        service = LanceRulesService(db_path=args.db_path, embedding_provider=provider)
+        service.connect()
+        if provider == "local":
+            service.embedding_provider.embed_query("warm up")  # Loads the IDF weights
+        results[provider] = run_provider(service, queries, args.k)
+
+    print(f"\n{len(queries)} queries, k={args.k}")
+    for provider, (latencies, vector_results, hybrid_results) in results.items():
+        print(f"\n{provider}")
+        print(f"  query embedding:  {latency(latencies)}")
+        for mode, names in (("vector", vector_results), ("hybrid", hybrid_results)):
+            scores = evaluate(names, expected, args.k)
+            print(f"  {mode + ':':<17} " + ", ".join(f"{key} {value:.2f}" for key, value in scores.items()))
+
+    if "gemini" in results:
+        local_names, gemini_names = results["local"][1], results["gemini"][1]
+        overlap = statistics.mean(
+            len(set(local) & set(gemini)) / max(1, len(gemini))
+            for local, gemini in zip(local_names, gemini_names)
+        )
+        print(f"\nOverlap@{args.k} of local with Gemini vector results: {overlap:.2f}")
+
+    missing = [name for name, names in zip(expected, results["local"][2]) if name not in names]
+    if missing:
+        print(f"\nNot found by local hybrid search: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ Analyze dangling references in D&D rules metadata.
 
 This script identifies all references that point to rules not in the dataset,
 grouped and sorted by source, without requiring database rebuild or embeddings.
+If the rules table exists, it also validates the reference closures precomputed
+by the build against the stored references.
 
 Usage:
     uv run python scripts/db/analyze_dangling_references.py
@@ -225,6 +227,36 @@ def print_analysis(results: Dict):
     print("  - Complete list with reference types and sources")
 
 
+def check_reference_closures(db_path: Path) -> List[str] | None:
+    """
+    Validate the reference closures stored in the rules table.
+
+    Returns:
+        Problem descriptions, or None if the table has no closures
+    """
+    from src.db.lance_rules_service import LanceRulesService
+
+    service = LanceRulesService(db_path=str(db_path), use_result_cache=False)
+    service.connect()
+    if "reference_closure" not in service.table.schema.names:
+        return None
+    return service.validate_reference_closures()
+
+
+def print_closure_problems(problems: List[str] | None):
+    """Print the closure validation results."""
+    if problems is None:
+        print("  Rules table predates reference closures - rebuild it to validate")
+    elif not problems:
+        print("  ✅ Every stored closure matches the stored references")
+    else:
+        print(f"  ❌ {len(problems)} closure problems:")
+        for problem in problems[:20]:
+            print(f"    - {problem}")
+        if len(problems) > 20:
+            print(f"    ... and {len(problems) - 20} more")
+
+
 def main():
     """Run dangling reference analysis."""
     print("=" * 70)
@@ -253,6 +285,12 @@ def main():
     # Print results
     print_analysis(results)
 
+    # Phase 3: Validate the closures precomputed by the build
+    db_path = Path("src/db/lancedb")
+    if db_path.exists():
+        print("\nPhase 3: Validating reference closures in the rules table...")
+        print_closure_problems(check_reference_closures(db_path))
+
     print("\n" + "=" * 70)
 
 
@@ -3,9 +3,14 @@ Build LanceDB rules database from rendered files.
 
 This is a one-time setup script that:
 1. Loads all rules from src/db/rendered_rules/ and src/db/metadata/
-2. Creates embeddings using gemini-embedding-001
+2. Creates embeddings using gemini-embedding-001 (batched, concurrent,
+   rate limited and checkpointed to src/db/embedding_cache/ so an
+   interrupted build resumes where it stopped), plus offline local
+   embeddings for LANCE_EMBEDDING_PROVIDER=local
 3. Deduplicates and validates references
-4. Builds LanceDB table
+4. Builds LanceDB table - incrementally by default: only new or changed
+   rules (by content hash) are embedded and upserted, removed rules are
+   deleted and the FTS index is updated in place
 
 Usage:
     # Process all entries
@@ -13,6 +18,12 @@ Usage:
 
     # Test mode - process only first 10 entries
     uv run python scripts/db/build_lance_rules_db.py --limit 10
+
+    # Rebuild the whole table from scratch
+    uv run python scripts/db/build_lance_rules_db.py --mode overwrite
+
+    # Tune embedding throughput
+    uv run python scripts/db/build_lance_rules_db.py --batch-size 50 --concurrency 8 --rpm 1000
 """
 
 import argparse
@@ -23,7 +34,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.db.lance_rules_service import LanceRulesService
+from src.db.lance_rules_service import DEFAULT_EMBEDDING_CACHE_DIR, LanceRulesService
+from src.db.reference_closure import CLOSURE_DEPTH
 
 
 def print_stats(stats: dict):
@@ -34,12 +46,29 @@ def print_stats(stats: dict):
 
     print(f"\n📊 Entry Statistics:")
     print(f"  Total entries loaded: {stats['total_entries']}")
+    if stats.get('mode') == "incremental":
+        print(f"  Unchanged: {stats['unchanged_entries']}, upserted: {stats['upserted_entries']}, "
+              f"deleted: {stats['deleted_entries']}")
+        print(f"  Upserted with unchanged content (vectors reused): {stats['reused_vectors']}")
+
+    embedding = stats.get('embedding')
+    if embedding:
+        print(f"\n⚡ Embedding Throughput:")
+        print(f"  Documents: {embedding['documents']} "
+              f"({embedding['cached']} from checkpoint, {embedding['embedded']} embedded, {embedding['failed']} failed)")
+        print(f"  API requests: {embedding['requests']} ({embedding['retries']} retries)")
+        print(f"  Time: {embedding['seconds']:.1f}s, {embedding['documents_per_second']:.1f} documents/s")
+        print(f"  Local (offline) embeddings: {stats.get('local_embedding_seconds', 0):.1f}s")
 
     print(f"\n🔗 Reference Statistics:")
     print(f"  Total references found: {stats['total_references_found']}")
     print(f"  Valid references retained: {stats['final_valid_references']}")
     print(f"  Duplicate references removed: {stats['duplicate_references_removed']}")
     print(f"  Invalid references filtered: {stats['invalid_references_filtered']}")
+    print(f"  Closure references (within {CLOSURE_DEPTH} hops): {stats.get('closure_references', 0)}")
+    if stats.get('closure_problems'):
+        print(f"  ⚠️  Closure problems: {len(stats['closure_problems'])} "
+              f"(run scripts/db/analyze_dangling_references.py)")
 
     if stats['reference_types']:
         print(f"\n📑 References by Type:")
@@ -67,6 +96,14 @@ def main():
         default=None,
         help="Limit number of entries to process (for testing). Default: process all"
     )
+    parser.add_argument("--mode", choices=["incremental", "overwrite"], default="incremental",
+                        help="Update only changed rules (default) or rebuild the table")
+    parser.add_argument("--batch-size", type=int, default=100, help="Documents per embedding request (max 100)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Embedding requests in flight at once")
+    parser.add_argument("--rpm", type=float, default=None,
+                        help="Embedding requests per minute. Default: paid tier quota")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore the embedding checkpoint and embed everything again")
     args = parser.parse_args()
 
     print("=" * 70)
@@ -110,7 +147,12 @@ def main():
             rendered_rules_dir=rendered_rules_dir,
             metadata_dir=metadata_dir,
             show_progress=True,
-            max_entries=args.limit
+            max_entries=args.limit,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            embedding_cache_dir=None if args.no_resume else DEFAULT_EMBEDDING_CACHE_DIR,
+            mode=args.mode
         )
 
         # Calculate invalid references
@@ -124,7 +166,7 @@ def main():
         print_stats(stats)
 
         print("\n✅ SUCCESS!")
-        print(f"   LanceDB database created at: src/db/lancedb/")
+        print(f"   LanceDB database {'updated' if stats['mode'] == 'incremental' else 'created'} at: src/db/lancedb/")
         print(f"   Total entries: {stats['total_entries']}")
         print(f"   Valid references: {stats['final_valid_references']}")
 
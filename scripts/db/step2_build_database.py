@@ -8,19 +8,23 @@ This script:
 - Generates embeddings using Gemini API (RATE LIMITED - uses paid tier if available)
 - Creates LanceDB table with vector embeddings
 - Creates FTS index for hybrid search
+- Reports embedding throughput (documents/s, requests, checkpoint hits)
 
 ⚠️  API USAGE WARNING:
-- This script calls the Gemini API ~2,696 times (once per rule)
+- Rules are embedded 100 per request: ~27 requests for ~2,696 rules
 - Uses GEMINI_API_KEY_PAID_TIER or GOOGLE_API_KEY_PAID_TIER if available (1500 req/min)
 - Falls back to free tier: GEMINI_API_KEY or GOOGLE_API_KEY (15 req/min)
-- With free tier, this will take ~3 hours due to rate limiting
-- With paid tier, this takes ~2-3 minutes
+- Embeddings are checkpointed to src/db/embedding_cache/ by content hash;
+  rerunning after a crash or quota error only embeds what is missing
 
 Usage:
     uv run python scripts/db/step2_build_database.py
 
     # Test mode - only process first 50 entries
     uv run python scripts/db/step2_build_database.py --limit 50
+
+    # Other options (--batch-size, --concurrency, --rpm, --no-resume) are
+    # passed through to build_lance_rules_db.py
 """
 
 import sys
@@ -5,6 +5,10 @@ Step 3: Test LanceDB database.
 This script:
 - Verifies the database was built correctly
 - Runs integration tests
+- Benchmarks the indexes: recall@k and latency of the ANN vector index
+  against exact (brute-force) search over a sweep of nprobes, plus latency
+  of id lookups and type-filtered searches. Queries are midpoints of stored
+  embeddings, so the benchmark makes no API calls.
 - Shows example queries
 
 ⚠️  API USAGE WARNING:
@@ -14,17 +18,116 @@ This script:
 
 Usage:
     uv run python scripts/db/step3_test_database.py
+    uv run python scripts/db/step3_test_database.py --skip-tests --queries 200 --k 10
 """
 
 import sys
+import time
+import random
+import argparse
+import statistics
 import subprocess
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+NPROBES_SWEEP = [5, 10, 20, 50]
+
+
+def timed(run):
+    """Run a query and return (result, milliseconds)."""
+    start = time.perf_counter()
+    result = run()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def latency(samples) -> str:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"p50 {statistics.median(samples):7.2f} ms, p95 {p95:7.2f} ms"
+
+
+def benchmark_indexes(db_path: Path, num_queries: int, k: int, seed: int = 7):
+    """Measure recall and latency of the ANN and scalar indexes."""
+    import lancedb
+    from src.db.lance_rules_service import SEARCH_NPROBES, SEARCH_REFINE_FACTOR, VECTOR_INDEX_MIN_ROWS
+
+    table = lancedb.connect(str(db_path)).open_table("rules")
+    num_rows = table.count_rows()
+    indexes = {index.name: index for index in table.list_indices()}
+
+    print(f"Rows: {num_rows:,}, table versions: {len(table.list_versions())}")
+    for name, index in indexes.items():
+        index_stats = table.index_stats(name)
+        print(f"  {name:<12} {index.index_type:<8} on {', '.join(index.columns):<8} "
+              f"unindexed rows: {index_stats.num_unindexed_rows if index_stats else '?'}")
+
+    rows = table.search().select(["id", "type", "vector"]).limit(num_rows).to_list()
+    rng = random.Random(seed)
+    queries = [
+        ((np.asarray(a["vector"]) + np.asarray(b["vector"])) / 2).tolist()
+        for a, b in (rng.sample(rows, 2) for _ in range(num_queries))
+    ]
+
+    def run_vector(query, **options):
+        search = table.search(query).select(["id"]).limit(k)
+        if options.get("exact"):
+            search = search.bypass_vector_index()
+        if options.get("nprobes"):
+            search = search.nprobes(options["nprobes"])
+        if options.get("refine_factor"):
+            search = search.refine_factor(options["refine_factor"])
+        return [row["id"] for row in search.to_list()]
+
+    exact, exact_ms = [], []
+    for query in queries:
+        ids, ms = timed(lambda: run_vector(query, exact=True))
+        exact.append(set(ids))
+        exact_ms.append(ms)
+
+    print(f"\nVector search, {num_queries} queries, k={k}")
+    print(f"  {'exact (brute force)':<28} recall 1.000, {latency(exact_ms)}")
+    if "vector_idx" not in indexes:
+        print(f"  No ANN index (table has fewer than {VECTOR_INDEX_MIN_ROWS:,} rows) - search() is exact")
+    else:
+        configs = [(nprobes, SEARCH_REFINE_FACTOR) for nprobes in NPROBES_SWEEP] + [(SEARCH_NPROBES, None)]
+        for nprobes, refine_factor in configs:
+            recalls, ms_samples = [], []
+            for query, expected in zip(queries, exact):
+                ids, ms = timed(lambda: run_vector(query, nprobes=nprobes, refine_factor=refine_factor))
+                recalls.append(len(expected & set(ids)) / max(1, len(expected)))
+                ms_samples.append(ms)
+            label = f"nprobes={nprobes}, refine={refine_factor or '-'}"
+            marker = "  <- search()" if (nprobes, refine_factor) == (SEARCH_NPROBES, SEARCH_REFINE_FACTOR) else ""
+            print(f"  {label:<28} recall {statistics.mean(recalls):.3f}, {latency(ms_samples)}{marker}")
+
+    sample = rng.sample(rows, min(num_queries, len(rows)))
+    id_ms = [
+        timed(lambda: table.search().where(f"id = '{row['id'].replace(chr(39), chr(39) * 2)}'").limit(1).to_list())[1]
+        for row in sample
+    ]
+    filter_ms = [
+        timed(lambda: table.search(query).where(f"type = '{row['type']}'").nprobes(SEARCH_NPROBES)
+              .refine_factor(SEARCH_REFINE_FACTOR).limit(k).to_list())[1]
+        for query, row in zip(queries, sample)
+    ]
+    print(f"\nScalar lookups")
+    print(f"  {'get_by_id (id = ...)':<28} {latency(id_ms)}")
+    print(f"  {'vector + type filter':<28} {latency(filter_ms)}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skip-tests", action="store_true", help="Only run the index benchmark")
+    parser.add_argument("--skip-benchmark", action="store_true", help="Only run the integration tests")
+    parser.add_argument("--queries", type=int, default=100, help="Benchmark queries")
+    parser.add_argument("--k", type=int, default=10, help="Results per benchmark query")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("STEP 3: TEST LANCEDB DATABASE")
     print("=" * 70)
@@ -54,24 +157,31 @@ def main():
     print(f"✅ Database found at: {db_path}")
     print()
 
-    # Run pytest integration tests
-    print("Running integration tests...")
-    print("-" * 70)
+    if not args.skip_benchmark:
+        print("Benchmarking indexes...")
+        print("-" * 70)
+        benchmark_indexes(db_path, args.queries, args.k)
+        print()
 
-    test_file = project_root / "tests" / "test_lance_rules_service.py"
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", str(test_file), "-v"],
-        cwd=str(project_root)
-    )
+    if not args.skip_tests:
+        # Run pytest integration tests
+        print("Running integration tests...")
+        print("-" * 70)
 
-    print()
+        test_file = project_root / "tests" / "test_lance_rules_service.py"
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", str(test_file), "-v"],
+            cwd=str(project_root)
+        )
 
-    if result.returncode != 0:
-        print("❌ Some tests failed!")
-        sys.exit(1)
+        print()
+
+        if result.returncode != 0:
+            print("❌ Some tests failed!")
+            sys.exit(1)
 
     print("=" * 70)
-    print("✅ STEP 3 COMPLETE - ALL TESTS PASSED!")
+    print("✅ STEP 3 COMPLETE!")
     print("=" * 70)
     print()
     print("🎉 Database is ready to use!")
@@ -86,6 +86,8 @@ class FailureReason:
     # Input validation
     NO_MONSTERS_SPECIFIED = "no_monsters_specified"
     NO_ROLLS_PROVIDED = "no_rolls_provided"
+    NO_PARTY_LOADED = "no_party_loaded"
+    NO_QUERIES_PROVIDED = "no_queries_provided"
 
     # Entity not found
     CHARACTER_NOT_FOUND = "character_not_found"
@@ -94,6 +96,7 @@ class FailureReason:
     # Operation failures
     SPAWN_ERROR = "spawn_error"
     NO_MONSTERS_CREATED = "no_monsters_created"
+    ESTIMATE_ERROR = "estimate_error"
     TRANSITION_ERROR = "transition_error"
 
 
@@ -296,13 +299,15 @@ def _require_combat_phase(
 async def query_rules_database(
     ctx: RunContext[DMToolsDependencies],
     query: str,
-    limit: int = 3
+    limit: int = 3,
+    detail: Literal["summary", "full"] = "summary"
 ) -> str:
     """
     Query D&D rules database for spell, item, condition, or action information.
 
     Automatically detects query type and returns relevant rules:
-    - Short queries (≤10 words): Tries exact name match first, falls back to hybrid search
+    - Short queries (≤10 words): Tries a local name match first (tolerates casing,
+      typos, type hints like "shield spell" and aliases), falls back to hybrid search
     - Long queries (>10 words): Uses hybrid search (vector + full-text)
 
     Caches all results in current turn's metadata["rules_cache"] for reuse by
@@ -312,10 +317,13 @@ async def query_rules_database(
         ctx: PydanticAI RunContext with DMToolsDependencies
         query: Rule name or natural language query
                Examples:
-                 - "Bless" (exact match)
+                 - "Bless", "shield spell", "magic misile" (name match)
                  - "bonus action fireball concentration" (multi-keyword)
                  - "how does spellcasting work?" (natural language)
         limit: Maximum number of results to return (default 3, max 10)
+        detail: "summary" (default) for the compact mechanics of each rule
+                (action cost, range, save, damage, duration, concentration),
+                "full" for the complete rule text when the summary is not enough
 
     Returns:
         Formatted rule information string with up to 'limit' results
@@ -338,7 +346,7 @@ async def query_rules_database(
     turn_manager = ctx.deps.turn_manager
     rules_cache_service = ctx.deps.rules_cache_service
 
-    log.dm_tool("query_rules_database called", query=query, limit=limit)
+    log.dm_tool("query_rules_database called", query=query, limit=limit, detail=detail)
 
     # Get current turn for caching
     current_turn = turn_manager.get_current_turn_context()
@@ -348,16 +356,16 @@ async def query_rules_database(
     # Clamp limit to max 10
     limit = min(limit, 10)
 
-    # Auto-detect: short queries try exact match first
+    # Auto-detect: short queries try a local name match first (no embedding call)
     if len(query.split()) <= 10:
-        rule_entry = lance_service.get_by_name(query)
+        rule_entry = lance_service.find_by_name(query)
         if rule_entry:
-            # Exact match found - cache and return single result
+            # Name match found - cache and return single result
             cache_entry = _format_lance_entry_to_cache(rule_entry)
             rules_cache_service.add_to_cache(cache_entry, current_turn)
             log.dm_tool("query_rules_database complete",
-                       query=query, results_count=1, match_type="exact", cached=True)
-            return _format_rule_for_dm(cache_entry)
+                       query=query, results_count=1, match_type="name", cached=True)
+            return _format_rule_for_dm(cache_entry, detail)
 
     # Fall through to hybrid search (or if query was long/no exact match)
     results = lance_service.search(query, limit=limit)
@@ -372,7 +380,7 @@ async def query_rules_database(
     for result in results:
         cache_entry = _format_lance_entry_to_cache(result)
         rules_cache_service.add_to_cache(cache_entry, current_turn)
-        formatted_results.append(_format_rule_for_dm(cache_entry))
+        formatted_results.append(_format_rule_for_dm(cache_entry, detail))
 
     log.dm_tool("query_rules_database complete",
                query=query, results_count=len(results), match_type="hybrid", cached=True)
@@ -381,6 +389,99 @@ async def query_rules_database(
     return "\n\n---\n\n".join(formatted_results)
 
 
+MAX_BATCH_QUERIES = 10  # Queries answered per query_rules_batch call
+
+
+async def query_rules_batch(
+    ctx: RunContext[DMToolsDependencies],
+    queries: List[str],
+    limit: int = 3,
+    detail: Literal["summary", "full"] = "summary"
+) -> str:
+    """
+    Query the D&D rules database for several rules in one call.
+
+    Use this instead of repeated query_rules_database calls when an action
+    involves several rules at once (the spell, the condition it applies, the
+    action type). Each query is resolved like query_rules_database: short
+    queries try a local name match first, everything else uses hybrid search.
+    All hybrid queries share one embedding request and run concurrently.
+
+    Caches all results in current turn's metadata["rules_cache"], each rule once.
+
+    Args:
+        ctx: PydanticAI RunContext with DMToolsDependencies
+        queries: Rule names or natural language queries (max 10)
+                 Example: ["Hold Person", "paralyzed", "concentration"]
+        limit: Maximum number of results per hybrid query (default 3, max 10)
+        detail: "summary" (default) or "full", as for query_rules_database
+
+    Returns:
+        One section per query; a rule returned by an earlier query is
+        referenced by name instead of repeated
+
+    Examples:
+        >>> await query_rules_batch(ctx, ["Hold Person", "paralyzed"])
+        "## Hold Person\\nHold Person (Spell, Level 2):\\n...\\n\\n## paralyzed\\nParalyzed (Condition):\\n..."
+    """
+    log = _get_log(ctx)
+    lance_service = ctx.deps.lance_service
+    turn_manager = ctx.deps.turn_manager
+    rules_cache_service = ctx.deps.rules_cache_service
+
+    log.dm_tool("query_rules_batch called", queries=queries, limit=limit, detail=detail)
+
+    # Get current turn for caching
+    current_turn = turn_manager.get_current_turn_context()
+    if not current_turn:
+        return _fail(log, "query_rules_batch", FailureReason.NO_ACTIVE_TURN)
+
+    queries = [query for query in dict.fromkeys(q.strip() for q in queries) if query][:MAX_BATCH_QUERIES]
+    if not queries:
+        return _fail(log, "query_rules_batch", FailureReason.NO_QUERIES_PROVIDED)
+
+    # Clamp limit to max 10
+    limit = min(limit, 10)
+
+    # Short queries try a local name match first (no embedding call)
+    results_by_query: Dict[str, List[dict]] = {}
+    for query in queries:
+        if len(query.split()) <= 10:
+            rule_entry = lance_service.find_by_name(query)
+            if rule_entry:
+                results_by_query[query] = [rule_entry]
+
+    # Everything else in one batched hybrid search
+    search_queries = [query for query in queries if query not in results_by_query]
+    if search_queries:
+        for query, results in zip(search_queries, lance_service.search_batch(search_queries, limit=limit)):
+            results_by_query[query] = results
+
+    # Cache and format each rule once, in query order
+    sections = []
+    seen = set()
+    for query in queries:
+        formatted_results = []
+        for result in results_by_query[query]:
+            cache_entry = _format_lance_entry_to_cache(result)
+            key = (cache_entry["name"].lower(), cache_entry["entry_type"])
+            if key in seen:
+                formatted_results.append(f"{cache_entry['name']}: see above")
+                continue
+            seen.add(key)
+            rules_cache_service.add_to_cache(cache_entry, current_turn)
+            formatted_results.append(_format_rule_for_dm(cache_entry, detail))
+
+        body = "\n\n---\n\n".join(formatted_results) or f"No rules found matching '{query}'"
+        sections.append(f"## {query}\n{body}")
+
+    log.dm_tool("query_rules_batch complete",
+               queries=len(queries), name_matches=len(queries) - len(search_queries),
+               hybrid_queries=len(search_queries), results_count=len(seen), cached=True)
+
+    return "\n\n".join(sections)
+
+
 def _format_lance_entry_to_cache(lance_entry: dict) -> dict:
     """
     Format LanceDB entry into cache schema.
@@ -409,6 +510,10 @@ def _format_lance_entry_to_cache(lance_entry: dict) -> dict:
         "source": "lancedb"
     }
 
+    # Mechanics summary built with the database (rule_summary.py)
+    if lance_entry.get("summary"):
+        cache_entry["summary"] = lance_entry["summary"]
+
     # Extract additional metadata if available
     metadata = lance_entry.get("metadata", {})
     if metadata:
@@ -427,12 +532,14 @@ def _format_lance_entry_to_cache(lance_entry: dict) -> dict:
     return cache_entry
 
 
-def _format_rule_for_dm(cache_entry: dict) -> str:
+def _format_rule_for_dm(cache_entry: dict, detail: Literal["summary", "full"] = "full") -> str:
     """
     Format cache entry into readable string for DM narrative generation.
 
     Args:
         cache_entry: Cache entry with rule information
+        detail: "summary" shows the mechanics summary instead of the full
+                description (entries without a summary always show the description)
 
     Returns:
         Formatted string with rule details
@@ -444,6 +551,8 @@ def _format_rule_for_dm(cache_entry: dict) -> str:
     name = cache_entry.get("name", "Unknown")
     entry_type = cache_entry.get("entry_type", "unknown").capitalize()
     description = cache_entry.get("description", "No description available.")
+    if detail == "summary" and cache_entry.get("summary"):
+        description = f"{cache_entry['summary']}\n(Summary - query with detail=\"full\" for the complete rule)"
 
     # Build header with type and level/rarity info
     header_parts = [entry_type]
@@ -647,16 +756,27 @@ async def query_character_ability(
 
 
 async def get_available_monsters(
-    ctx: RunContext[DMToolsDependencies]
+    ctx: RunContext[DMToolsDependencies],
+    cr_min: Optional[float] = None,
+    cr_max: Optional[float] = None,
+    creature_type: Optional[str] = None,
+    size: Optional[str] = None,
+    environment: Optional[str] = None
 ) -> str:
     """
     Get list of available monster templates for encounter selection.
 
     Call this to see what monsters can be spawned for combat encounters.
     Returns a list of monster types with their basic stats (CR, HP, AC, size, type).
+    Pass filters to get a shortlist that fits the scene and the party's level.
 
     Args:
         ctx: PydanticAI RunContext with DMToolsDependencies
+        cr_min: Minimum challenge rating, inclusive (use 0.25 for CR 1/4, 0.5 for CR 1/2)
+        cr_max: Maximum challenge rating, inclusive
+        creature_type: Creature type such as "humanoid", "undead", "beast", "giant"
+        size: Size such as "Small", "Medium", "Large", "Huge"
+        environment: Habitat such as "forest", "underdark", "dungeon", "swamp"
 
     Returns:
         Formatted list of available monster templates with summary stats
@@ -668,16 +788,25 @@ async def get_available_monsters(
          - orc (CR 1/2, Medium humanoid): HP 15, AC 13, Aggressive
          - skeleton (CR 1/4, Medium undead): HP 13, AC 13
          ..."
+
+        >>> await get_available_monsters(ctx, cr_max=1, creature_type="undead")
     """
     log = _get_log(ctx)
-    log.dm_tool("get_available_monsters called")
+    filters = {
+        "cr_min": cr_min,
+        "cr_max": cr_max,
+        "creature_type": creature_type,
+        "size": size,
+        "environment": environment
+    }
+    log.dm_tool("get_available_monsters called", **{k: v for k, v in filters.items() if v is not None})
 
     try:
         monster_spawner = _require_monster_spawner(ctx, "get_available_monsters")
     except ToolValidationError as e:
         return e.error_message
 
-    result = monster_spawner.get_available_monsters_context()
+    result = monster_spawner.get_available_monsters_context(**filters)
     log.dm_tool("get_available_monsters complete")
 
     return result
@@ -761,6 +890,58 @@ async def select_encounter_monsters(
     return f"Created {len(created_ids)} monsters:\n{summary}"
 
 
+async def estimate_encounter_difficulty(
+    ctx: RunContext[DMToolsDependencies],
+    monsters: List[MonsterSelection]
+) -> str:
+    """
+    Estimate how dangerous an encounter would be for the current party, without spawning it.
+
+    Runs a fast Monte Carlo simulation of the fight (party attacks vs monster actions).
+    Use it to compare candidate selections before calling select_encounter_monsters().
+
+    Args:
+        ctx: PydanticAI RunContext with DMToolsDependencies
+        monsters: List of MonsterSelection objects specifying type and count
+
+    Returns:
+        Difficulty label, party win probability, expected rounds and expected party HP loss
+
+    Example:
+        >>> await estimate_encounter_difficulty(ctx, [MonsterSelection(type="orc", count=3)])
+        "Estimated difficulty: Hard (2000 simulated fights)
+         - Party win probability: 78%
+         ..."
+    """
+    log = _get_log(ctx)
+    selections = [{"type": m.type, "count": m.count} for m in monsters] if monsters else []
+    log.dm_tool("estimate_encounter_difficulty called", selections=selections)
+
+    try:
+        monster_spawner = _require_monster_spawner(ctx, "estimate_encounter_difficulty")
+        state_manager = _require_state_manager(ctx, "estimate_encounter_difficulty")
+    except ToolValidationError as e:
+        return e.error_message
+
+    if not monsters:
+        return _fail(log, "estimate_encounter_difficulty", FailureReason.NO_MONSTERS_SPECIFIED)
+
+    party = list(state_manager.characters.values())
+    if not party:
+        return _fail(log, "estimate_encounter_difficulty", FailureReason.NO_PARTY_LOADED)
+
+    try:
+        estimate = monster_spawner.estimate_encounter(selections, party)
+    except ValueError as e:
+        return _fail(log, "estimate_encounter_difficulty", FailureReason.ESTIMATE_ERROR,
+                    level=LogLevel.ERROR, error=str(e))
+
+    log.dm_tool("estimate_encounter_difficulty complete",
+               difficulty=estimate.difficulty,
+               win_probability=round(estimate.party_win_probability, 3))
+    return estimate.describe()
+
+
 async def add_monster_initiative(
     ctx: RunContext[DMToolsDependencies],
     rolls: List[MonsterInitiativeRoll]
@@ -1069,7 +1250,7 @@ def create_dm_tools(
         dm_agent = create_dungeon_master_agent(tools=tools)
         result = await dm_agent.process_message(context, deps=deps)
     """
-    tools = [query_rules_database, query_character_ability, get_available_monsters, select_encounter_monsters, add_monster_initiative, remove_defeated_participant, end_combat]
+    tools = [query_rules_database, query_rules_batch, query_character_ability, get_available_monsters, estimate_encounter_difficulty, select_encounter_monsters, add_monster_initiative, remove_defeated_participant, end_combat]
     dependencies = DMToolsDependencies(
         lance_service=lance_service,
         turn_manager=turn_manager,
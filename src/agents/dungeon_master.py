@@ -11,10 +11,13 @@ The Dungeon Master Agent is an LLM agent responsible for:
 Integrates with existing TurnManager and SessionManager architecture.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 from pathlib import Path
 
+from pydantic_core import from_json
 from pydantic_ai import Agent, RunContext
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.usage import RunUsage
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
 from dotenv import load_dotenv
@@ -29,6 +32,62 @@ import asyncio
 #TODO: gemini-2.5-flash defaults with thinking ability, may be turned off
 MODEL_NAME = 'gemini-2.5-flash'
 
+# How often (seconds) partial responses are surfaced while streaming
+STREAM_DEBOUNCE_SECONDS = 0.1
+
+
+class StreamedDMResult:
+    """
+    Result of a streamed DM run.
+
+    Mirrors the parts of AgentRunResult that callers use (`output` and `usage()`),
+    so streamed and non-streamed runs are interchangeable.
+    """
+
+    def __init__(self, output: DungeonMasterResponse, usage: RunUsage):
+        self.output = output
+        self._usage = usage
+
+    def usage(self) -> RunUsage:
+        return self._usage
+
+
+def extract_partial_narrative(response: ModelResponse) -> Optional[str]:
+    """
+    Extract the (possibly incomplete) narrative from a partial model response.
+
+    The structured output arrives either as output tool call arguments or as JSON
+    text, depending on the output mode. Both are parsed as partial JSON so the
+    narrative can be surfaced before the rest of the response is generated.
+
+    Args:
+        response: Partial ModelResponse from a streamed run
+
+    Returns:
+        Narrative text received so far, or None if it hasn't started yet
+    """
+    for part in reversed(response.parts):
+        if isinstance(part, ToolCallPart):
+            args = part.args
+        elif isinstance(part, TextPart):
+            args = part.content
+        else:
+            continue
+
+        if isinstance(args, str):
+            if not args.strip():
+                continue
+            try:
+                args = from_json(args, allow_partial='trailing-strings')
+            except ValueError:
+                continue
+
+        if isinstance(args, dict) and isinstance(args.get("narrative"), str):
+            return args["narrative"]
+
+    return None
+
+
 class DungeonMasterAgent:
     """
     LLM Agent for Dungeon Master responsibilities.
@@ -76,7 +135,8 @@ class DungeonMasterAgent:
     async def process_message(
         self,
         context: str,
-        deps: Optional[Any] = None
+        deps: Optional[Any] = None,
+        on_narrative: Optional[Callable[[str], Awaitable[None]]] = None
     ):
         """
         Process a pre-built context and return Dungeon Master AgentRunResult.
@@ -84,17 +144,47 @@ class DungeonMasterAgent:
         Args:
             context: Pre-built context string from external context builder
             deps: Optional dependencies for tool execution (e.g., DMToolsDependencies)
+            on_narrative: Optional async callback receiving the narrative as it streams in.
+                When provided, the run is streamed and the callback is awaited with the
+                full narrative-so-far each time it grows.
 
         Returns:
-            AgentRunResult containing:
+            AgentRunResult (or StreamedDMResult when streaming) containing:
                 - output: DungeonMasterResponse with narrative and step completion status
                 - usage(): Method to get token and request usage
         """
+        if on_narrative is not None:
+            return await self._process_message_streamed(context, deps, on_narrative)
+
         # Get response from LLM agent using pre-built context
         # Pass deps to agent.run() for tool dependency injection
         result = await self.agent.run(context, deps=deps)
 
         return result
+
+    async def _process_message_streamed(
+        self,
+        context: str,
+        deps: Optional[Any],
+        on_narrative: Callable[[str], Awaitable[None]]
+    ) -> StreamedDMResult:
+        """Run the agent in streaming mode, surfacing the narrative field incrementally."""
+        last_narrative = ""
+        async with self.agent.run_stream(context, deps=deps) as stream:
+            async for response, _is_last in stream.stream_responses(debounce_by=STREAM_DEBOUNCE_SECONDS):
+                narrative = extract_partial_narrative(response)
+                if narrative and narrative != last_narrative:
+                    last_narrative = narrative
+                    await on_narrative(narrative)
+
+            output = await stream.get_output()
+            usage = stream.usage()
+
+        # Make sure the callback sees the validated final narrative
+        if output.narrative != last_narrative:
+            await on_narrative(output.narrative)
+
+        return StreamedDMResult(output=output, usage=usage)
     
     def process_message_sync(
         self,
@@ -14,7 +14,8 @@ from ..models.state_commands_optimized import HPAgentResult
 # HP Agent Instructions
 HP_AGENT_INSTRUCTIONS = """You are an HP extraction specialist for a D&D game system.
 
-Your role is to analyze game narratives and extract ONLY HP-related changes as HPChangeCommand objects.
+Your role is to analyze game narratives and extract ONLY HP-related changes as HPChangeCommand
+and AreaEffectCommand objects.
 
 ## Character ID Resolution
 
@@ -57,20 +58,29 @@ For each HP-related piece of information, create an HPChangeCommand with:
 - damage_type: only for damage (slashing, fire, piercing, etc.)
 - is_temporary: true only for temporary HP
 
+When ONE area effect (Fireball, breath weapon, ...) damages SEVERAL targets with the same roll, emit a
+single AreaEffectCommand instead of one HPChangeCommand per target:
+- character_ids: every target in the area
+- damage: the rolled damage BEFORE saves and resistances
+- damage_type: the damage type
+- saved: character_ids that succeeded on the saving throw
+- on_save: "half" (default) or "none" if a successful save negates the damage
+- effect_name: the spell or ability name
+The system applies half damage on saves and monster resistances/immunities/vulnerabilities itself.
+
 ## Worked Examples
 
-Narrative: "Gandalf casts Fireball using a 3rd level spell slot. The fireball explodes! Orc 1 takes 28 fire damage and dies. Orc 2 takes 28 fire damage."
+Narrative: "Gandalf casts Fireball using a 3rd level spell slot. The fireball explodes for 28 fire damage! Orc 1 and Orc 2 fail their saves, Orc 3 dodges aside and takes half."
 
 STEP 1 - Identify:
 - "Gandalf casts Fireball using a 3rd level spell slot" → NOT HP (spell casting)
-- "Orc 1 takes 28 fire damage" → HP damage ✓
-- "and dies" → NOT HP (death state, not HP change)
-- "Orc 2 takes 28 fire damage" → HP damage ✓
+- "28 fire damage" to Orc 1, Orc 2 and Orc 3 from one Fireball → area HP damage ✓
+- "Orc 3 dodges aside and takes half" → successful save ✓
 
 STEP 2 - Extract:
 [
-  {"type": "hp_change", "character_id": "orc_1", "change": -28, "damage_type": "fire"},
-  {"type": "hp_change", "character_id": "orc_2", "change": -28, "damage_type": "fire"}
+  {"type": "area_effect", "character_ids": ["orc_1", "orc_2", "orc_3"], "damage": 28,
+   "damage_type": "fire", "saved": ["orc_3"], "effect_name": "Fireball"}
 ]
 
 ---
@@ -95,7 +105,7 @@ STEP 1 - Identify:
 STEP 2 - Extract:
 [{"type": "hp_change", "character_id": "gimli", "change": 7}]
 
-Return HPAgentResult with a list of HPChangeCommand objects.
+Return HPAgentResult with a list of HPChangeCommand and AreaEffectCommand objects.
 IF NO HP changes are found, return an empty list.
 """
 
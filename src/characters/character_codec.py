@@ -0,0 +1,114 @@
+"""
+Character serialization - fast paths for loading, saving and restoring sheets.
+
+- character_from_json / character_to_json: parse and emit JSON bytes directly
+  in pydantic-core (model_validate_json / model_dump_json), skipping the
+  json module and the intermediate dict.
+- character_from_snapshot: rebuild a Character from data this process dumped
+  itself (session snapshots, the binary cache). It is validated with a
+  "trusted" context, so model validators that re-derive state
+  (apply_condition_rules) are skipped: the snapshot already reflects them.
+- CharacterBinaryCache: optional msgpack cache of validated characters keyed by
+  the source file's mtime and size. Used only when msgpack is installed.
+"""
+
+import os
+from typing import Any, Dict, Optional, Union
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency: the binary cache is disabled without it
+    msgpack = None
+
+from .charactersheet import Character
+
+TRUSTED_CONTEXT = {"trusted": True}  # Checked by Character.apply_condition_rules
+BINARY_CACHE_VERSION = 1
+
+
+def character_from_json(data: Union[bytes, str]) -> Character:
+    """Parse and validate a character sheet from raw JSON."""
+    return Character.model_validate_json(data)
+
+
+def character_to_json(character: Character, indent: Optional[int] = 2) -> bytes:
+    """Serialize a character to UTF-8 JSON bytes (indented for sheets on disk)."""
+    return character.model_dump_json(indent=indent).encode("utf-8")
+
+
+def character_from_snapshot(data: Dict[str, Any]) -> Character:
+    """
+    Rebuild a character from a dict this application dumped (trusted).
+
+    Field validation still runs (it is what builds the nested models), but
+    derived-state validators are skipped.
+    """
+    return Character.model_validate(data, context=TRUSTED_CONTEXT)
+
+
+class CharacterBinaryCache:
+    """Compact msgpack cache of validated characters, invalidated by source mtime/size."""
+
+    available = msgpack is not None
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for <character_id>.msgpack files
+
+        Raises:
+            RuntimeError: If msgpack is not installed
+        """
+        if not self.available:
+            raise RuntimeError("CharacterBinaryCache requires the optional 'msgpack' package")
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, character_id: str, source_path: str) -> Optional[Character]:
+        """
+        Get a cached character if the cache entry matches the current source file.
+
+        Returns:
+            Character, or None on a miss (no entry, stale entry, unreadable entry)
+        """
+        try:
+            stat = os.stat(source_path)
+            with open(self._path(character_id), 'rb') as f:
+                entry = msgpack.unpackb(f.read())
+        except (OSError, ValueError, msgpack.UnpackException):
+            return None
+
+        if (entry.get("version") != BINARY_CACHE_VERSION
+                or entry.get("mtime_ns") != stat.st_mtime_ns
+                or entry.get("size") != stat.st_size):
+            return None
+        return character_from_snapshot(entry["character"])
+
+    def store(self, character_id: str, source_path: str, character: Character) -> None:
+        """Cache a character as the validated form of the current source file."""
+        try:
+            stat = os.stat(source_path)
+            entry = {
+                "version": BINARY_CACHE_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "character": character.model_dump(mode="json"),
+            }
+            temp_path = f"{self._path(character_id)}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(msgpack.packb(entry))
+            os.replace(temp_path, self._path(character_id))
+        except OSError as e:
+            print(f"Warning: could not write character cache for {character_id}: {e}")
+
+    def invalidate(self, character_id: str) -> None:
+        """Drop a cached character."""
+        try:
+            os.remove(self._path(character_id))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, character_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{character_id}.msgpack")
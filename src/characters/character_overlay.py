@@ -0,0 +1,213 @@
+"""
+Copy-on-write character overlays - shared base sheets plus per-session deltas.
+
+Sessions used to copy the pregenerated sheets into a temp directory so that
+StateManager could overwrite them. Instead:
+
+- BaseSheetStore: loads each base sheet once per process (per directory) and
+  keeps its validated dump. Stores are shared by every session and never
+  written to.
+- CharacterOverlay: one per session. Holds only the sparse difference between
+  the session's copy of a character and its base sheet (HP, spell slots,
+  effects, inventory...). Reading a character materializes base + delta into
+  a fresh Character; saving one re-diffs it against the base. Characters
+  uploaded during the session become session-local base sheets of the
+  overlay, invisible to other sessions and gone with it.
+
+Deltas are nested dicts mirroring the sheet dump. Dicts are diffed key by key;
+lists and scalars are replaced whole. Keys removed from a dict are recorded as
+DELETED.
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+from .charactersheet import Character
+from .character_codec import character_from_json, character_from_snapshot
+
+DEFAULT_SHEET_DIR = "src/characters/"
+
+
+class _Deleted:
+    """Marker for a key present in the base sheet but removed in the session."""
+
+    def __repr__(self) -> str:
+        return "DELETED"
+
+
+DELETED = _Deleted()
+
+
+def diff_sheet(base: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the sparse delta that turns base into current.
+
+    Returns:
+        Nested dict of changed values (empty if the sheets are equal)
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in current.items():
+        if key not in base:
+            delta[key] = value
+            continue
+        base_value = base[key]
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            nested = diff_sheet(base_value, value)
+            if nested:
+                delta[key] = nested
+        elif value != base_value:
+            delta[key] = value
+    for key in base.keys() - current.keys():
+        delta[key] = DELETED
+    return delta
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge a delta onto a base sheet without mutating either.
+
+    Unchanged subtrees are shared with the base; validation copies them into
+    new models, so the result is safe to hand to character_from_snapshot.
+    """
+    merged = dict(base)
+    for key, value in delta.items():
+        if value is DELETED:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = apply_delta(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class BaseSheetStore:
+    """Read-only, load-once cache of the character sheets in one directory."""
+
+    def __init__(self, sheet_dir: str = DEFAULT_SHEET_DIR):
+        """
+        Initialize the store.
+
+        Args:
+            sheet_dir: Directory containing <character_id>.json sheets
+        """
+        self.sheet_dir = sheet_dir
+        self._sheets: Dict[str, Dict[str, Any]] = {}
+        self.loads = 0  # Sheets parsed from disk (one per character per process)
+
+    def get(self, character_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the validated dump of a base sheet. Callers must not mutate it.
+
+        Returns:
+            Sheet dict, or None if there is no such sheet
+        """
+        sheet = self._sheets.get(character_id)
+        if sheet is None:
+            sheet_file = os.path.join(self.sheet_dir, f"{character_id}.json")
+            if not os.path.exists(sheet_file):
+                return None
+            with open(sheet_file, 'rb') as f:
+                sheet = character_from_json(f.read()).model_dump()
+            self._sheets[character_id] = sheet
+            self.loads += 1
+        return sheet
+
+    def character_ids(self) -> List[str]:
+        """IDs of the sheets loaded so far."""
+        return list(self._sheets)
+
+    def invalidate(self, character_id: Optional[str] = None) -> None:
+        """Forget one loaded sheet (or all), e.g. after editing the files on disk."""
+        if character_id is None:
+            self._sheets.clear()
+        else:
+            self._sheets.pop(character_id, None)
+
+
+class CharacterOverlay:
+    """Per-session copy-on-write view of the characters in a BaseSheetStore."""
+
+    def __init__(self, base_store: Optional[BaseSheetStore] = None):
+        """
+        Initialize the overlay.
+
+        Args:
+            base_store: Shared base sheets (defaults to the process-wide store
+                        for src/characters/)
+        """
+        self.base_store = base_store or get_base_sheet_store()
+        self._deltas: Dict[str, Dict[str, Any]] = {}
+        self._uploads: Dict[str, Dict[str, Any]] = {}  # Session-local base sheets
+
+    def add_base(self, character_id: str, character: Character) -> None:
+        """
+        Add a session-local base sheet (e.g. an uploaded character).
+
+        It shadows any shared sheet with the same ID for this session only, and
+        any recorded delta for the ID is discarded.
+        """
+        self._uploads[character_id] = character.model_dump()
+        self._deltas.pop(character_id, None)
+
+    def uploaded_ids(self) -> List[str]:
+        """IDs of the session-local base sheets, in upload order."""
+        return list(self._uploads)
+
+    def _base(self, character_id: str) -> Optional[Dict[str, Any]]:
+        base = self._uploads.get(character_id)
+        return base if base is not None else self.base_store.get(character_id)
+
+    def materialize(self, character_id: str) -> Optional[Character]:
+        """
+        Build the session's current version of a character.
+
+        Returns:
+            A new Character (base sheet + session delta), or None if there is
+            no base sheet
+        """
+        base = self._base(character_id)
+        if base is None:
+            return None
+        delta = self._deltas.get(character_id)
+        return character_from_snapshot(apply_delta(base, delta) if delta else base)
+
+    def record(self, character_id: str, character: Character) -> bool:
+        """
+        Store the session's changes to a character as a delta against its base.
+
+        Returns:
+            False if the character has no base sheet (nothing recorded)
+        """
+        base = self._base(character_id)
+        if base is None:
+            return False
+        delta = diff_sheet(base, character.model_dump())
+        if delta:
+            self._deltas[character_id] = delta
+        else:
+            self._deltas.pop(character_id, None)
+        return True
+
+    def delta(self, character_id: str) -> Dict[str, Any]:
+        """Get the recorded delta for a character (empty if unchanged)."""
+        return self._deltas.get(character_id, {})
+
+    def reset(self, character_id: Optional[str] = None) -> None:
+        """Discard session changes to one character (or all), reverting to the base."""
+        if character_id is None:
+            self._deltas.clear()
+        else:
+            self._deltas.pop(character_id, None)
+
+
+# Process-wide base sheet stores, one per directory
+_base_sheet_stores: Dict[str, BaseSheetStore] = {}
+
+
+def get_base_sheet_store(sheet_dir: str = DEFAULT_SHEET_DIR) -> BaseSheetStore:
+    """Get or create the shared base sheet store for a directory."""
+    key = os.path.abspath(sheet_dir)
+    store = _base_sheet_stores.get(key)
+    if store is None:
+        store = _base_sheet_stores[key] = BaseSheetStore(sheet_dir)
+    return store
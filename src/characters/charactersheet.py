@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, model_validator
 from typing import List, Optional, Dict
 from .character_components import (
     DurationType, Effect, CharacterClassEntry, AbilityScores, AbilityScoreEntry,
@@ -7,6 +7,8 @@ from .character_components import (
     SpellcastingMeta, SpellSlotLevel, Spells, SpellEntry, CharacterInfo,
     FeatureEntry, ProficienciesAndLanguages
 )
+from .effect_store import EffectStore
+from .render_cache import cached_render, next_render_version
 
 
 # Skill to ability mapping for bonus calculations
@@ -62,7 +64,14 @@ class Character(BaseModel):
     languages_and_proficiencies: Optional[ProficienciesAndLanguages] = None
 
     # Runtime state - KEEP
-    active_effects: List[Effect] = Field(default_factory=list)
+    active_effects: EffectStore = Field(default_factory=EffectStore)
+
+    # Render cache version - bumped on every mutation (see render_cache.py)
+    _render_version: int = PrivateAttr(default_factory=next_render_version)
+
+    def bump_version(self) -> None:
+        """Mark the character as changed so cached sheet renders are not reused."""
+        self._render_version = next_render_version()
 
     # ==================== Backward Compatibility Properties ====================
 
@@ -85,10 +94,15 @@ class Character(BaseModel):
 
     @property
     def conditions(self) -> List[str]:
-        """Extract condition names from active effects."""
-        condition_names = [e.name for e in self.active_effects if e.effect_type == "condition"]
+        """Extract condition names from active effects (cached until effects, HP or death saves change)."""
+        hp = self.combat_stats.hit_points
+        death_saves = self.combat_stats.death_saves
+        state_key = (hp.current, hp.maximum, death_saves.successes, death_saves.failures)
+        return self.active_effects.cached_conditions(state_key, self._derived_conditions)
 
-        # Add derived conditions
+    def _derived_conditions(self) -> List[str]:
+        """Conditions computed from HP and death saves."""
+        condition_names = []
         if self.combat_stats.hit_points.is_bloodied:
             condition_names.append("Bloodied")
         if self.combat_stats.hit_points.is_unconscious:
@@ -97,7 +111,6 @@ class Character(BaseModel):
             condition_names.append("Dead")
         elif self.combat_stats.death_saves.is_stable:
             condition_names.append("Stable")
-
         return condition_names
 
     @property
@@ -134,24 +147,29 @@ class Character(BaseModel):
 
     def add_effect(self, effect: Effect):
         """Add a new effect to the character."""
-        self.active_effects.append(effect)
+        self.active_effects.add(effect)
+        self.bump_version()
 
     def remove_effect(self, effect_name: str):
         """Remove effect by name."""
-        self.active_effects = [e for e in self.active_effects if e.name != effect_name]
+        self.active_effects.remove(effect_name)
+        self.bump_version()
 
     def tick_effects(self, duration_type: DurationType = DurationType.ROUNDS):
         """
         Progress all effects of a certain duration type.
         Removes expired effects automatically.
         """
-        self.active_effects = [
-            e for e in self.active_effects
-            if e.duration_type != duration_type or e.tick()
-        ]
+        self.active_effects.remove_where(
+            lambda e: e.duration_type == duration_type and not e.tick()
+        )
+        self.bump_version()
 
     def has_condition(self, condition_name: str) -> bool:
         """Check if character has a specific condition (applied or derived)."""
+        effect = self.active_effects.get(condition_name)
+        if effect is not None and effect.effect_type == "condition":
+            return True
         return condition_name in self.conditions
 
     # ==================== Ability & Skill Methods ====================
@@ -190,6 +208,7 @@ class Character(BaseModel):
         if damage <= 0:
             return {"temp_absorbed": 0, "actual_damage": 0}
 
+        self.bump_version()
         hp = self.combat_stats.hit_points
 
         # Apply to temp HP first
@@ -212,6 +231,7 @@ class Character(BaseModel):
         if amount > 0:
             hp = self.combat_stats.hit_points
             hp.current = min(hp.maximum, hp.current + amount)
+            self.bump_version()
 
     def add_temporary_hp(self, amount: int):
         """
@@ -219,6 +239,7 @@ class Character(BaseModel):
         """
         hp = self.combat_stats.hit_points
         hp.temporary = max(hp.temporary, amount)
+        self.bump_version()
 
     # ==================== Rest Management ====================
 
@@ -227,6 +248,7 @@ class Character(BaseModel):
         Take a short rest. Optionally spend hit dice to heal.
         Returns HP healed.
         """
+        self.bump_version()
         hp_healed = 0
         hit_dice = self.combat_stats.hit_dice
 
@@ -252,6 +274,7 @@ class Character(BaseModel):
         """
         Take a long rest. Restore HP, half of hit dice, and spell slots.
         """
+        self.bump_version()
         hp = self.combat_stats.hit_points
         hit_dice = self.combat_stats.hit_dice
         death_saves = self.combat_stats.death_saves
@@ -512,6 +535,7 @@ Prepared Spells: {prepared_count}"""
                 lines.append(f"  Notes: {attack.notes}")
         return "\n".join(lines)
 
+    @cached_render("features_detailed")
     def get_features_detailed(self) -> str:
         """Detailed features and traits with full descriptions for DM reference."""
         if not self.features_and_traits:
@@ -529,6 +553,7 @@ Prepared Spells: {prepared_count}"""
                     lines.append(f"  {desc_line}")
         return "\n".join(lines)
 
+    @cached_render("spells_detailed")
     def get_spells_detailed(self) -> str:
         """Detailed spell list with casting time, range, components, duration, and description."""
         if not self.spells:
@@ -605,6 +630,7 @@ Prepared Spells: {prepared_count}"""
 
         return "\n".join(lines) if len(lines) > 1 else "No equipment"
 
+    @cached_render("full_sheet_detailed")
     def get_full_sheet_detailed(self) -> str:
         """Complete character sheet with full descriptions for DM reference."""
         sections = [
@@ -640,6 +666,7 @@ Prepared Spells: {prepared_count}"""
 
         return "\n\n".join(sections)
 
+    @cached_render("full_sheet")
     def get_full_sheet(self) -> str:
         """Complete character sheet."""
         sections = [
@@ -678,12 +705,14 @@ Prepared Spells: {prepared_count}"""
     # ==================== Validator for Automatic Condition Interactions ====================
 
     @model_validator(mode='after')
-    def apply_condition_rules(self):
+    def apply_condition_rules(self, info: ValidationInfo):
         """Handle automatic condition interactions per D&D rules."""
+        if info.context and info.context.get("trusted"):
+            return self  # Trusted snapshot (character_codec): already applied before it was dumped
+
         # If unconscious, automatically apply prone (if not already present)
         if self.is_unconscious:
-            prone_effect = next((e for e in self.active_effects if e.name == "Prone"), None)
-            if not prone_effect:
+            if not self.active_effects.has("Prone"):
                 self.add_effect(Effect(
                     name="Prone",
                     effect_type="condition",
@@ -694,12 +723,8 @@ Prepared Spells: {prepared_count}"""
 
         # Remove prone if character is no longer unconscious and prone was auto-applied
         if not self.is_unconscious:
-            auto_prone = next(
-                (e for e in self.active_effects
-                 if e.name == "Prone" and e.source == "Unconscious (automatic)"),
-                None
-            )
-            if auto_prone:
+            prone = self.active_effects.get("Prone")
+            if prone is not None and prone.source == "Unconscious (automatic)":
                 self.remove_effect("Prone")
 
         return self
@@ -0,0 +1,184 @@
+"""
+Indexed container for the active effects of a Character or Monster.
+
+Effects are looked up by name (condition/effect commands), filtered by type
+(conditions list) and removed by name far more often than they are iterated.
+EffectStore keeps insertion order like the list it replaces, plus a name index
+and a type index, so membership, lookup and removal are O(1) in the number of
+effects.
+
+It validates from and serializes to a plain list of Effect, so saved character
+JSON, snapshots and model_dump() output are unchanged.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .character_components import Effect
+
+
+class EffectStore:
+    """Ordered effects indexed by name and by effect_type."""
+
+    def __init__(self, effects: Optional[List[Effect]] = None):
+        self._effects: Dict[int, Effect] = {}  # Slot -> effect, in insertion order
+        self._by_name: Dict[str, Dict[int, None]] = {}  # Lowercased name -> slots
+        self._by_type: Dict[str, Dict[int, None]] = {}  # effect_type -> slots
+        self._next_slot = 0
+        self._revision = 0
+        self._view: Optional[List[Effect]] = None
+        self._conditions: Optional[Tuple[Hashable, List[str]]] = None
+        for effect in effects or []:
+            self.add(effect)
+
+    # ==================== Mutation ====================
+
+    def add(self, effect: Effect) -> None:
+        """Append an effect."""
+        slot = self._next_slot
+        self._next_slot += 1
+        self._effects[slot] = effect
+        self._by_name.setdefault(effect.name.lower(), {})[slot] = None
+        self._by_type.setdefault(effect.effect_type, {})[slot] = None
+        self._changed()
+
+    def remove(self, name: str, case_sensitive: bool = True) -> List[Effect]:
+        """
+        Remove every effect with the given name.
+
+        Args:
+            name: Effect name
+            case_sensitive: If False, "prone" also removes "Prone"
+
+        Returns:
+            The removed effects (empty if none matched)
+        """
+        removed = list(self._matches(name, case_sensitive))
+        for slot, effect in removed:
+            self._discard(slot, effect)
+        if removed:
+            self._changed()
+        return [effect for _, effect in removed]
+
+    def remove_where(self, predicate: Callable[[Effect], bool]) -> List[Effect]:
+        """Remove every effect matching a predicate (used for expiry)."""
+        removed = [(slot, effect) for slot, effect in self._effects.items() if predicate(effect)]
+        for slot, effect in removed:
+            self._discard(slot, effect)
+        if removed:
+            self._changed()
+        return [effect for _, effect in removed]
+
+    def clear(self) -> None:
+        """Remove all effects."""
+        self._effects.clear()
+        self._by_name.clear()
+        self._by_type.clear()
+        self._changed()
+
+    # ==================== Lookup ====================
+
+    def get(self, name: str, case_sensitive: bool = True) -> Optional[Effect]:
+        """Get the first effect with the given name, or None."""
+        return next((effect for _, effect in self._matches(name, case_sensitive)), None)
+
+    def has(self, name: str, case_sensitive: bool = True) -> bool:
+        """Check whether an effect with the given name is active."""
+        return self.get(name, case_sensitive) is not None
+
+    def of_type(self, effect_type: str) -> List[Effect]:
+        """Get the effects of one effect_type (e.g., "condition"), in order."""
+        return [self._effects[slot] for slot in self._by_type.get(effect_type, ())]
+
+    def names(self) -> List[str]:
+        """Get the names of all effects, in order."""
+        return [effect.name for effect in self._effects.values()]
+
+    def cached_conditions(self, state_key: Hashable, derive: Callable[[], List[str]]) -> List[str]:
+        """
+        Get condition names, reusing the last result while nothing changed.
+
+        Args:
+            state_key: The owner's HP/death-save state the derived conditions depend on
+            derive: Returns derived condition names (Bloodied, Unconscious, ...)
+
+        Returns:
+            Applied condition names followed by derived ones. Callers must not
+            mutate the returned list.
+        """
+        key = (self._revision, state_key)
+        if self._conditions is None or self._conditions[0] != key:
+            names = [effect.name for effect in self.of_type("condition")]
+            self._conditions = (key, names + derive())
+        return self._conditions[1]
+
+    # ==================== Sequence protocol ====================
+
+    def __iter__(self) -> Iterator[Effect]:
+        return iter(list(self._effects.values()))
+
+    def __len__(self) -> int:
+        return len(self._effects)
+
+    def __bool__(self) -> bool:
+        return bool(self._effects)
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return self.has(item)
+        return any(effect == item for effect in self._effects.values())
+
+    def __getitem__(self, index):
+        if self._view is None:
+            self._view = list(self._effects.values())
+        return self._view[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EffectStore):
+            return list(self._effects.values()) == list(other._effects.values())
+        if isinstance(other, list):
+            return list(self._effects.values()) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EffectStore({list(self._effects.values())!r})"
+
+    # ==================== Pydantic integration ====================
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        list_schema = handler.generate_schema(List[Effect])
+        from_list = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            python_schema=core_schema.union_schema([
+                core_schema.is_instance_schema(cls),
+                from_list,
+            ]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda store: list(store._effects.values()),
+                return_schema=list_schema,
+            ),
+        )
+
+    # ==================== Internals ====================
+
+    def _matches(self, name: str, case_sensitive: bool) -> Iterator[Tuple[int, Effect]]:
+        for slot in self._by_name.get(name.lower(), ()):
+            effect = self._effects[slot]
+            if not case_sensitive or effect.name == name:
+                yield slot, effect
+
+    def _discard(self, slot: int, effect: Effect) -> None:
+        del self._effects[slot]
+        for index, key in ((self._by_name, effect.name.lower()), (self._by_type, effect.effect_type)):
+            slots = index[key]
+            del slots[slot]
+            if not slots:
+                del index[key]
+
+    def _changed(self) -> None:
+        self._revision += 1
+        self._view = None
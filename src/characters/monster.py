@@ -5,7 +5,7 @@ Implements the same combat interface as Character for duck typing compatibility
 with StateCommandExecutor, while using monster-specific components for statblock data.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional, Dict
 
 from .character_components import AbilityScores, Effect
@@ -14,6 +14,8 @@ from .monster_components import (
     ChallengeRating, DamageModifiers, MonsterAction, MonsterReaction,
     MonsterSpecialTrait, LegendaryActions, MythicActions
 )
+from .effect_store import EffectStore
+from .render_cache import cached_render, next_render_version
 
 
 class Monster(BaseModel):
@@ -54,9 +56,16 @@ class Monster(BaseModel):
     mythic_actions: Optional[MythicActions] = None
 
     # Runtime state (same interface as Character for duck typing)
-    active_effects: List[Effect] = Field(default_factory=list)
+    active_effects: EffectStore = Field(default_factory=EffectStore)
     legendary_actions_remaining: int = 0
 
+    # Render cache version - bumped on every mutation (see render_cache.py)
+    _render_version: int = PrivateAttr(default_factory=next_render_version)
+
+    def bump_version(self) -> None:
+        """Mark the monster as changed so cached statblock renders are not reused."""
+        self._render_version = next_render_version()
+
     # ==================== Combat Methods (Duck Typing Interface) ====================
 
     def take_damage(self, damage: int) -> Dict[str, int]:
@@ -72,6 +81,7 @@ class Monster(BaseModel):
             - actual_damage: Actual HP lost (for StateCommandExecutor compatibility)
             - current_hp: Current HP after damage
         """
+        self.bump_version()
         temp_absorbed = min(damage, self.hit_points.temporary)
         self.hit_points.temporary -= temp_absorbed
         remaining = damage - temp_absorbed
@@ -92,6 +102,7 @@ class Monster(BaseModel):
         Returns:
             Actual amount healed (may be less if near max HP)
         """
+        self.bump_version()
         old_hp = self.hit_points.current
         self.hit_points.current = min(self.hit_points.maximum, self.hit_points.current + amount)
         return self.hit_points.current - old_hp
@@ -104,6 +115,7 @@ class Monster(BaseModel):
             amount: Temporary HP to add
         """
         self.hit_points.temporary = max(self.hit_points.temporary, amount)
+        self.bump_version()
 
     # ==================== Effect Methods (Duck Typing Interface) ====================
 
@@ -114,8 +126,9 @@ class Monster(BaseModel):
         Args:
             effect: Effect to add
         """
-        self.remove_effect(effect.name)
-        self.active_effects.append(effect)
+        self.active_effects.remove(effect.name, case_sensitive=False)
+        self.active_effects.add(effect)
+        self.bump_version()
 
     def remove_effect(self, effect_name: str) -> bool:
         """
@@ -127,10 +140,9 @@ class Monster(BaseModel):
         Returns:
             True if effect was found and removed, False otherwise
         """
-        for i, e in enumerate(self.active_effects):
-            if e.name.lower() == effect_name.lower():
-                self.active_effects.pop(i)
-                return True
+        if self.active_effects.remove(effect_name, case_sensitive=False):
+            self.bump_version()
+            return True
         return False
 
     def has_condition(self, condition_name: str) -> bool:
@@ -143,7 +155,10 @@ class Monster(BaseModel):
         Returns:
             True if monster has the condition
         """
-        return condition_name.lower() in [c.lower() for c in self.conditions]
+        effect = self.active_effects.get(condition_name, case_sensitive=False)
+        if effect is not None and effect.effect_type == "condition":
+            return True
+        return condition_name.lower() in [c.lower() for c in self._derived_conditions()]
 
     @property
     def conditions(self) -> List[str]:
@@ -151,10 +166,14 @@ class Monster(BaseModel):
         Get list of active condition names.
 
         Includes both explicit conditions from active_effects and
-        derived conditions (Bloodied, Unconscious).
+        derived conditions (Bloodied, Unconscious). Cached until effects or HP change.
         """
-        conditions = [e.name for e in self.active_effects if e.effect_type == "condition"]
-        # Add derived conditions
+        state_key = (self.hit_points.current, self.hit_points.maximum)
+        return self.active_effects.cached_conditions(state_key, self._derived_conditions)
+
+    def _derived_conditions(self) -> List[str]:
+        """Conditions computed from HP."""
+        conditions = []
         if self.hit_points.is_bloodied:
             conditions.append("Bloodied")
         if self.hit_points.is_unconscious:
@@ -185,6 +204,7 @@ class Monster(BaseModel):
         """
         if self.legendary_actions_remaining >= cost:
             self.legendary_actions_remaining -= cost
+            self.bump_version()
             return True
         return False
 
@@ -192,6 +212,7 @@ class Monster(BaseModel):
         """Reset legendary actions to full at start of monster's turn."""
         if self.legendary_actions:
             self.legendary_actions_remaining = self.legendary_actions.uses
+            self.bump_version()
 
     # ==================== Summary Methods ====================
 
@@ -214,6 +235,7 @@ class Monster(BaseModel):
             lines.append(f"Legendary Actions: {self.legendary_actions_remaining}/{self.legendary_actions.uses}")
         return "\n".join(lines)
 
+    @cached_render("full_statblock")
     def get_full_statblock(self) -> str:
         """
         Full monster statblock in standard format.
@@ -329,6 +351,7 @@ class Monster(BaseModel):
 
         return "\n".join(lines)
 
+    @cached_render("actions_detailed")
     def get_actions_detailed(self) -> str:
         """
         Detailed action descriptions for DM reference.
@@ -357,6 +380,7 @@ class Monster(BaseModel):
 
         return "\n".join(lines)
 
+    @cached_render("traits_detailed")
     def get_traits_detailed(self) -> str:
         """
         Detailed special trait descriptions.
@@ -17,6 +17,7 @@ class MonsterMeta(BaseModel):
     size: str  # "Tiny", "Small", "Medium", "Large", "Huge", "Gargantuan"
     type: str  # "humanoid", "dragon", "undead", "fiend", etc.
     alignment: str  # "chaotic evil", "lawful good", "unaligned", etc.
+    environment: List[str] = Field(default_factory=list)  # "forest", "underdark", etc.
 
 
 # === Combat Stats ===
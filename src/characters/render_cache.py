@@ -0,0 +1,94 @@
+"""
+Memoized text rendering for character sheets and monster statblocks.
+
+Sheet rendering is a pure function of an entity's state, but it is requested
+on every DM call (active character context) and by several DM tools. Entities
+carry a render version that every mutation bumps; rendered sections are cached
+by (character_id, version, section) so an unchanged sheet is never reformatted.
+
+Versions come from one process-wide counter, so two copies of the same
+character (e.g., "fighter" in two Discord sessions) never share a cache key.
+"""
+
+import functools
+import itertools
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_version_counter = itertools.count(1)
+
+
+def next_render_version() -> int:
+    """Allocate a render version no other entity has used."""
+    return next(_version_counter)
+
+
+class RenderCache:
+    """Bounded LRU cache of rendered entity sections."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int, str], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, entity_id: str, version: int, section: str, render: Callable[[], str]) -> str:
+        """
+        Get a rendered section, rendering and caching it on a miss.
+
+        Args:
+            entity_id: Character or monster ID
+            version: Entity render version (changes on every mutation)
+            section: Name of the rendered section
+            render: Zero-argument function producing the text
+        """
+        key = (entity_id, version, section)
+        text = self._entries.get(key)
+        if text is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return text
+
+        self.misses += 1
+        text = render()
+        self._entries[key] = text
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # Stale versions age out first
+        return text
+
+    def clear(self) -> None:
+        """Drop all cached renders."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached_render(section: str):
+    """
+    Decorator for zero-argument render methods of Character/Monster.
+
+    The entity must expose character_id and a _render_version private attribute.
+    """
+    def decorator(method: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(method)
+        def wrapper(self) -> str:
+            return get_render_cache().get_or_render(
+                self.character_id, self._render_version, section, lambda: method(self)
+            )
+        return wrapper
+    return decorator
+
+
+# Global render cache instance
+_render_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """Get or create the global render cache instance."""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache()
+    return _render_cache
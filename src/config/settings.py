@@ -46,6 +46,17 @@ class Settings(BaseSettings):
     dm_enable_memory: bool = True
     dm_enable_summarization: bool = True
 
+    # Session Hibernation (idle sessions are serialized to disk and restored on demand)
+    session_idle_timeout_seconds: float = 1800.0
+    max_resident_sessions: int = 50
+    session_hibernation_dir: str = "data/hibernated_sessions"
+
+    # Multi-process mode (gateway + N workers, sessions partitioned by channel); 1 = single process
+    discord_workers: int = 1
+
+    # Turn Checkpointing (live sessions are checkpointed to the database after each DM cycle)
+    turn_checkpointing_enabled: bool = True
+
     def get_encryption_key(self) -> Optional[bytes]:
         """Get encryption key as bytes, or None if not configured."""
         if not self.encryption_key:
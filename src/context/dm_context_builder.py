@@ -222,7 +222,7 @@ class DMContextBuilder:
             lines.append(f"\n  {entry_type.upper()}S:")
             for rule in rules:
                 name = rule.get("name", "Unknown")
-                summary = rule.get("summary", rule.get("description", "")[:100])
+                summary = rule.get("summary") or rule.get("description", "")[:100]
                 lines.append(f"    - {name}: {summary}")
 
         return "\n".join(lines)
@@ -0,0 +1,255 @@
+"""
+Batched, concurrent and resumable embedding of rule documents.
+
+Building the rules table used to embed one document per API call in a serial
+loop and only wrote anything once every document was embedded. This module:
+
+- Sends up to batch_size documents per embed_content call and keeps up to
+  `concurrency` calls in flight, paced by a token-bucket rate limiter so the
+  tier's requests-per-minute quota is never exceeded.
+- Retries failed calls with exponential backoff. A batch that keeps failing is
+  reported and skipped; everything else still completes.
+- Checkpoints every finished batch to a sidecar directory of Parquet parts
+  keyed by content hash, so a rerun (after a crash, Ctrl-C or quota error)
+  only embeds what is missing. Unchanged documents are never re-embedded.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 100  # Documents per embed_content request accepted by the Gemini API
+FREE_TIER_REQUESTS_PER_MINUTE = 15
+PAID_TIER_REQUESTS_PER_MINUTE = 1500
+
+EmbedBatchFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+def content_hash(text: str) -> str:
+    """Stable key for a document's embedding."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TokenBucket:
+    """Async token bucket: `rate_per_minute` tokens refill continuously up to `capacity`."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate_per_second)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available and take them."""
+        async with self._lock:  # FIFO: waiters are served in order
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_second)
+
+
+class EmbeddingCheckpoint:
+    """
+    Sidecar store of embeddings keyed by content hash.
+
+    Each flushed batch is written as its own Parquet part (temp file + rename),
+    so a crash can lose at most the batch being written.
+    """
+
+    SCHEMA = pa.schema([("content_hash", pa.string()), ("vector", pa.list_(pa.float32()))])
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._vectors: Optional[Dict[str, List[float]]] = None
+
+    def load(self) -> Dict[str, List[float]]:
+        """Read every checkpointed embedding (content hash -> vector)."""
+        if self._vectors is None:
+            self._vectors = {}
+            for part in sorted(self.directory.glob("*.parquet")):
+                try:
+                    table = pq.read_table(part)
+                except Exception as e:  # Truncated part from a crash mid-write
+                    logger.warning(f"Skipping unreadable embedding checkpoint {part}: {e}")
+                    continue
+                self._vectors.update(zip(
+                    table.column("content_hash").to_pylist(),
+                    table.column("vector").to_pylist()
+                ))
+        return self._vectors
+
+    def add(self, vectors: Dict[str, List[float]]) -> None:
+        """Persist a batch of embeddings."""
+        if not vectors:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        table = pa.table(
+            {"content_hash": list(vectors), "vector": list(vectors.values())},
+            schema=self.SCHEMA
+        )
+        part = self.directory / f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+        temp = part.with_suffix(".tmp")
+        pq.write_table(table, temp)
+        os.replace(temp, part)
+        self.load().update(vectors)
+
+    def compact(self) -> None:
+        """Merge all parts into one file (e.g. after a completed build)."""
+        vectors = self.load()
+        parts = sorted(self.directory.glob("*.parquet"))
+        if len(parts) <= 1:
+            return
+        self.add(dict(vectors))  # Written before the old parts go, so a crash loses nothing
+        for part in parts:
+            part.unlink()
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+
+@dataclass
+class EmbeddingStats:
+    """Outcome and throughput of one pipeline run."""
+    documents: int = 0  # Unique documents requested
+    cached: int = 0  # Served from the checkpoint
+    embedded: int = 0  # Embedded by the API in this run
+    failed: int = 0  # Documents whose batch failed after all retries
+    requests: int = 0  # API calls made, including retries
+    retries: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.embedded / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "documents": self.documents,
+            "cached": self.cached,
+            "embedded": self.embedded,
+            "failed": self.failed,
+            "requests": self.requests,
+            "retries": self.retries,
+            "seconds": round(self.seconds, 2),
+            "documents_per_second": round(self.documents_per_second, 2),
+        }
+
+
+class EmbeddingPipeline:
+    """Embeds documents in rate-limited concurrent batches with a resumable checkpoint."""
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFn,
+        checkpoint: Optional[EmbeddingCheckpoint] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        concurrency: int = 4,
+        requests_per_minute: float = FREE_TIER_REQUESTS_PER_MINUTE,
+        max_retries: int = 5,
+        backoff_seconds: float = 2.0,
+        progress: Optional[Callable[[EmbeddingStats], None]] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            embed_batch: Async function embedding a list of texts (one vector per text)
+            checkpoint: Sidecar store for resumable runs (None: nothing is persisted)
+            batch_size: Documents per request (at most MAX_BATCH_SIZE)
+            concurrency: Requests in flight at once
+            requests_per_minute: Request quota enforced by the token bucket
+            max_retries: Retries per batch before it is reported as failed
+            backoff_seconds: Base delay of the exponential backoff
+            progress: Optional callback after every finished batch
+        """
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.embed_batch = embed_batch
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = TokenBucket(requests_per_minute)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.progress = progress
+
+    async def run(self, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Embed texts, reusing checkpointed embeddings.
+
+        Returns:
+            content hash -> vector for every text that has an embedding
+            (texts of failed batches are missing; see self.stats)
+        """
+        self.stats = stats = EmbeddingStats()
+        start = time.perf_counter()
+
+        unique = {content_hash(text): text for text in texts}
+        stats.documents = len(unique)
+        vectors: Dict[str, List[float]] = {}
+        if self.checkpoint is not None:
+            cached = self.checkpoint.load()
+            vectors.update({key: cached[key] for key in unique if key in cached})
+        stats.cached = len(vectors)
+
+        pending = [(key, text) for key, text in unique.items() if key not in vectors]
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def worker(batch):
+            async with semaphore:
+                embedded = await self._embed_with_retries(batch)
+            if embedded is None:
+                stats.failed += len(batch)
+            else:
+                vectors.update(embedded)
+                stats.embedded += len(embedded)
+                if self.checkpoint is not None:
+                    self.checkpoint.add(embedded)
+            stats.seconds = time.perf_counter() - start
+            if self.progress:
+                self.progress(stats)
+
+        await asyncio.gather(*(worker(batch) for batch in batches))
+        stats.seconds = time.perf_counter() - start
+        return vectors
+
+    async def _embed_with_retries(self, batch: Sequence[tuple]) -> Optional[Dict[str, List[float]]]:
+        texts = [text for _, text in batch]
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            self.stats.requests += 1
+            try:
+                embeddings = await self.embed_batch(texts)
+                if len(embeddings) != len(texts):
+                    raise ValueError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+                return {key: list(vector) for (key, _), vector in zip(batch, embeddings)}
+            except Exception as e:
+                if attempt == self.max_retries:
+                    message = f"Embedding batch of {len(texts)} failed after {attempt + 1} attempts: {e}"
+                    logger.error(message)
+                    self.stats.errors.append(message)
+                    return None
+                self.stats.retries += 1
+                delay = self.backoff_seconds * 2 ** attempt * (0.5 + random.random())
+                logger.warning(f"Embedding batch failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        return None
@@ -0,0 +1,221 @@
+"""
+Query embedding providers for LanceRulesService.
+
+The rules table carries one vector column per provider:
+
+- GeminiEmbeddingProvider ("vector"): gemini-embedding-001 via the API. Best
+  semantic quality, but every query is a network call (100-300 ms) and search
+  fails offline.
+- HashedNgramEmbeddingProvider ("local_vector"): a TF-IDF weighted bag of
+  words, word bigrams and character n-grams, hashed straight into a fixed
+  number of signed dimensions (a random projection that needs no matrix).
+  Runs on the CPU in well under a millisecond per query, needs no network or
+  model download, and tolerates typos through the character n-grams. The IDF
+  weights are fitted on the corpus at build time and saved next to the table.
+"""
+
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from google.genai import types
+
+from .embedding_pipeline import MAX_BATCH_SIZE
+
+GEMINI_VECTOR_COLUMN = "vector"
+GEMINI_DIMS = 768
+LOCAL_VECTOR_COLUMN = "local_vector"
+LOCAL_DIMS = 1024  # Fewer dimensions means more hash collisions: 512 cost ~20% MRR
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+class EmbeddingProvider(ABC):
+    """Embeds search queries into one of the rules table's vector columns."""
+
+    name: str
+    vector_column: str
+    dimensions: int
+
+    @abstractmethod
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query."""
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed several search queries, in order."""
+        return [self.embed_query(text) for text in texts]
+
+
+class GeminiEmbeddingProvider(EmbeddingProvider):
+    """Query embeddings from gemini-embedding-001 (the build-time "vector" column)."""
+
+    name = "gemini"
+    vector_column = GEMINI_VECTOR_COLUMN
+    dimensions = GEMINI_DIMS
+
+    def __init__(self, get_client: Callable, model: str = "gemini-embedding-001"):
+        """
+        Initialize the provider.
+
+        Args:
+            get_client: Returns a genai.Client (created lazily by the service)
+            model: Embedding model name
+        """
+        self.get_client = get_client
+        self.model = model
+
+    def embed_query(self, text: str) -> List[float]:
+        result = self.get_client().models.embed_content(
+            model=self.model,
+            contents=[text],
+            config=types.EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT")
+        )
+        return result.embeddings[0].values
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed several queries with one request per MAX_BATCH_SIZE texts."""
+        embeddings = []
+        for i in range(0, len(texts), MAX_BATCH_SIZE):
+            result = self.get_client().models.embed_content(
+                model=self.model,
+                contents=texts[i:i + MAX_BATCH_SIZE],
+                config=types.EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT")
+            )
+            embeddings.extend(embedding.values for embedding in result.embeddings)
+        return embeddings
+
+
+class HashedNgramEmbeddingProvider(EmbeddingProvider):
+    """
+    Offline TF-IDF embeddings projected by feature hashing.
+
+    Every feature (word, word bigram, character 3-5-gram of a word) is hashed
+    with CRC32 - stable across processes, unlike hash() - to an IDF bucket,
+    a dimension and a sign. A text's vector is the signed sum of
+    (1 + log tf) * idf over its features, L2-normalized, so L2 distance ranks
+    like cosine similarity. Each word's character n-grams share the weight of
+    one feature, which keeps whole-word matches dominant.
+    """
+
+    name = "local"
+    vector_column = LOCAL_VECTOR_COLUMN
+
+    NGRAM_SIZES = (3, 4, 5)
+    IDF_BUCKETS = 1 << 18
+
+    def __init__(self, state_path: Optional[str] = None, dimensions: int = LOCAL_DIMS):
+        """
+        Initialize the provider.
+
+        Args:
+            state_path: .npy file holding the fitted IDF weights (loaded lazily)
+            dimensions: Output dimensions
+        """
+        self.state_path = Path(state_path) if state_path else None
+        self.dimensions = dimensions
+        self._idf: Optional[np.ndarray] = None
+        self._features = lru_cache(maxsize=200_000)(self._compute_features)
+
+    @property
+    def is_fitted(self) -> bool:
+        if self._idf is None and self.state_path is not None and self.state_path.exists():
+            self.load()
+        return self._idf is not None
+
+    def fit(self, texts: Iterable[str]) -> "HashedNgramEmbeddingProvider":
+        """Fit the IDF weights on a corpus (smoothed: log((1 + n) / (1 + df)) + 1)."""
+        document_frequency = np.zeros(self.IDF_BUCKETS, dtype=np.float64)
+        num_documents = 0
+        for text in texts:
+            words = set(_tokenize(text))
+            buckets = [self._features(word)[0] for word in words]
+            buckets.extend(self._features(bigram)[0][:1] for bigram in set(_bigrams(_tokenize(text))))
+            if buckets:
+                document_frequency[np.unique(np.concatenate(buckets))] += 1
+            num_documents += 1
+        self._idf = (np.log((1 + num_documents) / (1 + document_frequency)) + 1).astype(np.float32)
+        return self
+
+    def save(self) -> None:
+        """Write the fitted IDF weights to state_path."""
+        if self._idf is None or self.state_path is None:
+            raise ValueError("Nothing to save: fit() the provider and give it a state_path")
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(self.state_path, self._idf)
+
+    def load(self) -> None:
+        """Read the IDF weights from state_path."""
+        idf = np.load(self.state_path)
+        if idf.shape != (self.IDF_BUCKETS,):
+            raise ValueError(f"Unexpected IDF state shape {idf.shape} in {self.state_path}")
+        self._idf = idf
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed(text).tolist()
+
+    def embed_documents(self, texts: Iterable[str]) -> List[List[float]]:
+        """Embed documents for the local_vector column."""
+        return [self.embed(text).tolist() for text in texts]
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a text as a normalized float32 vector."""
+        if not self.is_fitted:
+            raise ValueError(
+                "Local embedding weights not found. Build the rules table first "
+                f"(expected {self.state_path})"
+            )
+        words = _tokenize(text)
+        counts = Counter(words)
+        counts.update(_bigrams(words))
+
+        buckets, dims, weights = [], [], []
+        for feature, count in counts.items():
+            feature_buckets, feature_dims, feature_weights = self._features(feature)
+            buckets.append(feature_buckets)
+            dims.append(feature_dims)
+            weights.append(feature_weights * (1.0 + math.log(count)))
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        if buckets:
+            buckets = np.concatenate(buckets)
+            np.add.at(vector, np.concatenate(dims), np.concatenate(weights) * self._idf[buckets])
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector /= norm
+        return vector
+
+    def _compute_features(self, feature: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hash a word (or bigram) and its character n-grams to (buckets, dims, signed weights)."""
+        hashes = [zlib.crc32(feature.encode("utf-8"))]
+        ngram_weight = 1.0
+        if " " not in feature:  # Bigrams match as a whole only
+            padded = f"<{feature}>"
+            ngrams = [
+                padded[i:i + size]
+                for size in self.NGRAM_SIZES
+                for i in range(len(padded) - size + 1)
+            ]
+            hashes.extend(zlib.crc32(ngram.encode("utf-8")) ^ 0x5BD1E995 for ngram in ngrams)
+            ngram_weight = 1.0 / max(1, len(ngrams))
+
+        hashes = np.array(hashes, dtype=np.uint64)
+        buckets = (hashes % self.IDF_BUCKETS).astype(np.int64)
+        dims = ((hashes >> 18) % self.dimensions).astype(np.int64)
+        signs = np.where(hashes & (1 << 31), -1.0, 1.0).astype(np.float32)
+        weights = np.full(len(hashes), ngram_weight, dtype=np.float32)
+        weights[0] = 1.0
+        return buckets, dims, signs * weights
+
+
+def _tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _bigrams(words: List[str]) -> List[str]:
+    return [f"{a} {b}" for a, b in zip(words, words[1:])]
@@ -13,6 +13,7 @@ class LanceConfig:
     table_name: str = "rules"
     embedding_model: str = "gemini-embedding-001"
     vector_dims: int = 768
+    embedding_provider: str = "gemini"  # Query embeddings: "gemini" or "local" (offline)
 
     @classmethod
     def from_env(cls) -> "LanceConfig":
@@ -22,13 +23,15 @@ class LanceConfig:
         Environment variables:
             LANCE_DB_PATH: Path to LanceDB database (default: src/db/lancedb)
             LANCE_TABLE_NAME: Name of the table (default: rules)
+            LANCE_EMBEDDING_PROVIDER: Query embedding provider (default: gemini)
 
         Returns:
             LanceConfig instance
         """
         return cls(
             db_path=Path(os.getenv("LANCE_DB_PATH", "src/db/lancedb")),
-            table_name=os.getenv("LANCE_TABLE_NAME", "rules")
+            table_name=os.getenv("LANCE_TABLE_NAME", "rules"),
+            embedding_provider=os.getenv("LANCE_EMBEDDING_PROVIDER", "gemini")
         )
 
     def validate(self) -> bool:
@@ -50,4 +53,10 @@ class LanceConfig:
         if not self.table_name:
             raise ValueError("table_name cannot be empty")
 
+        if self.embedding_provider not in ("gemini", "local"):
+            raise ValueError(
+                f"Invalid embedding_provider: {self.embedding_provider}. "
+                "Use 'gemini' or 'local'."
+            )
+
         return True
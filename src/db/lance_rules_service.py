@@ -10,20 +10,66 @@ This service provides:
 Replaces both Qdrant vector database and filesystem-based reference lookups.
 """
 
+import asyncio
 import json
 import logging
 import os
+import time
 import dotenv
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 dotenv.load_dotenv()
 
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import lancedb
 from google import genai
 from google.genai import types
 from lancedb.pydantic import LanceModel, Vector
 
+from .embedding_providers import (
+    GEMINI_DIMS,
+    GEMINI_VECTOR_COLUMN,
+    LOCAL_DIMS,
+    LOCAL_VECTOR_COLUMN,
+    EmbeddingProvider,
+    GeminiEmbeddingProvider,
+    HashedNgramEmbeddingProvider,
+)
+from .reference_closure import (
+    CLOSURE_DEPTH,
+    build_reference_closures,
+    render_references_block,
+    validate_reference_closures,
+)
+from .rule_summary import summarize_rule
+from .rules_name_index import RulesNameIndex
+from .semantic_cache import SemanticResultCache, get_semantic_result_cache
+from .embedding_pipeline import (
+    FREE_TIER_REQUESTS_PER_MINUTE,
+    MAX_BATCH_SIZE,
+    PAID_TIER_REQUESTS_PER_MINUTE,
+    EmbeddingCheckpoint,
+    EmbeddingPipeline,
+    content_hash,
+)
+
+
+DEFAULT_EMBEDDING_CACHE_DIR = "src/db/embedding_cache"
+
+# ANN index. Below VECTOR_INDEX_MIN_ROWS a brute-force scan is exact and still
+# fast, and IVF_PQ needs a few hundred rows per partition to train well.
+VECTOR_INDEX_MIN_ROWS = 2048
+VECTOR_INDEX_TYPE = "IVF_PQ"
+VECTOR_INDEX_SUB_VECTOR_DIMS = 16  # 768 dims -> 48 PQ sub-vectors, 1024 -> 64
+SEARCH_NPROBES = 20  # IVF partitions probed per query
+SEARCH_REFINE_FACTOR = 10  # Re-rank limit * factor PQ candidates with full vectors
+SEARCH_BATCH_WORKERS = 4  # Concurrent hybrid searches in search_batch()
+
+# Scalar indexes for filters and lookups: BTREE for high-cardinality columns,
+# BITMAP for the handful of entry types
+SCALAR_INDEXES = {"id": "BTREE", "name": "BTREE", "type": "BITMAP"}
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +85,9 @@ class RuleEntry(LanceModel):
 
     # Content and embedding
     content: str  # Full markdown content
+    summary: str = ""  # Mechanics only, at most SUMMARY_MAX_TOKENS (rule_summary.py)
     vector: Vector(768)  # pyright: ignore[reportInvalidTypeForm] # Gemini embedding (gemini-embedding-001)
+    local_vector: Vector(LOCAL_DIMS)  # pyright: ignore[reportInvalidTypeForm] # Offline hashed n-gram embedding
 
     # Metadata for filtering (spell-specific)
     level: Optional[int] = None
@@ -55,6 +103,15 @@ class RuleEntry(LanceModel):
     references: List[str] = []  # ["Sphere|XPHB", "burning|XPHB"]
     reference_types: Dict[str, List[str]] = {}  # {"variantrule": ["Sphere|XPHB"], ...}
 
+    # Transitive references within CLOSURE_DEPTH hops (breadth-first) and
+    # their pre-rendered summary, computed at build time
+    reference_closure: List[str] = []
+    reference_closure_depth: List[int] = []  # Hops to each closure entry
+    references_block: str = ""
+
+    # Hash of the rendered content + metadata, compared by incremental builds
+    content_hash: str = ""
+
 
 class LanceRulesService:
     """
@@ -73,7 +130,9 @@ class LanceRulesService:
         db_path: str = "src/db/lancedb",
         table_name: str = "rules",
         api_key: Optional[str] = None,
-        use_paid_tier: bool = False
+        use_paid_tier: bool = False,
+        embedding_provider: Union[str, EmbeddingProvider] = "gemini",
+        use_result_cache: bool = True
     ):
         """
         Initialize the Lance rules service.
@@ -83,6 +142,10 @@ class LanceRulesService:
             table_name: Name of the table to use
             api_key: Optional API key override. If None, uses environment variables
             use_paid_tier: If True, use paid tier API key for higher rate limits
+            embedding_provider: Query embeddings - "gemini" (API), "local" (offline,
+                                CPU) or an EmbeddingProvider instance
+            use_result_cache: Answer repeated and paraphrased queries from the
+                              process-wide semantic result cache
         """
         self.db_path = db_path
         self.table_name = table_name
@@ -92,6 +155,23 @@ class LanceRulesService:
         self._api_key = api_key
         self._use_paid_tier = use_paid_tier
         self._name_index = None  # Built on connect() for fast name lookups
+        self._fuzzy_name_index: Optional[RulesNameIndex] = None  # Typo/alias tolerant, built with it
+
+        if embedding_provider == "gemini":
+            embedding_provider = GeminiEmbeddingProvider(self._get_embedding_client)
+        elif embedding_provider == "local":
+            embedding_provider = HashedNgramEmbeddingProvider(self.local_embedding_path)
+        elif isinstance(embedding_provider, str):
+            raise ValueError(f"Unknown embedding provider: {embedding_provider}")
+        self.embedding_provider = embedding_provider
+        self.result_cache: Optional[SemanticResultCache] = (
+            get_semantic_result_cache() if use_result_cache else None
+        )
+
+    @property
+    def local_embedding_path(self) -> str:
+        """IDF weights of the local embedding provider, written at build time."""
+        return os.path.join(self.db_path, f"{self.table_name}_local_idf.npy")
 
     def connect(self):
         """Connect to existing LanceDB database."""
@@ -145,7 +225,12 @@ class LanceRulesService:
 
         # Fetch all entries using LanceDB's native query
         # Only select name, id, and type fields for efficiency
-        all_entries = self.table.search().limit(10000).to_list()
+        all_entries = (
+            self.table.search()
+            .select(["id", "name", "type"])
+            .limit(max(1, self.table.count_rows()))
+            .to_list()
+        )
 
         for entry in all_entries:
             name = entry['name']
@@ -160,27 +245,47 @@ class LanceRulesService:
                 'type': entry_type
             })
 
+        self._fuzzy_name_index = RulesNameIndex.from_entries(all_entries)
+
         logger.info(f"Name index built: {len(self._name_index)} unique names")
 
     def _get_embedding(self, text: str) -> List[float]:
         """
-        Get embedding for text using Gemini.
+        Get a query embedding from the configured embedding provider.
 
         Args:
             text: Text to embed
 
         Returns:
-            768-dimensional embedding vector
+            Embedding vector for the provider's vector column
+        """
+        return self.embedding_provider.embed_query(text)
+
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get query embeddings for several texts (one request with the Gemini provider)."""
+        if len(texts) == 1:
+            return [self._get_embedding(texts[0])]
+        return self.embedding_provider.embed_queries(texts)
+
+    async def _embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of documents in one request (async client).
+
+        Args:
+            texts: Up to MAX_BATCH_SIZE documents
+
+        Returns:
+            One embedding per document, in order
         """
         client = self._get_embedding_client()
 
-        result = client.models.embed_content(
+        result = await client.aio.models.embed_content(
             model="gemini-embedding-001",
-            contents=[text],
+            contents=texts,
             config=types.EmbedContentConfig(task_type="RETRIEVAL_DOCUMENT")
         )
 
-        return result.embeddings[0].values
+        return [embedding.values for embedding in result.embeddings]
 
     def _get_content_file(
         self,
@@ -302,24 +407,58 @@ class LanceRulesService:
         rendered_rules_dir: Path,
         metadata_dir: Path,
         show_progress: bool = True,
-        max_entries: Optional[int] = None
+        max_entries: Optional[int] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        concurrency: int = 4,
+        requests_per_minute: Optional[float] = None,
+        embedding_cache_dir: Optional[str] = DEFAULT_EMBEDDING_CACHE_DIR,
+        mode: str = "overwrite"
     ) -> Dict[str, any]:
         """
         Load all rules from filesystem into LanceDB.
 
-        Uses two-phase loading:
+        Uses phased loading:
         1. Phase 1: Build set of all valid IDs
         2. Phase 2: Process entries with validated references
+        3. Phase 3: Embed contents in concurrent, rate-limited batches,
+           checkpointed so an interrupted build resumes where it stopped,
+           and with the offline local provider (local_vector column)
+        4. Phase 4: Create (or update) the table
+        5. Phase 5: Create the FTS index
+        6. Phase 6: Create ANN and scalar indexes, then optimize() and remove
+           old table versions
+        7. Phase 7: Validate the stored reference closures
+
+        Phase 2 also precomputes each entry's mechanics summary, its reference
+        closure (CLOSURE_DEPTH hops) and its pre-rendered references block, so
+        search-time expansion needs one batched fetch at most.
+
+        In "incremental" mode each entry's content_hash (rendered markdown +
+        metadata) is compared with the one stored in the table: only new or
+        changed entries are upserted (merge_insert on id), vanished IDs are
+        deleted and the FTS index is updated in place. Changed entries whose
+        content is unchanged (only a summary or closure of a referenced rule
+        moved) keep their stored vectors; the rest are embedded. Without an
+        existing table (or one built before content hashes) it falls back to
+        "overwrite".
 
         Args:
             rendered_rules_dir: Directory containing markdown files
             metadata_dir: Directory containing metadata JSON files
             show_progress: Whether to print progress updates
             max_entries: Maximum number of entries to process (for testing). None = process all
+            batch_size: Documents per embedding request
+            concurrency: Embedding requests in flight at once
+            requests_per_minute: Embedding request quota (None: free or paid tier default)
+            embedding_cache_dir: Sidecar checkpoint of embeddings by content hash
+                                 (None disables resuming)
+            mode: "overwrite" (rebuild the table) or "incremental"
 
         Returns:
             Statistics dictionary with loading results
         """
+        if mode not in ("overwrite", "incremental"):
+            raise ValueError(f"Unknown load mode: {mode}")
         logger.info("Starting LanceDB loading process...")
 
         # Phase 1: Load all entries to build valid ID set
@@ -370,6 +509,16 @@ class LanceRulesService:
             "final_valid_references": 0,
             "reference_types": {},
             "fts_index_created": False,
+            "indexes": [],
+            "versions_removed": 0,
+            "embedding": {},
+            "mode": mode,
+            "unchanged_entries": 0,
+            "upserted_entries": 0,
+            "reused_vectors": 0,
+            "deleted_entries": 0,
+            "closure_references": 0,
+            "closure_problems": [],
             "errors": []
         }
 
@@ -399,17 +548,15 @@ class LanceRulesService:
                         stats["reference_types"][ref_type] = 0
                     stats["reference_types"][ref_type] += len(ref_list)
 
-                # Create embedding
-                embedding = self._get_embedding(content)
-
-                # Create entry
+                # Create entry (vector is filled in Phase 3)
                 entry = {
                     "id": entry_id,
                     "name": metadata['name'],
                     "source": metadata['source'],
                     "type": metadata['type'],
                     "content": content,
-                    "vector": embedding,
+                    "summary": summarize_rule(content, metadata),
+                    "vector": None,
                     "level": metadata.get('level'),
                     "school": metadata.get('school'),
                     "rarity": metadata.get('rarity'),
@@ -419,7 +566,6 @@ class LanceRulesService:
                 }
 
                 final_entries.append(entry)
-                stats["total_entries"] += 1
 
             except Exception as e:
                 logger.error(f"Error processing {entry_id}: {e}")
@@ -431,28 +577,127 @@ class LanceRulesService:
             stats["total_references_found"] - stats["final_valid_references"]
         )
 
-        if show_progress:
-            print(f"\nPhase 3: Creating LanceDB table...")
-
-        # Create or overwrite table
-        self.db = lancedb.connect(self.db_path)
-        self.table = self.db.create_table(
-            self.table_name,
-            data=final_entries,
-            mode="overwrite"
+        # Reference closures (part of the content hash: an entry changes when
+        # anything within CLOSURE_DEPTH hops of it does)
+        entries_by_id = {entry["id"]: entry for entry in final_entries}
+        closures = build_reference_closures({entry["id"]: entry["references"] for entry in final_entries})
+        for entry in final_entries:
+            closure = closures[entry["id"]]
+            entry["reference_closure"], entry["reference_closure_depth"] = closure
+            entry["references_block"] = render_references_block(closure, entries_by_id)
+        stats["closure_references"] = sum(len(entry["reference_closure"]) for entry in final_entries)
+
+        for entry in final_entries:
+            entry["content_hash"] = self._entry_hash(entry)
+        present_ids = {entry["id"] for entry in final_entries}
+
+        local_provider = (
+            self.embedding_provider
+            if isinstance(self.embedding_provider, HashedNgramEmbeddingProvider)
+            else HashedNgramEmbeddingProvider(self.local_embedding_path)
         )
 
+        stored_hashes = self._get_stored_hashes() if mode == "incremental" else None
+        if mode == "incremental" and (stored_hashes is None or not local_provider.is_fitted):
+            if show_progress:
+                print("\n  No table with content hashes and local embeddings yet - falling back to a full rebuild")
+            mode = stats["mode"] = "overwrite"
+        if mode == "overwrite":
+            # IDF weights come from the whole corpus; incremental builds reuse them
+            local_provider.fit(entry["content"] for entry in final_entries)
+        else:
+            changed = [entry for entry in final_entries if stored_hashes.get(entry["id"]) != entry["content_hash"]]
+            stats["unchanged_entries"] = len(final_entries) - len(changed)
+            final_entries = changed
+
+        # Both vectors depend only on content (the IDF weights are fixed between
+        # overwrites) - entries whose summary or closures changed keep them
+        reused = {}
+        if mode == "incremental":
+            stored = self._get_many({entry["id"] for entry in final_entries if entry["id"] in stored_hashes})
+            for entry in final_entries:
+                row = stored.get(entry["id"])
+                if row is not None and row["content"] == entry["content"]:
+                    reused[entry["id"]] = row
+            stats["reused_vectors"] = len(reused)
+        to_embed = [entry for entry in final_entries if entry["id"] not in reused]
+
+        # Phase 3: Embed new and changed contents in batches
         if show_progress:
-            print(f"✓ Created table '{self.table_name}' with {len(final_entries)} entries")
+            print(f"\nPhase 3: Embedding {len(to_embed)} entries "
+                  f"({len(reused)} with unchanged content keep their vectors)...")
+
+        vectors, embedding_stats = self._embed_all(
+            [entry["content"] for entry in to_embed],
+            batch_size=batch_size,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            embedding_cache_dir=embedding_cache_dir,
+            show_progress=show_progress
+        )
+        stats["embedding"] = embedding_stats.to_dict()
+        stats["errors"].extend(embedding_stats.errors)
+
+        embedded_entries = []
+        for entry in to_embed:
+            entry["vector"] = vectors.get(content_hash(entry["content"]))
+            if entry["vector"] is None:
+                stats["errors"].append(f"Missing embedding for {entry['id']}")
+                continue
+            embedded_entries.append(entry)
+
+        start = time.perf_counter()
+        local_vectors = local_provider.embed_documents(entry["content"] for entry in embedded_entries)
+        for entry, local_vector in zip(embedded_entries, local_vectors):
+            entry["local_vector"] = local_vector
+        stats["local_embedding_seconds"] = round(time.perf_counter() - start, 2)
+
+        for entry in final_entries:
+            row = reused.get(entry["id"])
+            if row is not None:
+                entry["vector"], entry["local_vector"] = row["vector"], row["local_vector"]
+                embedded_entries.append(entry)
+        final_entries = embedded_entries
+        stats["upserted_entries"] = len(final_entries)
+
+        if mode == "incremental":
+            if show_progress:
+                print(f"\nPhase 4: Updating LanceDB table...")
+            # A test run (max_entries) sees only part of the corpus - never delete then
+            vanished = [] if max_entries else sorted(set(stored_hashes) - present_ids)
+            self._apply_incremental(final_entries, vanished)
+            stats["deleted_entries"] = len(vanished)
+            stats["total_entries"] = self.table.count_rows()
+            if show_progress:
+                print(f"✓ Upserted {len(final_entries)} entries, deleted {len(vanished)}, "
+                      f"{stats['unchanged_entries']} unchanged")
+        else:
+            if show_progress:
+                print(f"\nPhase 4: Creating LanceDB table...")
+
+            # Create or overwrite table
+            self.db = lancedb.connect(self.db_path)
+            self.table = self.db.create_table(
+                self.table_name,
+                data=final_entries,
+                mode="overwrite"
+            )
+            local_provider.save()  # Matches the table just written
+            stats["total_entries"] = len(final_entries)
 
-        # Phase 4: Create FTS index for hybrid search
+            if show_progress:
+                print(f"✓ Created table '{self.table_name}' with {len(final_entries)} entries")
+
+        # Phase 5: Create FTS index for hybrid search
         if show_progress:
-            print(f"\nPhase 4: Creating FTS index for hybrid search...")
+            print(f"\nPhase 5: {'Updating' if mode == 'incremental' else 'Creating'} FTS index for hybrid search...")
 
         try:
-            self.table.create_fts_index("content", replace=True)
+            # An existing index picks up the upserted rows in optimize() (Phase 6)
+            if mode == "overwrite" or not self._has_index("content"):
+                self.table.create_fts_index("content", replace=True)
             if show_progress:
-                print(f"✓ Created FTS index on 'content' column")
+                print(f"✓ FTS index on 'content' column is in place")
             stats["fts_index_created"] = True
         except Exception as e:
             logger.warning(f"Failed to create FTS index: {e}")
@@ -460,10 +705,174 @@ class LanceRulesService:
                 print(f"⚠️  Failed to create FTS index: {e}")
             stats["fts_index_created"] = False
 
-        logger.info(f"Successfully loaded {len(final_entries)} entries into LanceDB")
+        # Phase 6: ANN + scalar indexes, compaction and version cleanup
+        if show_progress:
+            print(f"\nPhase 6: Building ANN and scalar indexes, compacting table...")
+
+        self._build_indexes(rebuild=mode == "overwrite", stats=stats)
+
+        if show_progress:
+            print(f"✓ Indexes: {', '.join(stats['indexes'])}")
+            print(f"✓ Compacted table, removed {stats['versions_removed']} old versions")
+
+        # Phase 7: Closures must match the stored references (a test run
+        # with max_entries leaves references outside the subset)
+        if not max_entries:
+            stats["closure_problems"] = self.validate_reference_closures()
+            if show_progress:
+                print(f"\nPhase 7: Validated reference closures: {len(stats['closure_problems'])} problems")
+
+        if self.result_cache is not None:
+            self.result_cache.invalidate((self.db_path, self.table_name))
+
+        logger.info(f"Successfully loaded {len(final_entries)} entries into LanceDB ({mode})")
 
         return stats
 
+    @staticmethod
+    def _entry_hash(entry: Dict) -> str:
+        """Hash everything stored for an entry except its embedding."""
+        hashed = {key: value for key, value in entry.items() if key not in ("vector", "content_hash")}
+        return content_hash(json.dumps(hashed, sort_keys=True, ensure_ascii=False))
+
+    def _get_stored_hashes(self) -> Optional[Dict[str, str]]:
+        """
+        Get id -> content_hash of the existing table.
+
+        Returns:
+            The hashes, or None if there is no table or it predates a column
+            of RuleEntry (content hashes, local embeddings, reference closures)
+        """
+        self.db = lancedb.connect(self.db_path)
+        try:
+            self.table = self.db.open_table(self.table_name)
+        except Exception:
+            return None
+        if not set(RuleEntry.model_fields) <= set(self.table.schema.names):
+            return None
+        rows = (
+            self.table.search()
+            .select(["id", "content_hash"])
+            .limit(max(1, self.table.count_rows()))
+            .to_arrow()
+        )
+        return dict(zip(rows.column("id").to_pylist(), rows.column("content_hash").to_pylist()))
+
+    def _apply_incremental(self, upserts: List[Dict], deleted_ids: List[str], chunk_size: int = 500) -> None:
+        """Upsert changed entries by id and delete vanished ones."""
+        if upserts:
+            (
+                self.table.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(upserts)
+            )
+        for i in range(0, len(deleted_ids), chunk_size):
+            quoted = ", ".join(_sql_string(entry_id) for entry_id in deleted_ids[i:i + chunk_size])
+            self.table.delete(f"id IN ({quoted})")
+
+    def validate_reference_closures(self) -> List[str]:
+        """
+        Check the stored reference closures against the stored references.
+
+        Returns:
+            Problem descriptions (empty if every closure is current)
+        """
+        if self.table is None:
+            self.connect()
+        columns = ["id", "references", "reference_closure", "reference_closure_depth"]
+        rows = self.table.search().select(columns).limit(max(1, self.table.count_rows())).to_list()
+        return validate_reference_closures(rows)
+
+    def _build_indexes(self, rebuild: bool, stats: Dict) -> None:
+        """
+        Create the ANN and scalar indexes, then optimize and clean up the table.
+
+        Args:
+            rebuild: Create every index from scratch (after an overwrite). Otherwise
+                     only missing indexes are created and optimize() adds the new
+                     rows to the existing ones.
+            stats: Load statistics to record indexes and removed versions in
+        """
+        num_rows = self.table.count_rows()
+
+        for column, dims in ((GEMINI_VECTOR_COLUMN, GEMINI_DIMS), (LOCAL_VECTOR_COLUMN, LOCAL_DIMS)):
+            if num_rows < VECTOR_INDEX_MIN_ROWS or (not rebuild and self._has_index(column)):
+                continue
+            try:
+                self.table.create_index(
+                    metric="l2",  # Same distance as search()
+                    vector_column_name=column,
+                    index_type=VECTOR_INDEX_TYPE,
+                    # ~sqrt(rows) partitions, but at least 256 training rows each
+                    num_partitions=max(1, min(round(num_rows ** 0.5), num_rows // 256)),
+                    num_sub_vectors=dims // VECTOR_INDEX_SUB_VECTOR_DIMS,
+                    replace=True
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create vector index on '{column}': {e}")
+                stats["errors"].append(f"Failed to create vector index on '{column}': {e}")
+
+        for column, index_type in SCALAR_INDEXES.items():
+            if rebuild or not self._has_index(column):
+                try:
+                    self.table.create_scalar_index(column, index_type=index_type, replace=True)
+                except Exception as e:
+                    logger.warning(f"Failed to create {index_type} index on '{column}': {e}")
+                    stats["errors"].append(f"Failed to create {index_type} index on '{column}': {e}")
+
+        # Compact fragments, fold unindexed rows into every index and drop the
+        # versions earlier builds left behind
+        versions = len(self.table.list_versions())
+        self.table.optimize(cleanup_older_than=timedelta(0))
+        stats["versions_removed"] = versions - len(self.table.list_versions())
+        stats["indexes"] = list(dict.fromkeys(index.name for index in self.table.list_indices()))
+
+    def _has_index(self, column: str) -> bool:
+        """Whether the table has an index on a column."""
+        try:
+            return any(column in index.columns for index in self.table.list_indices())
+        except Exception:
+            return False
+
+    def _embed_all(
+        self,
+        contents: List[str],
+        batch_size: int,
+        concurrency: int,
+        requests_per_minute: Optional[float],
+        embedding_cache_dir: Optional[str],
+        show_progress: bool
+    ):
+        """
+        Embed contents through the batched pipeline.
+
+        Returns:
+            (content hash -> vector, EmbeddingStats)
+        """
+        if requests_per_minute is None:
+            requests_per_minute = (
+                PAID_TIER_REQUESTS_PER_MINUTE if self._use_paid_tier else FREE_TIER_REQUESTS_PER_MINUTE
+            )
+
+        def report(progress_stats):
+            done = progress_stats.cached + progress_stats.embedded + progress_stats.failed
+            print(f"  Embedded {done}/{progress_stats.documents} "
+                  f"({progress_stats.cached} cached, {progress_stats.documents_per_second:.1f} docs/s)")
+
+        pipeline = EmbeddingPipeline(
+            self._embed_documents,
+            checkpoint=EmbeddingCheckpoint(embedding_cache_dir) if embedding_cache_dir else None,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            progress=report if show_progress else None
+        )
+        vectors = asyncio.run(pipeline.run(contents))
+        if pipeline.checkpoint is not None and not pipeline.stats.failed:
+            pipeline.checkpoint.compact()
+        return vectors, pipeline.stats
+
     def search(
         self,
         query: str,
@@ -493,38 +902,205 @@ class LanceRulesService:
         Returns:
             List of results with hybrid scoring and optional expanded references
         """
+        return self.search_batch(
+            [query],
+            limit=limit,
+            expand_references=expand_references,
+            max_depth=max_depth,
+            filter_type=filter_type
+        )[0]
+
+    def search_batch(
+        self,
+        queries: List[str],
+        limit: int = 5,
+        expand_references: bool = True,
+        max_depth: int = 1,
+        filter_type: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Run several hybrid searches at once.
+
+        Queries not answered by the result cache are embedded in one provider
+        request and searched concurrently; reference expansion fetches each
+        referenced entry once for the whole batch.
+
+        Args:
+            queries: Search queries
+            limit, expand_references, max_depth, filter_type: As for search()
+
+        Returns:
+            One result list per query, in order
+        """
         if self.table is None:
             self.connect()
 
-        # Get query embedding for vector search
-        query_embedding = self._get_embedding(query)
+        results: List[Optional[List[Dict]]] = [None] * len(queries)
+        partition = self._cache_partition(limit, expand_references, max_depth, filter_type)
+
+        # Same query text seen before: skip the embedding call too
+        if self.result_cache is not None:
+            for i, query in enumerate(queries):
+                cached = self.result_cache.get_by_text(partition, query)
+                results[i] = self._results_from_tree(cached) if cached is not None else None
+
+        # Get query embeddings for vector search (one request for the batch)
+        pending = [i for i, result in enumerate(results) if result is None]
+        embeddings = dict(zip(pending, self._get_embeddings([queries[i] for i in pending]))) if pending else {}
+
+        # A paraphrase of a cached query shares its results
+        if self.result_cache is not None:
+            for i in pending:
+                cached = self.result_cache.get(partition, queries[i], embeddings[i])
+                results[i] = self._results_from_tree(cached) if cached is not None else None
+
+        pending = [i for i in pending if results[i] is None]
+        if not pending:
+            return results
+
+        # LanceDB releases the GIL while searching, so threads overlap the searches
+        with ThreadPoolExecutor(max_workers=min(SEARCH_BATCH_WORKERS, len(pending))) as pool:
+            searched = pool.map(
+                lambda i: self._hybrid_search(queries[i], embeddings[i], limit, filter_type),
+                pending
+            )
+            for i, search_results in zip(pending, searched):
+                results[i] = search_results
+
+        # Expand references if requested
+        if expand_references:
+            # One fetch for every entry within max_depth hops of the page
+            fetched = self._get_many({
+                ref_id for i in pending for result in results[i] for ref_id in self._closure_ids(result, max_depth)
+            }) if max_depth > 0 else {}
+            for i in pending:
+                for result in results[i]:
+                    result['expanded_references'] = self._expand_references(
+                        result.get('references', []),
+                        max_depth=max_depth,
+                        visited=set([result['id']]),
+                        fetched=fetched
+                    )
+
+        if self.result_cache is not None:
+            for i in pending:
+                self.result_cache.put(partition, queries[i], embeddings[i], self._tree_from_results(results[i]))
+
+        return results
+
+    @staticmethod
+    def _closure_ids(entry: Dict, max_depth: int) -> List[str]:
+        """IDs within max_depth hops of an entry (direct references for tables without closures)."""
+        closure = entry.get('reference_closure')
+        if closure is None:
+            return entry.get('references') or []
+        return [
+            ref_id for ref_id, hops in zip(closure, entry.get('reference_closure_depth') or [])
+            if hops <= max_depth
+        ]
 
-        # Perform hybrid search (vector + FTS)
+    def _hybrid_search(
+        self,
+        query: str,
+        query_embedding: List[float],
+        limit: int,
+        filter_type: Optional[str]
+    ) -> List[Dict]:
+        """Hybrid search (vector + FTS) for one query, without reference expansion."""
         # Since we have pre-computed embeddings, use the explicit vector()/text() API
         # LanceDB automatically uses reciprocal rank fusion (RRF) to combine results
-        search = self.table.search(query_type="hybrid").vector(query_embedding).text(query)
+        search = (
+            self.table.search(query_type="hybrid", vector_column_name=self.embedding_provider.vector_column)
+            .vector(query_embedding)
+            .text(query)
+            .nprobes(SEARCH_NPROBES)  # Ignored without an ANN index (brute force)
+            .refine_factor(SEARCH_REFINE_FACTOR)
+        )
 
-        # Apply type filter if specified
+        # Apply type filter if specified (uses the bitmap index on type)
         if filter_type:
-            search = search.where(f"type = '{filter_type}'")
+            search = search.where(f"type = {_sql_string(filter_type)}")
 
-        # Set limit
-        search = search.limit(limit)
+        return search.limit(limit).to_list()
 
-        # Execute search
-        results = search.to_list()
+    def _cache_partition(
+        self,
+        limit: int,
+        expand_references: bool,
+        max_depth: int,
+        filter_type: Optional[str]
+    ) -> Tuple:
+        """Result cache partition: everything besides the query that shapes the results."""
+        return (
+            self.db_path,
+            self.table_name,
+            self.embedding_provider.vector_column,
+            filter_type,
+            limit,
+            max_depth if expand_references else 0
+        )
 
-        # Expand references if requested
-        if expand_references:
-            for result in results:
-                result['expanded_references'] = self._expand_references(
-                    result.get('references', []),
-                    max_depth=max_depth,
-                    visited=set([result['id']])
-                )
+    @staticmethod
+    def _tree_from_results(results: List[Dict]) -> List[Tuple]:
+        """Reduce search results to (id, scores, expansion tree) for the result cache."""
+        def expansions(entries: Optional[List[Dict]]) -> Optional[List[Tuple]]:
+            if entries is None:
+                return None
+            return [(entry['id'], expansions(entry.get('expanded_references'))) for entry in entries]
+
+        return [
+            (
+                result['id'],
+                {key: value for key, value in result.items() if key.startswith('_')},
+                expansions(result.get('expanded_references'))
+            )
+            for result in results
+        ]
 
+    def _results_from_tree(self, tree: List[Tuple]) -> Optional[List[Dict]]:
+        """Rebuild cached results with one lookup of every ID; None if any entry is gone."""
+        ids: Set[str] = set()
+
+        def collect(expansions: Optional[List[Tuple]]) -> None:
+            for entry_id, nested in expansions or ():
+                ids.add(entry_id)
+                collect(nested)
+
+        for entry_id, _, expansions in tree:
+            ids.add(entry_id)
+            collect(expansions)
+        rows = self._get_many(ids)
+        if len(rows) != len(ids):
+            return None
+
+        def build(expansions: List[Tuple]) -> List[Dict]:
+            entries = []
+            for entry_id, nested in expansions:
+                entry = dict(rows[entry_id])
+                if nested is not None:
+                    entry['expanded_references'] = build(nested)
+                entries.append(entry)
+            return entries
+
+        results = []
+        for entry_id, scores, expansions in tree:
+            result = dict(rows[entry_id], **scores)
+            if expansions is not None:
+                result['expanded_references'] = build(expansions)
+            results.append(result)
         return results
 
+    def _get_many(self, entry_ids: Set[str], chunk_size: int = 200) -> Dict[str, Dict]:
+        """Fetch entries by ID (BTREE index on id), keyed by ID."""
+        entry_ids = sorted(entry_ids)
+        rows = {}
+        for i in range(0, len(entry_ids), chunk_size):
+            chunk = entry_ids[i:i + chunk_size]
+            quoted = ", ".join(_sql_string(entry_id) for entry_id in chunk)
+            for row in self.table.search().where(f"id IN ({quoted})").limit(len(chunk)).to_list():
+                rows[row['id']] = row
+        return rows
+
     def get_by_id(self, entry_id: str) -> Optional[Dict]:
         """
         Retrieve a specific entry by ID.
@@ -537,8 +1113,8 @@ class LanceRulesService:
         """
         if self.table is None:
             self.connect()
-        #TODO: .search() might not be the most efficient way to get by ID
-        results = self.table.search().where(f"id = '{entry_id}'").limit(1).to_list()
+        # Served by the BTREE index on id
+        results = self.table.search().where(f"id = {_sql_string(entry_id)}").limit(1).to_list()
 
         if results:
             return results[0]
@@ -590,11 +1166,39 @@ class LanceRulesService:
         # Return first match (fetch full entry by ID)
         return self.get_by_id(candidates[0]['id'])
 
+    def find_by_name(self, query: str) -> Optional[Dict]:
+        """
+        Resolve a name-like query locally and fetch the entry - no embedding call.
+
+        Unlike get_by_name, tolerates casing, punctuation and spacing
+        ("Counterspell!", "fire ball"), typos ("magic misile"), type hints
+        ("shield spell") and common aliases ("aoo"). Conceptual questions and
+        ambiguous typos return None and should go to search().
+
+        Args:
+            query: Short query that may name a rule
+
+        Returns:
+            Matching entry or None
+        """
+        if self.table is None:
+            self.connect()
+
+        if self._fuzzy_name_index is None:
+            raise ValueError("Name index not built. This should happen automatically on connect().")
+
+        match = self._fuzzy_name_index.resolve(query)
+        if match is None:
+            return None
+        logger.debug(f"Resolved '{query}' to {match.entry_id} ({match.match_type})")
+        return self.get_by_id(match.entry_id)
+
     def _expand_references(
         self,
         reference_ids: List[str],
         max_depth: int = 1,
-        visited: Set[str] = None
+        visited: Set[str] = None,
+        fetched: Optional[Dict[str, Optional[Dict]]] = None
     ) -> List[Dict]:
         """
         Recursively expand references.
@@ -603,6 +1207,8 @@ class LanceRulesService:
             reference_ids: List of reference IDs to expand
             max_depth: Maximum recursion depth
             visited: Set of already-visited IDs (cycle detection)
+            fetched: Entries already looked up by ID (None if missing), shared
+                     across calls so each entry is fetched once
 
         Returns:
             List of referenced entries
@@ -623,7 +1229,12 @@ class LanceRulesService:
             visited.add(ref_id)
 
             # Fetch the referenced entry
-            entry = self.get_by_id(ref_id)
+            if fetched is None:
+                entry = self.get_by_id(ref_id)
+            else:
+                if ref_id not in fetched:
+                    fetched[ref_id] = self.get_by_id(ref_id)
+                entry = dict(fetched[ref_id]) if fetched[ref_id] is not None else None
 
             if entry:
                 # Recursively expand nested references
@@ -631,7 +1242,8 @@ class LanceRulesService:
                     entry['expanded_references'] = self._expand_references(
                         entry['references'],
                         max_depth=max_depth - 1,
-                        visited=visited.copy()
+                        visited=visited.copy(),
+                        fetched=fetched
                     )
 
                 expanded.append(entry)
@@ -648,7 +1260,8 @@ class LanceRulesService:
 
         Args:
             results: Search results from search()
-            include_references: Whether to include expanded references
+            include_references: Whether to include expanded references (or, for
+                                unexpanded results, the pre-rendered references block)
 
         Returns:
             Formatted context string
@@ -673,6 +1286,11 @@ class LanceRulesService:
                     ref_content = ref['content'].replace('\n', '\n    ')
                     lines.append(f"    {ref_content}")
                     lines.append("")
+            # Not expanded: the block pre-rendered at build time needs no fetch
+            elif include_references and result.get('references_block'):
+                lines.append(f"--- Referenced Rules for {result['name']} ---")
+                lines.append(result['references_block'])
+                lines.append("")
 
         return "\n".join(lines)
 
@@ -713,15 +1331,23 @@ class LanceRulesService:
         return {
             "total_entries": total_entries,
             "table_name": self.table_name,
-            "db_path": self.db_path
+            "db_path": self.db_path,
+            "indexes": list(dict.fromkeys(index.name for index in self.table.list_indices())),
+            "result_cache": self.result_cache.stats() if self.result_cache is not None else None
         }
 
 
+def _sql_string(value: str) -> str:
+    """Quote a value as a SQL string literal for LanceDB filters."""
+    return "'" + value.replace("'", "''") + "'"
+
+
 def create_lance_rules_service(
     db_path: str = "src/db/lancedb",
     auto_connect: bool = True,
     use_paid_tier: bool = False,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    embedding_provider: Optional[str] = None
 ) -> LanceRulesService:
     """
     Factory function for LanceRulesService.
@@ -731,6 +1357,8 @@ def create_lance_rules_service(
         auto_connect: Whether to automatically connect to existing DB
         use_paid_tier: If True, use paid tier API key for higher rate limits
         api_key: Optional explicit API key override
+        embedding_provider: "gemini" or "local" (offline). Default: the
+                            LANCE_EMBEDDING_PROVIDER environment variable, else "gemini"
 
     Returns:
         Initialized LanceRulesService
@@ -738,7 +1366,8 @@ def create_lance_rules_service(
     service = LanceRulesService(
         db_path=db_path,
         use_paid_tier=use_paid_tier,
-        api_key=api_key
+        api_key=api_key,
+        embedding_provider=embedding_provider or os.getenv("LANCE_EMBEDDING_PROVIDER", "gemini")
     )
 
     if auto_connect:
@@ -0,0 +1,118 @@
+"""
+Build-time transitive closure of rule references.
+
+RuleEntry.references holds direct references only, so reference expansion
+used to walk them at query time: one get_by_id per referenced entry, level by
+level. load_from_files now stores per entry:
+
+- reference_closure / reference_closure_depth: every ID reachable within
+  CLOSURE_DEPTH reference hops, breadth-first, with its hop count. Search
+  fetches the closure of a whole result page in one batched query and expands
+  from memory.
+- references_block: a compact pre-rendered "referenced rules" block, printed
+  by format_for_context without any fetch.
+
+validate_reference_closures() recomputes the closures from the stored direct
+references, so a build (or analyze_dangling_references.py) can detect stale
+closures and closure IDs without an entry.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+CLOSURE_DEPTH = 2  # Reference hops precomputed per entry
+SUMMARY_WIDTH = 160  # Characters of content for a direct reference without a summary
+
+Closure = Tuple[List[str], List[int]]  # (IDs, hop count of each)
+
+_MARKUP = re.compile(r"[*_`]")
+
+
+def build_reference_closures(references: Dict[str, List[str]], depth: int = CLOSURE_DEPTH) -> Dict[str, Closure]:
+    """
+    Breadth-first reference closure of every entry.
+
+    Args:
+        references: entry ID -> direct reference IDs (in stored order)
+        depth: Maximum reference hops
+
+    Returns:
+        entry ID -> (IDs in breadth-first order without the entry itself, hop counts)
+    """
+    closures = {}
+    for entry_id in references:
+        ids: List[str] = []
+        depths: List[int] = []
+        seen = {entry_id}
+        frontier = [entry_id]
+        for hops in range(1, depth + 1):
+            next_frontier = []
+            for current in frontier:
+                for ref_id in references.get(current, ()):
+                    if ref_id not in seen:
+                        seen.add(ref_id)
+                        ids.append(ref_id)
+                        depths.append(hops)
+                        next_frontier.append(ref_id)
+            frontier = next_frontier
+        closures[entry_id] = (ids, depths)
+    return closures
+
+
+def render_references_block(closure: Closure, entries: Dict[str, Dict]) -> str:
+    """
+    Render the referenced rules of an entry: one line per direct reference,
+    then the names of indirect references.
+
+    Args:
+        closure: The entry's closure from build_reference_closures()
+        entries: entry ID -> entry with name, type, content and (optionally) summary
+    """
+    lines = []
+    indirect = []
+    for ref_id, hops in zip(*closure):
+        entry = entries.get(ref_id)
+        if entry is None:
+            continue
+        if hops == 1:
+            summary = entry.get("summary") or summary_line(entry["content"])
+            lines.append(f"• {entry['name']} ({entry['type']}): {summary}")
+        else:
+            indirect.append(entry["name"])
+    if indirect:
+        lines.append(f"Also referenced: {', '.join(indirect)}")
+    return "\n".join(lines)
+
+
+def summary_line(content: str, width: int = SUMMARY_WIDTH) -> str:
+    """First line of text below the markdown heading, without emphasis markup."""
+    for line in content.splitlines():
+        line = _MARKUP.sub("", line).strip()
+        if line and not line.startswith("#"):
+            return line if len(line) <= width else line[:width - 1].rstrip() + "…"
+    return ""
+
+
+def validate_reference_closures(rows: Iterable[Dict], depth: int = CLOSURE_DEPTH) -> List[str]:
+    """
+    Check stored closures against the stored direct references.
+
+    Args:
+        rows: Entries with id, references, reference_closure and reference_closure_depth
+
+    Returns:
+        One problem description per stale closure or closure with missing entries
+    """
+    rows = list(rows)
+    references = {row["id"]: list(row.get("references") or []) for row in rows}
+    expected = build_reference_closures(references, depth)
+
+    problems = []
+    for row in rows:
+        closure = (list(row.get("reference_closure") or []), list(row.get("reference_closure_depth") or []))
+        missing = [ref_id for ref_id in closure[0] if ref_id not in references]
+        if missing:
+            problems.append(f"{row['id']}: closure references missing entries {', '.join(missing[:5])}")
+        if closure != expected[row["id"]]:
+            problems.append(f"{row['id']}: stale reference closure")
+    return problems
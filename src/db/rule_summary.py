@@ -0,0 +1,166 @@
+"""
+Compact, mechanics-only rule summaries computed at build time.
+
+The DM context used to carry either the full rendered markdown of a rule
+(long spells and feats run to thousands of characters) or its first 100
+characters (which rarely contain the mechanics). summarize_rule() extracts the
+mechanics instead, from the 5etools metadata where present and from the
+rendered text otherwise:
+
+    Level 3 Evocation; 1 action; 150 ft; 20-ft Sphere; Dex save, half on
+    success; 8d6 Fire
+
+Entries with no recognizable mechanics (most variant rules) fall back to
+their first sentence. Every summary is bounded by SUMMARY_MAX_TOKENS.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+SUMMARY_MAX_TOKENS = 60
+CHARS_PER_TOKEN = 4  # Rough English average, good enough for a budget
+
+SCHOOLS = {
+    "A": "Abjuration", "C": "Conjuration", "D": "Divination", "E": "Enchantment",
+    "V": "Evocation", "I": "Illusion", "N": "Necromancy", "T": "Transmutation",
+}
+
+_ABILITIES = "Strength|Dexterity|Constitution|Intelligence|Wisdom|Charisma"
+_SAVE = re.compile(rf"\b({_ABILITIES}) saving throw", re.IGNORECASE)
+_HALF_ON_SUCCESS = re.compile(r"half as much damage", re.IGNORECASE)
+_ATTACK = re.compile(r"\b(melee|ranged) (spell |weapon )?attack", re.IGNORECASE)
+_DAMAGE = re.compile(r"\b(\d+d\d+(?: ?\+ ?\d+)?) (\w+) damage", re.IGNORECASE)
+_HEALING = re.compile(r"regains? (?:a number of )?Hit Points equal to (\d+d\d+(?: plus| \+)? ?[\w ]*?modifier|\d+d\d+)",
+                      re.IGNORECASE)
+_AREA = re.compile(r"\b(\d+)-foot(?:-(?:radius|long|wide|tall))?,? ?(Sphere|Cone|Cube|Line|Cylinder|Emanation)",
+                   re.IGNORECASE)
+_RANGE = re.compile(r"\bwithin (\d+) feet\b", re.IGNORECASE)
+_ACTION_COST = re.compile(r"\b(?:as|take|takes|use) an? (Bonus Action|Reaction|Magic action)\b", re.IGNORECASE)
+_BONUS = re.compile(r"([+-]\d+) bonus to (AC|Armor Class|attack rolls|damage rolls|saving throws|ability checks)",
+                    re.IGNORECASE)
+_ADVANTAGE = re.compile(r"\b(Advantage|Disadvantage) on ((?:[A-Z][a-z]+ )?(?:attack rolls|saving throws|ability checks"
+                        r"|[A-Z][a-z]+ \([A-Z][a-z ]+\) checks|[A-Z][a-z]+ checks|[A-Z][a-z]+ saving throws))")
+_CONDITION = re.compile(r"\b(?:has|have|gains?|is|are) the ([A-Z][a-z]+) condition")
+_SPEED_ZERO = re.compile(r"\bSpeed (?:is|becomes) 0\b")
+_DURATION = re.compile(r"\bfor (?:up to )?(1 (?:round|minute|hour|day)|\d+ (?:rounds|minutes|hours|days))\b")
+_CONCENTRATION = re.compile(r"\bConcentration\b")
+_SENTENCE = re.compile(r"(.+?[.!?])(?:\s|$)")
+_MARKUP = re.compile(r"[*_`]")
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def summarize_rule(content: str, metadata: Optional[Dict] = None, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
+    """
+    Summarize a rule's mechanics.
+
+    Args:
+        content: Rendered markdown
+        metadata: The entry's 5etools metadata (level, school, time, range, duration, rarity)
+        max_tokens: Token budget for the summary
+
+    Returns:
+        "; "-separated mechanics, or the first sentence if none are found
+    """
+    metadata = metadata or {}
+    text = _plain_text(content)
+
+    parts: List[str] = []
+    header = _header(metadata)
+    parts.extend(_action_cost(metadata, text))
+    parts.extend(_range(metadata, text))
+    parts.extend(_unique(f"{size}-ft {shape.capitalize()}" for size, shape in _AREA.findall(text))[:1])
+
+    save = _SAVE.search(text)
+    if save:
+        parts.append(f"{save.group(1)[:3].capitalize()} save" + (", half on success" if _HALF_ON_SUCCESS.search(text) else ""))
+    parts.extend(_unique(f"{kind.lower()} {(style or '').strip()} attack".replace("  ", " ")
+                         for kind, style in _ATTACK.findall(text))[:1])
+    parts.extend(_unique(f"{dice.replace(' ', '')} {kind.capitalize()}" for dice, kind in _DAMAGE.findall(text))[:3])
+    parts.extend(_unique(f"heals {amount}" for amount in _HEALING.findall(text))[:1])
+    parts.extend(_unique(f"{bonus} {target}" for bonus, target in _BONUS.findall(text))[:2])
+    parts.extend(_unique(f"{kind} on {target}" for kind, target in _ADVANTAGE.findall(text))[:2])
+    parts.extend(_unique(_CONDITION.findall(text))[:3])
+    if _SPEED_ZERO.search(text):
+        parts.append("Speed 0")
+    parts.extend(_duration(metadata, text))
+
+    if not parts:
+        sentence = _SENTENCE.match(text)
+        parts.append(sentence.group(1) if sentence else text)
+    if header:
+        parts.insert(0, header)
+    return _fit("; ".join(part for part in parts if part), max_tokens)
+
+
+def _plain_text(content: str) -> str:
+    lines = [_MARKUP.sub("", line).strip() for line in content.splitlines()]
+    return " ".join(line for line in lines if line and not line.startswith("#"))
+
+
+def _header(metadata: Dict) -> str:
+    if metadata.get("type") == "spell" and metadata.get("level") is not None:
+        school = SCHOOLS.get(metadata.get("school"), metadata.get("school") or "")
+        level = "Cantrip" if metadata["level"] == 0 else f"Level {metadata['level']}"
+        return f"{level} {school}".strip()
+    if metadata.get("rarity") and metadata["rarity"] != "none":
+        return str(metadata["rarity"]).capitalize()
+    return ""
+
+
+def _action_cost(metadata: Dict, text: str) -> List[str]:
+    times = metadata.get("time")
+    if isinstance(times, list) and times and isinstance(times[0], dict):
+        time = times[0]
+        unit = str(time.get("unit", "")).replace("bonus", "bonus action")
+        return [f"{time.get('number', 1)} {unit}".strip()]
+    match = _ACTION_COST.search(text)
+    return [match.group(1)] if match else []
+
+
+def _range(metadata: Dict, text: str) -> List[str]:
+    spell_range = metadata.get("range")
+    if isinstance(spell_range, dict):
+        distance = spell_range.get("distance") or {}
+        kind = distance.get("type")
+        if kind in ("self", "touch", "sight", "unlimited"):
+            return [kind.capitalize()]
+        if distance.get("amount") is not None:
+            unit = "ft" if kind == "feet" else kind
+            return [f"{distance['amount']} {unit}"]
+    match = _RANGE.search(text)
+    return [f"within {match.group(1)} ft"] if match else []
+
+
+def _duration(metadata: Dict, text: str) -> List[str]:
+    durations = metadata.get("duration")
+    if isinstance(durations, list) and durations and isinstance(durations[0], dict):
+        duration = durations[0]
+        if duration.get("type") == "instant":
+            return ["Instantaneous"]
+        timed = duration.get("duration") or {}
+        if timed.get("amount") is not None:
+            unit = timed.get("type", "")
+            length = f"{timed['amount']} {unit}{'s' if timed['amount'] != 1 else ''}"
+            return [f"Concentration, up to {length}" if duration.get("concentration") else length]
+        if duration.get("type") == "permanent":
+            return ["Until dispelled"]
+    parts = _unique(_DURATION.findall(text))[:1]
+    if _CONCENTRATION.search(text):
+        parts.append("Concentration")
+    return parts
+
+
+def _unique(values) -> List[str]:
+    return list(dict.fromkeys(values))
+
+
+def _fit(summary: str, max_tokens: int) -> str:
+    """Cut at the last separator (or character) within the token budget."""
+    if estimate_tokens(summary) <= max_tokens:
+        return summary
+    limit = max_tokens * CHARS_PER_TOKEN - 1
+    cut = summary.rfind("; ", 0, limit)
+    return (summary[:cut] if cut > limit // 2 else summary[:limit].rstrip()) + "…"
@@ -0,0 +1,267 @@
+"""
+In-memory fuzzy index over rule names for lookups that need no embedding.
+
+query_rules_database used to try an exact, case-sensitive name match and fall
+back to hybrid search (embedding call + vector + FTS) on any miss, so
+"fire ball", "shield spell", "Counterspell!" or "grappled" all paid the slow
+path. RulesNameIndex resolves those locally:
+
+- Case, punctuation and spacing are normalized ("Counterspell!", "fire ball")
+- Type hints are split off the query ("shield spell" -> Shield, type spell;
+  "the grappled condition" -> Grappled, type condition)
+- Names are also indexed without their parenthetical ("Fight or Flight")
+  and under common table-talk aliases ("aoo", "temp hp")
+- Typos are resolved through a trigram index whose candidates are verified
+  by edit distance ("magic misile"); ties between different names resolve to
+  nothing, so conceptual questions still go to hybrid search
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+MIN_TRIGRAM_SIMILARITY = 0.3  # Jaccard overlap for a name to be a fuzzy candidate
+MAX_NAME_WORDS = 6  # Longer queries are questions, not names
+FUZZY_CANDIDATES = 10  # Candidates verified by edit distance
+
+# Query words that name an entry type rather than an entry
+TYPE_HINTS: Dict[str, str] = {
+    "spell": "spell", "spells": "spell", "cantrip": "spell",
+    "condition": "condition", "status": "condition",
+    "item": "item", "magic item": "item", "weapon": "item", "armor": "item",
+    "feat": "feat",
+    "action": "action",
+    "rule": "variantrule", "variant rule": "variantrule",
+    "monster": "monster", "creature": "monster",
+    "background": "background",
+    "species": "race", "race": "race",
+    "class": "class",
+    "subclass": "subclass",
+    "disease": "disease",
+    "sense": "sense",
+    "skill": "skill",
+}
+
+# Table-talk names -> rule names (only registered if the rule exists)
+COMMON_ALIASES: Dict[str, str] = {
+    "aoo": "Opportunity Attack",
+    "attack of opportunity": "Opportunity Attack",
+    "ac": "Armor Class",
+    "hp": "Hit Points",
+    "temp hp": "Temporary Hit Points",
+    "thp": "Temporary Hit Points",
+    "dc": "Difficulty Class",
+    "crit": "Critical Hit",
+    "nat 20": "Critical Hit",
+    "adv": "Advantage",
+    "disadv": "Disadvantage",
+    "death saves": "Death Saving Throw",
+    "death save": "Death Saving Throw",
+    "conc": "Concentration",
+    "cure light wounds": "Cure Wounds",
+}
+
+_LEADING_ARTICLES = ("the ", "a ", "an ")
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, replace punctuation with spaces, drop leading articles, collapse whitespace."""
+    text = re.sub(r"[^\w\s]", " ", text.lower().replace("’", "'").replace("'", ""))
+    text = " ".join(text.split())
+    for article in _LEADING_ARTICLES:
+        if text.startswith(article):
+            return text[len(article):]
+    return text
+
+
+def _compact(key: str) -> str:
+    return key.replace(" ", "")
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent swaps cost 1), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            )
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def max_edits(key: str) -> int:
+    """Typos tolerated for a name of this length."""
+    length = len(_compact(key))
+    return 0 if length <= 3 else 1 if length <= 6 else 2 if length <= 12 else 3
+
+
+@dataclass
+class NameMatch:
+    """A rule name resolved from a query."""
+    entry_id: str
+    name: str
+    entry_type: str
+    match_type: str  # "exact", "alias" or "fuzzy"
+    distance: int = 0
+
+
+class RulesNameIndex:
+    """Trigram + edit distance index over rule names and aliases."""
+
+    def __init__(self):
+        self._entries: Dict[str, List[Tuple[str, str, str]]] = {}  # key -> [(entry_id, name, type)]
+        self._aliases: Set[str] = set()  # Keys that are not the entry's own name
+        self._compact: Dict[str, str] = {}  # key without spaces -> key
+        self._trigrams: Dict[str, Set[str]] = {}  # trigram -> keys
+        self.types: Set[str] = set()
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict]) -> "RulesNameIndex":
+        """Build from rows with id, name and type."""
+        index = cls()
+        for entry in entries:
+            index.add(entry["id"], entry["name"], entry["type"])
+        index.add_common_aliases()
+        return index
+
+    def add(self, entry_id: str, name: str, entry_type: str) -> None:
+        """Index a rule under its name and its name without a parenthetical."""
+        self.types.add(entry_type)
+        value = (entry_id, name, entry_type)
+        self._add_key(normalize(name), value)
+        short = normalize(_PARENTHETICAL.sub("", name))
+        if short and short != normalize(name):
+            self._add_key(short, value, alias=True)
+
+    def add_alias(self, alias: str, name: str) -> bool:
+        """Register an alias for an indexed name. Returns False if the name is unknown."""
+        entries = self._entries.get(normalize(name))
+        if not entries:
+            return False
+        for value in entries:
+            self._add_key(normalize(alias), value, alias=True)
+        return True
+
+    def add_common_aliases(self) -> None:
+        for alias, name in COMMON_ALIASES.items():
+            self.add_alias(alias, name)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, query: str) -> Optional[NameMatch]:
+        """
+        Resolve a query to a rule name, or None if it is not (close to) a name.
+
+        A type hint in the query ("shield spell") restricts the match to that
+        type; several entries sharing the name resolve to the first one indexed.
+        """
+        key = normalize(query)
+        if not key or key.count(" ") + 1 > MAX_NAME_WORDS:
+            return None
+
+        readings = self._split_type_hint(key)
+        for name_key, entry_type in readings:
+            match = self._resolve_exact(name_key, entry_type)
+            if match:
+                return match
+        for name_key, entry_type in reversed(readings):  # Hinted readings first
+            match = self._resolve_fuzzy(name_key, entry_type)
+            if match:
+                return match
+        return None
+
+    def _split_type_hint(self, key: str) -> List[Tuple[str, Optional[str]]]:
+        """Readings of a query: as-is, then with a leading/trailing type hint removed."""
+        readings = [(key, None)]
+        for hint, entry_type in TYPE_HINTS.items():
+            hinted_type = entry_type if entry_type in self.types else None
+            if key.endswith(" " + hint):
+                readings.append((normalize(key[:-len(hint) - 1]), hinted_type))
+            if key.startswith(hint + " "):
+                readings.append((normalize(key[len(hint) + 1:]), hinted_type))
+        return [(name_key, entry_type) for name_key, entry_type in readings if name_key]
+
+    def _resolve_exact(self, key: str, entry_type: Optional[str]) -> Optional[NameMatch]:
+        key = key if key in self._entries else self._compact.get(_compact(key), "")
+        found = self._pick(self._entries.get(key, []), entry_type)
+        if not found:
+            return None
+        return NameMatch(*found, match_type="alias" if key in self._aliases else "exact")
+
+    def _resolve_fuzzy(self, key: str, entry_type: Optional[str]) -> Optional[NameMatch]:
+        limit = max_edits(key)
+        if limit == 0:
+            return None
+
+        query = _trigrams(key)
+        overlap: Dict[str, int] = {}
+        for trigram in query:
+            for candidate in self._trigrams.get(trigram, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+        scored = sorted(
+            (
+                (shared / (len(query) + len(_trigrams(candidate)) - shared), candidate)
+                for candidate, shared in overlap.items()
+            ),
+            reverse=True
+        )
+
+        best: List[Tuple[str, str, str]] = []
+        best_distance = limit + 1
+        for similarity, candidate in scored[:FUZZY_CANDIDATES]:
+            if similarity < MIN_TRIGRAM_SIMILARITY:
+                break
+            found = self._pick(self._entries[candidate], entry_type)
+            if not found:
+                continue
+            cap = min(limit, max_edits(candidate))  # A short name tolerates fewer typos
+            distance = edit_distance(_compact(key), _compact(candidate), cap)
+            if distance > cap:
+                continue
+            if distance < best_distance:
+                best, best_distance = [found], distance
+            elif distance == best_distance and found[1] != best[0][1]:
+                best.append(found)
+
+        if len(best) != 1:  # Nothing close enough, or a tie between different names
+            return None
+        return NameMatch(*best[0], match_type="fuzzy", distance=best_distance)
+
+    @staticmethod
+    def _pick(entries: List[Tuple[str, str, str]], entry_type: Optional[str]) -> Optional[Tuple[str, str, str]]:
+        if entry_type is None:
+            return entries[0] if entries else None
+        return next((entry for entry in entries if entry[2] == entry_type), None)
+
+    def _add_key(self, key: str, value: Tuple[str, str, str], alias: bool = False) -> None:
+        if not key:
+            return
+        entries = self._entries.setdefault(key, [])
+        if value in entries:
+            return
+        if not entries:
+            for trigram in _trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(key)
+            self._compact.setdefault(_compact(key), key)
+            if alias:
+                self._aliases.add(key)
+        elif not alias:
+            self._aliases.discard(key)  # A real name wins over an alias
+        entries.append(value)
@@ -0,0 +1,191 @@
+"""
+Process-wide semantic cache of rules search results.
+
+Different phrasings of one question ("how does grappling work", "grapple
+rules") each paid a full hybrid search plus reference expansion. The cache
+stores, per query, its normalized embedding and the ranked result IDs with
+their expansion trees - not the rows, which carry large vectors. A later query
+is answered from the cache when:
+
+- its normalized text was seen before (no embedding call at all), or
+- the cosine similarity of its embedding to a cached query's embedding is at
+  least similarity_threshold
+
+Entries are partitioned by everything that changes the result (database,
+table, vector column, type filter, limit, expansion depth), bounded by a
+global LRU limit, and counted in hit/miss metrics. One instance is shared by
+every LanceRulesService - and therefore every session - in the process.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_SIMILARITY_THRESHOLD = 0.92  # Cosine similarity for two queries to share results
+
+Partition = Tuple[Hashable, ...]
+
+
+@dataclass
+class _Entry:
+    partition: Partition
+    text: str
+    vector: Optional[np.ndarray]  # Normalized query embedding
+    value: Any
+
+
+@dataclass
+class _Partition:
+    texts: Dict[str, int] = field(default_factory=dict)  # normalized text -> entry key
+    keys: List[int] = field(default_factory=list)  # Entries with a vector, in matrix row order
+    matrix: Optional[np.ndarray] = None  # Stacked vectors, rebuilt lazily after changes
+
+
+class SemanticResultCache:
+    """Bounded LRU cache of search results keyed by query text and embedding similarity."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()  # LRU order, oldest first
+        self._partitions: Dict[Partition, _Partition] = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+        self.text_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ==================== Lookup ====================
+
+    def get_by_text(self, partition: Partition, query: str) -> Optional[Any]:
+        """Cached value for the same query text (no miss is counted - get() follows)."""
+        with self._lock:
+            bucket = self._partitions.get(partition)
+            key = bucket.texts.get(_normalize(query)) if bucket else None
+            if key is None:
+                return None
+            self.text_hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key].value
+
+    def get(self, partition: Partition, query: str, embedding: Sequence[float]) -> Optional[Any]:
+        """Cached value for the same text or the most similar cached embedding."""
+        with self._lock:
+            bucket = self._partitions.get(partition)
+            key = bucket.texts.get(_normalize(query)) if bucket else None
+            if key is not None:
+                self.text_hits += 1
+            elif bucket and bucket.keys:
+                if bucket.matrix is None:
+                    bucket.matrix = np.stack([self._entries[k].vector for k in bucket.keys])
+                similarities = bucket.matrix @ _unit(embedding)
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    key = bucket.keys[best]
+                    self.semantic_hits += 1
+
+            if key is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key].value
+
+    # ==================== Maintenance ====================
+
+    def put(self, partition: Partition, query: str, embedding: Optional[Sequence[float]], value: Any) -> None:
+        """Cache a value for a query, evicting the least recently used entries beyond max_entries."""
+        text = _normalize(query)
+        with self._lock:
+            bucket = self._partitions.setdefault(partition, _Partition())
+            if text in bucket.texts:
+                self._remove(bucket.texts[text])
+                bucket = self._partitions.setdefault(partition, _Partition())
+
+            key = self._next_key
+            self._next_key += 1
+            vector = _unit(embedding) if embedding is not None else None
+            self._entries[key] = _Entry(partition, text, vector, value)
+            bucket.texts[text] = key
+            if vector is not None:
+                bucket.keys.append(key)
+                bucket.matrix = None
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, prefix: Partition = ()) -> int:
+        """
+        Drop every partition whose key starts with prefix (everything by default).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if entry.partition[:len(prefix)] == prefix
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics and size."""
+        with self._lock:
+            hits = self.text_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "partitions": len(self._partitions),
+                "hits": hits,
+                "text_hits": self.text_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        bucket = self._partitions[entry.partition]
+        if bucket.texts.get(entry.text) == key:
+            del bucket.texts[entry.text]
+        if entry.vector is not None:
+            bucket.keys.remove(key)
+            bucket.matrix = None
+        if not bucket.texts and not bucket.keys:
+            del self._partitions[entry.partition]
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _unit(vector: Sequence[float]) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+_shared_cache: Optional[SemanticResultCache] = None
+
+
+def get_semantic_result_cache() -> SemanticResultCache:
+    """Get the process-wide result cache shared by every LanceRulesService."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SemanticResultCache()
+    return _shared_cache
@@ -38,18 +38,28 @@ logging.getLogger('discord.http').setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
-def create_bot() -> commands.Bot:
+def create_intents() -> discord.Intents:
+    """Gateway intents used by the bot (shared by the gateway in multi-process mode)."""
+    # Configure intents (required for message content and guild access)
+    intents = discord.Intents.default()
+    intents.message_content = True  # Required to read message content
+    intents.guilds = True  # Required for guild information
+    intents.members = False  # Not needed for now
+    return intents
+
+
+def create_bot(sync_commands: bool = True) -> commands.Bot:
     """
     Create and configure the Discord bot.
 
+    Args:
+        sync_commands: Whether to sync slash commands on ready (only one worker
+            does this in multi-process mode)
+
     Returns:
         Configured Discord bot instance
     """
-    # Configure intents (required for message content and guild access)
-    intents = discord.Intents.default()
-    intents.message_content = True  # Required to read message content
-    intents.guilds = True  # Required for guild information
-    intents.members = False  # Not needed for now
+    intents = create_intents()
 
     # Create bot instance
     bot = commands.Bot(
@@ -64,21 +74,19 @@ def create_bot() -> commands.Bot:
         print(f"✓ Bot connected as {bot.user} (ID: {bot.user.id})")
         print(f"✓ Connected to {len(bot.guilds)} guild(s)")
         print("✓ D&D Dungeon Master Bot is ready!")
-        #TODO: may want to make it 
-        # Clean up orphaned sessions from previous runs
+        # Recover sessions that were live before the restart from their checkpoints
+        # (sessions without a usable checkpoint are cleaned up as orphans)
         try:
-            from src.persistence.database import get_session
-            from src.persistence.repositories.session_repo import SessionRepository
-
-            async with get_session() as db_session:
-                session_repo = SessionRepository(db_session)
-                # Delete all active sessions (they're orphaned if bot just started)
-                deleted_count = await session_repo.delete_all_active()
-                await db_session.commit()
-                if deleted_count > 0:
-                    print(f"✓ Cleaned up {deleted_count} orphaned session(s) from database")
+            from src.discord.utils.session_pool import get_session_pool
+
+            recovered = await get_session_pool().recover_from_checkpoints()
+            if recovered > 0:
+                print(f"✓ Recovered {recovered} session(s) from checkpoints")
         except Exception as e:
-            print(f"⚠ Warning: Could not clean up orphaned sessions: {e}")
+            print(f"⚠ Warning: Could not recover sessions from checkpoints: {e}")
+
+        if not sync_commands:
+            return
 
         # Sync slash commands with Discord
         try:
@@ -137,6 +145,17 @@ async def main():
         print("  Please set DISCORD_BOT_TOKEN in your .env file")
         return
 
+    # Multi-process mode: this process only holds the gateway connection
+    from src.config.settings import get_settings
+
+    worker_count = get_settings().discord_workers
+    if worker_count > 1:
+        from src.discord.gateway import run_gateway
+
+        print(f"Starting Discord gateway with {worker_count} workers...")
+        await run_gateway(token, worker_count)
+        return
+
     # Create bot
     bot = create_bot()
 
@@ -14,6 +14,7 @@ from discord.ext import commands
 from src.persistence.database import get_session
 from src.persistence.repositories.api_key_repo import APIKeyRepository
 from src.discord.utils.session_pool import get_session_pool
+from src.discord.worker import get_worker_link
 
 
 class AdminCommands(commands.Cog):
@@ -118,6 +119,11 @@ class AdminCommands(commands.Cog):
                 # End all active sessions for this guild
                 ended_sessions = await self.session_pool.end_all_guild_sessions(guild_id)
 
+                # Multi-process mode: the guild's other channels live in other workers
+                worker_link = get_worker_link()
+                if worker_link:
+                    worker_link.broadcast("end_guild_sessions", guild_id=guild_id)
+
                 response_msg = "✅ **Server API Key Removed**\n\n"
                 response_msg += "The server's API key has been deleted from the database.\n"
 
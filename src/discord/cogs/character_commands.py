@@ -8,11 +8,13 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import json
-import os
-from pathlib import Path
+from pydantic import ValidationError
 
+from src.characters.character_codec import character_from_json
 from src.discord.utils.session_pool import get_session_pool
 
+BUILTIN_CHARACTERS = ("fighter", "wizard", "cleric")
+
 
 class CharacterCommands(commands.Cog):
     """Commands for character management."""
@@ -21,9 +23,9 @@ class CharacterCommands(commands.Cog):
         self.bot = bot
         self.session_pool = get_session_pool()
 
-    def _get_session_or_error(self, interaction: discord.Interaction):
-        """Helper to get session or return error message."""
-        session_context = self.session_pool.get(interaction.channel_id)
+    async def _get_session_or_error(self, interaction: discord.Interaction):
+        """Helper to get session (rehydrating it if hibernated) or return error message."""
+        session_context = await self.session_pool.get_or_restore(interaction.channel_id)
         if not session_context:
             return None, "⚠️ No active game session in this channel. Use `/start` to begin."
         return session_context, None
@@ -173,7 +175,7 @@ class CharacterCommands(commands.Cog):
     @app_commands.command(name="character", description="View your character's stats and status")
     async def show_character(self, interaction: discord.Interaction):
         """Show character status using Character's built-in summary methods."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -211,7 +213,7 @@ class CharacterCommands(commands.Cog):
     @app_commands.command(name="character-detailed", description="View your character's full detailed sheet")
     async def show_character_detailed(self, interaction: discord.Interaction):
         """Show detailed character sheet with full descriptions (handles Discord message limits)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -305,7 +307,7 @@ class CharacterCommands(commands.Cog):
     @app_commands.describe(character_id="Character ID (use /who to see available characters)")
     async def register_character(self, interaction: discord.Interaction, character_id: str):
         """Register character (mirrors demo_terminal.py:482-500)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -341,25 +343,19 @@ class CharacterCommands(commands.Cog):
     @app_commands.command(name="who", description="Show all available characters")
     async def show_characters(self, interaction: discord.Interaction):
         """Show available characters."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
 
         session_manager = session_context.session_manager
 
-        # Get character directory from session's temp directory
-        char_dir = session_context.temp_character_dir or "src/characters"
-
-        # Dynamically discover all character JSON files
-        all_char_files = []
-        if os.path.exists(char_dir):
-            all_char_files = [f[:-5] for f in os.listdir(char_dir) if f.endswith('.json')]
-
-        # Separate built-in from custom
-        builtin_chars = ["fighter", "wizard", "cleric"]
-        builtin_available = [c for c in all_char_files if c in builtin_chars]
-        custom_available = [c for c in all_char_files if c not in builtin_chars]
+        # Built-in sheets are shared; uploads exist only in this session's overlay
+        builtin_available = list(BUILTIN_CHARACTERS)
+        custom_available = [
+            c for c in session_manager.state_manager.uploaded_character_ids()
+            if c not in BUILTIN_CHARACTERS
+        ]
 
         who_text = "**🎭 Available Characters**\n\n"
 
@@ -398,7 +394,7 @@ class CharacterCommands(commands.Cog):
     @app_commands.describe(character_file="JSON file containing character data")
     async def upload_character(self, interaction: discord.Interaction, character_file: discord.Attachment):
         """Upload a custom character JSON file."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -446,8 +442,7 @@ class CharacterCommands(commands.Cog):
 
             # Prevent overwriting built-in characters
             character_id = data["character_id"]
-            builtin_chars = ["fighter", "wizard", "cleric"]
-            if character_id in builtin_chars:
+            if character_id in BUILTIN_CHARACTERS:
                 await interaction.followup.send(
                     f"❌ Cannot upload a character with ID '{character_id}' - this is a built-in character.\n"
                     f"Please use a different character_id in your JSON file.",
@@ -455,20 +450,19 @@ class CharacterCommands(commands.Cog):
                 )
                 return
 
-            # Save to session's temp character directory
-            char_dir = session_context.temp_character_dir or "src/characters"
-            os.makedirs(char_dir, exist_ok=True)
-
-            char_file_path = Path(char_dir) / f"{character_id}.json"
-
-            with open(char_file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            try:
+                character = character_from_json(file_bytes)
+            except ValidationError as e:
+                await interaction.followup.send(
+                    f"❌ Failed to load uploaded character: {e.error_count()} invalid field(s).\n"
+                    f"Please check your JSON structure.",
+                    ephemeral=True
+                )
+                return
 
-            # Verify the character can be loaded
+            # Keep the sheet in this session's state only - never on shared disk
             session_manager = session_context.session_manager
-            character = session_manager.state_manager.load_character(character_id)
-
-            if not character:
+            if not session_manager.state_manager.add_uploaded_character(character_id, character):
                 await interaction.followup.send(
                     f"❌ Failed to load uploaded character. Please check your JSON structure.",
                     ephemeral=True
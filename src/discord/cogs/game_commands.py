@@ -21,9 +21,9 @@ class GameCommands(commands.Cog):
         self.bot = bot
         self.session_pool = get_session_pool()
 
-    def _get_session_or_error(self, interaction: discord.Interaction):
-        """Helper to get session or return error message."""
-        session_context = self.session_pool.get(interaction.channel_id)
+    async def _get_session_or_error(self, interaction: discord.Interaction):
+        """Helper to get session (rehydrating it if hibernated) or return error message."""
+        session_context = await self.session_pool.get_or_restore(interaction.channel_id)
         if not session_context:
             return None, "⚠️ No active game session in this channel. Use `/start` to begin."
         return session_context, None
@@ -31,7 +31,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="turn", description="Show current turn information")
     async def show_turn(self, interaction: discord.Interaction):
         """Show current turn info (mirrors demo_terminal.py:269-287)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -92,7 +92,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="combat-state", description="Show current combat state and initiative order")
     async def show_combat_state(self, interaction: discord.Interaction):
         """Show current combat state including phase, round, and initiative order."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -157,7 +157,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="history", description="Show completed turns history")
     async def show_history(self, interaction: discord.Interaction):
         """Show completed turns (mirrors demo_terminal.py:289-302)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -189,7 +189,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="stats", description="Show turn manager statistics")
     async def show_stats(self, interaction: discord.Interaction):
         """Show turn manager stats (mirrors demo_terminal.py:304-321)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -219,7 +219,7 @@ class GameCommands(commands.Cog):
     @app_commands.command(name="context", description="Show DM context (for debugging)")
     async def show_context(self, interaction: discord.Interaction):
         """Show DM context (mirrors demo_terminal.py:238-372)."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -326,7 +326,7 @@ class GameCommands(commands.Cog):
         force: Optional[bool] = False
     ):
         """Toggle or manage combat mode for multiplayer coordination."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -513,7 +513,7 @@ class GameCommands(commands.Cog):
     # @app_commands.describe(roll="Your initiative roll result (d20 + modifier)")
     # async def initiative(self, interaction: discord.Interaction, roll: int):
     #     """Submit an initiative roll during combat start phase."""
-    #     session_context, error = self._get_session_or_error(interaction)
+    #     session_context, error = await self._get_session_or_error(interaction)
     #     if error:
     #         await interaction.response.send_message(error, ephemeral=True)
     #         return
@@ -593,7 +593,7 @@ class GameCommands(commands.Cog):
         value: Optional[str] = None
     ):
         """Configure session settings like timeouts."""
-        session_context, error = self._get_session_or_error(interaction)
+        session_context, error = await self._get_session_or_error(interaction)
         if error:
             await interaction.response.send_message(error, ephemeral=True)
             return
@@ -7,8 +7,9 @@ plus the on_message handler for player actions during active sessions.
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from typing import Optional, List
+from dataclasses import asdict
 import logging
 
 # Set up logger for this module
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 from src.discord.utils.session_pool import get_session_pool, SessionContext
 from src.discord.utils.message_converter import discord_to_chat_message
+from src.discord.utils.narrative_streamer import NarrativeStreamer
+from src.discord.utils.send_queue import get_outbound_dispatcher
+from src.persistence.turn_checkpointer import get_turn_checkpointer
 from src.memory.message_coordinator import MessageValidationResult
 from src.memory.response_collector import AddResult
 from src.models.response_expectation import ResponseExpectation, ResponseType
@@ -31,6 +35,28 @@ class SessionCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.session_pool = get_session_pool()
+        # Outbound sends are queued per channel (coalesced, rate-limit aware)
+        self.outbound = get_outbound_dispatcher()
+        # Sessions are checkpointed to the database after each DM cycle (written in the background)
+        self.checkpointer = get_turn_checkpointer()
+
+    async def cog_load(self):
+        """Start background session maintenance."""
+        self.hibernate_idle_sessions.start()
+
+    async def cog_unload(self):
+        """Stop background session maintenance."""
+        self.hibernate_idle_sessions.cancel()
+
+    @tasks.loop(seconds=60)
+    async def hibernate_idle_sessions(self):
+        """Periodically hibernate idle / least recently used sessions to free memory."""
+        try:
+            count = await self.session_pool.hibernate_idle()
+            if count:
+                logger.info(f"Hibernated {count} idle session(s)")
+        except Exception as e:
+            logger.exception(f"Error hibernating idle sessions: {e}")
 
     def _sync_combat_mode_with_phase(self, session_context: SessionContext) -> None:
         """
@@ -66,8 +92,8 @@ class SessionCommands(commands.Cog):
         guild_id = interaction.guild_id
         guild_name = interaction.guild.name if interaction.guild else "Unknown Guild"
 
-        # Check if session already exists
-        if self.session_pool.get(channel_id):
+        # Check if session already exists (resident or hibernated)
+        if self.session_pool.has_session(channel_id):
             await interaction.response.send_message(
                 "⚠️ A game session is already active in this channel. Use `/end` to end it first.",
                 ephemeral=True
@@ -121,8 +147,8 @@ class SessionCommands(commands.Cog):
         """End the game session in the current channel."""
         channel_id = interaction.channel_id
 
-        # Check if session exists
-        if not self.session_pool.get(channel_id):
+        # Check if session exists (resident or hibernated)
+        if not self.session_pool.has_session(channel_id):
             await interaction.response.send_message(
                 "⚠️ No active game session in this channel.",
                 ephemeral=True
@@ -131,6 +157,7 @@ class SessionCommands(commands.Cog):
 
         # End session
         await self.session_pool.end_session(channel_id)
+        self.outbound.remove_channel(channel_id)
 
         await interaction.response.send_message(
             "👋 **Game Session Ended**\n\n"
@@ -150,8 +177,8 @@ class SessionCommands(commands.Cog):
         if message.author.bot:
             return
 
-        # Check if message is in an active session channel
-        session_context = self.session_pool.get(message.channel.id)
+        # Check if message is in an active session channel (rehydrates hibernated sessions)
+        session_context = await self.session_pool.get_or_restore(message.channel.id)
         if not session_context:
             return  # No active session in this channel
 
@@ -173,147 +200,162 @@ class SessionCommands(commands.Cog):
             )
             return
 
-        try:
-            # Show typing indicator while processing
-            async with message.channel.typing():
-                # Get player's active character
-                # For Phase 1, we'll use the character name from the player registry
-                player_id = str(message.author.id)
-                session_manager = session_context.session_manager
-
-                # Get character for this player
-                character_id = session_manager.player_character_registry.get_character_id_by_player_id(player_id)
-
-                if not character_id:
-                    # Player hasn't registered a character yet
-                    await message.channel.send(
-                        f"{message.author.mention} ⚠️ You haven't registered a character yet! "
-                        f"Use `/register <character_id>` to register.\n"
-                        f"Available characters: fighter, wizard, cleric"
-                    )
-                    return
-
-                # Use character_id for system validation, character_name for DM narrative
-                # character_id: canonical identifier for turn tracking, validation, initiative
-                # character_name: display name for narrative flavor (e.g., "Tharion Stormwind")
-                character = session_manager.state_manager.get_character(character_id)
-                character_display_name = character.info.name if character else character_id
-
-                # Milestone 5: Validate responder via MessageCoordinator
-                # Use character_id for validation (matches turn tracking)
-                coordinator = session_context.message_coordinator
-                if coordinator:
-                    validation = coordinator.validate_responder(character_id)
-                    if validation.result != MessageValidationResult.VALID:
-                        if coordinator.combat_mode:
-                            # In combat mode, reject invalid responders with feedback
-                            await self._send_validation_feedback(message, validation)
-                            return
-                        # In exploration mode, let message through (validation passes)
-
-                # Convert Discord message to ChatMessage format
-                # Use display name for narrative (DM sees "Tharion Stormwind said...")
-                chat_message = discord_to_chat_message(message, character_display_name)
-
-                # Milestone 5: Multi-response collection for combat mode
-                # Only use collection logic when there's an active expectation with a collector
-                if coordinator and coordinator.combat_mode and coordinator.current_expectation:
-                    # Add response to collector (use character_id for tracking)
-                    add_result = coordinator.add_response(character_id, chat_message)
-
-                    if add_result == AddResult.DUPLICATE:
-                        await message.reply(
-                            "You've already responded! Waiting for others...",
-                            delete_after=10
-                        )
-                        return
-                    elif add_result == AddResult.UNEXPECTED:
-                        await message.reply(
-                            "Your response wasn't expected at this time.",
-                            delete_after=10
-                        )
-                        return
-
-                    # Check if collection is complete
-                    if not coordinator.is_collection_complete():
-                        # Show progress (use display name for user-facing message)
-                        missing = coordinator.get_missing_responders()
-                        collected_count = len(coordinator.get_collected_responses())
-                        total_count = collected_count + len(missing)
-                        await message.add_reaction("✅")
+        # Busy sessions are never hibernated mid-turn
+        with session_context.in_use():
+            try:
+                # Show typing indicator while processing
+                async with message.channel.typing():
+                    # Get player's active character
+                    # For Phase 1, we'll use the character name from the player registry
+                    player_id = str(message.author.id)
+                    session_manager = session_context.session_manager
+
+                    # Get character for this player
+                    character_id = session_manager.player_character_registry.get_character_id_by_player_id(player_id)
+
+                    if not character_id:
+                        # Player hasn't registered a character yet
                         await message.channel.send(
-                            f"Got **{character_display_name}**'s response. "
-                            f"({collected_count}/{total_count}) "
-                            f"Waiting for: {', '.join(missing)}"
+                            f"{message.author.mention} ⚠️ You haven't registered a character yet! "
+                            f"Use `/register <character_id>` to register.\n"
+                            f"Available characters: fighter, wizard, cleric"
                         )
                         return
 
-                    # Collection complete - gather all messages for batch processing
-                    collected_messages = list(coordinator.get_collected_responses().values())
-                else:
-                    # Exploration mode, no coordinator, or no expectation set - single message processing
-                    collected_messages = [chat_message]
-
-                # Process through SessionManager
-                result = await session_manager.demo_process_player_input(
-                    new_messages=collected_messages
-                )
-
-                # Sync combat_mode with current game phase after DM processing
-                # (phase may have changed during processing, e.g., entering COMBAT_ROUNDS)
-                self._sync_combat_mode_with_phase(session_context)
+                    # Use character_id for system validation, character_name for DM narrative
+                    # character_id: canonical identifier for turn tracking, validation, initiative
+                    # character_name: display name for narrative flavor (e.g., "Tharion Stormwind")
+                    character = session_manager.state_manager.get_character(character_id)
+                    character_display_name = character.info.name if character else character_id
+
+                    # Milestone 5: Validate responder via MessageCoordinator
+                    # Use character_id for validation (matches turn tracking)
+                    coordinator = session_context.message_coordinator
+                    if coordinator:
+                        validation = coordinator.validate_responder(character_id)
+                        if validation.result != MessageValidationResult.VALID:
+                            if coordinator.combat_mode:
+                                # In combat mode, reject invalid responders with feedback
+                                await self._send_validation_feedback(message, validation)
+                                return
+                            # In exploration mode, let message through (validation passes)
+
+                    # Convert Discord message to ChatMessage format
+                    # Use display name for narrative (DM sees "Tharion Stormwind said...")
+                    chat_message = discord_to_chat_message(message, character_display_name)
+
+                    # Milestone 5: Multi-response collection for combat mode
+                    # Only use collection logic when there's an active expectation with a collector
+                    if coordinator and coordinator.combat_mode and coordinator.current_expectation:
+                        # Add response to collector (use character_id for tracking)
+                        add_result = coordinator.add_response(character_id, chat_message)
+
+                        if add_result == AddResult.DUPLICATE:
+                            await message.reply(
+                                "You've already responded! Waiting for others...",
+                                delete_after=10
+                            )
+                            return
+                        elif add_result == AddResult.UNEXPECTED:
+                            await message.reply(
+                                "Your response wasn't expected at this time.",
+                                delete_after=10
+                            )
+                            return
 
-                # Milestone 5: Update expectation after DM response and show UI
-                if coordinator:
-                    awaiting = result.get("awaiting_response")
-                    coordinator.set_expectation(awaiting)
+                        # Check if collection is complete
+                        if not coordinator.is_collection_complete():
+                            # Show progress (use display name for user-facing message)
+                            missing = coordinator.get_missing_responders()
+                            collected_count = len(coordinator.get_collected_responses())
+                            total_count = collected_count + len(missing)
+                            await message.add_reaction("✅")
+                            self.outbound.enqueue(
+                                message.channel,
+                                f"Got **{character_display_name}**'s response. "
+                                f"({collected_count}/{total_count}) "
+                                f"Waiting for: {', '.join(missing)}"
+                            )
+                            return
 
-                # Send DM responses (mirrors demo_terminal.py:201-202)
-                for response_text in result["responses"]:
-                    # Format response with DM prefix
-                    formatted_response = f"**DM:** {response_text}"
-
-                    # Split if too long (Discord has 2000 char limit)
-                    if len(formatted_response) > 2000:
-                        # Split into chunks
-                        chunks = [formatted_response[i:i+1900] for i in range(0, len(formatted_response), 1900)]
-                        for chunk in chunks:
-                            await message.channel.send(chunk)
+                        # Collection complete - gather all messages for batch processing
+                        collected_messages = list(coordinator.get_collected_responses().values())
                     else:
-                        await message.channel.send(formatted_response)
+                        # Exploration mode, no coordinator, or no expectation set - single message processing
+                        collected_messages = [chat_message]
 
-                # Display state change notification if any (mirrors demo_terminal.py:205-209)
-                if result.get("state_results") and result["state_results"].get("success"):
-                    state_info = result["state_results"]
-                    if state_info.get("commands_executed", 0) > 0:
-                        await message.channel.send(
-                            f"💫 {state_info['commands_executed']} state changes applied\n"
-                            f"Type `/character` to see updated character status"
+                    # Process through SessionManager, streaming narration into a placeholder
+                    streamer = NarrativeStreamer(message.channel, dispatcher=self.outbound)
+                    await streamer.start()
+                    try:
+                        result = await session_manager.demo_process_player_input(
+                            new_messages=collected_messages,
+                            on_narrative=streamer.update
+                        )
+                    except Exception:
+                        await streamer.abort()
+                        raise
+
+                    # Sync combat_mode with current game phase after DM processing
+                    # (phase may have changed during processing, e.g., entering COMBAT_ROUNDS)
+                    self._sync_combat_mode_with_phase(session_context)
+
+                    # Milestone 5: Update expectation after DM response and show UI
+                    if coordinator:
+                        awaiting = result.get("awaiting_response")
+                        coordinator.set_expectation(awaiting)
+
+                    # Render final DM responses (mirrors demo_terminal.py:201-202)
+                    # Already-streamed text is only edited if it changed; split at Discord's 2000 char limit
+                    await streamer.finalize(result["responses"])
+                    self._checkpoint(session_context)
+
+                    # Display state change notification if any (mirrors demo_terminal.py:205-209)
+                    if result.get("state_results") and result["state_results"].get("success"):
+                        state_info = result["state_results"]
+                        if state_info.get("commands_executed", 0) > 0:
+                            self.outbound.enqueue(
+                                message.channel,
+                                f"💫 {state_info['commands_executed']} state changes applied\n"
+                                f"Type `/character` to see updated character status"
+                            )
+
+                    # Milestone 5: System-driven UI selection based on ResponseType
+                    # Show UI whenever there's a ResponseExpectation, regardless of combat_mode
+                    # combat_mode only controls validation (blocking wrong players), not UI display
+                    # This allows initiative modals during COMBAT_START even with combat_mode=False
+                    awaiting = result.get("awaiting_response")
+                    if coordinator and awaiting:
+                        # Show warning if characters were filtered (Milestone 6)
+                        filtered_warning = result.get("filtered_characters_warning")
+                        if filtered_warning:
+                            self.outbound.enqueue(message.channel, f"⚠️ *{filtered_warning}*")
+
+                        await self._show_response_ui(
+                            message.channel,
+                            awaiting,
+                            session_context
                         )
 
-                # Milestone 5: System-driven UI selection based on ResponseType
-                # Show UI whenever there's a ResponseExpectation, regardless of combat_mode
-                # combat_mode only controls validation (blocking wrong players), not UI display
-                # This allows initiative modals during COMBAT_START even with combat_mode=False
-                awaiting = result.get("awaiting_response")
-                if coordinator and awaiting:
-                    # Show warning if characters were filtered (Milestone 6)
-                    filtered_warning = result.get("filtered_characters_warning")
-                    if filtered_warning:
-                        await message.channel.send(f"⚠️ *{filtered_warning}*")
-
-                    await self._show_response_ui(
-                        message.channel,
-                        awaiting,
-                        session_context
-                    )
+            except Exception as e:
+                self.outbound.enqueue(
+                    message.channel,
+                    f"❌ Error processing message: {str(e)}\n"
+                    f"Please try again or use `/end` to restart the session."
+                )
+                logger.exception(f"Error in on_message: {e}")
 
-        except Exception as e:
-            await message.channel.send(
-                f"❌ Error processing message: {str(e)}\n"
-                f"Please try again or use `/end` to restart the session."
+    def _checkpoint(self, session_context: SessionContext) -> None:
+        """Queue a checkpoint of the session after a completed DM cycle."""
+        try:
+            self.checkpointer.checkpoint(
+                session_context.session_db_id,
+                session_context.session_manager,
+                session_context.message_coordinator,
+                timeouts=asdict(session_context.timeouts)
             )
-            logger.exception(f"Error in on_message: {e}")
+        except Exception as e:
+            logger.exception(f"Error checkpointing session: {e}")
 
     async def _send_validation_feedback(
         self,
@@ -377,6 +419,7 @@ class SessionCommands(commands.Cog):
         """
         from src.models.chat_message import ChatMessage
 
+        session_context.touch()
         session_manager = session_context.session_manager
         coordinator = session_context.message_coordinator
 
@@ -486,10 +529,17 @@ class SessionCommands(commands.Cog):
         try:
             # Show typing indicator while processing
             async with channel.typing():
-                # Process through SessionManager
-                result = await session_manager.demo_process_player_input(
-                    new_messages=[system_message]
-                )
+                # Process through SessionManager, streaming narration into a placeholder
+                streamer = NarrativeStreamer(channel, dispatcher=self.outbound)
+                await streamer.start()
+                try:
+                    result = await session_manager.demo_process_player_input(
+                        new_messages=[system_message],
+                        on_narrative=streamer.update
+                    )
+                except Exception:
+                    await streamer.abort()
+                    raise
 
                 # Sync combat_mode with current game phase after DM processing
                 self._sync_combat_mode_with_phase(session_context)
@@ -499,22 +549,16 @@ class SessionCommands(commands.Cog):
                     awaiting = result.get("awaiting_response")
                     coordinator.set_expectation(awaiting)
 
-                # Send DM responses
-                for response_text in result["responses"]:
-                    formatted_response = f"**DM:** {response_text}"
-
-                    if len(formatted_response) > 2000:
-                        chunks = [formatted_response[i:i+1900] for i in range(0, len(formatted_response), 1900)]
-                        for chunk in chunks:
-                            await channel.send(chunk)
-                    else:
-                        await channel.send(formatted_response)
+                # Render final DM responses
+                await streamer.finalize(result["responses"])
+                self._checkpoint(session_context)
 
                 # Display state change notification if any
                 if result.get("state_results") and result["state_results"].get("success"):
                     state_info = result["state_results"]
                     if state_info.get("commands_executed", 0) > 0:
-                        await channel.send(
+                        self.outbound.enqueue(
+                            channel,
                             f"💫 {state_info['commands_executed']} state changes applied\n"
                             f"Type `/character` to see updated character status"
                         )
@@ -526,12 +570,13 @@ class SessionCommands(commands.Cog):
                     # Show warning if characters were filtered (Milestone 6)
                     filtered_warning = result.get("filtered_characters_warning")
                     if filtered_warning:
-                        await channel.send(f"⚠️ *{filtered_warning}*")
+                        self.outbound.enqueue(channel, f"⚠️ *{filtered_warning}*")
 
                     await self._show_response_ui(channel, awaiting, session_context)
 
         except Exception as e:
-            await channel.send(
+            self.outbound.enqueue(
+                channel,
                 f"❌ Error processing {response_type} results: {str(e)}\n"
                 f"Please try again or use `/end` to restart the session."
             )
@@ -638,7 +683,7 @@ class SessionCommands(commands.Cog):
             # Standard turn - just announce whose turn it is (use display name)
             active_id = expectation.characters[0] if expectation.characters else "Unknown"
             active_name = id_to_name_map.get(active_id, active_id)
-            await channel.send(f"*⚔️ It's **{active_name}**'s turn. {active_name} may respond.*")
+            self.outbound.enqueue(channel, f"*⚔️ It's **{active_name}**'s turn. {active_name} may respond.*")
 
         elif expectation.response_type == ResponseType.INITIATIVE:
             # Show initiative view with roll button
@@ -650,7 +695,8 @@ class SessionCommands(commands.Cog):
                 on_complete=on_initiative_complete,
             )
             display_names = get_display_names(expectation.characters)
-            await channel.send(
+            self.outbound.enqueue(
+                channel,
                 "🎲 **Roll for Initiative!**\n"
                 f"Waiting for: {', '.join(display_names)}",
                 view=view
@@ -671,7 +717,7 @@ class SessionCommands(commands.Cog):
                 get_save_modifier=get_save_modifier,
                 on_complete=on_save_complete,
             )
-            await channel.send(f"🎲 **{prompt}**", view=view)
+            self.outbound.enqueue(channel, f"🎲 **{prompt}**", view=view)
 
         elif expectation.response_type == ResponseType.REACTION:
             # Show reaction view with Pass/Use Reaction buttons
@@ -683,7 +729,7 @@ class SessionCommands(commands.Cog):
                 get_character_for_user=get_character_for_user,
                 on_complete=on_reaction_complete,
             )
-            await channel.send(f"⚡ {prompt}", view=view)
+            self.outbound.enqueue(channel, f"⚡ {prompt}", view=view)
 
         elif expectation.response_type == ResponseType.FREE_FORM:
             # Exploration mode - anyone can respond (use display names)
@@ -692,7 +738,7 @@ class SessionCommands(commands.Cog):
                 chars = ', '.join(display_names)
             else:
                 chars = "Anyone"
-            await channel.send(f"*{chars} may respond.*")
+            self.outbound.enqueue(channel, f"*{chars} may respond.*")
 
 
 async def setup(bot: commands.Bot):
@@ -0,0 +1,186 @@
+"""
+Gateway process for multi-process mode.
+
+The gateway owns the single Discord websocket and does no game work. Every
+dispatch event is routed by channel: events with a channel (messages,
+interactions, typing, reactions) go to the worker that owns the channel on a
+consistent hash ring; guild-level events (READY, GUILD_CREATE, ...) are
+broadcast to all workers so each keeps its own guild/channel cache.
+
+Workers that die are restarted with READY and the latest GUILD_CREATE of each
+guild replayed, so they rebuild their caches; their sessions come back from
+checkpoints once the dead worker's ownership locks are released.
+"""
+
+import asyncio
+import json
+import multiprocessing
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from src.discord.utils.hash_ring import ConsistentHashRing
+
+SUPERVISE_INTERVAL = 5.0  # Seconds between worker liveness checks
+
+# Events the gateway only forwards - it never builds objects for them
+FORWARD_ONLY_EVENTS = (
+    "MESSAGE_CREATE",
+    "MESSAGE_UPDATE",
+    "MESSAGE_DELETE",
+    "MESSAGE_DELETE_BULK",
+    "MESSAGE_REACTION_ADD",
+    "MESSAGE_REACTION_REMOVE",
+    "MESSAGE_REACTION_REMOVE_ALL",
+    "MESSAGE_REACTION_REMOVE_EMOJI",
+    "TYPING_START",
+    "INTERACTION_CREATE",
+)
+
+
+def routing_channel_id(event_type: str, data: Dict[str, Any]) -> Optional[int]:
+    """Get the channel an event belongs to, or None for guild-level events."""
+    channel_id = data.get("channel_id")
+    if channel_id is None and event_type == "INTERACTION_CREATE":
+        channel_id = (data.get("channel") or {}).get("id")
+    return int(channel_id) if channel_id is not None else None
+
+
+def _ignore(data: Dict[str, Any]) -> None:
+    pass
+
+
+class WorkerHandle:
+    """A worker process and the queue of events sent to it."""
+
+    def __init__(self, worker_id: int, worker_count: int, token: str, control_queue):
+        self.worker_id = worker_id
+        self.worker_count = worker_count
+        self._token = token
+        self._control_queue = control_queue
+        self._context = multiprocessing.get_context("spawn")
+        self.queue = None
+        self.process: Optional[multiprocessing.Process] = None
+
+    def start(self, replay: List[str]) -> None:
+        """Start (or restart) the process, replaying cached guild state first."""
+        from src.discord.worker import run_worker
+
+        self.queue = self._context.Queue()
+        for raw in replay:
+            self.queue.put(("event", raw))
+        self.process = self._context.Process(
+            target=run_worker,
+            args=(self.worker_id, self.worker_count, self._token, self.queue, self._control_queue),
+            name=f"dnd-worker-{self.worker_id}",
+            daemon=True,
+        )
+        self.process.start()
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def send_event(self, raw: str) -> None:
+        self.queue.put(("event", raw))
+
+    def send_control(self, name: str, payload: Dict[str, Any]) -> None:
+        self.queue.put(("control", name, payload))
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self.is_alive():
+            self.queue.put(("stop",))
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+
+
+class GatewayClient(discord.Client):
+    """Discord client that routes raw gateway events to worker processes."""
+
+    def __init__(self, token: str, worker_count: int, intents: discord.Intents):
+        super().__init__(intents=intents, enable_debug_events=True)
+        self.ring = ConsistentHashRing(worker_count)
+        self._control_queue = multiprocessing.get_context("spawn").Queue()
+        self.workers = [
+            WorkerHandle(worker_id, worker_count, token, self._control_queue)
+            for worker_id in range(worker_count)
+        ]
+        self._ready_payload: Optional[str] = None
+        self._guild_payloads: Dict[int, str] = {}  # guild_id -> latest GUILD_CREATE
+
+        for event_type in FORWARD_ONLY_EVENTS:
+            self._connection.parsers[event_type] = _ignore
+
+    def _replay(self) -> List[str]:
+        if self._ready_payload is None:
+            return []
+        return [self._ready_payload, *self._guild_payloads.values()]
+
+    async def setup_hook(self) -> None:
+        for worker in self.workers:
+            worker.start(self._replay())
+        asyncio.create_task(self._supervise())
+        asyncio.create_task(self._pump_control())
+
+    async def on_ready(self):
+        print(f"✓ Gateway connected as {self.user} - routing to {len(self.workers)} worker(s)")
+
+    async def on_socket_raw_receive(self, msg: Any) -> None:
+        raw = msg.decode() if isinstance(msg, bytes) else msg
+        payload = json.loads(raw)
+        if payload.get("op") != 0:
+            return  # Heartbeats, hello, etc. are handled by the gateway's own websocket
+
+        event_type, data = payload["t"], payload["d"]
+        if event_type == "READY":
+            self._ready_payload = raw
+            self._guild_payloads.clear()
+        elif event_type == "GUILD_CREATE":
+            self._guild_payloads[int(data["id"])] = raw
+        elif event_type == "GUILD_DELETE" and not data.get("unavailable"):
+            self._guild_payloads.pop(int(data["id"]), None)
+
+        channel_id = routing_channel_id(event_type, data)
+        if channel_id is None:
+            for worker in self.workers:
+                worker.send_event(raw)
+        else:
+            self.workers[self.ring.worker_for(channel_id)].send_event(raw)
+
+    async def _supervise(self) -> None:
+        """Restart workers that exited."""
+        while not self.is_closed():
+            await asyncio.sleep(SUPERVISE_INTERVAL)
+            for worker in self.workers:
+                if not worker.is_alive():
+                    print(f"⚠ Worker {worker.worker_id} exited (code {worker.process.exitcode}) - restarting")
+                    worker.start(self._replay())
+
+    async def _pump_control(self) -> None:
+        """Relay control messages from one worker to all the others."""
+        loop = asyncio.get_running_loop()
+        while not self.is_closed():
+            origin, name, payload = await loop.run_in_executor(None, self._control_queue.get)
+            if origin is None:
+                break  # Shutdown sentinel
+            for worker in self.workers:
+                if worker.worker_id != origin:
+                    worker.send_control(name, payload)
+
+    async def close(self) -> None:
+        for worker in self.workers:
+            worker.stop()
+        self._control_queue.put((None, None, None))  # Unblock _pump_control
+        await super().close()
+
+
+async def run_gateway(token: str, worker_count: int) -> None:
+    """Run the gateway and its workers until disconnected."""
+    from src.discord.bot import create_intents
+
+    client = GatewayClient(token, worker_count, create_intents())
+    try:
+        await client.start(token)
+    finally:
+        if not client.is_closed():
+            await client.close()
@@ -0,0 +1,49 @@
+"""
+Consistent hash ring for assigning Discord channels to worker processes.
+
+Each worker is placed on the ring many times (virtual nodes) so channels
+spread evenly, and adding or removing a worker only moves the channels
+adjacent to its points - roughly 1/N of them - instead of reshuffling all.
+"""
+
+import bisect
+import hashlib
+from typing import List, Tuple
+
+VIRTUAL_NODES = 128
+
+
+def _hash(key: str) -> int:
+    # Stable across processes and restarts (unlike the built-in hash())
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Maps channel IDs to worker IDs.
+
+    Usage:
+        ring = ConsistentHashRing(worker_count=4)
+        worker_id = ring.worker_for(channel_id)
+    """
+
+    def __init__(self, worker_count: int, virtual_nodes: int = VIRTUAL_NODES):
+        if worker_count < 1:
+            raise ValueError("worker_count must be at least 1")
+        self.worker_count = worker_count
+        points: List[Tuple[int, int]] = sorted(
+            (_hash(f"worker-{worker_id}#{replica}"), worker_id)
+            for worker_id in range(worker_count)
+            for replica in range(virtual_nodes)
+        )
+        self._keys = [point for point, _ in points]
+        self._workers = [worker_id for _, worker_id in points]
+
+    def worker_for(self, channel_id: int) -> int:
+        """Get the worker that owns a channel."""
+        index = bisect.bisect(self._keys, _hash(str(channel_id))) % len(self._keys)
+        return self._workers[index]
+
+    def owns(self, worker_id: int, channel_id: int) -> bool:
+        """Check whether a worker owns a channel."""
+        return self.worker_for(channel_id) == worker_id
@@ -0,0 +1,154 @@
+"""
+Progressive Discord rendering for streamed DM narration.
+
+Posts a placeholder message as soon as the DM starts generating, then edits it
+as the narrative streams in. Edits are throttled to stay well inside Discord's
+per-channel edit rate limits, and text past the message size limit rolls over
+into follow-up messages.
+"""
+
+import time
+import logging
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from src.discord.utils.send_queue import OutboundDispatcher
+
+logger = logging.getLogger(__name__)
+
+DM_PREFIX = "**DM:** "
+PLACEHOLDER_TEXT = f"{DM_PREFIX}*…*"
+CHUNK_SIZE = 1900  # Discord limit is 2000 - leave headroom (matches non-streamed chunking)
+MIN_EDIT_INTERVAL = 1.2  # seconds between renders (Discord allows ~5 edits / 5s per channel)
+
+
+def split_for_discord(text: str, chunk_size: int = CHUNK_SIZE) -> List[str]:
+    """
+    Split text into Discord-sized chunks.
+
+    Uses fixed-width slices so chunk boundaries stay stable as streamed text
+    grows - earlier messages never need re-editing once they fill up.
+    """
+    if not text:
+        return []
+    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+class NarrativeStreamer:
+    """
+    Renders streamed DM narratives into a Discord channel.
+
+    Each DM response (by index in the session manager's response list) gets its
+    own run of messages. Intermediate updates are throttled; finalize() always
+    renders the complete text so nothing is lost between throttled edits.
+
+    Usage:
+        streamer = NarrativeStreamer(channel)
+        await streamer.start()
+        result = await session_manager.demo_process_player_input(
+            new_messages=messages, on_narrative=streamer.update
+        )
+        await streamer.finalize(result["responses"])
+    """
+
+    def __init__(
+        self,
+        channel: discord.abc.Messageable,
+        min_edit_interval: float = MIN_EDIT_INTERVAL,
+        chunk_size: int = CHUNK_SIZE,
+        dispatcher: Optional["OutboundDispatcher"] = None
+    ):
+        """
+        Args:
+            channel: Channel to render into
+            min_edit_interval: Minimum seconds between throttled renders
+            chunk_size: Maximum characters per Discord message
+            dispatcher: Optional outbound queue; when given, new messages are sent
+                through it so they stay ordered with other queued channel output
+        """
+        self.channel = channel
+        self.dispatcher = dispatcher
+        self.min_edit_interval = min_edit_interval
+        self.chunk_size = chunk_size
+
+        self._messages: Dict[int, List[discord.Message]] = {}  # response index -> posted messages
+        self._rendered: Dict[int, List[str]] = {}  # response index -> chunk contents last sent
+        self._placeholder: Optional[discord.Message] = None
+        self._last_render: float = 0.0
+
+    async def start(self) -> None:
+        """Post the placeholder message that the first narrative will fill in."""
+        if self._placeholder is None:
+            self._placeholder = await self._send(PLACEHOLDER_TEXT)
+
+    async def update(self, index: int, text: str) -> None:
+        """
+        Receive the narrative-so-far for a response (throttled render).
+
+        Args:
+            index: Position of the narrative in the session manager's response list
+            text: Full narrative text received so far
+        """
+        now = time.monotonic()
+        if now - self._last_render < self.min_edit_interval:
+            return
+        self._last_render = now
+        await self._render(index, text)
+
+    async def finalize(self, responses: List[str]) -> None:
+        """
+        Render the final text of every response, unthrottled.
+
+        Responses that never streamed (e.g., streaming produced no partial output)
+        are sent here as regular messages.
+        """
+        for index, text in enumerate(responses):
+            await self._render(index, text)
+        await self.abort()
+
+    async def abort(self) -> None:
+        """Remove the placeholder if no narrative ever filled it."""
+        if self._placeholder is not None:
+            try:
+                await self._placeholder.delete()
+            except discord.HTTPException as e:
+                logger.warning(f"Could not delete narrative placeholder: {e}")
+            self._placeholder = None
+
+    async def _render(self, index: int, text: str) -> None:
+        """Bring the messages for one response in sync with its text."""
+        chunks = split_for_discord(f"{DM_PREFIX}{text}", self.chunk_size)
+        messages = self._messages.setdefault(index, [])
+        rendered = self._rendered.setdefault(index, [])
+
+        for i, chunk in enumerate(chunks):
+            if i < len(messages):
+                if rendered[i] != chunk:
+                    await messages[i].edit(content=chunk)
+                    rendered[i] = chunk
+            elif self._placeholder is not None:
+                # First text of the turn fills the placeholder
+                await self._placeholder.edit(content=chunk)
+                messages.append(self._placeholder)
+                rendered.append(chunk)
+                self._placeholder = None
+            else:
+                messages.append(await self._send(chunk))
+                rendered.append(chunk)
+
+        # Final text can be shorter than a partial render (e.g., the model
+        # revised its output) - drop messages no chunk maps to anymore
+        for message in messages[len(chunks):]:
+            try:
+                await message.delete()
+            except discord.HTTPException as e:
+                logger.warning(f"Could not delete stale narrative message: {e}")
+        del messages[len(chunks):]
+        del rendered[len(chunks):]
+
+    async def _send(self, content: str) -> discord.Message:
+        if self.dispatcher is not None:
+            return await self.dispatcher.send(self.channel, content)
+        return await self.channel.send(content)
@@ -0,0 +1,228 @@
+"""
+Rate-limit-aware outbound message queue for Discord channels.
+
+The DM pipeline produces several small messages per turn (state-change notices,
+filtered-character warnings, turn prompts, UI views). Sending each one with its
+own awaited REST call serializes the pipeline behind Discord's per-channel rate
+bucket. This module queues outbound payloads per channel, merges adjacent text
+payloads up to Discord's 2000 character limit, and paces sends with a local
+token bucket so callers can enqueue and move on.
+"""
+
+import asyncio
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE_LENGTH = 2000
+COALESCE_SEPARATOR = "\n"
+
+# Discord allows 5 messages per 5 seconds per channel
+DEFAULT_RATE = 5
+DEFAULT_PER = 5.0
+
+
+@dataclass
+class OutboundPayload:
+    """A single queued message and the future resolved with the sent Message."""
+    content: str
+    future: asyncio.Future
+    view: Optional[discord.ui.View] = None
+    coalesce: bool = True
+
+
+class SendRateLimiter:
+    """Token bucket pacing sends to a single channel."""
+
+    def __init__(self, rate: int = DEFAULT_RATE, per: float = DEFAULT_PER):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a send is allowed, then consume a token."""
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+            self._refill()
+        self._tokens -= 1
+
+
+class ChannelSendQueue:
+    """
+    Ordered outbound queue for one channel.
+
+    A worker task is started on demand and exits once the queue drains, so idle
+    channels hold no running tasks.
+    """
+
+    def __init__(
+        self,
+        channel: discord.abc.Messageable,
+        rate_limiter: Optional[SendRateLimiter] = None,
+        max_length: int = MAX_MESSAGE_LENGTH
+    ):
+        self.channel = channel
+        self.rate_limiter = rate_limiter or SendRateLimiter()
+        self.max_length = max_length
+        self._pending: Deque[OutboundPayload] = deque()
+        self._worker: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.payloads_enqueued = 0
+        self.messages_sent = 0
+
+    def enqueue(
+        self,
+        content: str,
+        view: Optional[discord.ui.View] = None,
+        coalesce: bool = True
+    ) -> asyncio.Future:
+        """
+        Queue a message without waiting for it to be sent.
+
+        Args:
+            content: Message text
+            view: Optional UI view to attach
+            coalesce: Whether this payload may be merged with adjacent ones
+
+        Returns:
+            Future resolved with the sent discord.Message (shared by merged payloads)
+        """
+        future = asyncio.get_running_loop().create_future()
+        # Fire-and-forget callers never read the result - mark failures as retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        self._pending.append(OutboundPayload(content=content, future=future, view=view, coalesce=coalesce))
+        self.payloads_enqueued += 1
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return future
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been sent."""
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    def _take_batch(self) -> List[OutboundPayload]:
+        """Pop the next payload plus any adjacent payloads it can be merged with."""
+        batch = [self._pending.popleft()]
+        if not batch[0].coalesce:
+            return batch
+
+        length = len(batch[0].content)
+        has_view = batch[0].view is not None
+        while self._pending:
+            candidate = self._pending[0]
+            if not candidate.coalesce or (has_view and candidate.view is not None):
+                break
+            merged_length = length + len(COALESCE_SEPARATOR) + len(candidate.content)
+            if merged_length > self.max_length:
+                break
+            batch.append(self._pending.popleft())
+            length = merged_length
+            has_view = has_view or candidate.view is not None
+        return batch
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch = self._take_batch()
+            content = COALESCE_SEPARATOR.join(p.content for p in batch)
+            view = next((p.view for p in batch if p.view is not None), None)
+
+            try:
+                sent = await self._send(content, view)
+            except Exception as e:
+                logger.exception(f"Failed to send queued message: {e}")
+                for payload in batch:
+                    if not payload.future.done():
+                        payload.future.set_exception(e)
+                continue
+
+            for payload in batch:
+                if not payload.future.done():
+                    payload.future.set_result(sent)
+
+    async def _send(self, content: str, view: Optional[discord.ui.View]) -> discord.Message:
+        """
+        Send one message, pacing against the bucket.
+
+        A 429 that slips past the bucket is retried by discord.py's HTTP client
+        itself (it sleeps out the bucket reset), so there is no retry loop here.
+        """
+        await self.rate_limiter.acquire()
+        if view is not None:
+            message = await self.channel.send(content, view=view)
+        else:
+            message = await self.channel.send(content)
+        self.messages_sent += 1
+        return message
+
+
+class OutboundDispatcher:
+    """Routes outbound messages to a per-channel ChannelSendQueue."""
+
+    def __init__(self):
+        self._queues: Dict[int, ChannelSendQueue] = {}  # channel_id -> queue
+
+    def get_queue(self, channel: discord.abc.Messageable) -> ChannelSendQueue:
+        """Get (or create) the queue for a channel."""
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = ChannelSendQueue(channel)
+            self._queues[channel.id] = queue
+        return queue
+
+    def enqueue(
+        self,
+        channel: discord.abc.Messageable,
+        content: str,
+        view: Optional[discord.ui.View] = None,
+        coalesce: bool = True
+    ) -> asyncio.Future:
+        """Queue a message for a channel without awaiting the send."""
+        return self.get_queue(channel).enqueue(content, view=view, coalesce=coalesce)
+
+    async def send(
+        self,
+        channel: discord.abc.Messageable,
+        content: str,
+        view: Optional[discord.ui.View] = None
+    ) -> discord.Message:
+        """Queue a standalone (never merged) message and wait for it to be sent."""
+        return await self.enqueue(channel, content, view=view, coalesce=False)
+
+    async def flush(self, channel: discord.abc.Messageable) -> None:
+        """Wait for a channel's queue to drain."""
+        queue = self._queues.get(channel.id)
+        if queue:
+            await queue.flush()
+
+    def remove_channel(self, channel_id: int) -> None:
+        """Forget a channel's queue (e.g., when its session ends)."""
+        self._queues.pop(channel_id, None)
+
+
+# Global dispatcher instance
+_outbound_dispatcher: Optional[OutboundDispatcher] = None
+
+
+def get_outbound_dispatcher() -> OutboundDispatcher:
+    """Get or create the global outbound dispatcher instance."""
+    global _outbound_dispatcher
+    if _outbound_dispatcher is None:
+        _outbound_dispatcher = OutboundDispatcher()
+    return _outbound_dispatcher
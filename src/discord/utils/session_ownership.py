@@ -0,0 +1,78 @@
+"""
+Session ownership across worker processes using Postgres advisory locks.
+
+A worker holds a session-level advisory lock (keyed by channel ID) for every
+session it has in memory. The locks live on one dedicated connection, so if a
+worker crashes or is restarted its locks are released by Postgres and another
+worker can take over the channel and restore it from its checkpoint.
+"""
+
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+class SessionOwnership:
+    """Claims and releases channel ownership for one worker process."""
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self._connection: Optional[AsyncConnection] = None
+        self._owned: Set[int] = set()
+
+    async def _get_connection(self) -> AsyncConnection:
+        if self._connection is None or self._connection.closed:
+            from src.persistence.database import get_engine
+
+            # Locks are tied to this connection - a reconnect means they were lost
+            self._owned.clear()
+            self._connection = await get_engine().connect()
+        return self._connection
+
+    async def claim(self, channel_id: int) -> bool:
+        """
+        Try to take ownership of a channel.
+
+        Returns:
+            True if this worker owns the channel (already or newly), False if
+            another worker holds it
+        """
+        if channel_id in self._owned:
+            return True
+        try:
+            connection = await self._get_connection()
+            result = await connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": channel_id}
+            )
+            acquired = bool(result.scalar())
+            await connection.commit()
+        except Exception as e:
+            # Same degradation as the rest of the pool: keep running without the DB
+            print(f"Warning: Could not claim session ownership for channel {channel_id}: {e}")
+            return True
+
+        if acquired:
+            self._owned.add(channel_id)
+        return acquired
+
+    async def release(self, channel_id: int) -> None:
+        """Give up ownership of a channel (session ended or hibernated)."""
+        if channel_id not in self._owned:
+            return
+        self._owned.discard(channel_id)
+        try:
+            connection = await self._get_connection()
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": channel_id}
+            )
+            await connection.commit()
+        except Exception as e:
+            print(f"Warning: Could not release session ownership for channel {channel_id}: {e}")
+
+    async def close(self) -> None:
+        """Release all locks by closing the lock connection."""
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+        self._owned.clear()
@@ -3,13 +3,27 @@ Session pool for managing SessionManager instances per Discord channel.
 
 This module provides session management with database persistence for
 multi-guild support and session recovery.
+
+Idle sessions can be hibernated: their state is serialized to a
+SessionHibernationStore and the in-memory SessionContext is dropped. The
+session is transparently rehydrated on the next access via get_or_restore().
+
+Sessions checkpointed to the database (see TurnCheckpointer) survive a crash:
+recover_from_checkpoints() re-registers them as hibernated on startup.
+
+In multi-process mode each worker's pool only handles the channels assigned to
+it (owns_channel) and holds a SessionOwnership lock for each resident session.
 """
 
-from typing import Dict, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, Optional, List
+from dataclasses import asdict, dataclass, field, fields
+from contextlib import contextmanager
+from datetime import datetime
+import asyncio
+import json
+import os
+import time
 import uuid
-import shutil
-import tempfile
 from pathlib import Path
 
 
@@ -29,16 +43,105 @@ class SessionContext:
     guild_id: int
     channel_id: int
     session_db_id: uuid.UUID  # Database session ID (Phase 2)
-    temp_character_dir: Optional[str] = None
     message_coordinator: Optional['MessageCoordinator'] = None  # Milestone 5: Multiplayer coordination
     timeouts: SessionTimeouts = None  # Milestone 6: Configurable timeouts
     logger: Optional['GameLogger'] = None  # Structured logging
+    last_activity: float = field(default_factory=time.monotonic)  # For idle/LRU hibernation
+    active_requests: int = 0  # In-flight handlers - busy sessions are never hibernated
 
     def __post_init__(self):
         """Initialize default timeouts if not provided."""
         if self.timeouts is None:
             self.timeouts = SessionTimeouts()
 
+    def touch(self) -> None:
+        """Record activity on this session."""
+        self.last_activity = time.monotonic()
+
+    @contextmanager
+    def in_use(self):
+        """Mark the session busy (not hibernatable) for the duration of a handler."""
+        self.active_requests += 1
+        self.touch()
+        try:
+            yield self
+        finally:
+            self.active_requests -= 1
+            self.touch()
+
+
+@dataclass
+class HibernatedSession:
+    """Index entry for a session whose state lives in the hibernation store."""
+    guild_id: int
+    channel_id: int
+    session_db_id: uuid.UUID
+    hibernated_at: datetime
+
+
+class SessionHibernationStore:
+    """
+    Local-disk store for hibernated session snapshots.
+
+    Each session is one JSON file named by channel ID, written atomically
+    (temp file + rename) so a crash never leaves a truncated snapshot.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, channel_id: int) -> Path:
+        return self.directory / f"{channel_id}.json"
+
+    def save(self, record: dict) -> None:
+        """Persist a hibernation record (must contain channel_id)."""
+        path = self._path(record["channel_id"])
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    def load(self, channel_id: int) -> Optional[dict]:
+        """Load a hibernation record, or None if absent."""
+        path = self._path(channel_id)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def delete(self, channel_id: int) -> None:
+        """Remove a hibernation record if present."""
+        self._path(channel_id).unlink(missing_ok=True)
+
+    def list_entries(self) -> List[HibernatedSession]:
+        """List all hibernated sessions (used to rebuild the index on startup)."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                entries.append(_entry_from_record(record))
+            except Exception as e:
+                print(f"Warning: Skipping unreadable hibernation record {path}: {e}")
+        return entries
+
+
+def _entry_from_record(record: dict) -> HibernatedSession:
+    return HibernatedSession(
+        guild_id=record["guild_id"],
+        channel_id=record["channel_id"],
+        session_db_id=uuid.UUID(record["session_db_id"]),
+        hibernated_at=datetime.fromisoformat(record["hibernated_at"]),
+    )
+
+
+def _timeouts_from_snapshot(snapshot: dict) -> SessionTimeouts:
+    """Rebuild the channel's timeouts; snapshots without them get the defaults."""
+    saved = snapshot.get("timeouts") or {}
+    known = {f.name for f in fields(SessionTimeouts)}
+    return SessionTimeouts(**{name: value for name, value in saved.items() if name in known})
+
 
 class SessionPool:
     """
@@ -48,12 +151,46 @@ class SessionPool:
     creates, manages, and cleans up SessionManager instances.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        hibernation_store: Optional[SessionHibernationStore] = None,
+        idle_timeout: float = 1800.0,
+        max_resident_sessions: int = 50,
+        ownership: Optional['SessionOwnership'] = None,
+        owns_channel: Optional[Callable[[int], bool]] = None
+    ):
+        """
+        Initialize the session pool.
+
+        Args:
+            hibernation_store: Store for hibernated sessions (hibernation disabled if None)
+            idle_timeout: Seconds of inactivity after which a session is hibernated
+            max_resident_sessions: Max sessions kept in memory; least recently used
+                sessions beyond this are hibernated
+            ownership: Cross-process ownership locks (worker mode only)
+            owns_channel: Predicate for channels this process is responsible for
+                (worker mode only; all channels if None)
+        """
         self._sessions: Dict[int, SessionContext] = {}  # channel_id -> SessionContext
+        self._hibernated: Dict[int, HibernatedSession] = {}  # channel_id -> index entry
+        self._restore_locks: Dict[int, asyncio.Lock] = {}
+        self.hibernation_store = hibernation_store
+        self.idle_timeout = idle_timeout
+        self.max_resident_sessions = max_resident_sessions
+        self.ownership = ownership
+        self.owns_channel = owns_channel or (lambda channel_id: True)
+
+        # Hibernated sessions survive restarts - rebuild the index from the store
+        if hibernation_store:
+            for entry in hibernation_store.list_entries():
+                if self.owns_channel(entry.channel_id):
+                    self._hibernated[entry.channel_id] = entry
 
     def get(self, channel_id: int) -> Optional[SessionContext]:
         """
-        Get an existing session for a channel.
+        Get an existing (resident) session for a channel.
+
+        Does not rehydrate hibernated sessions - use get_or_restore() for that.
 
         Args:
             channel_id: Discord channel ID
@@ -63,6 +200,67 @@ class SessionPool:
         """
         return self._sessions.get(channel_id)
 
+    def has_session(self, channel_id: int) -> bool:
+        """Check whether a channel has a session, resident or hibernated."""
+        return channel_id in self._sessions or channel_id in self._hibernated
+
+    def is_hibernated(self, channel_id: int) -> bool:
+        """Check whether a channel's session is hibernated."""
+        return channel_id in self._hibernated
+
+    async def get_or_restore(self, channel_id: int) -> Optional[SessionContext]:
+        """
+        Get a session for a channel, rehydrating it if hibernated.
+
+        Args:
+            channel_id: Discord channel ID
+
+        Returns:
+            SessionContext if the channel has a session, None otherwise
+        """
+        context = self._sessions.get(channel_id)
+        if context or channel_id not in self._hibernated:
+            return context
+
+        lock = self._restore_locks.setdefault(channel_id, asyncio.Lock())
+        async with lock:
+            # Another handler may have restored it while we waited
+            context = self._sessions.get(channel_id)
+            if context or channel_id not in self._hibernated:
+                return context
+            return await self._restore_session(channel_id)
+
+    def _build_session_components(self, guild_api_key: str):
+        """Create the session manager, coordinator and initial turn for a new session."""
+        from demo_terminal import create_demo_session_manager
+        from src.memory.turn_manager import ActionDeclaration
+        from src.memory.message_coordinator import create_message_coordinator
+        from src.prompts.demo_combat_steps import GamePhase
+
+        # Create session manager with guild's API key
+        session_manager, logger = create_demo_session_manager(
+            dm_model_name='gemini-2.5-flash',
+            api_key=guild_api_key,  # Pass guild's API key for BYOK
+            enable_logging=True  # Enable structured logging
+        )
+
+        # Initialize first turn in EXPLORATION mode
+        # This ensures there's an active turn before first player message
+        # Using GamePhase.EXPLORATION so the DM responds naturally instead of
+        # trying to announce combat turns
+        session_manager.turn_manager.start_and_queue_turns(
+            actions=[ActionDeclaration(speaker="System", content="Discord session started")],
+            phase=GamePhase.EXPLORATION
+        )
+        session_manager.turn_manager.update_processing_turn_to_current()
+        session_manager.turn_manager.mark_new_messages_as_responded()
+
+        # Milestone 5: Create message coordinator for multiplayer coordination
+        # Starts in exploration mode (combat_mode=False)
+        message_coordinator = create_message_coordinator()
+
+        return session_manager, logger, message_coordinator
+
     async def create_session(
         self,
         channel_id: int,
@@ -84,18 +282,16 @@ class SessionPool:
             ValueError: If session already exists for this channel
             ValueError: If guild has no API key registered (strict BYOK)
         """
-        if channel_id in self._sessions:
+        if self.has_session(channel_id):
             raise ValueError(f"Session already exists for channel {channel_id}")
+        if self.ownership and not await self.ownership.claim(channel_id):
+            raise ValueError(f"Session for channel {channel_id} is owned by another worker")
 
         # Import here to avoid circular dependencies
-        from demo_terminal import create_demo_session_manager
-        from src.memory.turn_manager import ActionDeclaration
-        from src.memory.message_coordinator import create_message_coordinator
         from src.persistence.database import get_session
         from src.persistence.repositories.guild_repo import GuildRepository
         from src.persistence.repositories.session_repo import SessionRepository
         from src.services.byok_service import get_api_key_for_guild
-        from src.prompts.demo_combat_steps import GamePhase
 
         # Phase 3: Get guild's API key (strict BYOK - no fallback)
         guild_api_key = await get_api_key_for_guild(guild_id)
@@ -105,28 +301,10 @@ class SessionPool:
                 f"Server admins: use `/guild-key` to register a Gemini API key."
             )
 
-        # Create session manager with guild's API key
-        session_manager, temp_dir, logger = create_demo_session_manager(
-            dm_model_name='gemini-2.5-flash',
-            api_key=guild_api_key,  # Pass guild's API key for BYOK
-            enable_logging=True  # Enable structured logging
+        session_manager, logger, message_coordinator = (
+            self._build_session_components(guild_api_key)
         )
 
-        # Initialize first turn in EXPLORATION mode
-        # This ensures there's an active turn before first player message
-        # Using GamePhase.EXPLORATION so the DM responds naturally instead of
-        # trying to announce combat turns
-        session_manager.turn_manager.start_and_queue_turns(
-            actions=[ActionDeclaration(speaker="System", content="Discord session started")],
-            phase=GamePhase.EXPLORATION
-        )
-        session_manager.turn_manager.update_processing_turn_to_current()
-        session_manager.turn_manager.mark_new_messages_as_responded()
-
-        # Milestone 5: Create message coordinator for multiplayer coordination
-        # Starts in exploration mode (combat_mode=False)
-        message_coordinator = create_message_coordinator()
-
         # Phase 2: Persist to database
         session_db_id = None
         try:
@@ -150,7 +328,6 @@ class SessionPool:
             guild_id=guild_id,
             channel_id=channel_id,
             session_db_id=session_db_id,
-            temp_character_dir=temp_dir,
             message_coordinator=message_coordinator,
             logger=logger
         )
@@ -169,44 +346,266 @@ class SessionPool:
             True if session was ended, False if no session existed
         """
         context = self._sessions.pop(channel_id, None)
-        if not context:
+        hibernated = self._hibernated.pop(channel_id, None)
+        if not context and not hibernated:
             return False
 
-        # Phase 2: Cleanup database record
+        session_db_id = context.session_db_id if context else hibernated.session_db_id
+        self._forget_checkpoint(session_db_id)
+
+        # Phase 2: Cleanup database record (turn checkpoints cascade)
         try:
             from src.persistence.database import get_session
             from src.persistence.repositories.session_repo import SessionRepository
 
             async with get_session() as db_session:
                 session_repo = SessionRepository(db_session)
-                await session_repo.delete(context.session_db_id)
+                await session_repo.delete(session_db_id)
                 await db_session.commit()
         except Exception as e:
             print(f"Warning: Failed to cleanup session from database: {e}")
 
-        # Close logger session
+        if hibernated and self.hibernation_store:
+            self.hibernation_store.delete(channel_id)
+
+        if context:
+            self._release_resources(context)
+
+        if self.ownership:
+            await self.ownership.release(channel_id)
+
+        return True
+
+    def _release_resources(self, context: SessionContext) -> None:
+        """Close the logger of a session."""
         if context.logger:
             try:
                 context.logger.close_session()
             except Exception as e:
                 print(f"Warning: Failed to close logger session: {e}")
 
-        # Cleanup temp character directory (like demo_terminal.py:503-509)
-        if context.temp_character_dir and Path(context.temp_character_dir).exists():
+    # ==================== Hibernation ====================
+
+    def can_hibernate(self, context: SessionContext) -> bool:
+        """
+        Check whether a session can be safely hibernated.
+
+        Busy sessions are skipped, as are sessions waiting on Discord UI views
+        (initiative/save/reaction) or partway through collecting responses -
+        those views hold callbacks bound to the live SessionContext.
+        """
+        from src.models.response_expectation import ResponseType
+
+        if self.hibernation_store is None or context.active_requests > 0:
+            return False
+
+        coordinator = context.message_coordinator
+        if coordinator:
+            expectation = coordinator.current_expectation
+            if expectation and expectation.response_type in (
+                ResponseType.INITIATIVE, ResponseType.SAVING_THROW, ResponseType.REACTION
+            ):
+                return False
+            if coordinator.get_collected_responses():
+                return False
+        return True
+
+    async def hibernate(self, channel_id: int) -> bool:
+        """
+        Serialize a resident session to the hibernation store and drop it from memory.
+
+        Args:
+            channel_id: Discord channel ID
+
+        Returns:
+            True if the session was hibernated, False if absent or not hibernatable
+        """
+        from src.memory.session_snapshot import capture_session_state
+
+        context = self._sessions.get(channel_id)
+        if not context or not self.can_hibernate(context):
+            return False
+
+        hibernated_at = datetime.now()
+        record = {
+            "guild_id": context.guild_id,
+            "channel_id": channel_id,
+            "session_db_id": str(context.session_db_id),
+            "hibernated_at": hibernated_at.isoformat(),
+            "state": capture_session_state(
+                context.session_manager, context.message_coordinator, asdict(context.timeouts)
+            ),
+        }
+
+        try:
+            self.hibernation_store.save(record)
+        except Exception as e:
+            print(f"Warning: Failed to hibernate session for channel {channel_id}: {e}")
+            return False
+
+        await self._set_db_status(context.session_db_id, "paused")
+        # Checkpoint rows stay as they are; the next checkpoint after restore resyncs them
+        self._forget_checkpoint(context.session_db_id)
+
+        self._sessions.pop(channel_id, None)
+        self._hibernated[channel_id] = _entry_from_record(record)
+        self._release_resources(context)
+        if self.ownership:
+            await self.ownership.release(channel_id)
+        return True
+
+    async def _restore_session(self, channel_id: int) -> Optional[SessionContext]:
+        """Rehydrate a hibernated session into memory."""
+        from src.memory.session_snapshot import restore_session_state
+        from src.services.byok_service import get_api_key_for_guild
+
+        entry = self._hibernated[channel_id]
+        record = self.hibernation_store.load(channel_id) if self.hibernation_store else None
+        if record is None:
+            print(f"Warning: Hibernation record missing for channel {channel_id}")
+            self._hibernated.pop(channel_id, None)
+            return None
+
+        if self.ownership and not await self.ownership.claim(channel_id):
+            # Previous owner (e.g., a worker being replaced) still holds it
+            print(f"Warning: Session for channel {channel_id} is still owned by another worker")
+            return None
+
+        guild_api_key = await get_api_key_for_guild(entry.guild_id)
+        if not guild_api_key:
+            # Key was removed while hibernated - leave the record for end_session cleanup
+            if self.ownership:
+                await self.ownership.release(channel_id)
+            return None
+
+        session_manager, logger, message_coordinator = (
+            self._build_session_components(guild_api_key)
+        )
+        restore_session_state(session_manager, record["state"], message_coordinator)
+
+        context = SessionContext(
+            session_manager=session_manager,
+            guild_id=entry.guild_id,
+            channel_id=channel_id,
+            session_db_id=entry.session_db_id,
+            message_coordinator=message_coordinator,
+            timeouts=_timeouts_from_snapshot(record["state"]),
+            logger=logger
+        )
+
+        self._sessions[channel_id] = context
+        self._hibernated.pop(channel_id, None)
+        self.hibernation_store.delete(channel_id)
+        await self._set_db_status(entry.session_db_id, "active")
+        return context
+
+    async def hibernate_idle(self) -> int:
+        """
+        Apply the eviction policy to resident sessions.
+
+        Sessions idle longer than idle_timeout are hibernated, then least recently
+        used sessions are hibernated until at most max_resident_sessions remain.
+
+        Returns:
+            Number of sessions hibernated
+        """
+        if self.hibernation_store is None:
+            return 0
+
+        now = time.monotonic()
+        by_recency = sorted(self._sessions.values(), key=lambda c: c.last_activity)
+
+        hibernated = 0
+        resident = len(by_recency)
+        for context in by_recency:
+            idle = now - context.last_activity >= self.idle_timeout
+            over_capacity = resident > self.max_resident_sessions
+            if not (idle or over_capacity):
+                break  # Sorted by recency - everything after is newer
+            if await self.hibernate(context.channel_id):
+                hibernated += 1
+                resident -= 1
+
+        return hibernated
+
+    async def recover_from_checkpoints(self) -> int:
+        """
+        Re-register sessions that were live when the bot stopped.
+
+        Sessions with a database checkpoint are added as hibernated, so startup
+        only reads the checkpoints and each session is rebuilt on its first use.
+        Sessions that are already known (resident or hibernated on disk) are
+        left alone; sessions with no usable checkpoint are deleted as orphans.
+
+        Returns:
+            Number of sessions recovered
+        """
+        from src.persistence.turn_checkpointer import load_checkpointed_sessions
+
+        recovered = 0
+        orphaned = []
+        for checkpointed in await load_checkpointed_sessions():
+            if not self.owns_channel(checkpointed.channel_id) or self.has_session(checkpointed.channel_id):
+                continue
+            if checkpointed.snapshot is None or self.hibernation_store is None:
+                orphaned.append(checkpointed.session_db_id)
+                continue
+
+            record = {
+                "guild_id": checkpointed.guild_id,
+                "channel_id": checkpointed.channel_id,
+                "session_db_id": str(checkpointed.session_db_id),
+                "hibernated_at": datetime.now().isoformat(),
+                "state": checkpointed.snapshot,
+            }
             try:
-                shutil.rmtree(context.temp_character_dir)
+                self.hibernation_store.save(record)
             except Exception as e:
-                print(f"Warning: Could not clean up temp directory: {e}")
+                print(f"Warning: Failed to recover session for channel {checkpointed.channel_id}: {e}")
+                continue
+            self._hibernated[checkpointed.channel_id] = _entry_from_record(record)
+            recovered += 1
 
-        return True
+        if orphaned:
+            try:
+                from src.persistence.database import get_session
+                from src.persistence.repositories.session_repo import SessionRepository
+
+                async with get_session() as db_session:
+                    session_repo = SessionRepository(db_session)
+                    for session_db_id in orphaned:
+                        await session_repo.delete(session_db_id)
+                    await db_session.commit()
+                print(f"✓ Cleaned up {len(orphaned)} orphaned session(s) from database")
+            except Exception as e:
+                print(f"Warning: Failed to clean up orphaned sessions: {e}")
+
+        return recovered
+
+    def _forget_checkpoint(self, session_db_id: uuid.UUID) -> None:
+        from src.persistence.turn_checkpointer import get_turn_checkpointer
+
+        get_turn_checkpointer().forget(session_db_id)
+
+    async def _set_db_status(self, session_db_id: uuid.UUID, status: str) -> None:
+        try:
+            from src.persistence.database import get_session
+            from src.persistence.repositories.session_repo import SessionRepository
+
+            async with get_session() as db_session:
+                session_repo = SessionRepository(db_session)
+                await session_repo.set_status(session_db_id, status)
+                await db_session.commit()
+        except Exception as e:
+            print(f"Warning: Failed to update session status in database: {e}")
 
     def get_all_sessions(self) -> Dict[int, SessionContext]:
-        """Get all active sessions."""
+        """Get all resident sessions."""
         return dict(self._sessions)
 
     def get_session_count(self) -> int:
-        """Get number of active sessions."""
-        return len(self._sessions)
+        """Get number of sessions (resident and hibernated)."""
+        return len(self._sessions) + len(self._hibernated)
 
     async def end_all_guild_sessions(self, guild_id: int) -> int:
         """
@@ -221,10 +620,13 @@ class SessionPool:
         Returns:
             Number of sessions ended
         """
-        # Find all channel IDs for this guild
+        # Find all channel IDs for this guild (resident and hibernated)
         channels_to_end = [
             channel_id for channel_id, context in self._sessions.items()
             if context.guild_id == guild_id
+        ] + [
+            channel_id for channel_id, entry in self._hibernated.items()
+            if entry.guild_id == guild_id
         ]
 
         # End each session
@@ -244,5 +646,29 @@ def get_session_pool() -> SessionPool:
     """Get or create the global session pool instance."""
     global _session_pool
     if _session_pool is None:
-        _session_pool = SessionPool()
+        configure_session_pool()
+    return _session_pool
+
+
+def configure_session_pool(
+    ownership: Optional['SessionOwnership'] = None,
+    owns_channel: Optional[Callable[[int], bool]] = None
+) -> SessionPool:
+    """
+    Create the global session pool from settings.
+
+    Worker processes call this before loading cogs to scope the pool to their
+    channels; single-process mode just uses get_session_pool().
+    """
+    global _session_pool
+    from src.config.settings import get_settings
+
+    settings = get_settings()
+    _session_pool = SessionPool(
+        hibernation_store=SessionHibernationStore(settings.session_hibernation_dir),
+        idle_timeout=settings.session_idle_timeout_seconds,
+        max_resident_sessions=settings.max_resident_sessions,
+        ownership=ownership,
+        owns_channel=owns_channel
+    )
     return _session_pool
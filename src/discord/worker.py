@@ -0,0 +1,103 @@
+"""
+Worker process for multi-process mode.
+
+A worker runs the normal bot (same cogs, same SessionPool) but never opens a
+gateway connection. The gateway process forwards it the raw gateway events for
+the channels it owns, which are fed straight into discord.py's parsers - so
+messages, slash commands and view interactions behave exactly as in
+single-process mode. Replies go out over the worker's own REST client.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerLink:
+    """Connection from a worker back to the gateway, for messages to the other workers."""
+
+    def __init__(self, worker_id: int, control_queue):
+        self.worker_id = worker_id
+        self._control_queue = control_queue
+
+    def broadcast(self, name: str, **payload: Any) -> None:
+        """Ask the gateway to deliver a control message to every other worker."""
+        self._control_queue.put((self.worker_id, name, payload))
+
+
+# Set in worker processes only
+_worker_link: Optional[WorkerLink] = None
+
+
+def get_worker_link() -> Optional[WorkerLink]:
+    """Get the gateway link of this worker, or None in single-process mode."""
+    return _worker_link
+
+
+async def _handle_control(name: str, payload: Dict[str, Any]) -> None:
+    """Handle a control message broadcast by another worker."""
+    from src.discord.utils.session_pool import get_session_pool
+
+    if name == "end_guild_sessions":
+        ended = await get_session_pool().end_all_guild_sessions(payload["guild_id"])
+        if ended:
+            print(f"✓ Ended {ended} session(s) for guild {payload['guild_id']}")
+    else:
+        logger.warning(f"Unknown control message: {name}")
+
+
+async def _worker_main(worker_id: int, worker_count: int, token: str, event_queue, control_queue) -> None:
+    global _worker_link
+    from src.discord.bot import create_bot, load_cogs
+    from src.discord.utils.hash_ring import ConsistentHashRing
+    from src.discord.utils.session_ownership import SessionOwnership
+    from src.discord.utils.session_pool import configure_session_pool
+
+    ring = ConsistentHashRing(worker_count)
+    ownership = SessionOwnership(worker_id)
+    # Must happen before cogs are loaded - they grab the global pool in __init__
+    configure_session_pool(
+        ownership=ownership,
+        owns_channel=lambda channel_id: ring.owns(worker_id, channel_id)
+    )
+    _worker_link = WorkerLink(worker_id, control_queue)
+
+    bot = create_bot(sync_commands=worker_id == 0)
+    await load_cogs(bot)
+    await bot.login(token)  # REST only - the gateway owns the websocket
+    print(f"✓ Worker {worker_id}/{worker_count} ready")
+
+    loop = asyncio.get_running_loop()
+    parsers = bot._connection.parsers
+    try:
+        while True:
+            item = await loop.run_in_executor(None, event_queue.get)
+            kind = item[0]
+            if kind == "stop":
+                break
+            if kind == "control":
+                asyncio.create_task(_handle_control(item[1], item[2]))
+                continue
+
+            payload = json.loads(item[1])
+            parser = parsers.get(payload["t"])
+            if parser is None:
+                continue
+            try:
+                parser(payload["d"])
+            except Exception:
+                logger.exception(f"Worker {worker_id} failed to parse {payload['t']}")
+    finally:
+        await bot.close()
+        await ownership.close()
+
+
+def run_worker(worker_id: int, worker_count: int, token: str, event_queue, control_queue) -> None:
+    """Process entry point (spawned by the gateway)."""
+    try:
+        asyncio.run(_worker_main(worker_id, worker_count, token, event_queue, control_queue))
+    except KeyboardInterrupt:
+        pass
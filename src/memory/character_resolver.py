@@ -0,0 +1,297 @@
+"""
+Character Resolver - maintained name → character_id index for state extraction.
+
+StateManager keeps one CharacterResolver up to date as characters are loaded
+and monsters are added or removed, instead of rebuilding a name map for every
+extraction. The resolver understands the ways narrative refers to combatants:
+
+- Full display names and character_ids ("Tharion Stormwind", "goblin_1")
+- First names and registered aliases ("Tharion", "the fighter")
+- Ordinal references into numbered monster groups ("the second goblin",
+  "goblin #2", "Goblin 2", "the goblin" when only one is present)
+- Misspellings, via a trigram index over all keys ("Tharian")
+
+It is used to keep state-extraction prompts small (only characters mentioned
+in the current turn) and to repair character_ids in extracted commands without
+another LLM call.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+FUZZY_THRESHOLD = 0.45  # Minimum trigram Jaccard similarity for a fuzzy match
+
+_ORDINAL_WORDS = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9, "tenth": 10,
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_NUMBERED_NAME = re.compile(r"^(.*?)[\s_#]+(\d+)$")  # "Goblin 2", "goblin_2", "goblin #2"
+_ORDINAL_PREFIX = re.compile(r"^(\w+)\s+(.+)$")  # "second goblin", "2nd goblin"
+_ORDINAL_SUFFIX = re.compile(r"^(\d+)(?:st|nd|rd|th)$")
+_LEADING_ARTICLES = ("the ", "a ", "an ")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation (except '#') and leading articles, collapse whitespace."""
+    text = re.sub(r"[^\w#\s]", " ", text.lower().replace("_", " "))
+    text = " ".join(text.split())
+    for article in _LEADING_ARTICLES:
+        if text.startswith(article):
+            return text[len(article):]
+    return text
+
+
+def _singular(word: str) -> str:
+    return word[:-1] if word.endswith("s") and len(word) > 3 else word
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CharacterResolver:
+    """Incrementally maintained index of character names, aliases and monster groups."""
+
+    def __init__(self):
+        self._display_names: Dict[str, str] = {}  # character_id -> display name
+        self._keys: Dict[str, Set[str]] = {}  # normalized key -> character_ids
+        self._keys_by_id: Dict[str, Set[str]] = {}  # character_id -> its keys
+        self._trigrams: Dict[str, Set[str]] = {}  # trigram -> keys
+        self._groups: Dict[str, Dict[int, str]] = {}  # group base name -> {number: character_id}
+        self._group_of: Dict[str, Tuple[str, int]] = {}  # character_id -> (group, number)
+
+    # ==================== Maintenance ====================
+
+    def register(
+        self,
+        character_id: str,
+        name: str,
+        aliases: Iterable[str] = (),
+        include_first_name: bool = False
+    ) -> None:
+        """
+        Add or replace a character in the index.
+
+        Args:
+            character_id: Unique character ID
+            name: Display name ("Tharion Stormwind", "Goblin 2")
+            aliases: Extra names the narrative may use
+            include_first_name: Also index the first word of the name (player characters)
+        """
+        if character_id in self._display_names:
+            self.unregister(character_id)
+        self._display_names[character_id] = name
+        self._keys_by_id[character_id] = set()
+
+        full = normalize(name)
+        keys = [normalize(character_id), full, *(normalize(alias) for alias in aliases)]
+        if include_first_name and " " in full:
+            keys.append(full.split(" ", 1)[0])  # First name
+        for key in keys:
+            self._add_key(character_id, key)
+
+        numbered = _NUMBERED_NAME.match(full)
+        if numbered:
+            group, number = numbered.group(1), int(numbered.group(2))
+            self._groups.setdefault(group, {})[number] = character_id
+            self._group_of[character_id] = (group, number)
+
+    def add_alias(self, character_id: str, alias: str) -> None:
+        """Register an extra name for an already indexed character."""
+        if character_id in self._display_names:
+            self._add_key(character_id, normalize(alias))
+
+    def unregister(self, character_id: str) -> None:
+        """Remove a character from the index (no-op if unknown)."""
+        if self._display_names.pop(character_id, None) is None:
+            return
+        for key in self._keys_by_id.pop(character_id, set()):
+            ids = self._keys[key]
+            ids.discard(character_id)
+            if not ids:
+                del self._keys[key]
+                for trigram in _trigrams(key):
+                    keys = self._trigrams[trigram]
+                    keys.discard(key)
+                    if not keys:
+                        del self._trigrams[trigram]
+        group_entry = self._group_of.pop(character_id, None)
+        if group_entry:
+            group, number = group_entry
+            members = self._groups[group]
+            members.pop(number, None)
+            if not members:
+                del self._groups[group]
+
+    def __contains__(self, character_id: str) -> bool:
+        return character_id in self._display_names
+
+    def __len__(self) -> int:
+        return len(self._display_names)
+
+    # ==================== Resolution ====================
+
+    def resolve(self, reference: str) -> Optional[str]:
+        """
+        Resolve a name, alias, ordinal reference or misspelling to a character_id.
+
+        Args:
+            reference: Text referring to one character ("the second goblin", "Tharion")
+
+        Returns:
+            The character_id, or None if the reference is unknown or ambiguous
+        """
+        if reference in self._display_names:
+            return reference
+        key = normalize(reference)
+        if not key:
+            return None
+
+        ids = self._keys.get(key)
+        if ids:
+            return next(iter(ids)) if len(ids) == 1 else None
+
+        is_group_reference, resolved = self._resolve_in_group(key)
+        if is_group_reference:
+            return resolved  # "goblin 7" with three goblins must not fuzzy-match "goblin 1"
+        return self._resolve_fuzzy(key)
+
+    def mapping(self, character_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Get display name → character_id for prompts.
+
+        Args:
+            character_ids: Restrict to these IDs (None for everyone indexed)
+        """
+        if character_ids is None:
+            return {name: character_id for character_id, name in self._display_names.items()}
+        return {
+            self._display_names[character_id]: character_id
+            for character_id in dict.fromkeys(character_ids)
+            if character_id in self._display_names
+        }
+
+    def find_mentions(self, text: str) -> Set[str]:
+        """
+        Find the characters a piece of narrative refers to.
+
+        Matches every indexed key (names, first names, aliases, IDs) as a word
+        sequence. A group name next to a number or ordinal ("goblin 2", "second
+        goblin") mentions that member; a bare one ("the goblins") mentions all.
+        """
+        words = normalize(text).split()
+        mentioned: Set[str] = set()
+        max_words = max((key.count(" ") + 1 for key in self._keys), default=0)
+        for start in range(len(words)):
+            for length in range(1, min(max_words, len(words) - start) + 1):
+                end = start + length
+                phrase = " ".join(words[start:end])
+                mentioned.update(self._keys.get(phrase, ()))
+
+                members = self._group_members(phrase)
+                if not members:
+                    continue
+                number = None
+                if phrase in self._groups:  # Plural ("two goblins") is a count, not an ordinal
+                    number = self._ordinal(words[end].lstrip("#")) if end < len(words) else None
+                    if number is None and start > 0:
+                        number = self._ordinal(words[start - 1])
+                if number is None:
+                    mentioned.update(members.values())
+                elif number in members:
+                    mentioned.add(members[number])
+        return mentioned
+
+    def repair_ids(
+        self,
+        character_ids: Iterable[str],
+        is_valid: Optional[Callable[[str], bool]] = None
+    ) -> Dict[str, str]:
+        """
+        Map invalid character_ids to the character they most likely mean.
+
+        Args:
+            character_ids: IDs returned by an extraction agent
+            is_valid: Optional predicate for IDs that need no repair (defaults to "indexed")
+
+        Returns:
+            {bad_id: repaired_id} for every ID that was invalid but resolvable
+        """
+        is_valid = is_valid or self.__contains__
+        repairs = {}
+        for character_id in character_ids:
+            if character_id in repairs or is_valid(character_id):
+                continue
+            resolved = self.resolve(character_id)
+            if resolved and resolved != character_id:
+                repairs[character_id] = resolved
+        return repairs
+
+    # ==================== Internals ====================
+
+    def _add_key(self, character_id: str, key: str) -> None:
+        if not key:
+            return
+        self._keys_by_id[character_id].add(key)
+        ids = self._keys.setdefault(key, set())
+        if not ids:
+            for trigram in _trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(key)
+        ids.add(character_id)
+
+    def _resolve_in_group(self, key: str) -> Tuple[bool, Optional[str]]:
+        """Returns (key refers to a known monster group, resolved character_id)."""
+        reference: Optional[Tuple[str, int]] = None
+
+        numbered = _NUMBERED_NAME.match(key)  # "goblin #2" / "goblin 2"
+        words = key.rsplit(" ", 1)
+        prefixed = _ORDINAL_PREFIX.match(key)
+        if numbered:
+            reference = (numbered.group(1), int(numbered.group(2)))
+        elif len(words) == 2 and words[1] in _ORDINAL_WORDS:  # "goblin two"
+            reference = (words[0], _ORDINAL_WORDS[words[1]])
+        elif prefixed:  # "second goblin" / "2nd goblin"
+            ordinal, group = prefixed.groups()
+            number = self._ordinal(ordinal)
+            if number is not None:
+                reference = (group, number)
+
+        if reference:
+            members = self._group_members(reference[0])
+            return members is not None, members.get(reference[1]) if members else None
+
+        # "goblin" when exactly one goblin is present
+        members = self._group_members(key)
+        if members is None:
+            return False, None
+        return True, next(iter(members.values())) if len(members) == 1 else None
+
+    @staticmethod
+    def _ordinal(word: str) -> Optional[int]:
+        if word.isdigit():
+            return int(word)
+        suffix = _ORDINAL_SUFFIX.match(word)
+        return int(suffix.group(1)) if suffix else _ORDINAL_WORDS.get(word)
+
+    def _group_members(self, group: str) -> Optional[Dict[int, str]]:
+        return self._groups.get(group) or self._groups.get(_singular(group))
+
+    def _resolve_fuzzy(self, key: str) -> Optional[str]:
+        query = _trigrams(key)
+        overlap: Dict[str, int] = {}
+        for trigram in query:
+            for candidate in self._trigrams.get(trigram, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+
+        best_ids: Set[str] = set()
+        best_score = FUZZY_THRESHOLD
+        for candidate, shared in overlap.items():
+            score = shared / (len(query) + len(_trigrams(candidate)) - shared)
+            if score > best_score:
+                best_ids, best_score = set(self._keys[candidate]), score
+            elif score == best_score and best_ids:
+                best_ids |= self._keys[candidate]
+        return next(iter(best_ids)) if len(best_ids) == 1 else None
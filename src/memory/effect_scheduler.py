@@ -0,0 +1,151 @@
+"""
+Combat-wide effect expiry scheduler.
+
+Round-based effects (DurationType.ROUNDS / CONCENTRATION) applied during combat
+are pushed onto one min-heap keyed by the turn boundary at which they expire:
+
+    (round_number, anchor_id, timing)
+
+where anchor_id is the character_id of the combatant whose turn the effect is
+tied to, and timing is START or END of that turn. Anchors are resolved to
+initiative positions only when combat reaches the anchor's round, so
+combatants leaving or joining mid-combat (which shifts initiative indices)
+never move an expiry onto someone else's turn. If the anchor has left combat,
+the effect expires at the first turn boundary of its round.
+
+When combat advances, TurnManager drains only the entries whose round has been
+reached, so the cost of a turn change is O(k log n) for the k effects due this
+round, independent of how many buffs and conditions are active on the
+battlefield. Effects that do not expire are never touched (their
+duration_remaining keeps the value it had when applied).
+
+Entries are invalidated lazily: if an effect is removed early, or re-applied
+with the same name (which re-schedules it), the stale heap entry is skipped
+when it surfaces.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..characters.character_components import DurationType, Effect
+
+# Turn-boundary timing (START sorts before END at the same initiative position)
+START = 0
+END = 1
+
+SCHEDULED_DURATION_TYPES = (DurationType.ROUNDS, DurationType.CONCENTRATION)
+
+Boundary = Tuple[int, str, int]  # (round_number, anchor_id, timing)
+
+
+@dataclass
+class ExpiredEffect:
+    """An effect removed by the scheduler at a turn boundary."""
+    character_id: str
+    effect_name: str
+    round_number: int
+    anchor_id: str
+    timing: int
+
+    def describe(self) -> str:
+        when = "start" if self.timing == START else "end"
+        return f"{self.effect_name} expired on {self.character_id} ({when} of turn, round {self.round_number})"
+
+
+class EffectScheduler:
+    """Min-heap of effect expiry boundaries across all combatants."""
+
+    def __init__(self):
+        # Heap entries: (round, seq, anchor_id, timing, character_id, effect_name)
+        self._heap: List[Tuple[int, int, str, int, str, str]] = []
+        self._live: Dict[Tuple[str, str], int] = {}  # (character_id, effect_name) -> current seq
+        self._seq = 0
+
+    def schedule(self, character_id: str, effect: Effect, boundary: Boundary) -> None:
+        """
+        Schedule an effect to expire at a turn boundary.
+
+        Re-scheduling the same (character_id, effect name) replaces the previous entry.
+        """
+        self._seq += 1
+        self._live[(character_id, effect.name)] = self._seq
+        round_number, anchor_id, timing = boundary
+        heapq.heappush(self._heap, (round_number, self._seq, anchor_id, timing, character_id, effect.name))
+
+    def drain(
+        self,
+        round_number: int,
+        position: int,
+        timing: int,
+        position_lookup: Callable[[str], Optional[int]],
+        character_lookup: Callable[[str], Optional[Any]]
+    ) -> List[ExpiredEffect]:
+        """
+        Expire every scheduled effect whose boundary is at or before the given one.
+
+        Args:
+            round_number: Round combat has just reached
+            position: Initiative position of the turn combat has just reached
+            timing: START or END of that turn
+            position_lookup: Returns the current initiative position of a
+                character_id, or None if it is no longer in combat
+            character_lookup: Returns the Character/Monster for a character_id
+
+        Returns:
+            The effects that were removed, earliest round first
+        """
+        expired: List[ExpiredEffect] = []
+        not_yet_due = []
+        while self._heap and self._heap[0][0] <= round_number:
+            entry = heapq.heappop(self._heap)
+            entry_round, seq, anchor_id, entry_timing, character_id, effect_name = entry
+            if self._live.get((character_id, effect_name)) != seq:
+                continue  # Re-scheduled since this entry was pushed
+
+            if entry_round == round_number:
+                anchor_position = position_lookup(anchor_id)
+                if anchor_position is not None and (anchor_position, entry_timing) > (position, timing):
+                    not_yet_due.append(entry)  # Anchor acts later this round
+                    continue
+            del self._live[(character_id, effect_name)]
+
+            character = character_lookup(character_id)
+            if character is None:
+                continue  # Combatant left the battle
+            effect = character.active_effects.get(effect_name)
+            if effect is None:
+                continue  # Removed before it expired
+
+            effect.duration_remaining = 0
+            character.remove_effect(effect_name)
+            expired.append(ExpiredEffect(character_id, effect_name, entry_round, anchor_id, entry_timing))
+
+        for entry in not_yet_due:
+            heapq.heappush(self._heap, entry)
+        return expired
+
+    def clear(self) -> None:
+        """Drop all scheduled expiries (combat ended)."""
+        self._heap.clear()
+        self._live.clear()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def export_state(self) -> List[List[Any]]:
+        """Serialize live entries to a JSON-compatible list."""
+        return [
+            [round_number, anchor_id, timing, character_id, effect_name]
+            for round_number, seq, anchor_id, timing, character_id, effect_name in sorted(self._heap)
+            if self._live.get((character_id, effect_name)) == seq
+        ]
+
+    def import_state(self, entries: List[List[Any]]) -> None:
+        """Restore entries produced by export_state(), replacing the current schedule."""
+        self.clear()
+        for round_number, anchor_id, timing, character_id, effect_name in entries:
+            self._seq += 1
+            self._live[(character_id, effect_name)] = self._seq
+            self._heap.append((round_number, self._seq, anchor_id, timing, character_id, effect_name))
+        heapq.heapify(self._heap)
@@ -24,18 +24,22 @@ class PlayerCharacterRegistry:
     and provides methods to retrieve character information using either identifier.
     """
     
-    def __init__(self, registry_file_path: str = "src/characters/player_character_registry.json"):
+    def __init__(self, registry_file_path: Optional[str] = "src/characters/player_character_registry.json"):
         """
         Initialize the player-character registry.
         
         Args:
             registry_file_path: Path to the registry file for persistence
+                                (None keeps mappings in memory only)
         """
         self.registry_file_path = registry_file_path
         self.player_to_character: Dict[str, str] = {}
         self.character_to_player: Dict[str, str] = {}
         self.character_cache: Dict[str, Character] = {}
         
+        if registry_file_path is None:
+            return
+
         # Ensure directory exists
         os.makedirs(os.path.dirname(registry_file_path), exist_ok=True)
         
@@ -243,6 +247,8 @@ class PlayerCharacterRegistry:
     
     def _save_registry(self) -> None:
         """Save player-character mappings to file."""
+        if self.registry_file_path is None:
+            return
         try:
             registry_data = {
                 "player_to_character": self.player_to_character,
@@ -273,12 +279,13 @@ class PlayerCharacterRegistry:
         }
 
 
-def create_player_character_registry(registry_file_path: str = "src/characters/player_character_registry.json") -> PlayerCharacterRegistry:
+def create_player_character_registry(registry_file_path: Optional[str] = "src/characters/player_character_registry.json") -> PlayerCharacterRegistry:
     """
     Factory function to create a configured player-character registry.
     
     Args:
         registry_file_path: Path to the registry file for persistence
+                            (None keeps mappings in memory only)
     
     Returns:
         Configured PlayerCharacterRegistry instance
@@ -3,7 +3,7 @@ Session manager that integrates state management with the DM agent.
 Coordinates between DM responses, state extraction, and state updates.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 import asyncio
 
 from ..services.game_logger import GameLogger, LogLevel
@@ -28,6 +28,7 @@ from ..context.gd_context_builder import GDContextBuilder
 from ..context.dm_context_builder import DMContextBuilder
 from ..context.state_extractor_context_builder import StateExtractorContextBuilder
 from ..models.state_commands_optimized import StateCommandResult
+from ..models.turn_context import TurnContext
 from ..services.rules_cache_service import RulesCacheService
 
 # Forward reference to avoid circular import - will import in factory function
@@ -98,6 +99,11 @@ class SessionManager:
         if enable_turn_management and not turn_manager:
             self.turn_manager = create_turn_manager()
 
+        # Let the turn manager expire round-based effects as combat advances
+        if self.turn_manager:
+            self.turn_manager.set_character_lookup(self.state_manager.get_character_by_id)
+            self.state_manager.command_executor.on_effect_added = self.turn_manager.schedule_effect
+
         # Initialize player character registry
         self.player_character_registry: PlayerCharacterRegistry = player_character_registry or create_player_character_registry()
 
@@ -274,7 +280,7 @@ class SessionManager:
                 if gameflow_director_response.game_state_updates_required:
                     current_TurnContext_snapshot = self.turn_manager.get_snapshot().turn_stack[-1][0]
                     # Get character name→ID mapping for state extraction
-                    character_map = self.state_manager.get_character_name_to_id_map()
+                    character_map = self._get_present_character_map(current_TurnContext_snapshot)
                     state_extractor_context = self.state_extractor_context_builder.build_context(
                         current_turn=current_TurnContext_snapshot,
                         character_map=character_map
@@ -533,8 +539,8 @@ class SessionManager:
 
             response_queue.append("[Resolution step detected - extracting state changes...]\n")
 
-            # Build state extraction context with character name→ID mapping
-            character_map = self.state_manager.get_character_name_to_id_map()
+            # Build state extraction context with name→ID mapping for characters in this turn
+            character_map = self._get_present_character_map(current_turn)
             state_context = self.state_extractor_context_builder.build_context(
                 current_turn=current_turn,
                 character_map=character_map
@@ -588,6 +594,25 @@ class SessionManager:
                                       level=LogLevel.ERROR)
             return None
 
+    def _get_present_character_map(self, current_turn: TurnContext) -> Dict[str, str]:
+        """
+        Get the name→ID mapping for characters present in a turn.
+
+        Includes combat participants, the active character and anyone the turn's
+        unprocessed messages refer to, so the extraction prompt does not carry
+        the whole roster.
+        """
+        include_ids = []
+        if self.turn_manager and self.turn_manager.combat_state:
+            include_ids.extend(self.turn_manager.combat_state.participants)
+        if current_turn.active_character:
+            include_ids.append(current_turn.active_character)
+
+        return self.state_manager.get_character_name_to_id_map(
+            mentioned_in="\n".join(current_turn.get_unprocessed_live_messages()),
+            include_ids=include_ids
+        )
+
     def _store_pending_monster_reactions(self, dm_response: DungeonMasterResponse) -> None:
         """
         Store monster reactions from DM response for later merging with player reactions.
@@ -626,7 +651,8 @@ class SessionManager:
     async def demo_process_player_input(
         self,
         new_messages: List[ChatMessage],
-        mock_next_objective: Optional[str] = None
+        mock_next_objective: Optional[str] = None,
+        on_narrative: Optional[Callable[[int, str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         DEMO VERSION: Simplified process_player_input without GD and state management.
@@ -641,6 +667,9 @@ class SessionManager:
         Args:
             new_messages: List of player chat messages
             mock_next_objective: Optional mock objective for when step completes
+            on_narrative: Optional async callback for streaming narration. Called with
+                (response_index, narrative_so_far) while each DM run generates, where
+                response_index is the narrative's position in "responses".
 
         Returns:
             Dictionary with:
@@ -700,8 +729,12 @@ class SessionManager:
         if self.logger:
             self.logger.dm("Processing DM response", context_length=len(dungeon_master_context))
 
+        response_queue: List[str] = []
+
         with character_registry_context(registered_chars):
-            dm_result = await self.dungeon_master_agent.process_message(dungeon_master_context, deps=deps)
+            dm_result = await self._run_dungeon_master(
+                dungeon_master_context, deps, len(response_queue), on_narrative
+            )
         dungeon_master_response: DungeonMasterResponse = dm_result.output
 
         # Track usage from this run
@@ -718,7 +751,6 @@ class SessionManager:
                          response=dungeon_master_response.model_dump())
 
         # === PHASE 3: PROCESS DM RESPONSE ===
-        response_queue: List[str] = []
         response_queue.append(dungeon_master_response.narrative)
 
         # Mark the player message(s) as responded to (DM has now responded to it)
@@ -791,7 +823,9 @@ class SessionManager:
                 )
                 deps = getattr(self.dungeon_master_agent, 'dm_deps', None)
                 with character_registry_context(registered_chars):
-                    dm_result = await self.dungeon_master_agent.process_message(dungeon_master_context, deps=deps)
+                    dm_result = await self._run_dungeon_master(
+                        dungeon_master_context, deps, len(response_queue), on_narrative
+                    )
                 dungeon_master_response = dm_result.output
 
                 # Track usage from re-run
@@ -841,6 +875,24 @@ class SessionManager:
             "filtered_characters_warning": filtered_warning  # Milestone 6: Warning if chars were filtered
         }
 
+    async def _run_dungeon_master(
+        self,
+        context: str,
+        deps: Any,
+        response_index: int,
+        on_narrative: Optional[Callable[[int, str], Awaitable[None]]]
+    ):
+        """Run the DM agent, streaming narration to on_narrative when provided."""
+        if on_narrative is None:
+            return await self.dungeon_master_agent.process_message(context, deps=deps)
+
+        async def forward_narrative(text: str) -> None:
+            await on_narrative(response_index, text)
+
+        return await self.dungeon_master_agent.process_message(
+            context, deps=deps, on_narrative=forward_narrative
+        )
+
     def demo_process_player_input_sync(
         self,
         new_messages: List[ChatMessage],
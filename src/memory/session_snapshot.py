@@ -0,0 +1,186 @@
+"""
+Session snapshots - capture and restore the mutable state of a game session.
+
+A snapshot is a JSON-compatible dict holding everything needed to rebuild a
+session on a freshly created SessionManager:
+- TurnManager state (turn stack, completed turns, combat state, game phase)
+- Player character sheets and runtime monsters from the StateManager, and
+  which sheets were uploaded into the session
+- Player → character registry mappings
+- MessageCoordinator expectation and combat mode
+- Response collection timeouts configured for the channel (/config timeouts)
+
+Agents, tools and services are not serialized - they are recreated by the
+session factory and the captured state is loaded into them.
+
+Repeated captures of the same session (checkpointing after every DM cycle) can
+pass a SnapshotCache so only state that changed since the previous capture is
+serialized again.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
+
+from ..characters.character_codec import character_from_snapshot
+from ..characters.monster import Monster
+from ..models.response_expectation import ResponseExpectation
+
+if TYPE_CHECKING:
+    from .session_manager import SessionManager
+    from .message_coordinator import MessageCoordinator
+
+SNAPSHOT_VERSION = 1
+
+
+class SessionSnapshotError(Exception):
+    """Exception raised when a snapshot cannot be restored."""
+    pass
+
+
+class SnapshotCache:
+    """
+    Serialized state reused between captures of one session.
+
+    Completed turns never change once completed, and characters and monsters
+    bump their render version on every mutation, so unchanged entries are
+    taken from the previous capture instead of being dumped again. Snapshots
+    built from a cache share those dicts and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self.completed_turns: Dict[str, Dict[str, Any]] = {}  # turn_id -> TurnContext.to_dict()
+        self._sheets: Dict[str, Dict[str, Tuple[Any, Dict[str, Any]]]] = {}  # kind -> id -> (version, dump)
+
+    def dump_sheets(self, kind: str, sheets: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Dump a collection of characters or monsters, reusing unchanged dumps.
+
+        Args:
+            kind: Collection name ("characters" or "monsters")
+            sheets: ID -> Character/Monster
+
+        Returns:
+            ID -> model_dump(mode="json")
+        """
+        previous = self._sheets.get(kind, {})
+        current = {}
+        for sheet_id, sheet in sheets.items():
+            version = getattr(sheet, "_render_version", None)
+            cached = previous.get(sheet_id)
+            if version is None or cached is None or cached[0] != version:
+                cached = (version, sheet.model_dump(mode="json"))
+            current[sheet_id] = cached
+        self._sheets[kind] = current
+        return {sheet_id: data for sheet_id, (_, data) in current.items()}
+
+
+def capture_session_state(
+    session_manager: "SessionManager",
+    message_coordinator: Optional["MessageCoordinator"] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+    cache: Optional[SnapshotCache] = None
+) -> Dict[str, Any]:
+    """
+    Capture the mutable state of a session.
+
+    Args:
+        session_manager: SessionManager to capture
+        message_coordinator: Optional coordinator for the session's channel
+        timeouts: Optional response collection timeouts (SessionTimeouts fields)
+        cache: Optional cache from the previous capture of this session
+
+    Returns:
+        JSON-compatible snapshot dict
+    """
+    state_manager = session_manager.state_manager
+    registry = session_manager.player_character_registry
+    turn_manager = session_manager.turn_manager
+
+    if cache is not None:
+        turn_state = turn_manager.export_state(cache.completed_turns) if turn_manager else None
+        characters = cache.dump_sheets("characters", state_manager.characters)
+        monsters = cache.dump_sheets("monsters", state_manager.monsters)
+    else:
+        turn_state = turn_manager.export_state() if turn_manager else None
+        characters = {char_id: char.model_dump(mode="json") for char_id, char in state_manager.characters.items()}
+        monsters = {
+            monster_id: monster.model_dump(mode="json")
+            for monster_id, monster in state_manager.monsters.items()
+        }
+
+    snapshot: Dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "turn_manager": turn_state,
+        "characters": characters,
+        "uploaded_characters": state_manager.uploaded_character_ids(),
+        "monsters": monsters,
+        "player_characters": registry.get_all_player_character_mappings() if registry else {},
+        "demo_step_index": session_manager._demo_step_index,
+        "coordinator": None,
+        "timeouts": dict(timeouts) if timeouts else None,
+    }
+
+    if message_coordinator:
+        expectation = message_coordinator.current_expectation
+        snapshot["coordinator"] = {
+            "combat_mode": message_coordinator.combat_mode,
+            "expectation": expectation.model_dump(mode="json") if expectation else None,
+        }
+
+    return snapshot
+
+
+def restore_session_state(
+    session_manager: "SessionManager",
+    snapshot: Dict[str, Any],
+    message_coordinator: Optional["MessageCoordinator"] = None
+) -> None:
+    """
+    Load a snapshot into a freshly created session.
+
+    Character sheets are written back through the StateManager so its storage
+    directory matches the restored in-memory state.
+
+    Args:
+        session_manager: Newly created SessionManager to restore into
+        snapshot: Dict produced by capture_session_state()
+        message_coordinator: Optional coordinator to restore expectation into
+
+    Raises:
+        SessionSnapshotError: If the snapshot version is unsupported
+    """
+    version = snapshot.get("version")
+    if version != SNAPSHOT_VERSION:
+        raise SessionSnapshotError(f"Unsupported session snapshot version: {version}")
+
+    if session_manager.turn_manager and snapshot.get("turn_manager"):
+        session_manager.turn_manager.import_state(snapshot["turn_manager"])
+
+    state_manager = session_manager.state_manager
+    uploaded = set(snapshot.get("uploaded_characters") or [])
+    for char_id, data in snapshot.get("characters", {}).items():
+        character = character_from_snapshot(data)
+        if char_id in uploaded:
+            # Uploads have no shared base sheet - their last state becomes the base
+            state_manager.add_uploaded_character(char_id, character)
+        else:
+            state_manager.add_character(char_id, character)
+            state_manager.save_character(char_id)
+
+    state_manager.clear_monsters()
+    for data in snapshot.get("monsters", {}).values():
+        state_manager.add_monster(Monster.model_validate(data))
+
+    registry = session_manager.player_character_registry
+    if registry:
+        for player_id, character_id in snapshot.get("player_characters", {}).items():
+            registry.register_player_character(player_id, character_id)
+
+    session_manager._demo_step_index = snapshot.get("demo_step_index", 0)
+
+    coordinator_state = snapshot.get("coordinator")
+    if message_coordinator and coordinator_state:
+        if coordinator_state.get("combat_mode"):
+            message_coordinator.enter_combat_mode()
+        expectation = coordinator_state.get("expectation")
+        if expectation:
+            message_coordinator.set_expectation(ResponseExpectation.model_validate(expectation))
@@ -16,6 +16,7 @@ from ..characters.monster import Monster
 from ..characters.character_components import Effect, DurationType
 from ..models.state_commands_optimized import (
     HPChangeCommand,
+    AreaEffectCommand,
     ConditionCommand,
     EffectCommand,
     SpellSlotCommand,
@@ -81,6 +82,9 @@ class StateCommandExecutor:
         """
         self.character_lookup = character_lookup
 
+        # Optional listener for newly applied effects/conditions (e.g., TurnManager.schedule_effect)
+        self.on_effect_added: Optional[Callable[[str, Effect], None]] = None
+
         # Map command types to handler methods
         self._handlers: Dict[str, Callable] = {
             "hp_change": self._handle_hp_change,
@@ -106,6 +110,10 @@ class StateCommandExecutor:
             CommandExecutionResult with success status and details
         """
         command_type = command.type
+        if isinstance(command, AreaEffectCommand):
+            # Multi-target - resolved in one pass over all targets
+            return self._handle_area_effect(command)
+
         character_id = command.character_id
 
         # Get character
@@ -138,6 +146,10 @@ class StateCommandExecutor:
                 character_id=character_id,
                 message=f"Error executing command: {str(e)}"
             )
+        finally:
+            # Handlers may write fields directly - invalidate cached sheet renders
+            if hasattr(character, "bump_version"):
+                character.bump_version()
 
     def execute_batch(self, commands: List[StateCommand]) -> BatchExecutionResult:
         """
@@ -282,6 +294,81 @@ class StateCommandExecutor:
                 details={"change": 0}
             )
 
+    def _handle_area_effect(self, command: AreaEffectCommand) -> CommandExecutionResult:
+        """
+        Handle area damage: saves and damage modifiers are resolved per target in one pass.
+
+        Successful saves take half (or no) damage; then immunity, resistance and
+        vulnerability (Monster.damage_modifiers) apply, in 5e order.
+        """
+        character_id = ", ".join(command.character_ids)
+        damage_type = command.damage_type.value if command.damage_type else None
+        saved = set(command.saved)
+
+        target_results = []
+        missing = []
+        for target_id in dict.fromkeys(command.character_ids):
+            character = self.character_lookup(target_id)
+            if character is None:
+                missing.append(target_id)
+                continue
+
+            amount = command.damage
+            if target_id in saved:
+                amount = amount // 2 if command.on_save == "half" else 0
+
+            modifier = None
+            damage_modifiers = getattr(character, "damage_modifiers", None)
+            if damage_type and damage_modifiers is not None:
+                if damage_type in damage_modifiers.immunities:
+                    amount, modifier = 0, "immune"
+                elif damage_type in damage_modifiers.resistances:
+                    amount, modifier = amount // 2, "resistant"
+                elif damage_type in damage_modifiers.vulnerabilities:
+                    amount, modifier = amount * 2, "vulnerable"
+
+            previous_hp = character.hit_points.current_hp
+            damage_result = character.take_damage(amount)
+
+            target_results.append({
+                "character_id": target_id,
+                "saved": target_id in saved,
+                "damage_modifier": modifier,
+                "damage_amount": amount,
+                "temp_hp_absorbed": damage_result["temp_absorbed"],
+                "actual_damage": damage_result["actual_damage"],
+                "previous_hp": previous_hp,
+                "new_hp": character.hit_points.current_hp,
+                "is_unconscious": character.is_unconscious
+            })
+
+        name = command.effect_name or "Area effect"
+        damage_type_str = f" {damage_type}" if damage_type else ""
+        message_parts = [f"{name}: {command.damage}{damage_type_str} damage to {len(target_results)} target(s)"]
+        message_parts.extend(
+            f"{r['character_id']} took {r['damage_amount']}"
+            + (" (saved)" if r["saved"] else "")
+            + (f" ({r['damage_modifier']})" if r["damage_modifier"] else "")
+            + (" - now unconscious!" if r["is_unconscious"] else "")
+            for r in target_results
+        )
+        if missing:
+            message_parts.append(f"Not found: {', '.join(missing)}")
+
+        return CommandExecutionResult(
+            success=not missing,
+            command_type=command.type,
+            character_id=character_id,
+            message=", ".join(message_parts),
+            details={
+                "effect_name": command.effect_name,
+                "damage": command.damage,
+                "damage_type": damage_type,
+                "targets": target_results,
+                "not_found": missing
+            }
+        )
+
     def _handle_condition(self, command: ConditionCommand, character: Character) -> CommandExecutionResult:
         """Handle condition add/remove commands."""
         condition_name = command.condition.value.capitalize()  # "poisoned" -> "Poisoned"
@@ -289,7 +376,7 @@ class StateCommandExecutor:
 
         if action == "add":
             # Check if condition already exists
-            existing = next((e for e in character.active_effects if e.name == condition_name), None)
+            existing = character.active_effects.get(condition_name)
             if existing:
                 return CommandExecutionResult(
                     success=False,
@@ -326,6 +413,8 @@ class StateCommandExecutor:
             )
 
             character.add_effect(effect)
+            if self.on_effect_added:
+                self.on_effect_added(command.character_id, effect)
 
             # Build duration description
             if command.duration_type == DurationType.PERMANENT:
@@ -351,7 +440,7 @@ class StateCommandExecutor:
 
         elif action == "remove":
             # Check if condition exists
-            existing = next((e for e in character.active_effects if e.name == condition_name), None)
+            existing = character.active_effects.get(condition_name)
             if not existing:
                 return CommandExecutionResult(
                     success=False,
@@ -394,7 +483,7 @@ class StateCommandExecutor:
 
         if action == "add":
             # Check if effect already exists
-            existing = next((e for e in character.active_effects if e.name == effect_name), None)
+            existing = character.active_effects.get(effect_name)
             if existing:
                 return CommandExecutionResult(
                     success=False,
@@ -440,6 +529,8 @@ class StateCommandExecutor:
             )
 
             character.add_effect(effect)
+            if self.on_effect_added:
+                self.on_effect_added(command.character_id, effect)
 
             # Build duration description
             if command.duration_type == DurationType.PERMANENT:
@@ -465,13 +556,13 @@ class StateCommandExecutor:
                     "duration": duration,
                     "description": command.description,
                     "summary": command.summary,
-                    "active_effects": [e.name for e in character.active_effects]
+                    "active_effects": character.active_effects.names()
                 }
             )
 
         elif action == "remove":
             # Check if effect exists
-            existing = next((e for e in character.active_effects if e.name == effect_name), None)
+            existing = character.active_effects.get(effect_name)
             if not existing:
                 return CommandExecutionResult(
                     success=False,
@@ -480,7 +571,7 @@ class StateCommandExecutor:
                     message=f"Effect '{effect_name}' not found on character",
                     details={
                         "effect_name": effect_name,
-                        "active_effects": [e.name for e in character.active_effects]
+                        "active_effects": character.active_effects.names()
                     }
                 )
 
@@ -494,7 +585,7 @@ class StateCommandExecutor:
                 details={
                     "effect_name": effect_name,
                     "action": "remove",
-                    "active_effects": [e.name for e in character.active_effects]
+                    "active_effects": character.active_effects.names()
                 }
             )
 
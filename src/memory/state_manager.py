@@ -2,25 +2,29 @@
 State Manager - Character and Monster Persistence Layer
 
 This class handles character and monster storage and persistence:
-- load_character(): Load character from JSON file
-- save_character(): Save character to JSON file
+- load_character(): Load character from JSON file (or a session overlay)
+- save_character(): Save character to JSON file (or record an overlay delta)
 - get_character(): Get character with caching
 - Monster management: add_monster, remove_monster, get_monster, clear_monsters
 - get_character_by_id(): Unified lookup for both characters and monsters
+- resolver: CharacterResolver kept in sync for name → ID resolution
 
 All state updates are handled by StateCommandExecutor.
 See state_command_executor.py for update logic.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterable, List, Any, Optional, Union
 import json
 import os
 from datetime import datetime
 
-from ..models.state_commands_optimized import StateCommandResult
+from ..models.state_commands_optimized import AreaEffectCommand, StateCommand, StateCommandResult, get_target_ids
 from ..characters.charactersheet import Character
+from ..characters.character_codec import CharacterBinaryCache, character_from_json, character_to_json
+from ..characters.character_overlay import CharacterOverlay
 from ..characters.monster import Monster
 from .state_command_executor import StateCommandExecutor, BatchExecutionResult
+from .character_resolver import CharacterResolver
 
 
 class StateUpdateError(Exception):
@@ -44,19 +48,39 @@ class StateManager:
     - Provide audit logging for state changes
     """
 
-    def __init__(self, character_data_path: str = "src/characters/", enable_logging: bool = True):
+    def __init__(
+        self,
+        character_data_path: str = "src/characters/",
+        enable_logging: bool = True,
+        binary_cache_dir: Optional[str] = None,
+        overlay: Optional[CharacterOverlay] = None
+    ):
         """
         Initialize the state manager.
 
         Args:
             character_data_path: Path to character data files
             enable_logging: Whether to log all state changes
+            binary_cache_dir: Optional directory for the msgpack character cache
+                              (ignored with a warning if msgpack is not installed)
+            overlay: Optional copy-on-write overlay. When set, characters are
+                     materialized from shared base sheets and saves are kept as
+                     in-memory deltas; character_data_path is never written to
+                     except for logs.
         """
         self.character_data_path = character_data_path
+        self.overlay = overlay
         self.enable_logging = enable_logging
         self.characters: Dict[str, Character] = {}
         self.monsters: Dict[str, Monster] = {}  # Combat monsters (runtime only)
         self.update_log: List[Dict[str, Any]] = []
+        self.resolver = CharacterResolver()  # Updated on load/add/remove, never rebuilt
+        self.binary_cache: Optional[CharacterBinaryCache] = None
+        if binary_cache_dir:
+            if CharacterBinaryCache.available:
+                self.binary_cache = CharacterBinaryCache(binary_cache_dir)
+            else:
+                print("Warning: msgpack is not installed, character binary cache disabled")
 
         # Initialize command executor with unified character lookup
         self.command_executor = StateCommandExecutor(
@@ -64,7 +88,8 @@ class StateManager:
         )
 
         # Ensure directories exist
-        os.makedirs(character_data_path, exist_ok=True)
+        if overlay is None:
+            os.makedirs(character_data_path, exist_ok=True)
         if enable_logging:
             os.makedirs(os.path.join(character_data_path, "logs"), exist_ok=True)
     
@@ -79,18 +104,64 @@ class StateManager:
             Character instance or None if not found
         """
         try:
+            if self.overlay:
+                character = self.overlay.materialize(character_id)
+                if character is not None:
+                    self.add_character(character_id, character)
+                return character
+
             character_file = os.path.join(self.character_data_path, f"{character_id}.json")
             if os.path.exists(character_file):
-                with open(character_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    character = Character.model_validate(data)
-                    self.characters[character_id] = character
-                    return character
+                character = self.binary_cache.load(character_id, character_file) if self.binary_cache else None
+                if character is None:
+                    with open(character_file, 'rb') as f:
+                        character = character_from_json(f.read())
+                    if self.binary_cache:
+                        self.binary_cache.store(character_id, character_file, character)
+                self.add_character(character_id, character)
+                return character
         except Exception as e:
             self._log_error(f"Failed to load character {character_id}: {e}")
         
         return None
     
+    def add_character(self, character_id: str, character: Character) -> None:
+        """
+        Add (or replace) a player character in memory and in the name resolver.
+
+        Args:
+            character_id: ID of the character
+            character: Character instance
+        """
+        self.characters[character_id] = character
+        if character.info and character.info.name:
+            self.resolver.register(character_id, character.info.name, include_first_name=True)
+
+    def add_uploaded_character(self, character_id: str, character: Character) -> bool:
+        """
+        Add a user-supplied character sheet to this session.
+
+        With an overlay the sheet becomes a session-local base sheet, kept in
+        memory only; otherwise it is saved under character_data_path.
+
+        Args:
+            character_id: ID of the character
+            character: Character instance
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.overlay:
+            self.overlay.add_base(character_id, character)
+            self.add_character(character_id, character)
+            return True
+        self.add_character(character_id, character)
+        return self.save_character(character_id)
+
+    def uploaded_character_ids(self) -> List[str]:
+        """IDs of the characters added with add_uploaded_character() (overlay sessions only)."""
+        return self.overlay.uploaded_ids() if self.overlay else []
+
     def save_character(self, character_id: str) -> bool:
         """
         Save a character to storage.
@@ -102,12 +173,15 @@ class StateManager:
             True if successful, False otherwise
         """
         try:
+            if character_id in self.characters and self.overlay:
+                return self.overlay.record(character_id, self.characters[character_id])
             if character_id in self.characters:
                 character_file = os.path.join(self.character_data_path, f"{character_id}.json")
-                with open(character_file, 'w', encoding='utf-8') as f:
-                    # Convert to dict for JSON serialization
-                    character_data = self.characters[character_id].model_dump()
-                    json.dump(character_data, f, indent=2, ensure_ascii=False)
+                character = self.characters[character_id]
+                with open(character_file, 'wb') as f:
+                    f.write(character_to_json(character))
+                if self.binary_cache:
+                    self.binary_cache.store(character_id, character_file, character)
                 return True
         except Exception as e:
             self._log_error(f"Failed to save character {character_id}: {e}")
@@ -155,6 +229,10 @@ class StateManager:
         }
 
         try:
+            # Repair character_ids the agents got slightly wrong ("Goblin 2", "tharion")
+            for bad_id, character_id in self._repair_character_ids(command_result.commands).items():
+                results["warnings"].append(f"Resolved character_id '{bad_id}' to '{character_id}'")
+
             # Execute all commands using the command executor
             batch_result: BatchExecutionResult = self.command_executor.execute_batch(
                 command_result.commands
@@ -167,9 +245,13 @@ class StateManager:
             for failure in batch_result.get_failures():
                 results["errors"].append(failure.message)
 
-            # Save all modified characters
-            for command in command_result.commands:
-                character_id = command.character_id
+            # Save each modified character once, however many commands touched it
+            modified_ids = dict.fromkeys(
+                character_id
+                for command in command_result.commands
+                for character_id in get_target_ids(command)
+            )
+            for character_id in modified_ids:
                 if character_id in self.characters:
                     self.save_character(character_id)
 
@@ -184,6 +266,28 @@ class StateManager:
 
         return results
 
+    def _repair_character_ids(self, commands: List[StateCommand]) -> Dict[str, str]:
+        """
+        Rewrite unknown character_ids in commands to the character the resolver matches.
+
+        Returns:
+            {bad_id: repaired_id} for each rewritten ID
+        """
+        repairs = self.resolver.repair_ids(
+            (character_id for command in commands for character_id in get_target_ids(command)),
+            is_valid=lambda character_id: self.get_character_by_id(character_id) is not None
+        )
+        if not repairs:
+            return repairs
+
+        for command in commands:
+            if isinstance(command, AreaEffectCommand):
+                command.character_ids = [repairs.get(c, c) for c in command.character_ids]
+                command.saved = [repairs.get(c, c) for c in command.saved]
+            elif command.character_id in repairs:
+                command.character_id = repairs[command.character_id]
+        return repairs
+
     def _log_command_execution(self, command_result: StateCommandResult, batch_result: BatchExecutionResult) -> None:
         """Log command execution for audit trail."""
         log_entry = {
@@ -272,6 +376,7 @@ class StateManager:
             monster: Monster instance to add
         """
         self.monsters[monster.character_id] = monster
+        self.resolver.register(monster.character_id, monster.name)
 
     def remove_monster(self, character_id: str) -> bool:
         """
@@ -285,6 +390,10 @@ class StateManager:
         """
         if character_id in self.monsters:
             del self.monsters[character_id]
+            self.resolver.unregister(character_id)
+            # A player character may share the ID space; keep it resolvable
+            if character_id in self.characters:
+                self.add_character(character_id, self.characters[character_id])
             return True
         return False
 
@@ -311,30 +420,34 @@ class StateManager:
 
     def clear_monsters(self) -> None:
         """Clear all monsters (typically at end of combat)."""
-        self.monsters.clear()
+        for character_id in list(self.monsters):
+            self.remove_monster(character_id)
 
-    def get_character_name_to_id_map(self) -> Dict[str, str]:
+    def get_character_name_to_id_map(
+        self,
+        mentioned_in: Optional[str] = None,
+        include_ids: Iterable[str] = ()
+    ) -> Dict[str, str]:
         """
-        Get name → character_id mapping for all characters (players and monsters).
+        Get name → character_id mapping for characters (players and monsters).
 
         Used by state extraction agents to resolve character names
         from narrative text to character IDs.
 
+        Args:
+            mentioned_in: If given, only include characters this text refers to
+                          (falls back to everyone if it names nobody)
+            include_ids: IDs to include regardless (e.g., combat participants)
+
         Returns:
             Dictionary mapping display names to character IDs
         """
-        mapping = {}
-
-        # Add player characters
-        for char_id, char in self.characters.items():
-            if char.info and char.info.name:
-                mapping[char.info.name] = char_id
-
-        # Add monsters
-        for monster_id, monster in self.monsters.items():
-            mapping[monster.name] = monster_id
+        if mentioned_in is None:
+            return self.resolver.mapping()
 
-        return mapping
+        present = list(include_ids) + sorted(self.resolver.find_mentions(mentioned_in))
+        mapping = self.resolver.mapping(present)
+        return mapping or self.resolver.mapping()
 
     def _transform_monster_template(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -463,14 +576,27 @@ class StateManager:
         return monsters
 
 
-def create_state_manager(character_data_path: str = "src/characters/") -> StateManager:
+def create_state_manager(
+    character_data_path: str = "src/characters/",
+    binary_cache_dir: Optional[str] = None,
+    overlay: Optional[CharacterOverlay] = None,
+    enable_logging: bool = True
+) -> StateManager:
     """
     Factory function to create a configured state manager.
     
     Args:
         character_data_path: Path to character data files
+        binary_cache_dir: Optional directory for the msgpack character cache
+        overlay: Optional copy-on-write overlay over shared base sheets
+        enable_logging: Whether to write state change logs under character_data_path
     
     Returns:
         Configured StateManager instance
     """
-    return StateManager(character_data_path=character_data_path)
\ No newline at end of file
+    return StateManager(
+        character_data_path=character_data_path,
+        enable_logging=enable_logging,
+        binary_cache_dir=binary_cache_dir,
+        overlay=overlay
+    )
\ No newline at end of file
@@ -130,7 +130,7 @@ This design supports complex D&D reaction scenarios while maintaining clean arch
 boundaries and providing efficient queue processing for combat mechanics.
 """
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Callable, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
@@ -142,6 +142,8 @@ from ..models.turn_context import TurnContext, TurnExtractionContext
 from ..models.turn_message import create_live_message, create_message_group
 from ..models.combat_state import CombatState, CombatPhase, InitiativeEntry, create_combat_state
 from ..models.dm_response import MonsterReactionDecision
+from ..characters.character_components import Effect
+from .effect_scheduler import EffectScheduler, SCHEDULED_DURATION_TYPES, START, END
 from ..context.state_extractor_context_builder import StateExtractorContextBuilder
 from ..prompts.demo_combat_steps import (
     DEMO_MAIN_ACTION_STEPS, DEMO_REACTION_STEPS,
@@ -259,6 +261,10 @@ class TurnManager:
         # These are merged into start_and_queue_turns when creating reaction subturns
         self._pending_monster_reactions: List[MonsterReactionDecision] = []
 
+        # Round-based effect expiry across all combatants - drained by advance_combat_turn()
+        self.effect_scheduler = EffectScheduler()
+        self._character_lookup: Optional[Callable[[str], Optional[Any]]] = None
+
     def _get_message_formatter(self):
         """Lazy load MessageFormatter when needed."""
         if self.message_formatter is None:
@@ -664,10 +670,9 @@ class TurnManager:
         effects_processed = []
         
         # TODO: Implement end-of-turn effect processing
-        # This would handle:
-        # - Duration-based condition expiration
+        # Duration-based condition/spell expiration is handled by effect_scheduler
+        # in advance_combat_turn(). This would handle:
         # - End-of-turn damage (poison, burning, etc.)
-        # - Spell effect expiration
         # - Regeneration effects
         # - Other turn-based triggers
         
@@ -951,6 +956,67 @@ class TurnManager:
             active_turns_by_level=active_turns_by_level
         )
 
+    def export_state(self, completed_turn_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Serialize the turn stack, combat state and bookkeeping to a JSON-compatible dict.
+
+        Used to persist a session (hibernation/checkpointing). The processing turn is
+        stored by turn_id and re-linked to the restored TurnContext in import_state().
+
+        Args:
+            completed_turn_cache: Optional turn_id -> to_dict() payload from a previous
+                export. Completed turns never change, so cached payloads are reused and
+                the cache is updated in place to hold exactly the current completed turns.
+        """
+        if completed_turn_cache is None:
+            completed_turns = [turn.to_dict() for turn in self.completed_turns]
+        else:
+            completed_turns = [
+                completed_turn_cache.get(turn.turn_id) or turn.to_dict() for turn in self.completed_turns
+            ]
+            completed_turn_cache.clear()
+            completed_turn_cache.update((turn["turn_id"], turn) for turn in completed_turns)
+
+        return {
+            "turn_stack": [[turn.to_dict() for turn in level_queue] for level_queue in self.turn_stack],
+            "completed_turns": completed_turns,
+            "turn_counter": self._turn_counter,
+            "processing_turn_id": self._processing_turn.turn_id if self._processing_turn else None,
+            "game_phase": self._current_game_phase.value,
+            "combat_state": self.combat_state.model_dump(mode="json"),
+            "pending_monster_reactions": [r.model_dump() for r in self._pending_monster_reactions],
+            "effect_schedule": self.effect_scheduler.export_state(),
+        }
+
+    def import_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore state produced by export_state(), replacing the current state.
+
+        Args:
+            state: Dict previously returned by export_state()
+        """
+        self.turn_stack = [
+            [TurnContext.from_dict(turn) for turn in level_queue]
+            for level_queue in state.get("turn_stack", [])
+        ]
+        self.completed_turns = [TurnContext.from_dict(turn) for turn in state.get("completed_turns", [])]
+        self._turn_counter = state.get("turn_counter", 0)
+        self._current_game_phase = GamePhase(state.get("game_phase", GamePhase.EXPLORATION.value))
+        self.combat_state = CombatState.model_validate(state["combat_state"]) if state.get("combat_state") else create_combat_state()
+        self._pending_monster_reactions = [
+            MonsterReactionDecision.model_validate(r) for r in state.get("pending_monster_reactions", [])
+        ]
+        self.effect_scheduler.import_state(state.get("effect_schedule", []))
+
+        # Re-link processing turn to the restored object (it must be the same instance as in the stack)
+        self._processing_turn = None
+        processing_turn_id = state.get("processing_turn_id")
+        if processing_turn_id:
+            for level_queue in self.turn_stack:
+                for turn in level_queue:
+                    if turn.turn_id == processing_turn_id:
+                        self._processing_turn = turn
+
     # =========================================================================
     # COMBAT PHASE MANAGEMENT
     # =========================================================================
@@ -1142,6 +1208,9 @@ class TurnManager:
                 self.turn_stack.pop()
             self.completed_turns.append(combat_start_turn)
 
+        # Effects applied before initiative expire at the end of their bearer's turns
+        self._schedule_existing_effects()
+
         # Queue the first round of combat turns
         self._queue_combat_round()
 
@@ -1259,6 +1328,25 @@ class TurnManager:
 
         next_participant, is_new_round = self.combat_state.advance_turn()
 
+        # Expire effects up to the start of the next participant's turn
+        # (this includes everything due at the end of the turn that just ended)
+        expired_effects = []
+        if self._character_lookup is not None:
+            positions = {
+                entry.character_id: position
+                for position, entry in enumerate(self.combat_state.initiative_order)
+            }
+            expired_effects = self.effect_scheduler.drain(
+                self.combat_state.round_number,
+                self.combat_state.current_participant_index,
+                START,
+                positions.get,
+                self._character_lookup
+            )
+            if self.logger and expired_effects:
+                self.logger.combat("Effects expired",
+                                  effects=[e.describe() for e in expired_effects])
+
         # Log turn advancement
         if self.logger:
             self.logger.combat("Turn advanced",
@@ -1272,14 +1360,16 @@ class TurnManager:
                 "combat_over": True,
                 "reason": "One side eliminated",
                 "remaining_players": self.combat_state.get_remaining_player_ids(),
-                "remaining_monsters": self.combat_state.get_remaining_monster_ids()
+                "remaining_monsters": self.combat_state.get_remaining_monster_ids(),
+                "expired_effects": [e.describe() for e in expired_effects]
             }
 
         result = {
             "combat_over": False,
             "next_participant": next_participant,
             "is_new_round": is_new_round,
-            "round_number": self.combat_state.round_number
+            "round_number": self.combat_state.round_number,
+            "expired_effects": [e.describe() for e in expired_effects]
         }
 
         # If new round, queue new turns
@@ -1289,6 +1379,60 @@ class TurnManager:
 
         return result
 
+    # =========================================================================
+    # EFFECT EXPIRY
+    # =========================================================================
+
+    def set_character_lookup(self, character_lookup: Callable[[str], Optional[Any]]) -> None:
+        """
+        Set the function used to find combatants when their effects expire.
+
+        Args:
+            character_lookup: Returns the Character/Monster for a character_id
+                (usually StateManager.get_character_by_id)
+        """
+        self._character_lookup = character_lookup
+
+    def schedule_effect(self, character_id: str, effect: Effect) -> None:
+        """
+        Schedule a newly applied effect for expiry.
+
+        Round-based effects applied during combat rounds last until the start of
+        the current participant's turn, duration rounds later. Other effects
+        (and effects applied outside combat) are ignored.
+
+        Args:
+            character_id: ID of the character the effect was applied to
+            effect: The applied effect
+        """
+        anchor_id = self.combat_state.get_current_participant_id()
+        if (self.combat_state.phase != CombatPhase.COMBAT_ROUNDS or
+                anchor_id is None or
+                effect.duration_type not in SCHEDULED_DURATION_TYPES or
+                effect.duration_remaining <= 0):
+            return
+        self.effect_scheduler.schedule(character_id, effect, (
+            self.combat_state.round_number + effect.duration_remaining,
+            anchor_id,
+            START
+        ))
+
+    def _schedule_existing_effects(self) -> None:
+        """Schedule round-based effects combatants already have when initiative is finalized."""
+        if self._character_lookup is None:
+            return
+        for entry in self.combat_state.initiative_order:
+            character = self._character_lookup(entry.character_id)
+            if character is None:
+                continue
+            for effect in character.active_effects:
+                if effect.duration_type in SCHEDULED_DURATION_TYPES and effect.duration_remaining > 0:
+                    self.effect_scheduler.schedule(entry.character_id, effect, (
+                        self.combat_state.round_number + effect.duration_remaining - 1,
+                        entry.character_id,
+                        END
+                    ))
+
     def start_combat_end(self, reason: Optional[str] = None) -> Dict[str, Any]:
         """
         Start Phase 3: Combat End.
@@ -1398,6 +1542,7 @@ class TurnManager:
 
         # Reset everything
         self.combat_state.finish_combat()
+        self.effect_scheduler.clear()
         self.turn_stack = []
 
         return {
@@ -40,6 +40,28 @@ class HPChangeCommand(BaseModel):
     )
 
 
+class AreaEffectCommand(BaseModel):
+    """Apply one area effect's damage to many targets (Fireball, breath weapon, ...)."""
+    type: Literal["area_effect"] = "area_effect"
+    character_ids: List[str] = Field(..., min_length=1, description="All targets caught in the area")
+    damage: int = Field(..., ge=0, description="Rolled damage before saves and resistances")
+    damage_type: Optional[DamageType] = Field(None, description="Type of damage")
+    saved: List[str] = Field(default_factory=list,
+        description="character_ids that succeeded on the saving throw")
+    on_save: Literal["half", "none"] = Field("half",
+        description="Damage on a successful save: half (most spells) or none")
+    effect_name: Optional[str] = Field(None, examples=["Fireball", "Breath Weapon"])
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {"type": "area_effect", "character_ids": ["goblin_1", "goblin_2", "goblin_3"],
+                 "damage": 28, "damage_type": "fire", "saved": ["goblin_2"], "effect_name": "Fireball"}
+            ]
+        }
+    )
+
+
 # ==================== Effect Commands (5 specialized commands) ====================
 # Used by: EFFECT_AGENT (Tier 1) and ADVANCED_BUFF_AGENT (Tier 2)
 
@@ -243,8 +265,9 @@ class RestCommand(BaseModel):
 # ==================== Command Union (11 commands total) ====================
 
 StateCommand = Union[
-    # HP (1)
+    # HP (2)
     HPChangeCommand,
+    AreaEffectCommand,
 
     # Effects (2) - Simplified text-based effects
     ConditionCommand,
@@ -261,11 +284,18 @@ StateCommand = Union[
 ]
 
 
+def get_target_ids(command: StateCommand) -> List[str]:
+    """Get the character_ids a command modifies (several for area effects)."""
+    if isinstance(command, AreaEffectCommand):
+        return list(command.character_ids)
+    return [command.character_id]
+
+
 # ==================== Specialist Agent Result Types ====================
 
 class HPAgentResult(BaseModel):
     """Result from HP specialist agent (Tier 1)."""
-    commands: List[HPChangeCommand] = Field(default_factory=list)
+    commands: List[Union[HPChangeCommand, AreaEffectCommand]] = Field(default_factory=list)
 
 
 class EffectAgentResult(BaseModel):
@@ -318,7 +348,7 @@ class StateCommandResult(BaseModel):
 
 AGENT_ROUTING = {
     "hp_agent": {
-        "commands": ["hp_change"],
+        "commands": ["hp_change", "area_effect"],
         "result_type": HPAgentResult,
         "keywords": ["damage", "hit", "hurt", "heal", "cure", "regenerate", "temporary hp", "temp hp"],
         "schema_tokens": 50  # Estimated
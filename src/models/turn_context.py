@@ -5,6 +5,7 @@ Contains TurnContext and related data structures for managing turn-based
 conversation context with selective filtering capabilities.
 """
 
+import copy
 from typing import List, Optional, Dict, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -231,6 +232,65 @@ class TurnContext:
             return self.game_step_list[self.current_step_index]
         return self.current_step_objective  # Fallback to manual objective
 
+    def messages_to_dict(self) -> List[Dict[str, Any]]:
+        """Serialize this turn's messages (groups are tagged with kind="group")."""
+        result = []
+        for item in self.messages:
+            if isinstance(item, MessageGroup):
+                result.append({"kind": "group", **item.to_dict()})
+            else:
+                result.append({"kind": "message", **item.to_dict()})
+        return result
+
+    @staticmethod
+    def messages_from_dict(data: List[Dict[str, Any]]) -> List[Union[TurnMessage, MessageGroup]]:
+        """Restore messages serialized with messages_to_dict()."""
+        return [
+            MessageGroup.from_dict(item) if item.get("kind") == "group" else TurnMessage.from_dict(item)
+            for item in data
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to a JSON-compatible dict (for session persistence).
+
+        Legacy _formatted_messages are not persisted - their content is already
+        mirrored into messages as live messages. The result shares no mutable
+        objects with the turn, so it can be read after the turn moves on.
+        """
+        return {
+            "turn_id": self.turn_id,
+            "turn_level": self.turn_level,
+            "current_step_objective": self.current_step_objective,
+            "active_character": self.active_character,
+            "initiative_order": list(self.initiative_order) if self.initiative_order is not None else None,
+            "messages": self.messages_to_dict(),
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "metadata": copy.deepcopy(self.metadata),
+            "game_step_list": list(self.game_step_list) if self.game_step_list is not None else None,
+            "current_step_index": self.current_step_index,
+            "child_count": self.child_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TurnContext":
+        """Restore a TurnContext serialized with to_dict()."""
+        return cls(
+            turn_id=data["turn_id"],
+            turn_level=data["turn_level"],
+            current_step_objective=data["current_step_objective"],
+            active_character=data.get("active_character"),
+            initiative_order=data.get("initiative_order"),
+            messages=cls.messages_from_dict(data.get("messages", [])),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]) if data.get("end_time") else None,
+            metadata=data.get("metadata", {}),
+            game_step_list=data.get("game_step_list"),
+            current_step_index=data.get("current_step_index", 0),
+            child_count=data.get("child_count", 0),
+        )
+
 
 @dataclass
 class TurnExtractionContext:
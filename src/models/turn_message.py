@@ -8,7 +8,7 @@ that supports selective filtering for different consumers (DM vs StateExtractor)
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Union
+from typing import Any, Dict, List, Union
 
 from .chat_message import ChatMessage
 
@@ -92,6 +92,33 @@ class TurnMessage:
             # Fallback for unknown message types
             return f'{indent}<unknown>{self.content}</unknown>'
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (for session persistence)."""
+        return {
+            "content": self.content,
+            "speaker": self.speaker,
+            "message_type": self.message_type.value,
+            "turn_origin": self.turn_origin,
+            "turn_level": self.turn_level,
+            "timestamp": self.timestamp.isoformat(),
+            "processed_for_state_extraction": self.processed_for_state_extraction,
+            "is_new_message": self.is_new_message,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TurnMessage":
+        """Restore a TurnMessage serialized with to_dict()."""
+        return cls(
+            content=data["content"],
+            speaker=data["speaker"],
+            message_type=MessageType(data["message_type"]),
+            turn_origin=data["turn_origin"],
+            turn_level=data["turn_level"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            processed_for_state_extraction=data.get("processed_for_state_extraction", False),
+            is_new_message=data.get("is_new_message", True),
+        )
+
 def create_live_message(
     content: str,
     turn_origin: str,
@@ -206,6 +233,23 @@ class MessageGroup:
         """String representation showing all messages."""
         return f"MessageGroup({len(self.messages)} messages)"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (for session persistence)."""
+        return {
+            "messages": [message.to_dict() for message in self.messages],
+            "timestamp": self.timestamp.isoformat(),
+            "is_new_message": self.is_new_message,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MessageGroup":
+        """Restore a MessageGroup serialized with to_dict()."""
+        return cls(
+            messages=[TurnMessage.from_dict(m) for m in data["messages"]],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            is_new_message=data.get("is_new_message", True),
+        )
+
 
 def create_message_group(messages: List[TurnMessage]) -> MessageGroup:
     """
@@ -0,0 +1,196 @@
+"""
+Partial updates of persisted character sheets (characters.character_data JSONB).
+
+A combat round changes a few leaves of a sheet (current HP, a spell slot
+counter, the effect list) while the document also carries features, spells
+and equipment descriptions. Instead of rewriting the whole document after
+every executed StateCommand:
+
+- CharacterPatchTracker remembers what the database holds for each character
+  and, given the commands just executed, diffs only the sheet sections those
+  commands can touch into PatchOperations (RFC 6902 style add/replace/remove).
+- build_patch_expression() turns the operations into one nested jsonb_set /
+  #- expression, so CharacterRepository.apply_patch() is a single UPDATE.
+
+Dicts are diffed key by key; lists (effects, equipment) are replaced whole.
+A character the tracker has not seen, or whose last write failed, needs a
+full rewrite (compute_patch returns None).
+
+Scope: this is the write path for code that keeps sheets in the characters
+table. The live game does not yet do that - StateManager.apply_commands
+updates in-memory sheets (saved to the session overlay), and session state
+reaches the database only through TurnCheckpointer's checkpoint_state - so no
+game loop code calls the tracker; scripts/benchmark_character_patches.py is
+its only runtime caller. Hook it up when characters get database rows.
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import Text, cast, func, literal
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+from src.characters.charactersheet import Character
+from src.characters.character_overlay import DELETED, diff_sheet
+from src.models.state_commands_optimized import StateCommand
+
+# Top-level sheet sections each command type can modify. None: any section.
+COMMAND_SECTIONS: Dict[str, Optional[Sequence[str]]] = {
+    "hp_change": ("combat_stats", "active_effects"),  # Dropping to 0 HP adds Unconscious/Prone
+    "area_effect": ("combat_stats", "active_effects"),
+    "condition": ("active_effects",),
+    "effect": ("active_effects",),
+    "spell_slot": ("spellcasting_meta",),
+    "hit_dice": ("combat_stats",),
+    "item": ("equipment", "coins"),
+    "death_save": ("combat_stats", "active_effects"),
+    "rest": None,  # Resets HP, hit dice, slots, effects and feature uses
+}
+
+
+@dataclass
+class PatchOperation:
+    """One change to a character_data document."""
+    op: str  # "add", "replace" or "remove"
+    path: List[str]  # Keys from the document root
+    value: Any = None
+
+    def to_json_patch(self) -> Dict[str, Any]:
+        """Render as an RFC 6902 JSON Patch operation."""
+        pointer = "/" + "/".join(key.replace("~", "~0").replace("/", "~1") for key in self.path)
+        if self.op == "remove":
+            return {"op": "remove", "path": pointer}
+        return {"op": self.op, "path": pointer, "value": self.value}
+
+
+def sections_for(commands: Iterable[StateCommand]) -> Optional[Set[str]]:
+    """
+    Get the sheet sections a batch of commands can modify.
+
+    Returns:
+        Set of top-level keys, or None if the whole sheet must be diffed
+    """
+    sections: Set[str] = set()
+    for command in commands:
+        touched = COMMAND_SECTIONS.get(command.type)
+        if touched is None:
+            return None
+        sections.update(touched)
+    return sections
+
+
+def diff_to_patch(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    prefix: Sequence[str] = ()
+) -> List[PatchOperation]:
+    """Turn the difference between two documents into patch operations."""
+    return _delta_to_patch(before, diff_sheet(before, after), list(prefix))
+
+
+def _delta_to_patch(base: Dict[str, Any], delta: Dict[str, Any], prefix: List[str]) -> List[PatchOperation]:
+    operations = []
+    for key, value in delta.items():
+        path = prefix + [key]
+        if value is DELETED:
+            operations.append(PatchOperation("remove", path))
+        elif key not in base:
+            operations.append(PatchOperation("add", path, value))
+        elif isinstance(value, dict) and isinstance(base[key], dict):
+            operations.extend(_delta_to_patch(base[key], value, path))
+        else:
+            operations.append(PatchOperation("replace", path, value))
+    return operations
+
+
+def apply_patch(document: Dict[str, Any], operations: Iterable[PatchOperation]) -> Dict[str, Any]:
+    """Apply operations to a document in place (mirrors what the database does)."""
+    for operation in operations:
+        parent = document
+        for key in operation.path[:-1]:
+            parent = parent[key]
+        if operation.op == "remove":
+            parent.pop(operation.path[-1], None)
+        else:
+            parent[operation.path[-1]] = operation.value
+    return document
+
+
+def build_patch_expression(column, operations: Iterable[PatchOperation]):
+    """
+    Build a SQL expression applying operations to a JSONB column.
+
+    Each add/replace wraps the expression in jsonb_set(..., create_missing=true)
+    and each remove applies the #- operator, so any number of operations
+    becomes one UPDATE ... SET column = <expression>.
+    """
+    expression = column
+    for operation in operations:
+        path = literal(list(operation.path), ARRAY(Text))
+        if operation.op == "remove":
+            expression = expression.op("#-")(path)
+        else:
+            expression = func.jsonb_set(expression, path, cast(operation.value, JSONB), True, type_=JSONB)
+    return expression
+
+
+class CharacterPatchTracker:
+    """
+    Tracks persisted character documents and computes patches after commands run.
+
+    Usage:
+        tracker.track(db_id, character)  # after loading or fully writing it
+        operations = tracker.compute_patch(db_id, character, executed_commands)
+        if operations is None:
+            await repo.update_data(db_id, character.model_dump(mode="json"))
+            tracker.track(db_id, character)
+        elif operations:
+            await repo.apply_patch(db_id, operations)
+    """
+
+    def __init__(self):
+        self._persisted: Dict[uuid.UUID, Dict[str, Any]] = {}  # What the DB holds, per character
+
+    def track(self, character_db_id: uuid.UUID, character: Character) -> None:
+        """Record a character as fully written to (or read from) the database."""
+        self._persisted[character_db_id] = character.model_dump(mode="json")
+
+    def compute_patch(
+        self,
+        character_db_id: uuid.UUID,
+        character: Character,
+        commands: Optional[Iterable[StateCommand]] = None
+    ) -> Optional[List[PatchOperation]]:
+        """
+        Diff a character against its persisted document and record the result as written.
+
+        Args:
+            character_db_id: Database ID of the character row
+            character: Current in-memory character
+            commands: Commands executed since the last write (None diffs every section)
+
+        Returns:
+            Patch operations (empty if nothing changed), or None if the character
+            is not tracked and needs a full rewrite
+        """
+        persisted = self._persisted.get(character_db_id)
+        if persisted is None:
+            return None
+
+        sections = sections_for(commands) if commands is not None else None
+        current = character.model_dump(mode="json", include=sections)
+        operations = []
+        for key, value in current.items():
+            if key not in persisted:
+                operations.append(PatchOperation("add", [key], value))
+            elif isinstance(value, dict) and isinstance(persisted[key], dict):
+                operations.extend(diff_to_patch(persisted[key], value, prefix=[key]))
+            elif value != persisted[key]:
+                operations.append(PatchOperation("replace", [key], value))
+            persisted[key] = value
+        return operations
+
+    def forget(self, character_db_id: uuid.UUID) -> None:
+        """Drop tracking for a character (deleted, or its last write failed)."""
+        self._persisted.pop(character_db_id, None)
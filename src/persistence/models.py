@@ -108,6 +108,8 @@ class Session(Base):
     status: Mapped[str] = mapped_column(String(20), default="active", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     last_activity: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # Session-level checkpoint (turn layout, combat state, characters); turns live in turn_contexts
+    checkpoint_state: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Relationships
     guild: Mapped["Guild"] = relationship("Guild", back_populates="sessions")
@@ -143,3 +145,7 @@ class TurnContext(Base):
 
     # Relationships
     session: Mapped["Session"] = relationship("Session", back_populates="turn_contexts")
+
+    __table_args__ = (
+        UniqueConstraint('session_id', 'turn_id', name='uix_session_turn'),
+    )
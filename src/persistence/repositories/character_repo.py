@@ -1,11 +1,12 @@
 """Character repository for database operations."""
 
 import uuid
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Dict, Optional, List
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.persistence.models import Character
+from src.persistence.character_patch import PatchOperation, build_patch_expression
 
 
 class CharacterRepository:
@@ -67,6 +68,38 @@ class CharacterRepository:
             await self.session.flush()
         return character
 
+    async def apply_patch(
+        self,
+        character_id: uuid.UUID,
+        operations: List[PatchOperation]
+    ) -> bool:
+        """
+        Apply patch operations to character data in one UPDATE, without rewriting the document.
+
+        Returns:
+            True if the character exists (or there was nothing to apply)
+        """
+        if not operations:
+            return True
+        result = await self.session.execute(
+            update(Character)
+            .where(Character.id == character_id)
+            .values(character_data=build_patch_expression(Character.character_data, operations))
+        )
+        return result.rowcount > 0
+
+    async def apply_patches(self, patches: Dict[uuid.UUID, List[PatchOperation]]) -> List[uuid.UUID]:
+        """
+        Apply patches to several characters in the current transaction.
+
+        Returns:
+            IDs of characters that were not found
+        """
+        return [
+            character_id for character_id, operations in patches.items()
+            if not await self.apply_patch(character_id, operations)
+        ]
+
     async def delete(self, character_id: uuid.UUID) -> bool:
         """Delete a character."""
         character = await self.get_by_id(character_id)
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.persistence.models import Session, SessionPlayer
@@ -83,6 +83,21 @@ class SessionRepository:
             return True
         return False
 
+    async def save_checkpoint_state(self, session_id: uuid.UUID, state: dict) -> None:
+        """Overwrite a session's checkpoint state without loading the row."""
+        await self.session.execute(
+            update(Session)
+            .where(Session.id == session_id)
+            .values(checkpoint_state=state, last_activity=datetime.utcnow())
+        )
+
+    async def get_resumable(self) -> List[Session]:
+        """Get all sessions that were live (active or hibernated) when the bot stopped."""
+        result = await self.session.execute(
+            select(Session).where(Session.status.in_(("active", "paused")))
+        )
+        return list(result.scalars().all())
+
     async def delete_all_active(self) -> int:
         """
         Delete all active sessions (cleanup orphaned sessions on bot restart).
@@ -0,0 +1,83 @@
+"""Turn context repository for database operations (turn checkpoints)."""
+
+import uuid
+from typing import List, Iterable
+from sqlalchemy import select, update, delete, cast
+from sqlalchemy.dialects.postgresql import insert, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.persistence.models import TurnContext
+
+
+class TurnContextRepository:
+    """Repository for TurnContext database operations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_session(self, session_id: uuid.UUID) -> List[TurnContext]:
+        """Get all checkpointed turns for a session."""
+        result = await self.session.execute(
+            select(TurnContext).where(TurnContext.session_id == session_id)
+        )
+        return list(result.scalars().all())
+
+    async def upsert_turns(self, session_id: uuid.UUID, rows: List[dict]) -> None:
+        """
+        Insert or replace turn rows in a single statement.
+
+        Args:
+            session_id: Database session ID
+            rows: Dicts with turn_id, turn_level, active_character, messages,
+                turn_metadata and is_completed
+        """
+        if not rows:
+            return
+        stmt = insert(TurnContext).values([{"session_id": session_id, **row} for row in rows])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uix_session_turn",
+            set_={
+                "turn_level": stmt.excluded.turn_level,
+                "active_character": stmt.excluded.active_character,
+                "messages": stmt.excluded.messages,
+                "turn_metadata": stmt.excluded.turn_metadata,
+                "is_completed": stmt.excluded.is_completed,
+            }
+        )
+        await self.session.execute(stmt)
+
+    async def append_messages(
+        self,
+        session_id: uuid.UUID,
+        turn_id: str,
+        messages: List[dict]
+    ) -> None:
+        """Append messages to a turn's JSONB message array without rewriting it."""
+        if not messages:
+            return
+        await self.session.execute(
+            update(TurnContext)
+            .where(TurnContext.session_id == session_id, TurnContext.turn_id == turn_id)
+            .values(messages=TurnContext.messages.op("||")(cast(messages, JSONB)))
+        )
+
+    async def delete_turns(self, session_id: uuid.UUID, turn_ids: Iterable[str]) -> None:
+        """Delete specific turns of a session."""
+        turn_ids = list(turn_ids)
+        if not turn_ids:
+            return
+        await self.session.execute(
+            delete(TurnContext).where(
+                TurnContext.session_id == session_id,
+                TurnContext.turn_id.in_(turn_ids)
+            )
+        )
+
+    async def delete_except(self, session_id: uuid.UUID, keep_turn_ids: Iterable[str]) -> None:
+        """Delete all turns of a session except the given ones (full resync)."""
+        await self.session.execute(
+            delete(TurnContext).where(
+                TurnContext.session_id == session_id,
+                TurnContext.turn_id.not_in(list(keep_turn_ids))
+            )
+        )
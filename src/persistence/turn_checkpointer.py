@@ -0,0 +1,368 @@
+"""
+Incremental checkpointing of live sessions to the database for crash recovery.
+
+After each DM cycle the session is captured with capture_session_state() and
+diffed against what was last written for it:
+- Each turn is one row in turn_contexts. Only new or changed turns are written;
+  turns that only gained messages get them appended to the JSONB array in place.
+- Everything else (turn stack layout, combat state, characters, monsters,
+  registry, coordinator, timeouts) is the session-level header in sessions.checkpoint_state,
+  rewritten only when it changed.
+
+Capturing on the event loop only serializes what changed since the previous
+checkpoint (see SnapshotCache): new turns, turns still on the stack, and sheets
+whose render version moved. Snapshots are queued, and a background task diffs
+them in a worker thread and writes all pending deltas in one transaction, so
+the Discord handler never waits on JSON encoding or the database. On startup,
+load_checkpointed_sessions() reassembles the latest checkpoint of every session
+that was live when the bot stopped.
+"""
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from src.memory.session_snapshot import SnapshotCache, capture_session_state
+
+if TYPE_CHECKING:
+    from src.memory.session_manager import SessionManager
+    from src.memory.message_coordinator import MessageCoordinator
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _turn_row(turn: Dict[str, Any], is_completed: bool) -> Dict[str, Any]:
+    """Map a TurnContext.to_dict() payload onto turn_contexts columns."""
+    return {
+        "turn_id": turn["turn_id"],
+        "turn_level": turn["turn_level"],
+        "active_character": turn.get("active_character") or "",
+        "messages": turn.get("messages", []),
+        "turn_metadata": {
+            key: value for key, value in turn.items()
+            if key not in ("turn_id", "turn_level", "messages")
+        },
+        "is_completed": is_completed,
+    }
+
+
+def _turn_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _turn_row() - rebuild a TurnContext.to_dict() payload."""
+    return {
+        **row["turn_metadata"],
+        "turn_id": row["turn_id"],
+        "turn_level": row["turn_level"],
+        "messages": row["messages"],
+    }
+
+
+def split_snapshot(snapshot: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Split a capture_session_state() snapshot into a session header and turn rows.
+
+    The header keeps the turn stack layout as turn IDs so the stack can be
+    reassembled from the rows by join_snapshot().
+
+    Returns:
+        Tuple of (header, turn_id -> turn_contexts row)
+    """
+    turn_state = snapshot.get("turn_manager")
+    rows: Dict[str, Dict[str, Any]] = {}
+    header = dict(snapshot)
+    if not turn_state:
+        return header, rows
+
+    stack_ids = []
+    for level_queue in turn_state.get("turn_stack", []):
+        level_ids = []
+        for turn in level_queue:
+            rows[turn["turn_id"]] = _turn_row(turn, is_completed=False)
+            level_ids.append(turn["turn_id"])
+        stack_ids.append(level_ids)
+
+    completed_ids = []
+    for turn in turn_state.get("completed_turns", []):
+        rows[turn["turn_id"]] = _turn_row(turn, is_completed=True)
+        completed_ids.append(turn["turn_id"])
+
+    header["turn_manager"] = {
+        **{k: v for k, v in turn_state.items() if k not in ("turn_stack", "completed_turns")},
+        "turn_stack_ids": stack_ids,
+        "completed_turn_ids": completed_ids,
+    }
+    return header, rows
+
+
+def join_snapshot(header: Dict[str, Any], rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reassemble a capture_session_state() snapshot from a header and turn rows.
+
+    Raises:
+        KeyError: If the header references a turn with no row
+    """
+    snapshot = dict(header)
+    turn_state = header.get("turn_manager")
+    if not turn_state:
+        return snapshot
+
+    turns = {row["turn_id"]: _turn_from_row(row) for row in rows}
+    snapshot["turn_manager"] = {
+        **{k: v for k, v in turn_state.items() if k not in ("turn_stack_ids", "completed_turn_ids")},
+        "turn_stack": [[turns[turn_id] for turn_id in level_ids] for level_ids in turn_state["turn_stack_ids"]],
+        "completed_turns": [turns[turn_id] for turn_id in turn_state["completed_turn_ids"]],
+    }
+    return snapshot
+
+
+@dataclass
+class CheckpointDelta:
+    """Changes to write for one session since its previous checkpoint."""
+    session_db_id: uuid.UUID
+    header: Optional[Dict[str, Any]] = None  # New session-level state, None if unchanged
+    upserts: List[Dict[str, Any]] = field(default_factory=list)  # Full turn rows
+    appends: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)  # turn_id -> new messages
+    deletes: List[str] = field(default_factory=list)  # turn_ids no longer in the session
+    full_resync: bool = False  # First checkpoint - drop any rows not in upserts
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.header or self.upserts or self.appends or self.deletes or self.full_resync)
+
+
+@dataclass
+class _TrackedTurn:
+    fields_json: str  # Row minus messages
+    message_jsons: List[str]
+    messages: Optional[List[Dict[str, Any]]] = None  # Snapshot list the JSON was built from
+
+
+@dataclass
+class _TrackedSession:
+    header_json: str
+    turns: Dict[str, _TrackedTurn]
+
+
+@dataclass
+class _PendingCapture:
+    session_db_id: uuid.UUID
+    snapshot: Dict[str, Any]
+    generation: int  # Bumped by forget() - stale captures are dropped
+
+
+@dataclass
+class CheckpointedSession:
+    """A session that was live when the bot stopped, with its latest checkpoint."""
+    session_db_id: uuid.UUID
+    guild_id: int
+    channel_id: int
+    snapshot: Optional[Dict[str, Any]]  # None if no usable checkpoint was written
+
+
+class TurnCheckpointer:
+    """
+    Writes incremental session checkpoints off the event loop.
+
+    Usage:
+        checkpointer = get_turn_checkpointer()
+        # after each DM cycle
+        checkpointer.checkpoint(
+            context.session_db_id, context.session_manager, context.message_coordinator,
+            timeouts=asdict(context.timeouts)
+        )
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._tracked: Dict[uuid.UUID, _TrackedSession] = {}  # What the DB holds, per session
+        self._caches: Dict[uuid.UUID, SnapshotCache] = {}
+        self._generations: Dict[uuid.UUID, int] = {}
+        self._pending: List[_PendingCapture] = []
+        self._writer: Optional[asyncio.Task] = None
+
+    def compute_delta(self, session_db_id: uuid.UUID, snapshot: Dict[str, Any]) -> CheckpointDelta:
+        """
+        Diff a snapshot against the last checkpoint of the session and record it as written.
+
+        Returned rows and messages are detached copies, safe to write after the
+        live session has moved on. Turns whose messages list is the same object
+        as last time (reused from a SnapshotCache) are not encoded again.
+        """
+        header, rows = split_snapshot(snapshot)
+        previous = self._tracked.get(session_db_id)
+        delta = CheckpointDelta(session_db_id=session_db_id, full_resync=previous is None)
+
+        header_json = _dumps(header)
+        if previous is None or previous.header_json != header_json:
+            delta.header = json.loads(header_json)
+
+        tracked_turns: Dict[str, _TrackedTurn] = {}
+        for turn_id, row in rows.items():
+            before = previous.turns.get(turn_id) if previous else None
+            if before is not None and before.messages is row["messages"]:
+                tracked_turns[turn_id] = before  # Cached completed turn - unchanged
+                continue
+
+            fields_json = _dumps({k: v for k, v in row.items() if k != "messages"})
+            message_jsons = [_dumps(message) for message in row["messages"]]
+            tracked_turns[turn_id] = _TrackedTurn(fields_json, message_jsons, row["messages"])
+
+            if (before is None
+                    or before.fields_json != fields_json
+                    or message_jsons[:len(before.message_jsons)] != before.message_jsons):
+                delta.upserts.append({
+                    **json.loads(fields_json),
+                    "messages": [json.loads(m) for m in message_jsons],
+                })
+            elif len(message_jsons) > len(before.message_jsons):
+                delta.appends[turn_id] = [json.loads(m) for m in message_jsons[len(before.message_jsons):]]
+
+        if previous:
+            delta.deletes = [turn_id for turn_id in previous.turns if turn_id not in rows]
+
+        self._tracked[session_db_id] = _TrackedSession(header_json, tracked_turns)
+        return delta
+
+    def checkpoint(
+        self,
+        session_db_id: uuid.UUID,
+        session_manager: "SessionManager",
+        message_coordinator: Optional["MessageCoordinator"] = None,
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """
+        Capture a session and queue it for a background diff and write.
+
+        Must be called from the event loop. Returns False if checkpointing is
+        disabled.
+        """
+        if not self.enabled:
+            return False
+
+        cache = self._caches.setdefault(session_db_id, SnapshotCache())
+        snapshot = capture_session_state(session_manager, message_coordinator, timeouts, cache=cache)
+        self._pending.append(_PendingCapture(session_db_id, snapshot, self._generations.get(session_db_id, 0)))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_pending())
+        return True
+
+    def forget(self, session_db_id: uuid.UUID) -> None:
+        """Drop tracking for a session (ended, hibernated, or its last write failed)."""
+        self._tracked.pop(session_db_id, None)
+        self._caches.pop(session_db_id, None)
+        self._generations[session_db_id] = self._generations.get(session_db_id, 0) + 1
+        self._pending = [p for p in self._pending if p.session_db_id != session_db_id]
+
+    async def flush(self) -> None:
+        """Wait until all queued checkpoints have been written."""
+        while self._writer is not None and not self._writer.done():
+            await self._writer
+
+    def _compute_deltas(self, captures: List[_PendingCapture]) -> List[CheckpointDelta]:
+        """Diff queued captures in order (runs in a worker thread)."""
+        deltas = [self.compute_delta(capture.session_db_id, capture.snapshot) for capture in captures]
+        return [delta for delta in deltas if not delta.is_empty]
+
+    async def _write_pending(self) -> None:
+        while self._pending:
+            captures, self._pending = self._pending, []
+            try:
+                batch = await asyncio.to_thread(self._compute_deltas, captures)
+                # Sessions forgotten while diffing - their deltas must not be written
+                stale = {
+                    capture.session_db_id for capture in captures
+                    if capture.generation != self._generations.get(capture.session_db_id, 0)
+                }
+                for session_db_id in stale:
+                    self._tracked.pop(session_db_id, None)
+                batch = [delta for delta in batch if delta.session_db_id not in stale]
+                if batch:
+                    await self._write_batch(batch)
+            except Exception as e:
+                print(f"Warning: Failed to write session checkpoints: {e}")
+                # The DB no longer matches what we track - next checkpoint rewrites everything
+                for capture in captures:
+                    self._tracked.pop(capture.session_db_id, None)
+
+    async def _write_batch(self, batch: List[CheckpointDelta]) -> None:
+        """Apply a batch of deltas in a single transaction."""
+        from src.persistence.database import get_session
+        from src.persistence.repositories.session_repo import SessionRepository
+        from src.persistence.repositories.turn_context_repo import TurnContextRepository
+
+        async with get_session() as db_session:
+            session_repo = SessionRepository(db_session)
+            turn_repo = TurnContextRepository(db_session)
+
+            for delta in batch:
+                if delta.full_resync:
+                    await turn_repo.delete_except(delta.session_db_id, [row["turn_id"] for row in delta.upserts])
+                else:
+                    await turn_repo.delete_turns(delta.session_db_id, delta.deletes)
+                await turn_repo.upsert_turns(delta.session_db_id, delta.upserts)
+                for turn_id, messages in delta.appends.items():
+                    await turn_repo.append_messages(delta.session_db_id, turn_id, messages)
+                if delta.header is not None:
+                    await session_repo.save_checkpoint_state(delta.session_db_id, delta.header)
+
+            await db_session.commit()
+
+
+async def load_checkpointed_sessions() -> List[CheckpointedSession]:
+    """
+    Load the latest checkpoint of every session that was live when the bot stopped.
+
+    Sessions whose checkpoint is missing or inconsistent are returned with
+    snapshot=None so the caller can discard them.
+    """
+    from src.persistence.database import get_session
+    from src.persistence.repositories.session_repo import SessionRepository
+    from src.persistence.repositories.turn_context_repo import TurnContextRepository
+
+    sessions = []
+    async with get_session() as db_session:
+        session_repo = SessionRepository(db_session)
+        turn_repo = TurnContextRepository(db_session)
+
+        for game_session in await session_repo.get_resumable():
+            snapshot = None
+            if game_session.checkpoint_state:
+                turns = await turn_repo.get_by_session(game_session.id)
+                rows = [
+                    {
+                        "turn_id": turn.turn_id,
+                        "turn_level": turn.turn_level,
+                        "messages": turn.messages,
+                        "turn_metadata": turn.turn_metadata,
+                    }
+                    for turn in turns
+                ]
+                try:
+                    snapshot = join_snapshot(game_session.checkpoint_state, rows)
+                except KeyError as e:
+                    print(f"Warning: Incomplete checkpoint for session {game_session.id}: missing turn {e}")
+
+            sessions.append(CheckpointedSession(
+                session_db_id=game_session.id,
+                guild_id=game_session.guild_id,
+                channel_id=game_session.channel_id,
+                snapshot=snapshot,
+            ))
+    return sessions
+
+
+# Global checkpointer instance
+_turn_checkpointer: Optional[TurnCheckpointer] = None
+
+
+def get_turn_checkpointer() -> TurnCheckpointer:
+    """Get or create the global turn checkpointer instance."""
+    global _turn_checkpointer
+    if _turn_checkpointer is None:
+        from src.config.settings import get_settings
+
+        _turn_checkpointer = TurnCheckpointer(enabled=get_settings().turn_checkpointing_enabled)
+    return _turn_checkpointer
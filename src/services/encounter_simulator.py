@@ -0,0 +1,286 @@
+"""
+Encounter Simulator - Monte Carlo estimate of how a fight against the party will go.
+
+Runs thousands of simplified combats at once in NumPy arrays (one row per
+trial). Each round every living party member attacks, then every living
+monster attacks; attacks roll d20 + attack bonus against AC (natural 1 misses,
+natural 20 crits and doubles the damage dice) and deal their damage formula.
+Party members use their best weapon attack (repeated for Extra Attack) or
+attack-roll cantrip; levelled spells and saving-throw effects are left out, since
+their slots run out and they don't roll to hit. Party members focus fire on the
+first living monster; monsters pick a random living party member. Targets are re-picked for every attack, so no damage is
+wasted on creatures that already dropped.
+
+Deliberately simplified: no spells, movement, conditions, healing or death
+saves - the goal is a quick difficulty signal for encounter selection, not a
+rules-accurate replay.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..characters.charactersheet import Character
+from ..characters.monster import Monster
+
+DEFAULT_TRIALS = 2000
+MAX_ROUNDS = 30
+
+_FORMULA_PATTERN = re.compile(r"^\s*(\d+)\s*d\s*(\d+)\s*(?:([+-])\s*(\d+))?\s*$", re.IGNORECASE)
+_NUMBER_WORDS = {"two": 2, "three": 3, "four": 4, "five": 5}
+_SPELL_LEVEL_PATTERN = re.compile(r"\b\d+(?:st|nd|rd|th)[- ]level\b|\blevel \d+\b", re.IGNORECASE)
+_SAVE_PATTERN = re.compile(r"\bsav(?:e|ing throw)\b|\bDC\s*\d+", re.IGNORECASE)
+_EXTRA_ATTACK_PATTERN = re.compile(r"^Extra Attack(?:\s*\((\d+)\))?", re.IGNORECASE)
+
+
+@dataclass
+class Combatant:
+    """Combat numbers the simulator needs for one creature."""
+    name: str
+    armor_class: int
+    hit_points: int
+    attack_bonus: int
+    dice_count: int
+    dice_sides: int
+    damage_bonus: int
+    attacks_per_round: int = 1
+
+    @classmethod
+    def from_character(cls, character: Character) -> "Combatant":
+        """Build from a player character, using its best weapon attack or cantrip."""
+        weapon_attacks = _weapon_attack_count(character)
+        attacks = []
+        for attack in character.attacks_and_spellcasting:
+            notes = attack.notes or ""
+            if not attack.attack_bonus or _SPELL_LEVEL_PATTERN.search(notes) or _SAVE_PATTERN.search(notes):
+                continue  # Levelled spell, saving-throw effect, or no attack roll
+            per_round = 1 if "cantrip" in notes.lower() else weapon_attacks
+            attacks.append((attack.attack_bonus, parse_damage_formula(attack.damage), per_round))
+        return cls._with_best_attack(
+            character.info.name,
+            character.combat_stats.armor_class,
+            character.combat_stats.hit_points.current,
+            attacks,
+            attacks_per_round=weapon_attacks
+        )
+
+    @classmethod
+    def from_monster(cls, monster: Monster) -> "Combatant":
+        """Build from a spawned monster, using its best attack."""
+        attacks_per_round = _multiattack_count(a.description for a in monster.actions if a.name == "Multiattack")
+        attacks = [
+            (action.attack_bonus, parse_damage_formula(action.damage.formula), attacks_per_round)
+            for action in monster.actions
+            if action.attack_bonus is not None and action.damage is not None
+        ]
+        return cls._with_best_attack(
+            monster.name,
+            monster.armor_class.value,
+            monster.hit_points.current,
+            attacks,
+            attacks_per_round=attacks_per_round
+        )
+
+    @classmethod
+    def from_template(cls, template: Dict[str, Any]) -> "Combatant":
+        """Build from a monster template JSON (src/characters/monsters/*.json format)."""
+        stats = template.get("stats", {})
+        actions = template.get("actions", [])
+        attacks_per_round = _multiattack_count(
+            a.get("description", "") for a in actions if a.get("name") == "Multiattack"
+        )
+        attacks = [
+            (action["attack_bonus"], parse_damage_formula(action["damage"]["formula"]), attacks_per_round)
+            for action in actions
+            if action.get("attack_bonus") is not None and action.get("damage", {}).get("formula")
+        ]
+        return cls._with_best_attack(
+            template.get("name", "Monster"),
+            stats.get("armor_class", {}).get("value", 10),
+            stats.get("hit_points", {}).get("average", 1),
+            attacks,
+            attacks_per_round=attacks_per_round
+        )
+
+    @classmethod
+    def _with_best_attack(cls, name, armor_class, hit_points, attacks, attacks_per_round) -> "Combatant":
+        """
+        Pick the attack with the highest expected damage per round.
+
+        Args:
+            attacks: (attack_bonus, parsed formula, attacks per round) candidates
+            attacks_per_round: Attacks per round for the unarmed fallback
+        """
+        parsed = [attack for attack in attacks if attack[1] is not None]
+        if not parsed:
+            return cls(name, armor_class, hit_points, 0, 1, 4, 0, attacks_per_round)  # Unarmed fallback
+
+        # Expected damage against a typical AC 13, so accuracy and damage both count
+        def expected(attack) -> float:
+            bonus, (count, sides, damage_bonus), per_round = attack
+            hit_chance = min(0.95, max(0.05, (21 - (13 - bonus)) / 20))
+            return hit_chance * (count * (sides + 1) / 2 + damage_bonus) * per_round
+
+        bonus, (count, sides, damage_bonus), per_round = max(parsed, key=expected)
+        return cls(name, armor_class, hit_points, bonus, count, sides, damage_bonus, per_round)
+
+
+@dataclass
+class EncounterEstimate:
+    """Aggregated simulation results."""
+    trials: int
+    party_win_probability: float
+    expected_rounds: float
+    expected_party_hp_loss: float  # Absolute HP lost across the party
+    expected_party_hp_loss_fraction: float  # Of the party's starting HP
+    expected_party_deaths: float  # Party members at 0 HP at the end
+
+    @property
+    def difficulty(self) -> str:
+        """Rough difficulty label from win probability and HP loss."""
+        if self.party_win_probability < 0.5:
+            return "Deadly"
+        if self.party_win_probability < 0.85 or self.expected_party_hp_loss_fraction > 0.6:
+            return "Hard"
+        if self.expected_party_hp_loss_fraction > 0.3:
+            return "Medium"
+        return "Easy"
+
+    def describe(self) -> str:
+        """Format for DM context."""
+        return (
+            f"Estimated difficulty: {self.difficulty} ({self.trials} simulated fights)\n"
+            f"- Party win probability: {self.party_win_probability:.0%}\n"
+            f"- Expected length: {self.expected_rounds:.1f} rounds\n"
+            f"- Expected party HP loss: {self.expected_party_hp_loss:.0f} "
+            f"({self.expected_party_hp_loss_fraction:.0%} of total)\n"
+            f"- Expected party members down: {self.expected_party_deaths:.1f}"
+        )
+
+
+def parse_damage_formula(formula: str) -> Optional[tuple]:
+    """
+    Parse a damage formula like "3d8 + 5".
+
+    Returns:
+        (dice_count, dice_sides, bonus) or None if the formula is not NdM[+/-B]
+    """
+    match = _FORMULA_PATTERN.match(formula or "")
+    if not match:
+        return None
+    count, sides, sign, bonus = match.groups()
+    bonus_value = int(bonus or 0) * (-1 if sign == "-" else 1)
+    return int(count), int(sides), bonus_value
+
+
+def _weapon_attack_count(character: Character) -> int:
+    """Attacks per Attack action from the character's Extra Attack feature."""
+    count = 1
+    for feature in character.features_and_traits:
+        match = _EXTRA_ATTACK_PATTERN.match(feature.name)
+        if match:
+            count = max(count, 1 + int(match.group(1) or 1))
+    fighter_level = sum(
+        entry.level for entry in character.info.classes if entry.class_name.lower() == "fighter"
+    )
+    if count > 1 and fighter_level >= 20:
+        count = max(count, 4)
+    elif count > 1 and fighter_level >= 11:
+        count = max(count, 3)
+    return count
+
+
+def _multiattack_count(descriptions) -> int:
+    for description in descriptions:
+        for word, count in _NUMBER_WORDS.items():
+            if re.search(rf"\b{word}\b", description, re.IGNORECASE):
+                return count
+    return 1
+
+
+class EncounterSimulator:
+    """Vectorized Monte Carlo combat simulator."""
+
+    def __init__(self, trials: int = DEFAULT_TRIALS, max_rounds: int = MAX_ROUNDS, seed: Optional[int] = None):
+        self.trials = trials
+        self.max_rounds = max_rounds
+        self._rng = np.random.default_rng(seed)
+
+    def simulate(self, party: Sequence[Combatant], monsters: Sequence[Combatant]) -> EncounterEstimate:
+        """
+        Simulate the encounter and aggregate the outcomes.
+
+        Args:
+            party: Player-side combatants
+            monsters: Monster-side combatants
+
+        Returns:
+            EncounterEstimate with win probability, length and party HP loss
+        """
+        if not party or not monsters:
+            raise ValueError("Both the party and the monsters need at least one combatant")
+
+        party_hp = np.tile(np.array([c.hit_points for c in party], dtype=np.int32), (self.trials, 1))
+        monster_hp = np.tile(np.array([c.hit_points for c in monsters], dtype=np.int32), (self.trials, 1))
+        start_party_hp = party_hp.sum(axis=1)
+
+        rounds = np.full(self.trials, self.max_rounds, dtype=np.int32)
+        finished = np.zeros(self.trials, dtype=bool)
+
+        for round_number in range(1, self.max_rounds + 1):
+            self._attack(party, party_hp > 0, monster_hp, monsters, finished, focus_fire=True)
+            self._attack(monsters, monster_hp > 0, party_hp, party, finished, focus_fire=False)
+
+            ended = ~finished & (~(monster_hp > 0).any(axis=1) | ~(party_hp > 0).any(axis=1))
+            rounds[ended] = round_number
+            finished |= ended
+            if finished.all():
+                break
+
+        party_won = ~(monster_hp > 0).any(axis=1) & (party_hp > 0).any(axis=1)
+        hp_loss = start_party_hp - np.clip(party_hp, 0, None).sum(axis=1)
+        # A party that starts at 0 HP has already lost everything
+        hp_loss_fraction = np.divide(
+            hp_loss, start_party_hp, out=np.ones(self.trials), where=start_party_hp > 0
+        )
+        return EncounterEstimate(
+            trials=self.trials,
+            party_win_probability=float(party_won.mean()),
+            expected_rounds=float(rounds.mean()),
+            expected_party_hp_loss=float(hp_loss.mean()),
+            expected_party_hp_loss_fraction=float(hp_loss_fraction.mean()),
+            expected_party_deaths=float((party_hp <= 0).sum(axis=1).mean())
+        )
+
+    def _attack(
+        self,
+        attackers: Sequence[Combatant],
+        attacker_alive: np.ndarray,
+        defender_hp: np.ndarray,
+        defenders: Sequence[Combatant],
+        finished: np.ndarray,
+        focus_fire: bool
+    ) -> None:
+        """Resolve one side's attacks for every trial at once."""
+        armor_classes = np.array([c.armor_class for c in defenders], dtype=np.int32)
+        trial_index = np.arange(self.trials)
+        active = attacker_alive & ~finished[:, None]  # Creatures dropped this round still act
+
+        for index, attacker in enumerate(attackers):
+            for _ in range(attacker.attacks_per_round):
+                defender_alive = defender_hp > 0
+                if focus_fire:
+                    target = np.argmax(defender_alive, axis=1)
+                else:
+                    target = np.argmax(self._rng.random(defender_hp.shape) * defender_alive, axis=1)
+
+                d20 = self._rng.integers(1, 21, self.trials)
+                hit = ((d20 + attacker.attack_bonus >= armor_classes[target]) | (d20 == 20)) & (d20 != 1)
+                hit &= active[:, index] & defender_alive.any(axis=1)
+                dice = np.where(d20 == 20, attacker.dice_count * 2, attacker.dice_count)
+                rolls = self._rng.integers(1, attacker.dice_sides + 1, (self.trials, attacker.dice_count * 2))
+                mask = np.arange(attacker.dice_count * 2) < dice[:, None]
+                damage = np.maximum(0, (rolls * mask).sum(axis=1) + attacker.damage_bonus) * hit
+                defender_hp[trial_index, target] -= damage.astype(np.int32)
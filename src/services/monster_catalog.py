@@ -0,0 +1,307 @@
+"""
+Monster Catalog - Indexed summaries of the monster template directory.
+
+Template summaries are built once and persisted next to the templates in an
+index file. A refresh stats the template files: templates whose mtime changed
+(or that are new) are re-summarized, deleted ones are dropped, and everything
+else comes from the index. Queries only stat the directory itself and skip that
+scan while the directory is unchanged and the last scan is younger than
+REFRESH_INTERVAL (in-place edits do not touch the directory mtime, so they are
+picked up within that interval). Secondary indexes by creature type, size,
+environment and numeric CR let the DM ask for a filtered shortlist instead of
+the whole bestiary.
+"""
+
+import bisect
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from fractions import Fraction
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+INDEX_FILENAME = ".catalog_index.json"
+INDEX_VERSION = 1
+REFRESH_INTERVAL = 2.0  # Seconds a file scan is trusted while the directory is unchanged
+
+
+@dataclass
+class MonsterSummary:
+    """Summary info for a monster template."""
+    type_name: str  # Template name (e.g., "goblin")
+    display_name: str  # Display name (e.g., "Goblin")
+    cr: str  # Challenge rating (e.g., "1/4", "5")
+    size: str  # Size category
+    creature_type: str  # Type (humanoid, undead, etc.)
+    hp: int  # Average hit points
+    ac: int  # Armor class
+    special_trait: Optional[str] = None  # First special trait name if any
+    environments: List[str] = field(default_factory=list)  # Habitats (forest, underdark, etc.)
+
+    @property
+    def cr_value(self) -> Optional[float]:
+        """Numeric challenge rating (0.25 for "1/4"), or None if unknown."""
+        return parse_challenge_rating(self.cr)
+
+
+def parse_challenge_rating(cr: str) -> Optional[float]:
+    """Convert a challenge rating string like "1/4" or "5" to a number."""
+    try:
+        return float(Fraction(str(cr).strip()))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def summarize_template(type_name: str, template: Dict) -> Optional[MonsterSummary]:
+    """Create a MonsterSummary from a template, or None if it is malformed."""
+    try:
+        meta = template.get('meta', {})
+        stats = template.get('stats', {})
+        traits = template.get('special_traits', [])
+
+        # Get CR - handle both string and int formats
+        cr_data = stats.get('challenge', {})
+        if isinstance(cr_data, dict):
+            cr = str(cr_data.get('rating', '?'))
+        else:
+            cr = str(cr_data)
+
+        # Get HP
+        hp_data = stats.get('hit_points', {})
+        if isinstance(hp_data, dict):
+            hp = hp_data.get('average', 0)
+        else:
+            hp = hp_data
+
+        # Get AC
+        ac_data = stats.get('armor_class', {})
+        if isinstance(ac_data, dict):
+            ac = ac_data.get('value', 10)
+        else:
+            ac = ac_data
+
+        # Get first special trait name
+        special_trait = None
+        if traits and len(traits) > 0:
+            special_trait = traits[0].get('name')
+
+        environments = meta.get('environment', [])
+        if isinstance(environments, str):
+            environments = [environments]
+
+        return MonsterSummary(
+            type_name=type_name,
+            display_name=template.get('name', type_name.title()),
+            cr=cr,
+            size=meta.get('size', 'Medium'),
+            creature_type=meta.get('type', 'unknown'),
+            hp=hp,
+            ac=ac,
+            special_trait=special_trait,
+            environments=list(environments)
+        )
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+class MonsterCatalog:
+    """Persisted, mtime-invalidated index of monster template summaries."""
+
+    def __init__(
+        self,
+        catalog_path: str,
+        load_template: Callable[[str], Optional[Dict]],
+        refresh_interval: float = REFRESH_INTERVAL
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            catalog_path: Directory containing monster template JSON files
+            load_template: Loads a template by type name (called only for new/changed files)
+            refresh_interval: Seconds between file scans while the directory mtime is unchanged
+        """
+        self.catalog_path = catalog_path
+        self.index_path = os.path.join(catalog_path, INDEX_FILENAME)
+        self._load_template = load_template
+        self.refresh_interval = refresh_interval
+
+        self._summaries: Dict[str, MonsterSummary] = {}
+        self._mtimes: Dict[str, int] = {}  # type_name -> template st_mtime_ns
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_size: Dict[str, Set[str]] = {}
+        self._by_environment: Dict[str, Set[str]] = {}
+        self._cr_values: List[float] = []  # Sorted numeric CRs (for bisect)
+        self._cr_names: List[str] = []  # Type names aligned with _cr_values
+        self._loaded = False
+        self._scanned_dir_mtime: Optional[int] = None  # Directory st_mtime_ns at the last scan
+        self._scanned_at = 0.0  # time.monotonic() of the last scan
+
+    # ==================== Queries ====================
+
+    def search(
+        self,
+        cr_min: Optional[float] = None,
+        cr_max: Optional[float] = None,
+        creature_type: Optional[str] = None,
+        size: Optional[str] = None,
+        environment: Optional[str] = None
+    ) -> List[MonsterSummary]:
+        """
+        Find templates matching all given filters.
+
+        Args:
+            cr_min: Minimum challenge rating (inclusive, 0.25 for CR 1/4)
+            cr_max: Maximum challenge rating (inclusive)
+            creature_type: Creature type, case-insensitive (e.g., "undead")
+            size: Size category, case-insensitive (e.g., "Medium")
+            environment: Habitat, case-insensitive (e.g., "forest")
+
+        Returns:
+            Matching summaries sorted by type name
+        """
+        self.refresh()
+
+        candidates: Optional[Set[str]] = None
+        for index, value in ((self._by_type, creature_type), (self._by_size, size),
+                             (self._by_environment, environment)):
+            if value:
+                matches = index.get(value.strip().lower(), set())
+                candidates = matches if candidates is None else candidates & matches
+
+        if cr_min is not None or cr_max is not None:
+            low = bisect.bisect_left(self._cr_values, cr_min) if cr_min is not None else 0
+            high = bisect.bisect_right(self._cr_values, cr_max) if cr_max is not None else len(self._cr_values)
+            in_range = set(self._cr_names[low:high])
+            candidates = in_range if candidates is None else candidates & in_range
+
+        names = self._summaries.keys() if candidates is None else candidates
+        return [self._summaries[type_name] for type_name in sorted(names)]
+
+    def get(self, type_name: str) -> Optional[MonsterSummary]:
+        """Get the summary for one template, or None if it is not in the catalog."""
+        self.refresh()
+        return self._summaries.get(type_name)
+
+    def names(self) -> List[str]:
+        """Get all template type names, sorted."""
+        self.refresh()
+        return sorted(self._summaries)
+
+    def __contains__(self, type_name: str) -> bool:
+        return self.get(type_name) is not None
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._summaries)
+
+    # ==================== Index maintenance ====================
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date with the template directory (stat only for unchanged files).
+
+        Args:
+            force: Scan the files even if the directory is unchanged and the last
+                   scan is recent
+        """
+        if not self._loaded:
+            self._read_index()
+            self._loaded = True
+
+        now = time.monotonic()
+        if (not force and self._scanned_dir_mtime is not None
+                and now - self._scanned_at < self.refresh_interval
+                and self._dir_mtime() == self._scanned_dir_mtime):
+            return
+
+        current = dict(self._scan())
+        changed = False
+
+        for type_name in list(self._mtimes):
+            if type_name not in current:
+                del self._mtimes[type_name]
+                self._summaries.pop(type_name, None)
+                changed = True
+
+        for type_name, mtime in current.items():
+            if self._mtimes.get(type_name) == mtime:
+                continue
+            template = self._load_template(type_name)
+            summary = summarize_template(type_name, template) if template else None
+            self._mtimes[type_name] = mtime
+            if summary:
+                self._summaries[type_name] = summary
+            else:
+                self._summaries.pop(type_name, None)  # Remembered by mtime so it is not re-parsed
+            changed = True
+
+        if changed:
+            self._rebuild_secondary_indexes()
+            self._write_index()
+        # After writing the index, which itself changes the directory mtime
+        self._scanned_dir_mtime = self._dir_mtime()
+        self._scanned_at = now
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.catalog_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self) -> Iterable[Tuple[str, int]]:
+        if not os.path.isdir(self.catalog_path):
+            return []
+        return [
+            (entry.name[:-5], entry.stat().st_mtime_ns)
+            for entry in os.scandir(self.catalog_path)
+            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file()
+        ]
+
+    def _rebuild_secondary_indexes(self) -> None:
+        self._by_type.clear()
+        self._by_size.clear()
+        self._by_environment.clear()
+        by_cr = []
+        for type_name, summary in self._summaries.items():
+            self._by_type.setdefault(summary.creature_type.lower(), set()).add(type_name)
+            self._by_size.setdefault(summary.size.lower(), set()).add(type_name)
+            for environment in summary.environments:
+                self._by_environment.setdefault(environment.lower(), set()).add(type_name)
+            if summary.cr_value is not None:
+                by_cr.append((summary.cr_value, type_name))
+        by_cr.sort()
+        self._cr_values = [cr for cr, _ in by_cr]
+        self._cr_names = [type_name for _, type_name in by_cr]
+
+    def _read_index(self) -> None:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION:
+                return
+            for type_name, entry in data.get('entries', {}).items():
+                self._mtimes[type_name] = entry['mtime_ns']
+                if entry.get('summary'):
+                    self._summaries[type_name] = MonsterSummary(**entry['summary'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._mtimes.clear()
+            self._summaries.clear()
+        self._rebuild_secondary_indexes()
+
+    def _write_index(self) -> None:
+        entries = {
+            type_name: {
+                'mtime_ns': mtime,
+                'summary': asdict(self._summaries[type_name]) if type_name in self._summaries else None
+            }
+            for type_name, mtime in self._mtimes.items()
+        }
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'entries': entries}, f)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            # Read-only catalog: the in-memory index still works, it is just rebuilt next process
+            print(f"Warning: could not persist monster catalog index: {e}")
@@ -2,32 +2,24 @@
 Monster Spawner Service - Creates and manages monster instances for combat encounters.
 
 This service provides:
-1. Discovery of available monster templates
+1. Discovery of available monster templates (via the indexed MonsterCatalog)
 2. Spawning monsters from templates with unique IDs
 3. Formatting available monsters for DM context
 4. Loading pre-defined encounters
 """
 
+import difflib
 import json
 import os
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
 
 from ..memory.state_manager import StateManager
+from ..characters.charactersheet import Character
 from ..characters.monster import Monster
+from .encounter_simulator import Combatant, EncounterEstimate, EncounterSimulator, DEFAULT_TRIALS
+from .monster_catalog import MonsterCatalog, MonsterSummary
 
-
-@dataclass
-class MonsterSummary:
-    """Summary info for a monster template."""
-    type_name: str  # Template name (e.g., "goblin")
-    display_name: str  # Display name (e.g., "Goblin")
-    cr: str  # Challenge rating (e.g., "1/4", "5")
-    size: str  # Size category
-    creature_type: str  # Type (humanoid, undead, etc.)
-    hp: int  # Average hit points
-    ac: int  # Armor class
-    special_trait: Optional[str] = None  # First special trait name if any
+DEFAULT_CONTEXT_LIMIT = 30  # Max templates listed in DM context per call
 
 
 class MonsterSpawner:
@@ -56,33 +48,37 @@ class MonsterSpawner:
         self.state_manager = state_manager
         self.catalog_path = catalog_path
         self._template_cache: Dict[str, Dict] = {}
+        self.catalog = MonsterCatalog(catalog_path, load_template=self._reload_template)
         self._spawned_this_encounter: List[str] = []  # Track spawned IDs for summary
 
-    def get_available_monster_types(self) -> List[MonsterSummary]:
+    def get_available_monster_types(
+        self,
+        cr_min: Optional[float] = None,
+        cr_max: Optional[float] = None,
+        creature_type: Optional[str] = None,
+        size: Optional[str] = None,
+        environment: Optional[str] = None
+    ) -> List[MonsterSummary]:
         """
-        Get list of all available monster templates with summary info.
+        Get available monster templates with summary info, optionally filtered.
+
+        Args:
+            cr_min: Minimum challenge rating (inclusive, 0.25 for CR 1/4)
+            cr_max: Maximum challenge rating (inclusive)
+            creature_type: Creature type (e.g., "undead")
+            size: Size category (e.g., "Large")
+            environment: Habitat (e.g., "forest")
 
         Returns:
-            List of MonsterSummary objects for each template
+            List of MonsterSummary objects for each matching template, sorted by type name
         """
-        summaries = []
-
-        if not os.path.exists(self.catalog_path):
-            return summaries
-
-        for filename in sorted(os.listdir(self.catalog_path)):
-            if not filename.endswith('.json'):
-                continue
-
-            type_name = filename[:-5]  # Remove .json extension
-            template = self._load_template(type_name)
-
-            if template:
-                summary = self._create_summary(type_name, template)
-                if summary:
-                    summaries.append(summary)
-
-        return summaries
+        return self.catalog.search(
+            cr_min=cr_min,
+            cr_max=cr_max,
+            creature_type=creature_type,
+            size=size,
+            environment=environment
+        )
 
     def _load_template(self, type_name: str) -> Optional[Dict]:
         """Load and cache a monster template."""
@@ -101,74 +97,67 @@ class MonsterSpawner:
         except (json.JSONDecodeError, IOError):
             return None
 
-    def _create_summary(self, type_name: str, template: Dict) -> Optional[MonsterSummary]:
-        """Create a MonsterSummary from a template."""
-        try:
-            meta = template.get('meta', {})
-            stats = template.get('stats', {})
-            traits = template.get('special_traits', [])
-
-            # Get CR - handle both string and int formats
-            cr_data = stats.get('challenge', {})
-            if isinstance(cr_data, dict):
-                cr = str(cr_data.get('rating', '?'))
-            else:
-                cr = str(cr_data)
-
-            # Get HP
-            hp_data = stats.get('hit_points', {})
-            if isinstance(hp_data, dict):
-                hp = hp_data.get('average', 0)
-            else:
-                hp = hp_data
-
-            # Get AC
-            ac_data = stats.get('armor_class', {})
-            if isinstance(ac_data, dict):
-                ac = ac_data.get('value', 10)
-            else:
-                ac = ac_data
-
-            # Get first special trait name
-            special_trait = None
-            if traits and len(traits) > 0:
-                special_trait = traits[0].get('name')
-
-            return MonsterSummary(
-                type_name=type_name,
-                display_name=template.get('name', type_name.title()),
-                cr=cr,
-                size=meta.get('size', 'Medium'),
-                creature_type=meta.get('type', 'unknown'),
-                hp=hp,
-                ac=ac,
-                special_trait=special_trait
-            )
-        except (KeyError, TypeError):
-            return None
+    def _reload_template(self, type_name: str) -> Optional[Dict]:
+        """Load a template from disk, replacing any cached copy (catalog saw a new mtime)."""
+        self._template_cache.pop(type_name, None)
+        return self._load_template(type_name)
 
-    def get_available_monsters_context(self) -> str:
+    def _unknown_type_error(self, monster_type: str) -> ValueError:
+        """Build the error for an unknown monster type, suggesting close names."""
+        suggestions = difflib.get_close_matches(monster_type, self.catalog.names(), n=5)
+        hint = (f"Did you mean: {', '.join(suggestions)}?" if suggestions
+                else "Use get_available_monsters to list types.")
+        return ValueError(f"Monster type '{monster_type}' not found. {hint}")
+
+    def get_available_monsters_context(
+        self,
+        cr_min: Optional[float] = None,
+        cr_max: Optional[float] = None,
+        creature_type: Optional[str] = None,
+        size: Optional[str] = None,
+        environment: Optional[str] = None,
+        limit: int = DEFAULT_CONTEXT_LIMIT
+    ) -> str:
         """
         Format available monsters for DM context.
 
+        Args:
+            cr_min, cr_max, creature_type, size, environment: Filters (see get_available_monster_types)
+            limit: Maximum number of templates to list
+
         Returns:
-            Formatted string listing all available monster templates
+            Formatted string listing matching monster templates
         """
-        summaries = self.get_available_monster_types()
+        summaries = self.get_available_monster_types(
+            cr_min=cr_min,
+            cr_max=cr_max,
+            creature_type=creature_type,
+            size=size,
+            environment=environment
+        )
 
         if not summaries:
+            if any(f is not None for f in (cr_min, cr_max, creature_type, size, environment)):
+                return "No monster templates match those filters."
             return "No monster templates available."
 
         lines = ["Available Monster Templates:"]
-        for s in summaries:
+        for s in summaries[:limit]:
             trait_info = f", {s.special_trait}" if s.special_trait else ""
             lines.append(
                 f"- {s.type_name} (CR {s.cr}, {s.size} {s.creature_type}): "
                 f"HP {s.hp}, AC {s.ac}{trait_info}"
             )
 
+        if len(summaries) > limit:
+            lines.append(
+                f"... and {len(summaries) - limit} more. "
+                "Narrow the list with cr_min/cr_max, creature_type, size or environment."
+            )
+
         lines.append("")
         lines.append('Use select_encounter_monsters([{"type": "goblin", "count": 2}]) to spawn monsters.')
+        lines.append("Use estimate_encounter_difficulty with the same selections to check difficulty first.")
 
         return "\n".join(lines)
 
@@ -197,13 +186,9 @@ class MonsterSpawner:
                 continue
 
             # Validate template exists
+            if monster_type not in self.catalog:
+                raise self._unknown_type_error(monster_type)
             template_path = os.path.join(self.catalog_path, f"{monster_type}.json")
-            if not os.path.exists(template_path):
-                available = [s.type_name for s in self.get_available_monster_types()]
-                raise ValueError(
-                    f"Monster type '{monster_type}' not found. "
-                    f"Available types: {', '.join(available)}"
-                )
 
             # Create monsters using StateManager
             monsters = self.state_manager.create_monster_group(
@@ -218,6 +203,42 @@ class MonsterSpawner:
 
         return created_ids
 
+    def estimate_encounter(
+        self,
+        selections: List[Dict[str, Any]],
+        party: List[Character],
+        trials: int = DEFAULT_TRIALS,
+        seed: Optional[int] = None
+    ) -> EncounterEstimate:
+        """
+        Estimate how a fight against the selected monsters would go, without spawning them.
+
+        Args:
+            selections: List of {"type": str, "count": int} dictionaries (as for spawn_monsters)
+            party: Player characters facing the encounter
+            trials: Number of simulated fights
+            seed: Optional RNG seed for reproducible estimates
+
+        Returns:
+            EncounterEstimate with win probability, expected rounds and party HP loss
+
+        Raises:
+            ValueError: If a monster type is not found or there is nothing to simulate
+        """
+        monsters: List[Combatant] = []
+        for selection in selections:
+            monster_type = selection.get('type', '')
+            if not monster_type:
+                continue
+
+            template = self._load_template(monster_type) if monster_type in self.catalog else None
+            if template is None:
+                raise self._unknown_type_error(monster_type)
+            monsters.extend([Combatant.from_template(template)] * selection.get('count', 1))
+
+        combatants = [Combatant.from_character(character) for character in party]
+        return EncounterSimulator(trials=trials, seed=seed).simulate(combatants, monsters)
+
     def get_spawned_summary(self) -> str:
         """
         Get summary of monsters spawned in the current encounter.
@@ -2,10 +2,13 @@
 Test configuration and fixtures for memory component tests.
 """
 
+import asyncio
 import pytest
 import tempfile
+import json
 import os
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from unittest.mock import Mock, AsyncMock
 
 # Import memory components
@@ -16,6 +19,127 @@ from pydantic_ai.messages import ModelMessage, ModelRequest, ModelResponse, User
 from memory.config import MemoryConfig
 
 
+EMBEDDING_DIMS = 768  # Gemini document vectors
+
+
+class FakeEmbedder:
+    """Async embed_batch stand-in that records calls and can fail on demand."""
+
+    def __init__(self, fail_times: int = 0, fail_on: str = None):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_times = fail_times
+        self.fail_on = fail_on
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on in texts or self.fail_times > 0:
+                self.fail_times -= 1
+                raise RuntimeError("429 RESOURCE_EXHAUSTED")
+            return [[float(len(text))] * EMBEDDING_DIMS for text in texts]
+        finally:
+            self.in_flight -= 1
+
+
+class RulesTableBuilder:
+    """
+    Builds a LanceRulesService table under one directory with a fake embedding backend.
+
+    Rules are dicts with "name" plus optional "type" (default "condition"),
+    "text" (rendered below a "# name" heading), "markdown" (whole rendered
+    file), "references" (entry IDs) and any other metadata fields. Files are
+    named <name>_XPHB in snake case, so tests can edit them between loads.
+    """
+
+    dims = EMBEDDING_DIMS
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.rendered_dir = root / "rendered_rules"
+        self.metadata_dir = root / "metadata"
+
+    @staticmethod
+    def spells(count: int) -> List[Dict[str, Any]]:
+        """Rules "Spell 0".."Spell <count-1>", each referencing Spell 0."""
+        return [
+            {"name": f"Spell {i}", "type": "spell", "level": i % 9, "text": f"Does thing {i}.",
+             "references": ["Spell 0|XPHB"]}
+            for i in range(count)
+        ]
+
+    def write(self, rules: List[Dict[str, Any]]) -> None:
+        """Write the rendered_rules/ and metadata/ trees load_from_files reads."""
+        for rule in rules:
+            rule = dict(rule)
+            name = rule.pop("name")
+            rule_type = rule.pop("type", "condition")
+            text = rule.pop("text", "")
+            markdown = rule.pop("markdown", f"# {name}\n{text}")
+            references = rule.pop("references", [])
+            metadata = {
+                "name": name, "source": "XPHB", "type": rule_type, **rule,
+                "references": [{"content": ref, "tagType": rule_type} for ref in references],
+            }
+            slug = f"{name.lower().replace(' ', '_')}_XPHB"
+            for directory in (self.metadata_dir, self.rendered_dir):
+                (directory / rule_type).mkdir(parents=True, exist_ok=True)
+            (self.metadata_dir / rule_type / f"{slug}.json").write_text(json.dumps(metadata))
+            (self.rendered_dir / rule_type / f"{slug}.md").write_text(markdown)
+
+    def load(self, service, **options) -> Dict[str, Any]:
+        """Run load_from_files over the written trees (no progress bar, no rate limit, no cache)."""
+        options = {"show_progress": False, "requests_per_minute": 60_000, "embedding_cache_dir": None, **options}
+        return service.load_from_files(self.rendered_dir, self.metadata_dir, **options)
+
+    def __call__(
+        self,
+        rules: List[Dict[str, Any]],
+        embed_documents=None,
+        use_result_cache: bool = False,
+        **options
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Write rules and build a table from them.
+
+        Args:
+            rules: Rule dicts (see class docstring)
+            embed_documents: Async stand-in for LanceRulesService._embed_documents
+                             (default: the same unit vector for every document)
+            use_result_cache: Passed to LanceRulesService
+            **options: Extra load_from_files options
+
+        Returns:
+            Tuple of (service, load_from_files stats)
+        """
+        from src.db.lance_rules_service import LanceRulesService
+
+        self.write(rules)
+        service = LanceRulesService(db_path=str(self.root / "lancedb"), use_result_cache=use_result_cache)
+        service._embed_documents = embed_documents or _unit_embeddings
+        return service, self.load(service, **options)
+
+
+async def _unit_embeddings(texts: List[str]) -> List[List[float]]:
+    return [[1.0] + [0.0] * (EMBEDDING_DIMS - 1) for _ in texts]
+
+
+@pytest.fixture
+def fake_embedder():
+    """FakeEmbedder factory: embedder = fake_embedder(fail_times=2)."""
+    return FakeEmbedder
+
+
+@pytest.fixture
+def build_rules_table(tmp_path):
+    """Build rules tables in tmp_path: service, stats = build_rules_table(rules)."""
+    return RulesTableBuilder(tmp_path)
+
+
 @pytest.fixture
 def temp_summary_file():
     """Create a temporary file for testing summary persistence."""
@@ -0,0 +1,94 @@
+"""
+Tests for character serialization fast paths.
+
+Tests cover:
+- JSON bytes round trip through character_from_json / character_to_json
+- Trusted snapshots skip derived-state validators; untrusted data does not
+- StateManager save/load round trip
+- msgpack binary cache hits, and invalidation when the sheet changes
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.characters.character_codec import (
+    CharacterBinaryCache,
+    character_from_json,
+    character_from_snapshot,
+    character_to_json,
+)
+from src.characters.charactersheet import Character
+from src.memory.state_manager import StateManager
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+@pytest.fixture
+def fighter_bytes() -> bytes:
+    return (CHARACTERS_DIR / "fighter.json").read_bytes()
+
+
+class TestCharacterCodec:
+    """Tests for the codec functions."""
+
+    def test_json_round_trip(self, fighter_bytes):
+        fighter = character_from_json(fighter_bytes)
+
+        restored = character_from_json(character_to_json(fighter))
+
+        assert restored.model_dump() == fighter.model_dump()
+        assert restored.model_dump() == Character.model_validate(json.loads(fighter_bytes)).model_dump()
+
+    def test_trusted_snapshot_skips_condition_rules(self, fighter_bytes):
+        data = json.loads(fighter_bytes)
+        data["combat_stats"]["hit_points"]["current"] = 0
+
+        assert Character.model_validate(data).active_effects.has("Prone")
+        assert not character_from_snapshot(data).active_effects.has("Prone")
+
+    def test_state_manager_round_trip(self, tmp_path, fighter_bytes):
+        (tmp_path / "fighter.json").write_bytes(fighter_bytes)
+        manager = StateManager(character_data_path=str(tmp_path), enable_logging=False)
+
+        fighter = manager.load_character("fighter")
+        fighter.take_damage(5)
+        assert manager.save_character("fighter")
+
+        reloaded = StateManager(character_data_path=str(tmp_path), enable_logging=False).load_character("fighter")
+        assert reloaded.hp == fighter.hp
+
+
+class TestCharacterBinaryCache:
+    """Tests for the optional msgpack cache."""
+
+    def test_cache_hit_and_invalidation(self, tmp_path, fighter_bytes):
+        pytest.importorskip("msgpack")
+        (tmp_path / "fighter.json").write_bytes(fighter_bytes)
+        cache_dir = tmp_path / "cache"
+        manager = StateManager(character_data_path=str(tmp_path), enable_logging=False,
+                               binary_cache_dir=str(cache_dir))
+
+        manager.load_character("fighter")
+        assert (cache_dir / "fighter.msgpack").exists()
+        cached = manager.binary_cache.load("fighter", str(tmp_path / "fighter.json"))
+        assert cached.model_dump() == character_from_json(fighter_bytes).model_dump()
+
+        # Editing the sheet makes the entry stale
+        edited = json.loads(fighter_bytes)
+        edited["combat_stats"]["hit_points"]["current"] = 1
+        (tmp_path / "fighter.json").write_text(json.dumps(edited))
+        stat = os.stat(tmp_path / "fighter.json")
+        os.utime(tmp_path / "fighter.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.binary_cache.load("fighter", str(tmp_path / "fighter.json")) is None
+        assert manager.load_character("fighter").hp == 1
+
+    def test_unavailable_without_msgpack(self, tmp_path):
+        if CharacterBinaryCache.available:
+            pytest.skip("msgpack is installed")
+        manager = StateManager(character_data_path=str(tmp_path), enable_logging=False,
+                               binary_cache_dir=str(tmp_path / "cache"))
+        assert manager.binary_cache is None
@@ -0,0 +1,153 @@
+"""
+Tests for copy-on-write character overlays.
+
+Tests cover:
+- Sheet diffs are sparse and round trip through apply_delta
+- Base sheets are loaded once and shared by every session
+- Sessions see only their own changes; the base sheet and files are untouched
+- Uploaded sheets are session-local base sheets
+- StateManager load/save through an overlay without a character directory
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.characters.character_overlay import (
+    DELETED,
+    BaseSheetStore,
+    CharacterOverlay,
+    apply_delta,
+    diff_sheet,
+)
+from src.memory.player_character_registry import PlayerCharacterRegistry
+from src.memory.state_manager import StateManager
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+@pytest.fixture
+def sheet_dir(tmp_path):
+    for name in ("fighter", "wizard"):
+        (tmp_path / f"{name}.json").write_bytes((CHARACTERS_DIR / f"{name}.json").read_bytes())
+    return tmp_path
+
+
+@pytest.fixture
+def store(sheet_dir):
+    return BaseSheetStore(str(sheet_dir))
+
+
+class TestSheetDiff:
+    """Tests for diff_sheet / apply_delta."""
+
+    def test_delta_is_sparse(self):
+        base = {"hp": {"current": 12, "max": 12}, "name": "Tharion", "items": ["rope"], "notes": "x"}
+        current = {"hp": {"current": 5, "max": 12}, "name": "Tharion", "items": ["rope", "torch"]}
+
+        delta = diff_sheet(base, current)
+
+        assert delta == {"hp": {"current": 5}, "items": ["rope", "torch"], "notes": DELETED}
+        assert apply_delta(base, delta) == current
+        assert base["hp"]["current"] == 12  # Base is never mutated
+
+    def test_equal_sheets_have_empty_delta(self):
+        base = {"hp": {"current": 12}}
+        assert diff_sheet(base, {"hp": {"current": 12}}) == {}
+
+
+class TestCharacterOverlay:
+    """Tests for shared bases and per-session deltas."""
+
+    def test_base_loaded_once_and_shared(self, store):
+        first, second = CharacterOverlay(store), CharacterOverlay(store)
+
+        first.materialize("fighter")
+        second.materialize("fighter")
+        second.materialize("wizard")
+
+        assert store.loads == 2
+        assert store.get("fighter") is store.get("fighter")
+
+    def test_sessions_are_isolated(self, store, sheet_dir):
+        first, second = CharacterOverlay(store), CharacterOverlay(store)
+        base_hp = first.materialize("fighter").hp
+        on_disk = (sheet_dir / "fighter.json").read_bytes()
+
+        fighter = first.materialize("fighter")
+        fighter.take_damage(5)
+        assert first.record("fighter", fighter)
+
+        assert first.materialize("fighter").hp == base_hp - 5
+        assert second.materialize("fighter").hp == base_hp
+        assert (sheet_dir / "fighter.json").read_bytes() == on_disk
+
+        delta = first.delta("fighter")
+        assert set(delta) <= {"combat_stats", "active_effects", "conditions"}
+
+        first.reset("fighter")
+        assert first.materialize("fighter").hp == base_hp
+
+    def test_unknown_character(self, store):
+        overlay = CharacterOverlay(store)
+        assert overlay.materialize("bard") is None
+        assert not overlay.record("bard", overlay.materialize("fighter"))
+
+
+    def test_uploads_are_session_local(self, store, sheet_dir):
+        first, second = CharacterOverlay(store), CharacterOverlay(store)
+        upload = first.materialize("wizard")
+        upload.info.name = "Custom Wizard"
+
+        first.add_base("custom", upload)
+        assert first.materialize("custom").info.name == "Custom Wizard"
+        assert first.uploaded_ids() == ["custom"]
+
+        changed = first.materialize("custom")
+        changed.take_damage(2)
+        assert first.record("custom", changed)
+        assert first.materialize("custom").hp == upload.hp - 2
+
+        assert second.materialize("custom") is None
+        assert second.uploaded_ids() == []
+        assert store.get("custom") is None
+        assert not (sheet_dir / "custom.json").exists()
+
+
+class TestStateManagerOverlay:
+    """Tests for StateManager backed by an overlay."""
+
+    def test_round_trip_without_files(self, tmp_path, store):
+        session_dir = tmp_path / "session"
+        manager = StateManager(character_data_path=str(session_dir), enable_logging=False,
+                               overlay=CharacterOverlay(store))
+
+        fighter = manager.load_character("fighter")
+        fighter.take_damage(3)
+        assert manager.save_character("fighter")
+
+        assert manager.load_character("fighter").hp == fighter.hp
+        assert manager.get_character("fighter") is not fighter  # Reload materializes a fresh copy
+        assert not session_dir.exists()
+
+    def test_in_memory_registry(self):
+        registry = PlayerCharacterRegistry(registry_file_path=None)
+        registry.register_player_character("player_1", "fighter")
+
+        assert registry.get_character_id_by_player_id("player_1") == "fighter"
+
+    def test_uploaded_character_stays_in_memory(self, tmp_path, store, sheet_dir):
+        session_dir = tmp_path / "session"
+        manager = StateManager(character_data_path=str(session_dir), enable_logging=False,
+                               overlay=CharacterOverlay(store))
+        other = StateManager(character_data_path=str(session_dir), enable_logging=False,
+                             overlay=CharacterOverlay(store))
+        upload = manager.load_character("wizard")
+
+        assert manager.add_uploaded_character("custom", upload)
+
+        assert manager.uploaded_character_ids() == ["custom"]
+        assert manager.load_character("custom").info.name == upload.info.name
+        assert other.load_character("custom") is None
+        assert not session_dir.exists()
+        assert sorted(p.name for p in sheet_dir.iterdir()) == ["fighter.json", "wizard.json"]
@@ -0,0 +1,121 @@
+"""
+Tests for partial character_data updates.
+
+Tests cover:
+- Patches computed after executed commands reproduce the full document
+- Only the leaves a command changed are patched
+- Untracked characters need a full rewrite
+- The UPDATE statement nests jsonb_set / #- over the JSONB column
+"""
+
+import copy
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from src.characters.charactersheet import Character
+from src.memory.state_command_executor import StateCommandExecutor
+from src.models.state_commands_optimized import (
+    EffectCommand,
+    HPChangeCommand,
+    ItemCommand,
+    SpellSlotCommand,
+)
+from src.persistence import models
+from src.persistence.character_patch import (
+    CharacterPatchTracker,
+    PatchOperation,
+    apply_patch,
+    build_patch_expression,
+    sections_for,
+)
+from src.persistence.repositories.character_repo import CharacterRepository
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+@pytest.fixture
+def wizard() -> Character:
+    return Character.model_validate_json((CHARACTERS_DIR / "wizard.json").read_bytes())
+
+
+class TestCharacterPatchTracker:
+    """Tests for patch computation."""
+
+    def test_patches_reproduce_full_document(self, wizard):
+        tracker, db_id = CharacterPatchTracker(), uuid.uuid4()
+        tracker.track(db_id, wizard)
+        stored = wizard.model_dump(mode="json")
+        executor = StateCommandExecutor(character_lookup=lambda _: wizard)
+
+        rounds = [
+            [HPChangeCommand(character_id="wizard", change=-4)],
+            [SpellSlotCommand(character_id="wizard", action="use", level=1, spell_name="Magic Missile"),
+             EffectCommand(character_id="wizard", action="add", effect_name="Mage Armor",
+                           duration_type="hours", duration=8, description="AC becomes 13 + Dex")],
+            [ItemCommand(character_id="wizard", action="add", item_name="Potion of Healing", quantity=2)],
+            [HPChangeCommand(character_id="wizard", change=-100)],
+        ]
+        for commands in rounds:
+            assert executor.execute_batch(commands).all_successful
+            operations = tracker.compute_patch(db_id, wizard, commands)
+            apply_patch(stored, copy.deepcopy(operations))
+            assert stored == wizard.model_dump(mode="json")
+
+    def test_patch_is_targeted(self, wizard):
+        tracker, db_id = CharacterPatchTracker(), uuid.uuid4()
+        tracker.track(db_id, wizard)
+        command = HPChangeCommand(character_id="wizard", change=-3)
+        StateCommandExecutor(character_lookup=lambda _: wizard).execute_command(command)
+
+        operations = tracker.compute_patch(db_id, wizard, [command])
+
+        assert [operation.to_json_patch() for operation in operations] == [
+            {"op": "replace", "path": "/combat_stats/hit_points/current", "value": wizard.hit_points.current}
+        ]
+        assert tracker.compute_patch(db_id, wizard, [command]) == []
+
+    def test_untracked_character_needs_full_write(self, wizard):
+        tracker, db_id = CharacterPatchTracker(), uuid.uuid4()
+        assert tracker.compute_patch(db_id, wizard) is None
+
+        tracker.track(db_id, wizard)
+        tracker.forget(db_id)
+        assert tracker.compute_patch(db_id, wizard) is None
+
+    def test_rest_diffs_every_section(self):
+        assert sections_for([HPChangeCommand(character_id="a", change=1)]) == {"combat_stats", "active_effects"}
+        assert sections_for([Mock(type="rest")]) is None
+
+
+class TestPatchStatement:
+    """Tests for the SQL side."""
+
+    def test_expression_nests_operations(self):
+        operations = [
+            PatchOperation("replace", ["combat_stats", "hit_points", "current"], 5),
+            PatchOperation("remove", ["notes"]),
+        ]
+        statement = update(models.Character).values(
+            character_data=build_patch_expression(models.Character.character_data, operations)
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("jsonb_set(") == 1
+        assert "#-" in sql
+        assert "characters.character_data" in sql
+
+    @pytest.mark.asyncio
+    async def test_apply_patches_reports_missing(self):
+        session = Mock()
+        session.execute = AsyncMock(side_effect=[Mock(rowcount=1), Mock(rowcount=0)])
+        repo = CharacterRepository(session)
+        found, missing = uuid.uuid4(), uuid.uuid4()
+        operation = PatchOperation("replace", ["coins", "gp"], 10)
+
+        assert await repo.apply_patches({found: [operation], missing: [operation], uuid.uuid4(): []}) == [missing]
+        assert session.execute.await_count == 2
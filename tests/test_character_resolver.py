@@ -0,0 +1,116 @@
+"""
+Tests for CharacterResolver and its StateManager integration.
+
+Tests cover:
+- Exact, first-name, alias, ordinal and misspelled references
+- Ambiguous references resolve to nothing
+- Incremental updates on add_monster / remove_monster / clear_monsters
+- Name maps restricted to characters mentioned in a turn
+- apply_commands repairs character_ids before execution
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.characters.charactersheet import Character
+from src.memory.character_resolver import CharacterResolver
+from src.memory.state_manager import StateManager
+from src.models.state_commands_optimized import AreaEffectCommand, HPChangeCommand, StateCommandResult
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+GOBLIN_TEMPLATE = str(CHARACTERS_DIR / "monsters" / "goblin.json")
+
+
+@pytest.fixture
+def resolver():
+    resolver = CharacterResolver()
+    resolver.register("fighter", "Tharion Stormwind", aliases=["the fighter"], include_first_name=True)
+    resolver.register("wizard", "Lyralei Moonwhisper", include_first_name=True)
+    for number in (1, 2, 3):
+        resolver.register(f"goblin_{number}", f"Goblin {number}")
+    resolver.register("orc_chief", "Orc Chief")
+    return resolver
+
+
+@pytest.fixture
+def state_manager(tmp_path):
+    manager = StateManager(character_data_path=str(tmp_path), enable_logging=False)
+    fighter = Character(**json.loads((CHARACTERS_DIR / "fighter.json").read_text()))
+    manager.add_character("fighter", fighter)
+    manager.create_monster_group(GOBLIN_TEMPLATE, count=3, prefix="goblin")
+    return manager
+
+
+class TestCharacterResolver:
+    """Tests for reference resolution."""
+
+    @pytest.mark.parametrize("reference,expected", [
+        ("Tharion Stormwind", "fighter"),
+        ("Tharion", "fighter"),
+        ("the fighter", "fighter"),
+        ("Tharian", "fighter"),
+        ("Lyralei Moonwhispr", "wizard"),
+        ("goblin_2", "goblin_2"),
+        ("Goblin 2", "goblin_2"),
+        ("the second goblin", "goblin_2"),
+        ("3rd goblin", "goblin_3"),
+        ("goblin #1", "goblin_1"),
+        ("goblin three", "goblin_3"),
+        ("Orc Chief", "orc_chief"),
+    ])
+    def test_resolves_references(self, resolver, reference, expected):
+        assert resolver.resolve(reference) == expected
+
+    @pytest.mark.parametrize("reference", ["the goblin", "goblin_7", "dragon", ""])
+    def test_unknown_or_ambiguous(self, resolver, reference):
+        assert resolver.resolve(reference) is None
+
+    def test_single_group_member_resolves_by_group_name(self, resolver):
+        resolver.unregister("goblin_2")
+        resolver.unregister("goblin_3")
+
+        assert resolver.resolve("the goblin") == "goblin_1"
+        assert "goblin_2" not in resolver
+
+    def test_find_mentions(self, resolver):
+        mentioned = resolver.find_mentions("Tharion swings at the goblins; the Orc Chief roars.")
+        assert mentioned == {"fighter", "goblin_1", "goblin_2", "goblin_3", "orc_chief"}
+
+    def test_repair_ids(self, resolver):
+        repairs = resolver.repair_ids(["fighter", "tharion", "Goblin 2", "goblin_9"])
+        assert repairs == {"tharion": "fighter", "Goblin 2": "goblin_2"}
+
+
+class TestStateManagerResolver:
+    """Tests for the resolver maintained by StateManager."""
+
+    def test_index_follows_monster_lifecycle(self, state_manager):
+        assert state_manager.resolver.resolve("second goblin") == "goblin_2"
+
+        state_manager.remove_monster("goblin_2")
+        assert state_manager.resolver.resolve("second goblin") is None
+
+        state_manager.clear_monsters()
+        assert state_manager.get_character_name_to_id_map() == {"Tharion Stormwind": "fighter"}
+
+    def test_map_restricted_to_mentions(self, state_manager):
+        mapping = state_manager.get_character_name_to_id_map(
+            mentioned_in="Goblin 1 stabs Tharion.",
+            include_ids=["goblin_3"]
+        )
+        assert mapping == {"Goblin 3": "goblin_3", "Goblin 1": "goblin_1", "Tharion Stormwind": "fighter"}
+
+        assert len(state_manager.get_character_name_to_id_map(mentioned_in="Nothing happens.")) == 4
+
+    def test_apply_commands_repairs_ids(self, state_manager):
+        goblin_hp = state_manager.get_monster("goblin_2").hit_points.current
+        result = state_manager.apply_commands(StateCommandResult(commands=[
+            HPChangeCommand(character_id="Goblin 2", change=-3),
+            AreaEffectCommand(character_ids=["tharion", "goblin_1"], damage=4, saved=["tharion"]),
+        ]))
+
+        assert result["success"]
+        assert state_manager.get_monster("goblin_2").hit_points.current == goblin_hp - 3
+        assert any("'tharion' to 'fighter'" in warning for warning in result["warnings"])
@@ -6,8 +6,10 @@ from pydantic_ai import RunContext
 
 from src.agents.dm_tools import (
     query_rules_database,
+    query_rules_batch,
     get_available_monsters,
     select_encounter_monsters,
+    estimate_encounter_difficulty,
     add_monster_initiative,
     remove_defeated_participant,
     end_combat,
@@ -25,8 +27,9 @@ from src.models.turn_context import TurnContext
 def mock_lance_service():
     """Create mock LanceRulesService for testing."""
     service = Mock()
-    service.get_by_name = Mock()
+    service.find_by_name = Mock()
     service.search = Mock()
+    service.search_batch = Mock()
     return service
 
 
@@ -96,10 +99,10 @@ class TestAutoDetectShortQueries:
 
     @pytest.mark.asyncio
     async def test_short_query_exact_match_found(self, mock_run_context, mock_lance_service):
-        """Test short query finds exact match and returns single result."""
+        """Test short query finds name match and returns single result."""
         # Setup
         lance_entry = create_sample_lance_entry("Bless", "spell")
-        mock_lance_service.get_by_name.return_value = lance_entry
+        mock_lance_service.find_by_name.return_value = lance_entry
 
         # Execute
         result = await query_rules_database(
@@ -107,9 +110,9 @@ class TestAutoDetectShortQueries:
             query="Bless"  # Short query, auto-detects
         )
 
-        # Verify exact match was tried
-        mock_lance_service.get_by_name.assert_called_once_with("Bless")
-        # Verify search was NOT called (exact match succeeded)
+        # Verify name match was tried
+        mock_lance_service.find_by_name.assert_called_once_with("Bless")
+        # Verify search was NOT called (name match succeeded)
         mock_lance_service.search.assert_not_called()
 
         # Verify cache was updated
@@ -125,10 +128,10 @@ class TestAutoDetectShortQueries:
 
     @pytest.mark.asyncio
     async def test_short_query_fallback_to_search(self, mock_run_context, mock_lance_service):
-        """Test short query falls back to search when exact match fails."""
+        """Test short query falls back to search when name match fails."""
         # Setup
         lance_entry = create_sample_lance_entry("Fireball", "spell")
-        mock_lance_service.get_by_name.return_value = None  # Exact match fails
+        mock_lance_service.find_by_name.return_value = None  # Name match fails
         mock_lance_service.search.return_value = [lance_entry]  # Search succeeds
 
         # Execute
@@ -138,7 +141,7 @@ class TestAutoDetectShortQueries:
         )
 
         # Verify fallback occurred
-        mock_lance_service.get_by_name.assert_called_once_with("firebal")
+        mock_lance_service.find_by_name.assert_called_once_with("firebal")
         mock_lance_service.search.assert_called_once_with("firebal", limit=3)
 
         # Verify cache updated with search result
@@ -157,7 +160,7 @@ class TestAutoDetectLongQueries:
 
     @pytest.mark.asyncio
     async def test_long_query_skips_exact_match(self, mock_run_context, mock_lance_service):
-        """Test long query skips exact match and goes directly to search."""
+        """Test long query skips name match and goes directly to search."""
         # Setup
         lance_entry = create_sample_lance_entry("Bless", "spell")
         mock_lance_service.search.return_value = [lance_entry]
@@ -168,8 +171,8 @@ class TestAutoDetectLongQueries:
             query="how does the blessing spell work and what are its effects on attack rolls?"
         )
 
-        # Verify exact match was SKIPPED (query >10 words)
-        mock_lance_service.get_by_name.assert_not_called()
+        # Verify name match was SKIPPED (query >10 words)
+        mock_lance_service.find_by_name.assert_not_called()
         # Verify search was called directly
         mock_lance_service.search.assert_called_once()
 
@@ -214,7 +217,7 @@ class TestLimitParameter:
             create_sample_lance_entry("Fireball", "spell"),
             create_sample_lance_entry("Heal", "spell")
         ]
-        mock_lance_service.get_by_name.return_value = None  # Force search
+        mock_lance_service.find_by_name.return_value = None  # Force search
         mock_lance_service.search.return_value = results[:3]  # LanceDB returns limit
 
         # Execute without specifying limit (default=3)
@@ -237,7 +240,7 @@ class TestLimitParameter:
         """Test custom limit parameter."""
         # Setup
         results = [create_sample_lance_entry(f"Spell{i}", "spell") for i in range(5)]
-        mock_lance_service.get_by_name.return_value = None
+        mock_lance_service.find_by_name.return_value = None
         mock_lance_service.search.return_value = results
 
         # Execute with limit=5
@@ -257,7 +260,7 @@ class TestLimitParameter:
     async def test_limit_clamped_to_max_ten(self, mock_run_context, mock_lance_service):
         """Test limit is clamped to maximum of 10."""
         # Setup
-        mock_lance_service.get_by_name.return_value = None
+        mock_lance_service.find_by_name.return_value = None
         mock_lance_service.search.return_value = []
 
         # Execute with limit=20 (should be clamped to 10)
@@ -285,7 +288,7 @@ class TestMultiKeywordQueries:
             {"name": "Fireball", "type": "spell", "content": "A bright streak...", "metadata": {"level": 3}},
             {"name": "Concentration", "type": "variantrule", "content": "Some spells require concentration..."},
         ]
-        mock_lance_service.get_by_name.return_value = None  # Short query but no exact match
+        mock_lance_service.find_by_name.return_value = None  # Short query but no name match
         mock_lance_service.search.return_value = results
 
         # Execute multi-keyword query
@@ -329,9 +332,9 @@ class TestCachePopulation:
                 "damage": "None"
             }
         }
-        mock_lance_service.get_by_name.return_value = lance_entry
+        mock_lance_service.find_by_name.return_value = lance_entry
 
-        # Execute (short query with exact match)
+        # Execute (short query with name match)
         await query_rules_database(mock_run_context, query="Haste")
 
         # Verify cache entry schema
@@ -359,9 +362,9 @@ class TestCachePopulation:
         """Test cache entry is added to current turn context."""
         # Setup
         lance_entry = create_sample_lance_entry()
-        mock_lance_service.get_by_name.return_value = lance_entry
+        mock_lance_service.find_by_name.return_value = lance_entry
 
-        # Execute (short query with exact match)
+        # Execute (short query with name match)
         await query_rules_database(mock_run_context, query="Bless")
 
         # Verify turn context was passed to add_to_cache
@@ -380,7 +383,7 @@ class TestCachePopulation:
             create_sample_lance_entry("Spell2", "spell"),
             create_sample_lance_entry("Spell3", "spell")
         ]
-        mock_lance_service.get_by_name.return_value = None  # Force search
+        mock_lance_service.find_by_name.return_value = None  # Force search
         mock_lance_service.search.return_value = results
 
         # Execute
@@ -416,9 +419,9 @@ class TestErrorHandling:
 
     @pytest.mark.asyncio
     async def test_both_exact_and_search_fail(self, mock_run_context, mock_lance_service):
-        """Test error when both exact match and search fail."""
+        """Test error when both name match and search fail."""
         # Setup
-        mock_lance_service.get_by_name.return_value = None
+        mock_lance_service.find_by_name.return_value = None
         mock_lance_service.search.return_value = []
 
         # Execute
@@ -428,7 +431,7 @@ class TestErrorHandling:
         )
 
         # Verify both were tried
-        mock_lance_service.get_by_name.assert_called_once()
+        mock_lance_service.find_by_name.assert_called_once()
         mock_lance_service.search.assert_called_once()
 
         # Verify error message
@@ -436,6 +439,108 @@ class TestErrorHandling:
         mock_run_context.deps.rules_cache_service.add_to_cache.assert_not_called()
 
 
+# ==================== Batch Query Tests ====================
+
+class TestQueryRulesBatch:
+    """Tests for query_rules_batch (several lookups in one tool call)."""
+
+    @pytest.mark.asyncio
+    async def test_name_matches_and_one_batched_search(self, mock_run_context, mock_lance_service):
+        """Test name matches skip search and the rest share one search_batch call."""
+        mock_lance_service.find_by_name.side_effect = lambda query: (
+            create_sample_lance_entry("Hold Person", "spell") if query == "hold person" else None
+        )
+        mock_lance_service.search_batch.return_value = [
+            [create_sample_lance_entry("Paralyzed", "condition")],
+            [create_sample_lance_entry("Concentration", "variantrule")],
+        ]
+
+        result = await query_rules_batch(
+            mock_run_context,
+            queries=["hold person", "can a paralyzed creature move", "losing concentration"]
+        )
+
+        mock_lance_service.search_batch.assert_called_once_with(
+            ["can a paralyzed creature move", "losing concentration"], limit=3
+        )
+        mock_lance_service.search.assert_not_called()
+        assert mock_run_context.deps.rules_cache_service.add_to_cache.call_count == 3
+        assert result.index("## hold person") < result.index("Hold Person (Spell")
+        assert result.index("## can a paralyzed creature move") < result.index("Paralyzed (Condition")
+        assert "Concentration (Variantrule" in result
+
+    @pytest.mark.asyncio
+    async def test_overlapping_results_cached_once(self, mock_run_context, mock_lance_service):
+        """Test a rule returned by several queries is cached and printed once."""
+        mock_lance_service.find_by_name.return_value = None
+        mock_lance_service.search_batch.return_value = [
+            [create_sample_lance_entry("Grappled", "condition")],
+            [create_sample_lance_entry("Grappled", "condition"), create_sample_lance_entry("Prone", "condition")],
+        ]
+
+        result = await query_rules_batch(mock_run_context, queries=["grapple", "knock prone while grappling"])
+
+        cached = [call[0][0]["name"] for call in mock_run_context.deps.rules_cache_service.add_to_cache.call_args_list]
+        assert cached == ["Grappled", "Prone"]
+        assert result.count("Grappled (Condition") == 1
+        assert "Grappled: see above" in result
+
+    @pytest.mark.asyncio
+    async def test_duplicate_and_empty_queries(self, mock_run_context, mock_lance_service):
+        """Test duplicate queries run once and an empty batch is rejected."""
+        mock_lance_service.find_by_name.return_value = None
+        mock_lance_service.search_batch.return_value = [[]]
+
+        result = await query_rules_batch(mock_run_context, queries=["flanking", " flanking ", ""])
+
+        mock_lance_service.search_batch.assert_called_once_with(["flanking"], limit=3)
+        assert "No rules found matching 'flanking'" in result
+
+        assert "No queries provided" in await query_rules_batch(mock_run_context, queries=["  "])
+
+    @pytest.mark.asyncio
+    async def test_no_active_turn(self, mock_run_context, mock_turn_manager, mock_lance_service):
+        """Test error when there is no turn to cache into."""
+        mock_turn_manager.get_current_turn_context.return_value = None
+
+        result = await query_rules_batch(mock_run_context, queries=["Bless"])
+
+        assert "No active turn" in result
+        mock_lance_service.search_batch.assert_not_called()
+
+
+# ==================== Summary Detail Tests ====================
+
+class TestRuleDetail:
+    """Tests for summary vs full rule text in tool results."""
+
+    @pytest.mark.asyncio
+    async def test_summary_by_default_full_on_demand(self, mock_run_context, mock_lance_service):
+        """Test the mechanics summary is returned unless full text is requested."""
+        lance_entry = create_sample_lance_entry("Bless", "spell")
+        lance_entry["summary"] = "Level 1 Enchantment; 1 action; Concentration, up to 1 minute"
+        mock_lance_service.find_by_name.return_value = lance_entry
+
+        summary = await query_rules_database(mock_run_context, query="Bless")
+        full = await query_rules_database(mock_run_context, query="Bless", detail="full")
+
+        assert "Concentration, up to 1 minute" in summary
+        assert "roll 1d4" not in summary
+        assert "roll 1d4" in full
+
+        # The cache keeps both for downstream agents
+        cache_entry = mock_run_context.deps.rules_cache_service.add_to_cache.call_args[0][0]
+        assert cache_entry["summary"] == lance_entry["summary"]
+        assert "roll 1d4" in cache_entry["description"]
+
+    def test_entry_without_summary_shows_description(self):
+        """Test entries from older tables fall back to the description."""
+        cache_entry = _format_lance_entry_to_cache(create_sample_lance_entry("Bless", "spell"))
+
+        assert "summary" not in cache_entry
+        assert "roll 1d4" in _format_rule_for_dm(cache_entry, "summary")
+
+
 # ==================== Format Helper Tests ====================
 
 class TestFormatHelpers:
@@ -538,11 +643,13 @@ class TestFactoryFunction:
             rules_cache_service=mock_rules_cache_service
         )
 
-        # Verify tools list (query_rules_database, query_character_ability, get_available_monsters, select_encounter_monsters, add_monster_initiative, remove_defeated_participant, end_combat)
-        assert len(tools) == 7
+        # Verify tools list (query_rules_database, query_rules_batch, query_character_ability, get_available_monsters, estimate_encounter_difficulty, select_encounter_monsters, add_monster_initiative, remove_defeated_participant, end_combat)
+        assert len(tools) == 9
         assert query_rules_database in tools
+        assert query_rules_batch in tools
         assert get_available_monsters in tools
         assert select_encounter_monsters in tools
+        assert estimate_encounter_difficulty in tools
         assert add_monster_initiative in tools
         assert remove_defeated_participant in tools
         assert end_combat in tools
@@ -562,7 +669,7 @@ class TestDMToolsIntegration:
 
     @pytest.mark.asyncio
     async def test_end_to_end_exact_match(self, mock_lance_service, mock_rules_cache_service):
-        """Test end-to-end flow with exact match."""
+        """Test end-to-end flow with name match."""
         # Setup real TurnContext
         turn_manager = Mock()
         current_turn = TurnContext(
@@ -584,9 +691,9 @@ class TestDMToolsIntegration:
 
         # Setup LanceDB response
         lance_entry = create_sample_lance_entry("Shield", "spell")
-        mock_lance_service.get_by_name.return_value = lance_entry
+        mock_lance_service.find_by_name.return_value = lance_entry
 
-        # Execute (short query auto-detects exact match)
+        # Execute (short query auto-detects name match)
         result = await query_rules_database(ctx, query="Shield")
 
         # Verify
@@ -615,7 +722,7 @@ class TestDMToolsIntegration:
         ctx.deps = deps
 
         # Setup responses
-        mock_lance_service.get_by_name.side_effect = [
+        mock_lance_service.find_by_name.side_effect = [
             create_sample_lance_entry("Bless", "spell"),
             create_sample_lance_entry("Shield", "spell"),
             create_sample_lance_entry("Haste", "spell")
@@ -0,0 +1,171 @@
+"""
+Tests for the combat-wide effect expiry scheduler.
+
+Tests cover:
+- Effects applied during combat expire at the start of the applying turn, N rounds later
+- Effects present before initiative expire at the end of their bearer's turn
+- Early removal and re-application invalidate stale heap entries
+- Expiry follows the anchoring combatant when initiative positions shift
+- Schedule survives TurnManager export_state/import_state
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+from src.characters.charactersheet import Character
+from src.characters.character_components import DurationType, Effect
+from src.memory.state_command_executor import StateCommandExecutor
+from src.memory.turn_manager import TurnManager
+from src.models.combat_state import CombatPhase
+from src.models.state_commands_optimized import EffectCommand
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+INITIATIVE = [("fighter", 18), ("wizard", 15), ("cleric", 12)]  # Cleric stands in as the enemy
+
+
+def load_character(character_id: str) -> Character:
+    return Character(**json.loads((CHARACTERS_DIR / f"{character_id}.json").read_text()))
+
+
+def make_effect(name: str, rounds: int) -> Effect:
+    return Effect(
+        name=name,
+        effect_type="buff",
+        duration_type=DurationType.ROUNDS,
+        duration_remaining=rounds,
+        source="test"
+    )
+
+
+@pytest.fixture
+def characters():
+    return {character_id: load_character(character_id) for character_id, _ in INITIATIVE}
+
+
+@pytest.fixture
+def executor(characters):
+    return StateCommandExecutor(characters.get)
+
+
+def start_combat(turn_manager: TurnManager, executor: StateCommandExecutor, characters) -> None:
+    turn_manager.set_character_lookup(characters.get)
+    executor.on_effect_added = turn_manager.schedule_effect
+    turn_manager.enter_combat([character_id for character_id, _ in INITIATIVE])
+    for character_id, roll in INITIATIVE:
+        turn_manager.add_initiative_roll(character_id, character_id, roll, is_player=character_id != "cleric")
+    turn_manager.end_turn_sync()  # Finalizes initiative
+    assert turn_manager.combat_state.phase == CombatPhase.COMBAT_ROUNDS
+
+
+def add_effect_command(character_id: str, name: str, rounds: int) -> EffectCommand:
+    return EffectCommand(
+        character_id=character_id,
+        action="add",
+        effect_name=name,
+        duration_type=DurationType.ROUNDS,
+        duration=rounds,
+        description=name
+    )
+
+
+class TestEffectScheduler:
+    """Tests for TurnManager-driven effect expiry."""
+
+    def test_effect_expires_at_start_of_applying_turn(self, executor, characters):
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+
+        # Fighter (position 0) blesses the wizard for 1 round
+        executor.execute_command(add_effect_command("wizard", "Bless", 1))
+        executor.execute_command(add_effect_command("cleric", "Haste", 10))
+
+        assert tm.advance_combat_turn()["expired_effects"] == []  # -> wizard
+        assert tm.advance_combat_turn()["expired_effects"] == []  # -> cleric
+        result = tm.advance_combat_turn()  # -> fighter, round 2
+
+        assert result["round_number"] == 2
+        assert len(result["expired_effects"]) == 1
+        assert not characters["wizard"].active_effects.has("Bless")
+        assert characters["cleric"].active_effects.get("Haste").duration_remaining == 10
+        assert len(tm.effect_scheduler) == 1
+
+    def test_existing_effects_expire_at_end_of_bearer_turn(self, executor, characters):
+        characters["wizard"].add_effect(make_effect("Mage Armor Flicker", 1))
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+
+        tm.advance_combat_turn()  # End of fighter's turn
+        assert characters["wizard"].active_effects.has("Mage Armor Flicker")
+
+        tm.advance_combat_turn()  # End of wizard's turn
+        assert not characters["wizard"].active_effects.has("Mage Armor Flicker")
+
+    def test_removed_and_reapplied_effects(self, executor, characters):
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+
+        executor.execute_command(add_effect_command("wizard", "Bless", 1))
+        executor.execute_command(EffectCommand(character_id="wizard", action="remove", effect_name="Bless"))
+        tm.advance_combat_turn()  # -> wizard
+
+        # Re-applied on the wizard's turn for 1 round: lasts until the wizard's next turn
+        executor.execute_command(add_effect_command("wizard", "Bless", 1))
+        tm.advance_combat_turn()  # -> cleric
+        tm.advance_combat_turn()  # -> fighter, round 2
+        assert characters["wizard"].active_effects.has("Bless")
+
+        tm.advance_combat_turn()  # -> wizard, round 2
+        assert not characters["wizard"].active_effects.has("Bless")
+
+    def test_removing_combatant_ahead_of_anchor_keeps_expiry_turn(self, executor, characters):
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+        tm.advance_combat_turn()  # -> wizard
+
+        # Wizard (position 1) blesses the cleric until the start of the wizard's next turn
+        executor.execute_command(add_effect_command("cleric", "Bless", 1))
+        tm.combat_state.remove_participant("fighter")  # Wizard shifts to position 0
+
+        tm.advance_combat_turn()  # -> cleric
+        assert characters["cleric"].active_effects.has("Bless")
+
+        result = tm.advance_combat_turn()  # -> wizard, round 2
+        assert result["round_number"] == 2
+        assert tm.combat_state.get_current_participant_id() == "wizard"
+        assert len(result["expired_effects"]) == 1
+        assert not characters["cleric"].active_effects.has("Bless")
+
+    def test_effect_expires_at_round_start_when_anchor_leaves(self, executor, characters):
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+        tm.advance_combat_turn()  # -> wizard
+
+        executor.execute_command(add_effect_command("cleric", "Bless", 1))
+        tm.combat_state.remove_participant("wizard")  # Cleric takes over the current slot
+
+        result = tm.advance_combat_turn()  # -> fighter, round 2
+        assert result["round_number"] == 2
+        assert not characters["cleric"].active_effects.has("Bless")
+
+    def test_schedule_round_trips_through_export(self, executor, characters):
+        tm = TurnManager()
+        start_combat(tm, executor, characters)
+        executor.execute_command(add_effect_command("wizard", "Bless", 1))
+
+        restored = TurnManager()
+        restored.import_state(json.loads(json.dumps(tm.export_state())))
+        restored.set_character_lookup(characters.get)
+
+        for _ in range(3):
+            restored.advance_combat_turn()
+        assert not characters["wizard"].active_effects.has("Bless")
+
+    def test_effects_outside_combat_are_not_scheduled(self, executor, characters):
+        tm = TurnManager()
+        tm.set_character_lookup(characters.get)
+        executor.on_effect_added = tm.schedule_effect
+
+        executor.execute_command(add_effect_command("wizard", "Bless", 1))
+
+        assert len(tm.effect_scheduler) == 0
@@ -0,0 +1,97 @@
+"""
+Tests for EffectStore - the indexed active_effects container of Character and Monster.
+
+Tests cover:
+- Name/type lookup and removal keep insertion order
+- Case-sensitive (Character) and case-insensitive (Monster) removal
+- Cached condition list invalidated by effect and HP/death-save changes
+- Round-trip through model_dump / JSON as a plain list
+"""
+
+import json
+from pathlib import Path
+
+from src.characters.charactersheet import Character
+from src.characters.character_components import DurationType, Effect
+from src.characters.effect_store import EffectStore
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+def make_effect(name: str, effect_type: str = "condition", rounds: int = 3) -> Effect:
+    return Effect(
+        name=name,
+        effect_type=effect_type,
+        duration_type=DurationType.ROUNDS,
+        duration_remaining=rounds,
+        source="test"
+    )
+
+
+def load_fighter() -> Character:
+    return Character(**json.loads((CHARACTERS_DIR / "fighter.json").read_text()))
+
+
+class TestEffectStore:
+    """Tests for the container itself."""
+
+    def test_lookup_and_removal_preserve_order(self):
+        store = EffectStore([make_effect("Poisoned"), make_effect("Bless", "buff"), make_effect("Prone")])
+
+        assert store.get("Bless").effect_type == "buff"
+        assert [e.name for e in store.of_type("condition")] == ["Poisoned", "Prone"]
+
+        store.remove("Poisoned")
+
+        assert store.names() == ["Bless", "Prone"]
+        assert store[0].name == "Bless"
+        assert not store.has("Poisoned")
+
+    def test_case_sensitivity(self):
+        store = EffectStore([make_effect("Prone")])
+
+        assert store.remove("prone") == []
+        assert store.get("prone", case_sensitive=False).name == "Prone"
+        assert len(store.remove("prone", case_sensitive=False)) == 1
+        assert store == []
+
+    def test_remove_where(self):
+        store = EffectStore([make_effect("Bless", "buff", rounds=1), make_effect("Haste", "buff", rounds=5)])
+
+        expired = store.remove_where(lambda e: not e.tick())
+
+        assert [e.name for e in expired] == ["Bless"]
+        assert store.names() == ["Haste"]
+
+
+class TestCharacterConditions:
+    """Tests for cached conditions on Character."""
+
+    def test_conditions_reused_until_change(self):
+        fighter = load_fighter()
+        fighter.add_effect(make_effect("Poisoned"))
+
+        first = fighter.conditions
+        assert fighter.conditions is first
+        assert fighter.has_condition("Poisoned")
+
+        fighter.take_damage(fighter.hp - 1)
+        assert "Bloodied" in fighter.conditions
+
+        fighter.combat_stats.death_saves.failures = 3  # Direct write, as the executor does
+        assert "Dead" in fighter.conditions
+
+        fighter.remove_effect("Poisoned")
+        assert not fighter.has_condition("Poisoned")
+        assert "Poisoned" not in fighter.conditions
+
+    def test_serializes_as_list(self):
+        fighter = load_fighter()
+        fighter.add_effect(make_effect("Poisoned"))
+
+        dumped = fighter.model_dump()
+        assert isinstance(dumped["active_effects"], list)
+
+        restored = Character.model_validate_json(fighter.model_dump_json())
+        assert isinstance(restored.active_effects, EffectStore)
+        assert restored.active_effects == fighter.active_effects
@@ -0,0 +1,110 @@
+"""
+Tests for the batched embedding pipeline used to build the rules table.
+
+Tests cover:
+- Documents are embedded in batches with bounded concurrency
+- Duplicate documents are embedded once
+- Checkpointed embeddings are reused by later runs (resume after a crash)
+- Failed requests are retried; batches that keep failing are skipped
+- Token bucket pacing
+- load_from_files end to end with a fake embedding backend
+"""
+
+import time
+
+import pytest
+
+from src.db.embedding_pipeline import (
+    EmbeddingCheckpoint,
+    EmbeddingPipeline,
+    TokenBucket,
+    content_hash,
+)
+
+
+def make_pipeline(embedder, checkpoint=None, **kwargs):
+    options = dict(batch_size=4, concurrency=3, requests_per_minute=60_000, backoff_seconds=0.001)
+    options.update(kwargs)
+    return EmbeddingPipeline(embedder, checkpoint=checkpoint, **options)
+
+
+class TestEmbeddingPipeline:
+    """Tests for batching, checkpointing and retries."""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently(self, fake_embedder):
+        embedder = fake_embedder()
+        texts = [f"rule {i}" for i in range(10)] + ["rule 0"]
+
+        vectors = await make_pipeline(embedder).run(texts)
+
+        assert len(vectors) == 10
+        assert [len(call) for call in embedder.calls] == [4, 4, 2]
+        assert embedder.max_in_flight == 3
+        assert vectors[content_hash("rule 7")][0] == len("rule 7")
+
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, tmp_path, fake_embedder):
+        texts = [f"rule {i}" for i in range(10)]
+        failing = fake_embedder(fail_on="rule 9")
+        first = make_pipeline(failing, EmbeddingCheckpoint(str(tmp_path)), max_retries=1)
+
+        await first.run(texts)
+        assert first.stats.embedded == 8
+        assert first.stats.failed == 2
+
+        embedder = fake_embedder()
+        second = make_pipeline(embedder, EmbeddingCheckpoint(str(tmp_path)))
+        vectors = await second.run(texts)
+
+        assert len(vectors) == 10
+        assert second.stats.cached == 8
+        assert embedder.calls == [["rule 8", "rule 9"]]
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self, fake_embedder):
+        embedder = fake_embedder(fail_times=2)
+        pipeline = make_pipeline(embedder, concurrency=1)
+
+        vectors = await pipeline.run(["a", "b"])
+
+        assert len(vectors) == 2
+        assert pipeline.stats.retries == 2
+        assert pipeline.stats.requests == 3
+
+    def test_checkpoint_compaction(self, tmp_path):
+        checkpoint = EmbeddingCheckpoint(str(tmp_path))
+        checkpoint.add({"a": [1.0, 2.0]})
+        checkpoint.add({"b": [3.0, 4.0]})
+
+        checkpoint.compact()
+
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+        assert EmbeddingCheckpoint(str(tmp_path)).load() == {"a": [1.0, 2.0], "b": [3.0, 4.0]}
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        bucket = TokenBucket(rate_per_minute=1200, capacity=1)  # 20 per second
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        assert time.monotonic() - start >= 0.14
+
+
+class TestLoadFromFiles:
+    """load_from_files with a fake embedding backend."""
+
+    def test_build_resumes_from_checkpoint(self, tmp_path, build_rules_table, fake_embedder):
+        embedder = fake_embedder()
+        options = dict(batch_size=3, embedding_cache_dir=str(tmp_path / "embedding_cache"))
+
+        service, stats = build_rules_table(build_rules_table.spells(7), embed_documents=embedder, **options)
+
+        assert stats["total_entries"] == 7
+        assert stats["embedding"]["embedded"] == 7
+        assert len(embedder.calls) == 3
+        assert service.table.count_rows() == 7
+
+        rebuilt = build_rules_table.load(service, **options)
+        assert rebuilt["embedding"]["cached"] == 7
+        assert len(embedder.calls) == 3
@@ -0,0 +1,91 @@
+"""
+Tests for the query embedding providers of LanceRulesService.
+
+Tests cover:
+- Local hashed n-gram embeddings are deterministic and normalized
+- Related texts (including typos) score higher than unrelated ones
+- IDF weights survive save/load; an unfitted provider refuses to embed
+- Offline search over a built table with the local provider
+"""
+
+import numpy as np
+import pytest
+
+from src.db.embedding_providers import (
+    LOCAL_DIMS,
+    LOCAL_VECTOR_COLUMN,
+    GeminiEmbeddingProvider,
+    HashedNgramEmbeddingProvider,
+)
+from src.db.lance_rules_service import LanceRulesService
+
+RULES = {
+    "Fireball": "A bright streak flashes from your pointing finger and blossoms into an explosion of flame. "
+                "Each creature in a 20-foot-radius Sphere makes a Dexterity saving throw.",
+    "Grappled": "While Grappled, your Speed is 0 and you have Disadvantage on attack rolls "
+                "against any target other than the grappler.",
+    "Magic Missile": "You create three glowing darts of magical force. Each dart deals 1d4 + 1 Force damage.",
+    "Shield": "An imperceptible barrier of magical force protects you. Until the start of your next turn, "
+              "you have a +5 bonus to AC.",
+    "Cover": "Walls, trees, creatures and other obstacles can provide cover. Half cover grants a +2 bonus "
+             "to AC and Dexterity saving throws.",
+}
+
+
+@pytest.fixture
+def provider():
+    return HashedNgramEmbeddingProvider().fit(f"# {name}\n{text}" for name, text in RULES.items())
+
+
+class TestHashedNgramEmbeddingProvider:
+    """Tests for the offline embedding backend."""
+
+    def test_vectors_are_normalized_and_deterministic(self, provider):
+        vector = provider.embed_query("How does fireball work?")
+
+        assert len(vector) == LOCAL_DIMS
+        assert np.linalg.norm(vector) == pytest.approx(1.0)
+        assert vector == provider.embed_query("How does fireball work?")
+
+    def test_related_texts_score_higher(self, provider):
+        names = list(RULES)
+        documents = np.array([provider.embed(f"# {name}\n{RULES[name]}") for name in names])
+
+        for query, expected in [
+            ("fireball explosion", "Fireball"),
+            ("grapled speed", "Grappled"),  # Typo
+            ("magic missle darts", "Magic Missile"),  # Typo
+            ("half cover", "Cover"),
+        ]:
+            assert names[int(np.argmax(documents @ provider.embed(query)))] == expected, query
+
+    def test_state_roundtrip(self, provider, tmp_path):
+        provider.state_path = tmp_path / "idf.npy"
+        provider.save()
+
+        loaded = HashedNgramEmbeddingProvider(str(tmp_path / "idf.npy"))
+
+        assert loaded.is_fitted
+        assert loaded.embed_query("Shield") == provider.embed_query("Shield")
+
+    def test_unfitted_provider_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Build the rules table"):
+            HashedNgramEmbeddingProvider(str(tmp_path / "missing.npy")).embed_query("Shield")
+
+
+class TestLocalSearch:
+    """LanceRulesService with the local provider."""
+
+    def test_offline_search(self, tmp_path, build_rules_table):
+        build_rules_table([{"name": name, "type": "spell", "text": text} for name, text in RULES.items()])
+
+        service = LanceRulesService(db_path=str(tmp_path / "lancedb"), embedding_provider="local")
+
+        assert service.embedding_provider.vector_column == LOCAL_VECTOR_COLUMN
+        results = service.search("magic missle damage", limit=1, expand_references=False)
+        assert results[0]["id"] == "Magic Missile|XPHB"
+
+    def test_unknown_provider(self):
+        assert isinstance(LanceRulesService().embedding_provider, GeminiEmbeddingProvider)
+        with pytest.raises(ValueError, match="Unknown embedding provider"):
+            LanceRulesService(embedding_provider="openai")
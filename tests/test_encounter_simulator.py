@@ -0,0 +1,164 @@
+"""
+Tests for the Monte Carlo encounter difficulty estimator.
+
+Tests cover:
+- Damage formula and multiattack parsing
+- Combatants built from characters and monster templates
+- Win probability ordering (easy vs deadly) and seeded determinism
+- MonsterSpawner.estimate_encounter and the estimate_encounter_difficulty DM tool
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pydantic_ai import RunContext
+
+from src.agents.dm_tools import DMToolsDependencies, MonsterSelection, estimate_encounter_difficulty
+from src.characters.charactersheet import Character
+from src.memory.state_manager import StateManager
+from src.services.encounter_simulator import Combatant, EncounterSimulator, parse_damage_formula
+from src.services.monster_spawner import create_monster_spawner
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+PARTY_IDS = ["fighter", "wizard", "cleric"]
+
+
+def load_character(character_id: str) -> Character:
+    return Character(**json.loads((CHARACTERS_DIR / f"{character_id}.json").read_text()))
+
+
+def load_template(type_name: str) -> dict:
+    return json.loads((CHARACTERS_DIR / "monsters" / f"{type_name}.json").read_text())
+
+
+@pytest.fixture
+def party():
+    return [load_character(character_id) for character_id in PARTY_IDS]
+
+
+@pytest.fixture
+def state_manager(tmp_path, party):
+    manager = StateManager(character_data_path=str(tmp_path), enable_logging=False)
+    for character_id, character in zip(PARTY_IDS, party):
+        manager.add_character(character_id, character)
+    return manager
+
+
+class TestCombatants:
+    """Tests for parsing combat numbers."""
+
+    def test_parse_damage_formula(self):
+        assert parse_damage_formula("3d8 + 5") == (3, 8, 5)
+        assert parse_damage_formula("1d6-1") == (1, 6, -1)
+        assert parse_damage_formula("2d4") == (2, 4, 0)
+        assert parse_damage_formula("Str. save DC 15") is None
+
+    def test_from_template_uses_multiattack(self):
+        giant = Combatant.from_template(load_template("hill_giant"))
+
+        assert giant.attacks_per_round == 2
+        assert giant.hit_points == 105
+        assert (giant.dice_count, giant.dice_sides) == (3, 10)
+
+    def test_from_character(self, party):
+        fighter = Combatant.from_character(party[0])
+
+        assert fighter.hit_points == party[0].combat_stats.hit_points.current
+        assert fighter.armor_class == party[0].combat_stats.armor_class
+
+    def test_from_character_counts_extra_attack(self, party):
+        fighter = Combatant.from_character(party[0])
+
+        assert fighter.attacks_per_round == 2
+        assert (fighter.attack_bonus, fighter.dice_count, fighter.dice_sides) == (7, 1, 10)
+
+    def test_from_character_skips_levelled_and_save_spells(self, party):
+        wizard = Combatant.from_character(party[1])  # Fireball/Magic Missile would out-damage Fire Bolt
+        cleric = Combatant.from_character(party[2])  # Guiding Bolt (1st level), Sacred Flame (save)
+
+        assert (wizard.attack_bonus, wizard.dice_count, wizard.dice_sides) == (7, 2, 10)
+        assert wizard.attacks_per_round == 1
+        assert (cleric.attack_bonus, cleric.dice_count, cleric.dice_sides) == (5, 1, 8)
+
+
+class TestEncounterSimulator:
+    """Tests for the vectorized simulation."""
+
+    def test_easy_and_deadly_encounters(self, party):
+        combatants = [Combatant.from_character(character) for character in party]
+        goblin = Combatant.from_template(load_template("goblin"))
+        giant = Combatant.from_template(load_template("hill_giant"))
+        simulator = EncounterSimulator(trials=500, seed=7)
+
+        easy = simulator.simulate(combatants, [goblin])
+        deadly = simulator.simulate(combatants, [giant, giant])
+
+        assert easy.party_win_probability > 0.95
+        assert easy.difficulty == "Easy"
+        assert deadly.party_win_probability < 0.2
+        assert deadly.expected_party_hp_loss > easy.expected_party_hp_loss
+        assert easy.expected_rounds >= 1
+
+    def test_seeded_runs_are_deterministic(self, party):
+        combatants = [Combatant.from_character(character) for character in party]
+        orcs = [Combatant.from_template(load_template("orc"))] * 3
+
+        first = EncounterSimulator(trials=300, seed=42).simulate(combatants, orcs)
+        second = EncounterSimulator(trials=300, seed=42).simulate(combatants, orcs)
+
+        assert first == second
+
+    def test_party_at_zero_hp(self, party):
+        fallen = Combatant.from_character(party[0])
+        fallen.hit_points = 0
+
+        goblin = Combatant.from_template(load_template("goblin"))
+
+        estimate = EncounterSimulator(trials=50, seed=3).simulate([fallen], [goblin])
+
+        assert estimate.party_win_probability == 0.0
+        assert estimate.expected_party_hp_loss_fraction == 1.0
+
+    def test_requires_both_sides(self, party):
+        with pytest.raises(ValueError):
+            EncounterSimulator(trials=10).simulate([Combatant.from_character(party[0])], [])
+
+
+class TestEstimateEncounter:
+    """Tests for the spawner method and DM tool."""
+
+    def test_spawner_estimate_does_not_spawn(self, state_manager, party):
+        spawner = create_monster_spawner(state_manager=state_manager)
+
+        estimate = spawner.estimate_encounter([{"type": "goblin", "count": 2}], party, trials=200, seed=1)
+
+        assert estimate.trials == 200
+        assert estimate.party_win_probability > 0.9
+        assert state_manager.get_all_monsters() == []
+
+    def test_spawner_unknown_type(self, state_manager, party):
+        spawner = create_monster_spawner(state_manager=state_manager)
+
+        with pytest.raises(ValueError, match="not found"):
+            spawner.estimate_encounter([{"type": "dragon", "count": 1}], party)
+
+    @pytest.mark.asyncio
+    async def test_dm_tool(self, state_manager):
+        ctx = Mock(spec=RunContext)
+        ctx.deps = DMToolsDependencies(
+            lance_service=Mock(),
+            turn_manager=Mock(),
+            rules_cache_service=Mock(),
+            state_manager=state_manager,
+            monster_spawner=create_monster_spawner(state_manager=state_manager)
+        )
+
+        result = await estimate_encounter_difficulty(ctx, [MonsterSelection(type="orc", count=2)])
+        assert "Estimated difficulty" in result
+        assert "Party win probability" in result
+
+        state_manager.characters.clear()
+        result = await estimate_encounter_difficulty(ctx, [MonsterSelection(type="orc", count=2)])
+        assert result.startswith("Error: No party loaded")
@@ -0,0 +1,127 @@
+"""
+Tests for multi-process gateway/worker mode.
+
+Tests cover:
+- Consistent hash ring balance and stability when workers are added
+- Routing raw gateway events to the owning worker or broadcasting them
+- SessionPool scoping (owns_channel) and ownership claims
+"""
+
+import json
+import uuid
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+from src.discord.bot import create_intents
+from src.discord.gateway import GatewayClient, routing_channel_id
+from src.discord.utils.hash_ring import ConsistentHashRing
+from src.discord.utils.session_pool import SessionHibernationStore, SessionPool
+
+CHANNEL_IDS = [1_100_000_000_000_000_000 + i * 7919 for i in range(4000)]
+
+
+class TestConsistentHashRing:
+    """Tests for channel → worker assignment."""
+
+    def test_assignment_is_deterministic(self):
+        assert [ConsistentHashRing(4).worker_for(c) for c in CHANNEL_IDS[:50]] == \
+               [ConsistentHashRing(4).worker_for(c) for c in CHANNEL_IDS[:50]]
+
+    def test_channels_spread_across_workers(self):
+        ring = ConsistentHashRing(4)
+        counts = [0] * 4
+        for channel_id in CHANNEL_IDS:
+            counts[ring.worker_for(channel_id)] += 1
+        assert min(counts) > len(CHANNEL_IDS) / 4 * 0.6
+
+    def test_adding_worker_moves_few_channels(self):
+        before, after = ConsistentHashRing(4), ConsistentHashRing(5)
+        moved = [c for c in CHANNEL_IDS if before.worker_for(c) != after.worker_for(c)]
+
+        # Only channels taken over by the new worker move
+        assert all(after.worker_for(c) == 4 for c in moved)
+        assert len(moved) < len(CHANNEL_IDS) * 0.35
+
+    def test_requires_a_worker(self):
+        with pytest.raises(ValueError):
+            ConsistentHashRing(0)
+
+
+class TestGatewayRouting:
+    """Tests for GatewayClient event routing."""
+
+    def make_gateway(self, worker_count=3):
+        gateway = GatewayClient("token", worker_count, create_intents())
+        gateway.workers = [Mock(worker_id=i) for i in range(worker_count)]
+        return gateway
+
+    @staticmethod
+    def raw(event_type, data):
+        return json.dumps({"op": 0, "t": event_type, "s": 1, "d": data})
+
+    def test_routing_channel_id(self):
+        assert routing_channel_id("MESSAGE_CREATE", {"channel_id": "42"}) == 42
+        assert routing_channel_id("INTERACTION_CREATE", {"channel": {"id": "43"}}) == 43
+        assert routing_channel_id("GUILD_CREATE", {"id": "1"}) is None
+
+    @pytest.mark.asyncio
+    async def test_channel_events_go_to_owner(self):
+        gateway = self.make_gateway()
+        channel_id = CHANNEL_IDS[0]
+        owner = gateway.ring.worker_for(channel_id)
+
+        raw = self.raw("MESSAGE_CREATE", {"channel_id": str(channel_id)})
+        await gateway.on_socket_raw_receive(raw)
+
+        for worker in gateway.workers:
+            if worker.worker_id == owner:
+                worker.send_event.assert_called_once_with(raw)
+            else:
+                worker.send_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_guild_events_broadcast_and_replayed(self):
+        gateway = self.make_gateway()
+        ready = self.raw("READY", {"guilds": []})
+        guild = self.raw("GUILD_CREATE", {"id": "7"})
+        heartbeat = json.dumps({"op": 11, "d": None})
+
+        for raw in (ready, guild, heartbeat):
+            await gateway.on_socket_raw_receive(raw)
+
+        for worker in gateway.workers:
+            assert [c.args[0] for c in worker.send_event.call_args_list] == [ready, guild]
+        assert gateway._replay() == [ready, guild]
+
+        await gateway.on_socket_raw_receive(self.raw("GUILD_DELETE", {"id": "7"}))
+        assert gateway._replay() == [ready]
+
+
+class TestPoolScoping:
+    """Tests for SessionPool ownership in worker mode."""
+
+    def test_hibernated_index_only_includes_owned_channels(self, tmp_path):
+        store = SessionHibernationStore(str(tmp_path))
+        for channel_id in (1, 2):
+            store.save({
+                "guild_id": 1,
+                "channel_id": channel_id,
+                "session_db_id": str(uuid.uuid4()),
+                "hibernated_at": datetime.now().isoformat(),
+                "state": {},
+            })
+
+        pool = SessionPool(hibernation_store=store, owns_channel=lambda channel_id: channel_id == 2)
+
+        assert not pool.has_session(1)
+        assert pool.is_hibernated(2)
+
+    @pytest.mark.asyncio
+    async def test_create_refused_when_owned_elsewhere(self):
+        ownership = Mock()
+        ownership.claim = AsyncMock(return_value=False)
+        pool = SessionPool(ownership=ownership)
+
+        with pytest.raises(ValueError, match="another worker"):
+            await pool.create_session(10, 1, "guild")
@@ -17,7 +17,8 @@ from src.models.state_commands_optimized import (
     HPChangeCommand,
     SpellSlotCommand,
     HitDiceCommand,
-    ItemCommand
+    ItemCommand,
+    get_target_ids
 )
 
 
@@ -338,7 +339,8 @@ class TestAgentIntegration:
 
         # Extract with HP agent
         hp_result = run_async(hp_agent.extract(narrative))
-        assert len(hp_result.commands) >= 3, "HP agent should find damage to orcs"
+        damaged = [cid for cmd in hp_result.commands for cid in get_target_ids(cmd)]
+        assert len(damaged) >= 3, "HP agent should find damage to orcs"
 
         # Extract with Resource agent
         resource_result = run_async(resource_agent.extract(narrative))
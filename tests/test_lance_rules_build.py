@@ -0,0 +1,76 @@
+"""
+Tests for building the rules table with LanceRulesService.load_from_files.
+
+Tests cover:
+- Incremental rebuilds only re-embed changed rules and delete vanished ones
+- Entries changed only through a referenced rule keep their stored vectors
+- Builds create ANN and scalar indexes and clean up old table versions
+"""
+
+from src.db import lance_rules_service
+
+
+class TestIncrementalBuild:
+    """load_from_files(mode="incremental")."""
+
+    def test_incremental_rebuild_upserts_changes(self, build_rules_table, fake_embedder):
+        embedder = fake_embedder()
+        service, first = build_rules_table(build_rules_table.spells(5), embed_documents=embedder, mode="incremental")
+        assert first["mode"] == "overwrite"  # No table yet
+        assert first["total_entries"] == 5
+
+        spells = build_rules_table.rendered_dir / "spell"
+        (spells / "spell_2_XPHB.md").write_text("# Spell 2\nSummons a kraken.")
+        (spells / "spell_4_XPHB.md").unlink()
+        (build_rules_table.metadata_dir / "spell" / "spell_4_XPHB.json").unlink()
+        embedder.calls.clear()
+
+        stats = build_rules_table.load(service, mode="incremental")
+
+        assert stats["mode"] == "incremental"
+        assert (stats["unchanged_entries"], stats["upserted_entries"], stats["deleted_entries"]) == (3, 1, 1)
+        assert embedder.calls == [["# Spell 2\nSummons a kraken."]]
+        assert service.table.count_rows() == stats["total_entries"] == 4
+        hits = service.table.search("kraken", query_type="fts").select(["id"]).to_list()
+        assert [hit["id"] for hit in hits] == ["Spell 2|XPHB"]
+
+        unchanged = build_rules_table.load(service, mode="incremental")
+        assert unchanged["upserted_entries"] == 0
+        assert service.table.count_rows() == 4
+
+
+    def test_referenced_rule_edit_reuses_referrer_vectors(self, build_rules_table, fake_embedder):
+        embedder = fake_embedder()
+        service, _ = build_rules_table(build_rules_table.spells(5), embed_documents=embedder)
+        before = service.get_by_id("Spell 3|XPHB")
+
+        # Every spell references Spell 0, so its summary reaches all their references blocks
+        (build_rules_table.rendered_dir / "spell" / "spell_0_XPHB.md").write_text("# Spell 0\nDeals 2d6 Fire damage.")
+        embedder.calls.clear()
+
+        stats = build_rules_table.load(service, mode="incremental")
+
+        assert (stats["upserted_entries"], stats["reused_vectors"]) == (5, 4)
+        assert embedder.calls == [["# Spell 0\nDeals 2d6 Fire damage."]]
+        after = service.get_by_id("Spell 3|XPHB")
+        assert after["references_block"] != before["references_block"]
+        assert list(after["vector"]) == list(before["vector"])
+        assert list(after["local_vector"]) == list(before["local_vector"])
+
+
+class TestBuildIndexes:
+    """Index creation and table maintenance after a build."""
+
+    def test_build_creates_indexes(self, monkeypatch, build_rules_table, fake_embedder):
+        monkeypatch.setattr(lance_rules_service, "VECTOR_INDEX_MIN_ROWS", 256)
+        service, _ = build_rules_table(build_rules_table.spells(300), embed_documents=fake_embedder())
+        stats = build_rules_table.load(service)
+
+        assert set(stats["indexes"]) == {"content_idx", "vector_idx", "local_vector_idx", "id_idx", "name_idx", "type_idx"}
+        assert stats["versions_removed"] > 0
+        assert len(service.table.list_versions()) <= 2  # optimize() commits after its cleanup
+
+        service._get_embedding = lambda text: [float(len("# Spell 42\nDoes thing 42."))] * build_rules_table.dims
+        results = service.search("thing 42", limit=3, expand_references=False, filter_type="spell")
+        assert "Spell 42|XPHB" in [result["id"] for result in results]
+        assert service.get_by_id("Spell 42|XPHB")["name"] == "Spell 42"
@@ -744,6 +744,45 @@ class TestMonsterStateCommandExecutor:
         assert result.success is False
         assert "not found" in result.message
 
+    def test_area_effect_applies_saves_and_modifiers(self, executor, goblin, orc_chief):
+        """Test AreaEffectCommand resolves saves and damage modifiers per target."""
+        from src.models.state_commands_optimized import AreaEffectCommand
+
+        orc_chief.damage_modifiers.resistances.append("fire")
+        command = AreaEffectCommand(
+            character_ids=["goblin_1", "orc_chief"],
+            damage=20,
+            damage_type=DamageType.FIRE,
+            saved=["orc_chief"],
+            effect_name="Fireball"
+        )
+
+        result = executor.execute_command(command)
+
+        assert result.success is True
+        assert goblin.hit_points.current == 0
+        assert orc_chief.hit_points.current == 45 - 5  # Half on save, then resistance
+        assert [t["damage_amount"] for t in result.details["targets"]] == [20, 5]
+        assert "Fireball" in result.message
+
+    def test_area_effect_reports_missing_targets(self, executor, orc_chief):
+        """Test AreaEffectCommand still damages found targets when some are missing."""
+        from src.models.state_commands_optimized import AreaEffectCommand
+
+        orc_chief.damage_modifiers.immunities.append("poison")
+        command = AreaEffectCommand(
+            character_ids=["orc_chief", "goblin_9"],
+            damage=12,
+            damage_type=DamageType.POISON
+        )
+
+        result = executor.execute_command(command)
+
+        assert result.success is False
+        assert orc_chief.hit_points.current == 45
+        assert result.details["targets"][0]["damage_modifier"] == "immune"
+        assert result.details["not_found"] == ["goblin_9"]
+
 
 # ==================== StateManager Monster Support Tests ====================
 
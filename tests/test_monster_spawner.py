@@ -7,8 +7,10 @@ This test suite verifies:
 3. Available monsters context generation
 4. Integration with StateManager
 5. Error handling for invalid monster types
+6. Catalog index filtering, persistence and mtime invalidation
 """
 
+import os
 import pytest
 from pathlib import Path
 from typing import Dict
@@ -427,3 +429,81 @@ class TestRealTemplates:
         assert giant is not None
         assert giant.meta.size == "Huge"
         assert giant.challenge.rating == "5"
+
+
+# ==================== Catalog Index Tests ====================
+
+
+class TestMonsterCatalog:
+    """Test suite for the indexed, filterable template catalog."""
+
+    def test_filters(self, mock_spawner):
+        """Test CR range, type and size filters."""
+        assert [t.type_name for t in mock_spawner.get_available_monster_types(cr_max=0.25)] == ["goblin"]
+        assert [t.type_name for t in mock_spawner.get_available_monster_types(cr_min=0.5)] == ["orc"]
+        assert len(mock_spawner.get_available_monster_types(creature_type="Humanoid")) == 2
+        assert [t.type_name for t in mock_spawner.get_available_monster_types(size="medium")] == ["orc"]
+        assert mock_spawner.get_available_monster_types(creature_type="dragon") == []
+
+    def test_environment_filter_on_real_templates(self, monster_spawner):
+        """Test environment filter using the bundled templates' meta.environment."""
+        types = monster_spawner.get_available_monster_types(environment="underdark", creature_type="humanoid")
+        assert {t.type_name for t in types} == {"goblin", "orc"}
+
+    def test_index_is_persisted_and_reused(self, state_manager, mock_spawner, mock_catalog_path):
+        """Test that a second spawner reads the persisted index instead of loading templates."""
+        mock_spawner.get_available_monster_types()
+        assert (Path(mock_catalog_path) / ".catalog_index.json").exists()
+
+        fresh = MonsterSpawner(state_manager=state_manager, catalog_path=mock_catalog_path)
+        assert len(fresh.get_available_monster_types()) == 2
+        assert fresh._template_cache == {}
+
+    def test_index_invalidated_by_mtime(self, mock_spawner, mock_catalog_path):
+        """Test that edited, added and deleted templates are picked up."""
+        mock_spawner.get_available_monster_types()
+        catalog = Path(mock_catalog_path)
+
+        goblin_path = catalog / "goblin.json"
+        edited = goblin_path.read_text().replace('"Small"', '"Tiny"')
+        goblin_path.write_text(edited)
+        stat = goblin_path.stat()
+        os.utime(goblin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (catalog / "wolf.json").write_text(edited.replace("Goblin", "Wolf"))
+        (catalog / "orc.json").unlink()
+
+        types = {t.type_name: t for t in mock_spawner.get_available_monster_types()}
+        assert set(types) == {"goblin", "wolf"}
+        assert types["goblin"].size == "Tiny"
+
+    def test_queries_skip_scan_while_directory_unchanged(self, mock_spawner, mock_catalog_path):
+        """Test that repeated lookups stat only the directory, and new files still show up."""
+        catalog = mock_spawner.catalog
+        catalog.refresh_interval = 60
+        catalog.names()
+        scans = []
+        scan = catalog._scan
+        catalog._scan = lambda: scans.append(1) or scan()
+
+        mock_spawner.spawn_monsters([{"type": "goblin", "count": 1}, {"type": "orc", "count": 1}])
+        mock_spawner.get_available_monster_types(cr_max=1)
+        assert scans == []
+
+        (Path(mock_catalog_path) / "wolf.json").write_text((Path(mock_catalog_path) / "goblin.json").read_text())
+        assert "wolf" in catalog
+        assert "wolf" in catalog.names()
+        assert scans == [1]
+
+    def test_context_limit_and_filters(self, mock_spawner):
+        """Test that DM context is truncated and reports empty filter results."""
+        context = mock_spawner.get_available_monsters_context(limit=1)
+        assert "goblin" in context
+        assert "- orc" not in context
+        assert "1 more" in context
+
+        assert "match" in mock_spawner.get_available_monsters_context(creature_type="dragon")
+
+    def test_unknown_type_suggests_close_names(self, mock_spawner):
+        """Test that unknown types suggest similar template names."""
+        with pytest.raises(ValueError, match="Did you mean: goblin"):
+            mock_spawner.spawn_monsters([{"type": "goblins", "count": 1}])
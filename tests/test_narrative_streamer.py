@@ -0,0 +1,179 @@
+"""
+Tests for streamed DM narration.
+
+Tests cover:
+- Partial narrative extraction from streamed structured output
+- Throttled placeholder editing and rollover past Discord's message limit
+- Streaming through DungeonMasterAgent.process_message
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.test import TestModel
+
+from src.agents.dungeon_master import DungeonMasterAgent, extract_partial_narrative
+from src.discord.utils.narrative_streamer import (
+    NarrativeStreamer,
+    PLACEHOLDER_TEXT,
+    split_for_discord,
+)
+
+
+def make_channel():
+    """Create a fake channel whose send() returns editable fake messages."""
+    channel = Mock()
+    sent = []
+
+    async def send(content):
+        msg = Mock()
+        msg.content = content
+
+        async def edit(content):
+            msg.content = content
+
+        msg.edit = AsyncMock(side_effect=edit)
+        msg.delete = AsyncMock()
+        sent.append(msg)
+        return msg
+
+    channel.send = AsyncMock(side_effect=send)
+    channel.sent = sent
+    return channel
+
+
+class TestExtractPartialNarrative:
+    """Tests for parsing the narrative out of partial responses."""
+
+    def test_partial_tool_call_args(self):
+        response = ModelResponse(parts=[
+            ToolCallPart(tool_name="final_result", args='{"narrative": "The goblin sna')
+        ])
+        assert extract_partial_narrative(response) == "The goblin sna"
+
+    def test_dict_tool_call_args(self):
+        response = ModelResponse(parts=[
+            ToolCallPart(tool_name="final_result", args={"narrative": "Done.", "game_step_completed": True})
+        ])
+        assert extract_partial_narrative(response) == "Done."
+
+    def test_json_text_output(self):
+        response = ModelResponse(parts=[TextPart(content='{"narrative": "Roll for')])
+        assert extract_partial_narrative(response) == "Roll for"
+
+    def test_narrative_not_started(self):
+        response = ModelResponse(parts=[TextPart(content='{"narr')])
+        assert extract_partial_narrative(response) is None
+
+
+class TestNarrativeStreamer:
+    """Tests for progressive Discord rendering."""
+
+    def test_split_for_discord(self):
+        assert split_for_discord("") == []
+        assert split_for_discord("abc", chunk_size=2) == ["ab", "c"]
+
+    @pytest.mark.asyncio
+    async def test_first_update_fills_placeholder(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel, min_edit_interval=0)
+
+        await streamer.start()
+        await streamer.update(0, "The door creaks")
+        await streamer.finalize(["The door creaks open."])
+
+        assert len(channel.sent) == 1
+        assert channel.sent[0].content == "**DM:** The door creaks open."
+        channel.sent[0].delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_updates_are_throttled(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel, min_edit_interval=60)
+
+        await streamer.start()
+        await streamer.update(0, "A")
+        await streamer.update(0, "AB")  # Within interval - skipped
+        assert channel.sent[0].content == "**DM:** A"
+
+        await streamer.finalize(["ABC"])
+        assert channel.sent[0].content == "**DM:** ABC"
+
+    @pytest.mark.asyncio
+    async def test_rolls_over_into_new_messages(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel, min_edit_interval=0, chunk_size=10)
+
+        await streamer.start()
+        await streamer.finalize(["0123456789abc"])
+
+        contents = [m.content for m in channel.sent]
+        assert "".join(contents) == "**DM:** 0123456789abc"
+        assert all(len(c) <= 10 for c in contents)
+
+    @pytest.mark.asyncio
+    async def test_shorter_final_text_deletes_stale_messages(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel, min_edit_interval=0, chunk_size=10)
+
+        await streamer.start()
+        await streamer.update(0, "0123456789abcdefghij")
+        assert len(channel.sent) == 3
+
+        await streamer.finalize(["0"])
+
+        assert channel.sent[0].content == "**DM:** 0"
+        channel.sent[0].delete.assert_not_called()
+        channel.sent[1].delete.assert_called_once()
+        channel.sent[2].delete.assert_called_once()
+        assert streamer._messages[0] == [channel.sent[0]]
+        assert streamer._rendered[0] == ["**DM:** 0"]
+
+    @pytest.mark.asyncio
+    async def test_multiple_responses_get_separate_messages(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel, min_edit_interval=0)
+
+        await streamer.start()
+        await streamer.update(0, "First")
+        await streamer.finalize(["First.", "Second."])
+
+        assert [m.content for m in channel.sent] == ["**DM:** First.", "**DM:** Second."]
+
+    @pytest.mark.asyncio
+    async def test_abort_removes_unused_placeholder(self):
+        channel = make_channel()
+        streamer = NarrativeStreamer(channel)
+
+        await streamer.start()
+        assert channel.sent[0].content == PLACEHOLDER_TEXT
+        await streamer.abort()
+
+        channel.sent[0].delete.assert_called_once()
+
+
+class TestStreamedProcessMessage:
+    """Tests for DungeonMasterAgent streaming mode."""
+
+    @pytest.mark.asyncio
+    async def test_streams_narrative_and_returns_output(self):
+        agent = DungeonMasterAgent.__new__(DungeonMasterAgent)
+        agent.tools = []
+        agent.model = TestModel(custom_output_args={
+            "narrative": "The goblin lunges!",
+            "game_step_completed": False,
+            "awaiting_response": {"characters": ["fighter"], "response_type": "action"},
+        })
+        agent.agent = agent._create_agent()
+
+        seen = []
+
+        async def on_narrative(text):
+            seen.append(text)
+
+        result = await agent.process_message("context", on_narrative=on_narrative)
+
+        assert result.output.narrative == "The goblin lunges!"
+        assert result.usage().requests == 1
+        assert seen[-1] == "The goblin lunges!"
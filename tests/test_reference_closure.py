@@ -0,0 +1,132 @@
+"""
+Tests for build-time reference closures.
+
+Tests cover:
+- Breadth-first closures with hop counts, cycles and the depth limit
+- The pre-rendered references block and content summary lines
+- Validation of stale closures and closures with missing entries
+- load_from_files storing closures and search expanding without per-entry fetches
+"""
+
+import pytest
+
+from src.db.reference_closure import (
+    build_reference_closures,
+    render_references_block,
+    summary_line,
+    validate_reference_closures,
+)
+
+REFERENCES = {
+    "Grappled|XPHB": ["Speed|XPHB", "Prone|XPHB"],
+    "Prone|XPHB": ["Speed|XPHB", "Crawling|XPHB"],
+    "Speed|XPHB": ["Grappled|XPHB"],  # Cycle back to the root
+    "Crawling|XPHB": ["Difficult Terrain|XPHB"],
+    "Difficult Terrain|XPHB": [],
+}
+
+
+class TestBuildReferenceClosures:
+    """Tests for build_reference_closures."""
+
+    def test_breadth_first_with_hops(self):
+        closures = build_reference_closures(REFERENCES, depth=2)
+
+        assert closures["Grappled|XPHB"] == (["Speed|XPHB", "Prone|XPHB", "Crawling|XPHB"], [1, 1, 2])
+        assert closures["Difficult Terrain|XPHB"] == ([], [])
+
+    def test_depth_limit(self):
+        closures = build_reference_closures(REFERENCES, depth=3)
+
+        assert closures["Grappled|XPHB"][0][-1] == "Difficult Terrain|XPHB"
+        assert closures["Grappled|XPHB"][1][-1] == 3
+        assert build_reference_closures(REFERENCES, depth=1)["Prone|XPHB"] == (
+            ["Speed|XPHB", "Crawling|XPHB"], [1, 1]
+        )
+
+
+class TestReferencesBlock:
+    """Tests for render_references_block and summary_line."""
+
+    def test_block_lists_direct_then_indirect(self):
+        entries = {
+            entry_id: {"name": entry_id.split("|")[0], "type": "condition", "content": f"# {entry_id}\n*Rule.* Text"}
+            for entry_id in REFERENCES
+        }
+        closure = build_reference_closures(REFERENCES)["Grappled|XPHB"]
+
+        block = render_references_block(closure, entries)
+
+        assert block.splitlines() == [
+            "• Speed (condition): Rule. Text",
+            "• Prone (condition): Rule. Text",
+            "Also referenced: Crawling",
+        ]
+
+    def test_summary_line_truncates(self):
+        assert summary_line("# Title\n\n" + "word " * 100, width=20) == "word word word word…"
+        assert summary_line("# Only a heading") == ""
+
+
+class TestValidateReferenceClosures:
+    """Tests for validate_reference_closures."""
+
+    def rows(self):
+        closures = build_reference_closures(REFERENCES)
+        return [
+            {"id": entry_id, "references": refs,
+             "reference_closure": closures[entry_id][0], "reference_closure_depth": closures[entry_id][1]}
+            for entry_id, refs in REFERENCES.items()
+        ]
+
+    def test_current_closures_pass(self):
+        assert validate_reference_closures(self.rows()) == []
+
+    def test_stale_and_missing(self):
+        rows = [row for row in self.rows() if row["id"] != "Crawling|XPHB"]
+        rows[0]["references"] = ["Speed|XPHB"]  # Grappled no longer references Prone
+
+        problems = validate_reference_closures(rows)
+
+        assert "Grappled|XPHB: stale reference closure" in problems
+        assert any(problem.startswith("Prone|XPHB: closure references missing entries Crawling|XPHB")
+                   for problem in problems)
+
+
+class TestServiceClosures:
+    """load_from_files and search with stored closures."""
+
+    @pytest.fixture
+    def built(self, build_rules_table):
+        return build_rules_table([
+            {"name": entry_id.split("|")[0], "text": f"About {entry_id.split('|')[0]}.", "references": refs}
+            for entry_id, refs in REFERENCES.items()
+        ])
+
+    def test_build_stores_and_validates_closures(self, built):
+        service, stats = built
+
+        grappled = service.get_by_id("Grappled|XPHB")
+        assert list(grappled["reference_closure"]) == ["Speed|XPHB", "Prone|XPHB", "Crawling|XPHB"]
+        assert "• Prone (condition): About Prone." in grappled["references_block"]
+        assert stats["closure_problems"] == []
+        assert service.validate_reference_closures() == []
+
+    def test_search_expands_without_per_entry_fetches(self, built):
+        service, _ = built
+        service._get_embedding = lambda query: [1.0] + [0.0] * 767
+        service.get_by_id = lambda entry_id: (_ for _ in ()).throw(AssertionError(f"fetched {entry_id}"))
+
+        results = service.search("grappled", limit=5, max_depth=2)
+
+        grappled = next(result for result in results if result["id"] == "Grappled|XPHB")
+        prone = next(ref for ref in grappled["expanded_references"] if ref["id"] == "Prone|XPHB")
+        assert [ref["id"] for ref in prone["expanded_references"]] == ["Crawling|XPHB"]  # Speed already expanded
+
+    def test_format_for_context_uses_block(self, built):
+        service, _ = built
+
+        context = service.format_for_context([service.get_by_id("Grappled|XPHB")])
+
+        assert "--- Referenced Rules for Grappled ---" in context
+        assert "Also referenced: Crawling" in context
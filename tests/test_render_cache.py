@@ -0,0 +1,139 @@
+"""
+Tests for the versioned render cache of character sheets and monster statblocks.
+
+Tests cover:
+- Repeated renders of an unchanged entity are served from the cache
+- Mutations (entity methods and StateCommandExecutor commands) invalidate renders
+- Copies of the same character in different sessions never share renders
+- LRU bound on cache size
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+from src.characters.charactersheet import Character
+from src.characters.character_components import AbilityScores, AbilityScoreEntry
+from src.characters.monster import Monster
+from src.characters.monster_components import (
+    ChallengeRating,
+    MonsterArmorClass,
+    MonsterHitPoints,
+    MonsterMeta,
+    MonsterSenses,
+    MonsterSpeed,
+    SpeedEntry,
+)
+from src.characters.render_cache import RenderCache, get_render_cache
+from src.memory.state_command_executor import StateCommandExecutor
+from src.models.state_commands_optimized import HPChangeCommand, SpellSlotCommand
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+def load_character(character_id: str) -> Character:
+    return Character(**json.loads((CHARACTERS_DIR / f"{character_id}.json").read_text()))
+
+
+def make_goblin() -> Monster:
+    return Monster(
+        character_id="goblin_1",
+        name="Goblin 1",
+        meta=MonsterMeta(size="Small", type="humanoid", alignment="neutral evil"),
+        attributes=AbilityScores(
+            strength=AbilityScoreEntry(score=8),
+            dexterity=AbilityScoreEntry(score=14),
+            constitution=AbilityScoreEntry(score=10),
+            intelligence=AbilityScoreEntry(score=10),
+            wisdom=AbilityScoreEntry(score=8),
+            charisma=AbilityScoreEntry(score=8),
+        ),
+        armor_class=MonsterArmorClass(value=15),
+        hit_points=MonsterHitPoints(average=7, formula="2d6"),
+        speed=MonsterSpeed(walk=SpeedEntry(value=30)),
+        senses=MonsterSenses(passive_perception=9),
+        challenge=ChallengeRating(rating="1/4", xp=50),
+        proficiency_bonus=2,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    get_render_cache().clear()
+    yield
+    get_render_cache().clear()
+
+
+class TestCharacterRenders:
+    """Tests for cached Character sheet rendering."""
+
+    def test_repeated_render_is_cached(self):
+        fighter = load_character("fighter")
+        cache = get_render_cache()
+        misses = cache.misses
+
+        first = fighter.get_full_sheet()
+        second = fighter.get_full_sheet()
+
+        assert first is second
+        assert cache.misses == misses + 1
+
+    def test_take_damage_invalidates(self):
+        fighter = load_character("fighter")
+        before = fighter.get_full_sheet()
+
+        fighter.take_damage(5)
+
+        after = fighter.get_full_sheet()
+        assert after != before
+        assert f"{fighter.combat_stats.hit_points.current}/" in after
+
+    def test_executor_command_invalidates(self):
+        wizard = load_character("wizard")
+        executor = StateCommandExecutor(lambda character_id: wizard)
+        sheet_before = wizard.get_full_sheet()
+
+        result = executor.execute_command(
+            SpellSlotCommand(character_id=wizard.character_id, action="use", level=1)
+        )
+
+        assert result.success
+        assert wizard.get_full_sheet() != sheet_before
+
+    def test_copies_in_different_sessions_do_not_collide(self):
+        session_a = load_character("fighter")
+        session_b = load_character("fighter")
+        StateCommandExecutor(lambda character_id: session_b).execute_command(
+            HPChangeCommand(character_id="fighter", change=-4)
+        )
+
+        assert session_a.get_full_sheet() != session_b.get_full_sheet()
+        assert session_a.get_full_sheet() == load_character("fighter").get_full_sheet()
+
+
+class TestMonsterRenders:
+    """Tests for cached Monster statblock rendering."""
+
+    def test_statblock_invalidated_by_damage(self):
+        goblin = make_goblin()
+        before = goblin.get_full_statblock()
+        assert goblin.get_full_statblock() is before
+
+        goblin.take_damage(3)
+
+        assert goblin.get_full_statblock() != before
+
+
+class TestRenderCache:
+    """Tests for the RenderCache container."""
+
+    def test_lru_bound(self):
+        cache = RenderCache(max_entries=2)
+        cache.get_or_render("a", 1, "sheet", lambda: "a1")
+        cache.get_or_render("b", 1, "sheet", lambda: "b1")
+        cache.get_or_render("a", 1, "sheet", lambda: "unused")  # Refresh a
+        cache.get_or_render("c", 1, "sheet", lambda: "c1")  # Evicts b
+
+        assert len(cache) == 2
+        assert cache.get_or_render("a", 1, "sheet", lambda: "a-rerendered") == "a1"
+        assert cache.get_or_render("b", 1, "sheet", lambda: "b-rerendered") == "b-rerendered"
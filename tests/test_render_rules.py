@@ -0,0 +1,136 @@
+"""
+Tests for the parallel rules rendering pipeline (render_rules.py).
+
+Tests cover:
+- Large inputs are sharded and all shards are merged into one type directory
+- Unchanged inputs are skipped on the next run (and re-rendered with force)
+- JSON-lines progress output
+- A failing renderer leaves existing output and the manifest untouched
+"""
+
+import json
+import sys
+
+import pytest
+
+from render_rules import MANIFEST_NAME, Progress, render_all, shard_input
+
+FAKE_RENDERER = '''
+import json, sys
+from pathlib import Path
+
+args = dict(zip(sys.argv[1::2], sys.argv[2::2]))
+data = json.loads(Path(args["--input"]).read_text())
+if data.get("fail"):
+    sys.exit("renderer crashed")
+out = Path(args["--output-dir"])
+for entry_type, entries in data.items():
+    (out / entry_type).mkdir(parents=True, exist_ok=True)
+    (out / "metadata" / entry_type).mkdir(parents=True, exist_ok=True)
+    for entry in entries:
+        (out / entry_type / f"{entry['name']}.md").write_text(f"# {entry['name']}")
+        (out / "metadata" / entry_type / f"{entry['name']}.json").write_text(json.dumps(entry))
+    print(f"Found {len(entries)} {entry_type} entries")
+    print(f"Completed: {len(entries)} successful, 0 errors")
+'''
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    renderer = tmp_path / "fake_renderer.py"
+    renderer.write_text(FAKE_RENDERER)
+    rules_dir = tmp_path / "rules"
+    rules_dir.mkdir()
+    (rules_dir / "spells.json").write_text(json.dumps({"spell": [{"name": f"spell{i}"} for i in range(25)]}))
+    (rules_dir / "conditions.json").write_text(json.dumps({"condition": [{"name": "prone"}]}))
+
+    def run(**kwargs):
+        options = dict(
+            rules_dir=rules_dir,
+            rendered_rules_dir=tmp_path / "rendered_rules",
+            metadata_dir=tmp_path / "metadata",
+            renderer_command=[sys.executable, str(renderer)],
+            renderer_script=renderer,
+            rule_files=["spells.json", "conditions.json", "missing.json"],
+            jobs=4,
+            shard_size=10,
+            temp_output_dir=tmp_path / "temp",
+            progress=Progress(as_json=True),
+        )
+        options.update(kwargs)
+        return {result["file"]: result for result in render_all(**options)}
+
+    return tmp_path, run
+
+
+class TestRenderAll:
+    """Tests for render_all."""
+
+    def test_shards_are_rendered_and_merged(self, pipeline, capsys):
+        tmp_path, run = pipeline
+
+        results = run()
+
+        assert results["spells.json"]["status"] == "success"
+        assert results["spells.json"]["shards"] == 3
+        assert results["spells.json"]["entries"] == 25
+        assert results["missing.json"]["status"] == "skipped"
+        assert len(list((tmp_path / "rendered_rules" / "spell").glob("*.md"))) == 25
+        assert len(list((tmp_path / "metadata" / "spell").glob("*.json"))) == 25
+        assert (tmp_path / "rendered_rules" / "condition" / "prone.md").exists()
+        assert not (tmp_path / "temp").exists()
+
+        events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        shard_events = [event for event in events if event["event"] == "shard_done"]
+        assert len(shard_events) == 4
+        assert shard_events[-1]["done"] == shard_events[-1]["total"] == 4
+
+    def test_unchanged_inputs_are_skipped(self, pipeline):
+        tmp_path, run = pipeline
+        run()
+
+        (tmp_path / "rules" / "conditions.json").write_text(
+            json.dumps({"condition": [{"name": "prone"}, {"name": "grappled"}]})
+        )
+        results = run()
+
+        assert results["spells.json"]["status"] == "unchanged"
+        assert results["conditions.json"]["entries"] == 2
+        assert len(list((tmp_path / "rendered_rules" / "spell").glob("*.md"))) == 25
+
+        assert run(force=True)["spells.json"]["status"] == "success"
+
+    def test_failed_render_keeps_previous_output(self, pipeline):
+        tmp_path, run = pipeline
+        run()
+        manifest = json.loads((tmp_path / "rendered_rules" / MANIFEST_NAME).read_text())
+
+        (tmp_path / "rules" / "conditions.json").write_text(json.dumps({"condition": [], "fail": True}))
+        results = run()
+
+        assert results["conditions.json"]["status"] == "error"
+        assert "renderer crashed" in results["conditions.json"]["reason"]
+        assert (tmp_path / "rendered_rules" / "condition" / "prone.md").exists()
+        assert json.loads((tmp_path / "rendered_rules" / MANIFEST_NAME).read_text()) == manifest
+
+
+class TestShardInput:
+    """Tests for shard_input."""
+
+    def test_small_or_unknown_inputs_are_not_split(self, tmp_path):
+        small = tmp_path / "small.json"
+        small.write_text(json.dumps({"spell": [{"name": "a"}]}))
+        mixed = tmp_path / "mixed.json"
+        mixed.write_text(json.dumps({"spell": [{}] * 50, "item": [{}] * 50}))
+
+        assert shard_input(small, tmp_path / "shards", 10) == [small]
+        assert shard_input(mixed, tmp_path / "shards", 10) == [mixed]
+
+    def test_shards_keep_shape_and_name(self, tmp_path):
+        source = tmp_path / "spells.json"
+        source.write_text(json.dumps({"_meta": {"v": 1}, "spell": [{"name": str(i)} for i in range(5)]}))
+
+        shards = shard_input(source, tmp_path / "shards", 2)
+
+        assert [shard.name for shard in shards] == ["spells.json"] * 3
+        assert json.loads(shards[-1].read_text()) == {"_meta": {"v": 1}, "spell": [{"name": "4"}]}
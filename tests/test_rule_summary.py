@@ -0,0 +1,74 @@
+"""
+Tests for build-time rule summaries.
+
+Tests cover:
+- Mechanics from 5etools metadata (level, school, action cost, range, duration)
+- Mechanics from rendered text (area, save, damage, conditions, bonuses)
+- First-sentence fallback and the token budget
+- load_from_files storing summaries
+"""
+
+from src.db.rule_summary import estimate_tokens, summarize_rule
+
+FIREBALL = """### Fireball
+
+A bright streak flashes from you to a point you choose within range and then
+blossoms with a low roar into a fiery explosion. Each creature in a 20-foot-radius
+Sphere centered on that point makes a Dexterity saving throw, taking 8d6 Fire
+damage on a failed save or half as much damage on a successful one.
+"""
+
+
+class TestSummarizeRule:
+    """Tests for summarize_rule."""
+
+    def test_spell_mechanics(self):
+        metadata = {"type": "spell", "level": 3, "school": "V", "time": [{"number": 1, "unit": "action"}],
+                    "range": {"type": "point", "distance": {"type": "feet", "amount": 150}},
+                    "duration": [{"type": "instant"}]}
+
+        assert summarize_rule(FIREBALL, metadata) == (
+            "Level 3 Evocation; 1 action; 150 ft; 20-ft Sphere; Dex save, half on success; 8d6 Fire; Instantaneous"
+        )
+
+    def test_concentration_and_condition(self):
+        content = ("# Hold Person\nThe target must succeed on a Wisdom saving throw or have the Paralyzed "
+                   "condition for the duration.")
+        metadata = {"type": "spell", "level": 2, "school": "E", "time": [{"number": 1, "unit": "bonus"}],
+                    "duration": [{"type": "timed", "duration": {"type": "minute", "amount": 1}, "concentration": True}]}
+
+        summary = summarize_rule(content, metadata)
+
+        assert summary == "Level 2 Enchantment; 1 bonus action; Wis save; Paralyzed; Concentration, up to 1 minute"
+
+    def test_text_only_mechanics(self):
+        grappled = ("# Grappled\nWhile Grappled, your Speed is 0 and you have Disadvantage on attack rolls "
+                    "against any target other than the grappler.")
+        shield = "# Shield\nUntil the start of your next turn, you have a +5 bonus to AC. As a Reaction, ..."
+
+        assert summarize_rule(grappled, {"type": "condition"}) == "Disadvantage on attack rolls; Speed 0"
+        assert summarize_rule(shield) == "Reaction; +5 AC"
+
+    def test_fallback_to_first_sentence(self):
+        content = "# Cover\nWalls and other obstacles can provide cover. A target benefits only sometimes."
+
+        assert summarize_rule(content, {"type": "variantrule"}) == "Walls and other obstacles can provide cover."
+
+    def test_token_budget(self):
+        content = "# Long Rule\n" + "This rule goes on and on without any mechanics at all " * 20 + "."
+
+        summary = summarize_rule(content, max_tokens=20)
+
+        assert estimate_tokens(summary) <= 20
+        assert summary.endswith("…")
+
+
+class TestBuildSummaries:
+    """load_from_files with summaries."""
+
+    def test_summary_column(self, build_rules_table):
+        service, _ = build_rules_table([
+            {"name": "Fireball", "type": "spell", "level": 3, "school": "V", "markdown": FIREBALL}
+        ])
+
+        assert service.get_by_id("Fireball|XPHB")["summary"].startswith("Level 3 Evocation; 20-ft Sphere")
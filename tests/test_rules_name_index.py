@@ -0,0 +1,98 @@
+"""
+Tests for the fuzzy rules name index.
+
+Tests cover:
+- Casing, punctuation and spacing are normalized
+- Type hints pick between entries sharing a name
+- Parenthetical-free names and common aliases resolve
+- Typos resolve by edit distance; questions and ambiguous typos do not
+- LanceRulesService.find_by_name fetches the resolved entry
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.db.lance_rules_service import LanceRulesService
+from src.db.rules_name_index import RulesNameIndex, edit_distance
+
+ENTRIES = [
+    ("Fireball|XPHB", "Fireball", "spell"),
+    ("Fire Bolt|XPHB", "Fire Bolt", "spell"),
+    ("Fire Shield|XPHB", "Fire Shield", "spell"),
+    ("Shield|XPHB", "Shield", "spell"),
+    ("Shield|XPHB|item", "Shield", "item"),
+    ("Counterspell|XPHB", "Counterspell", "spell"),
+    ("Grappled|XPHB", "Grappled", "condition"),
+    ("Magic Missile|XPHB", "Magic Missile", "spell"),
+    ("Hold Person|XPHB", "Hold Person", "spell"),
+    ("Hold Monster|XPHB", "Hold Monster", "spell"),
+    ("Opportunity Attack|XPHB", "Opportunity Attack", "action"),
+    ("Fight or Flight (Monster Morale)|XDMG", "Fight or Flight (Monster Morale)", "variantrule"),
+]
+
+
+@pytest.fixture
+def index():
+    return RulesNameIndex.from_entries({"id": i, "name": n, "type": t} for i, n, t in ENTRIES)
+
+
+class TestRulesNameIndex:
+    """Tests for name resolution."""
+
+    @pytest.mark.parametrize("query,entry_id,match_type", [
+        ("Fireball", "Fireball|XPHB", "exact"),
+        ("fire ball", "Fireball|XPHB", "exact"),
+        ("Counterspell!", "Counterspell|XPHB", "exact"),
+        ("grappled", "Grappled|XPHB", "exact"),
+        ("the grappled condition", "Grappled|XPHB", "exact"),
+        ("shield spell", "Shield|XPHB", "exact"),
+        ("shield item", "Shield|XPHB|item", "exact"),
+        ("fight or flight", "Fight or Flight (Monster Morale)|XDMG", "alias"),
+        ("AoO", "Opportunity Attack|XPHB", "alias"),
+        ("magic misile", "Magic Missile|XPHB", "fuzzy"),
+        ("hold persn", "Hold Person|XPHB", "fuzzy"),
+        ("fire sheild", "Fire Shield|XPHB", "fuzzy"),
+    ])
+    def test_resolves(self, index, query, entry_id, match_type):
+        match = index.resolve(query)
+        assert match is not None
+        assert (match.entry_id, match.match_type) == (entry_id, match_type)
+
+    @pytest.mark.parametrize("query", [
+        "how does fireball work",
+        "what happens when you are grappled",
+        "fire",  # Too short to tolerate a typo
+        "hold",
+        "",
+    ])
+    def test_questions_and_partial_names_do_not_resolve(self, index, query):
+        assert index.resolve(query) is None
+
+    def test_ambiguous_typo_does_not_resolve(self):
+        index = RulesNameIndex.from_entries([
+            {"id": "Bane|XPHB", "name": "Bane", "type": "spell"},
+            {"id": "Bone|X", "name": "Bone", "type": "item"},
+        ])
+        assert index.resolve("bune") is None
+
+    def test_edit_distance(self):
+        assert edit_distance("fireball", "firebal", 2) == 1
+        assert edit_distance("shield", "sheild", 2) == 1  # Swap
+        assert edit_distance("fireball", "counterspell", 2) == 3  # Capped
+
+
+class TestFindByName:
+    """LanceRulesService.find_by_name."""
+
+    def test_fetches_resolved_entry(self, index):
+        service = LanceRulesService()
+        service.table = Mock()
+        service._fuzzy_name_index = index
+        service.get_by_id = Mock(return_value={"id": "Magic Missile|XPHB"})
+        service._get_embedding = Mock()
+
+        assert service.find_by_name("magic misile") == {"id": "Magic Missile|XPHB"}
+        assert service.find_by_name("how does magic missile work") is None
+        service.get_by_id.assert_called_once_with("Magic Missile|XPHB")
+        service._get_embedding.assert_not_called()
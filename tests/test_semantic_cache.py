@@ -0,0 +1,141 @@
+"""
+Tests for the semantic result cache of rules searches.
+
+Tests cover:
+- Same-text hits (normalized) and semantic hits above the similarity threshold
+- Misses below the threshold and across partitions
+- LRU eviction, invalidation by partition prefix and hit/miss metrics
+- LanceRulesService answering a paraphrased query without a table search
+- search_batch embedding all queries in one provider call
+"""
+
+import pytest
+
+from src.db.semantic_cache import SemanticResultCache
+
+PARTITION = ("db", "rules", "vector", None, 5, 2)
+
+
+class TestSemanticResultCache:
+    """Tests for SemanticResultCache."""
+
+    def test_text_hit_ignores_case_and_spacing(self):
+        cache = SemanticResultCache()
+        cache.put(PARTITION, "How does Fireball work?", [1.0, 0.0], "fireball")
+
+        assert cache.get_by_text(PARTITION, "  how does fireball   WORK?") == "fireball"
+        assert cache.stats()["text_hits"] == 1
+
+    def test_semantic_hit_above_threshold(self):
+        cache = SemanticResultCache(similarity_threshold=0.9)
+        cache.put(PARTITION, "how does grappling work", [1.0, 0.1, 0.0], "grappled")
+
+        assert cache.get_by_text(PARTITION, "grapple rules") is None
+        assert cache.get(PARTITION, "grapple rules", [0.98, 0.15, 0.02]) == "grappled"
+        assert cache.get(PARTITION, "fireball damage", [0.0, 0.2, 1.0]) is None
+
+        stats = cache.stats()
+        assert (stats["semantic_hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_partitions_are_isolated(self):
+        cache = SemanticResultCache()
+        cache.put(PARTITION, "shield", [1.0, 0.0], "any type")
+
+        spells_only = ("db", "rules", "vector", "spell", 5, 2)
+        assert cache.get(spells_only, "shield", [1.0, 0.0]) is None
+        assert cache.get(PARTITION, "shield", [1.0, 0.0]) == "any type"
+
+    def test_lru_eviction(self):
+        cache = SemanticResultCache(max_entries=2)
+        cache.put(PARTITION, "a", [1.0, 0.0, 0.0], "a")
+        cache.put(PARTITION, "b", [0.0, 1.0, 0.0], "b")
+        cache.get_by_text(PARTITION, "a")  # "b" is now least recently used
+        cache.put(PARTITION, "c", [0.0, 0.0, 1.0], "c")
+
+        assert len(cache) == 2
+        assert cache.get(PARTITION, "b", [0.0, 1.0, 0.0]) is None
+        assert cache.get(PARTITION, "a", [1.0, 0.0, 0.0]) == "a"
+        assert cache.stats()["evictions"] == 1
+
+    def test_put_replaces_same_text(self):
+        cache = SemanticResultCache()
+        cache.put(PARTITION, "prone", [1.0, 0.0], "old")
+        cache.put(PARTITION, "Prone", [1.0, 0.0], "new")
+
+        assert len(cache) == 1
+        assert cache.get(PARTITION, "other words", [1.0, 0.0]) == "new"
+
+    def test_invalidate_by_prefix(self):
+        cache = SemanticResultCache()
+        cache.put(PARTITION, "a", [1.0], "a")
+        cache.put(("other_db", "rules", "vector", None, 5, 2), "a", [1.0], "a")
+
+        assert cache.invalidate(("db", "rules")) == 1
+        assert cache.stats()["partitions"] == 1
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+
+class TestServiceResultCache:
+    """LanceRulesService.search through the result cache."""
+
+    @pytest.fixture
+    def service(self, build_rules_table):
+        service, _ = build_rules_table([
+            {"name": "Grappled", "text": "While Grappled, your Speed is 0. See {@condition Prone|XPHB}.",
+             "references": ["Prone|XPHB"]},
+            {"name": "Prone", "text": "A Prone creature's only movement option is to crawl."},
+        ])
+        service.result_cache = SemanticResultCache(similarity_threshold=0.9)
+        return service
+
+    def test_paraphrase_skips_table_search(self, service):
+        embeddings = {
+            "how does grappling work": [1.0, 0.1] + [0.0] * 766,
+            "grapple rules": [1.0, 0.12] + [0.0] * 766,
+        }
+        service._get_embedding = lambda query: embeddings[query]
+
+        first = service.search("how does grappling work", limit=2)
+
+        table_search = service.table.search
+
+        def hybrid_search_not_expected(*args, **kwargs):
+            assert kwargs.get("query_type") != "hybrid", "cache hit must not run hybrid search"
+            return table_search(*args, **kwargs)
+
+        service.table.search = hybrid_search_not_expected
+        second = service.search("grapple rules", limit=2)
+
+        assert [r["id"] for r in second] == [r["id"] for r in first]
+        assert second[0]["_relevance_score"] == first[0]["_relevance_score"]
+        grappled = next(r for r in second if r["id"] == "Grappled|XPHB")
+        assert [e["id"] for e in grappled["expanded_references"]] == ["Prone|XPHB"]
+        assert service.get_stats()["result_cache"]["semantic_hits"] == 1
+
+    def test_rebuild_invalidates(self, service, build_rules_table):
+        service._get_embedding = lambda query: [1.0] + [0.0] * 767
+        service.search("prone", limit=1)
+        assert len(service.result_cache) == 1
+
+        build_rules_table.load(service)
+        assert len(service.result_cache) == 0
+
+    def test_search_batch_embeds_once(self, service):
+        calls = []
+
+        def embed_queries(texts):
+            calls.append(list(texts))
+            return [[1.0, 0.1 * i] + [0.0] * 766 for i in range(len(texts))]
+
+        service.embedding_provider.embed_queries = embed_queries
+        service.result_cache.similarity_threshold = 1.1  # Semantic hits off
+
+        batch = service.search_batch(["grappled", "prone", "speed zero"], limit=2)
+
+        assert calls == [["grappled", "prone", "speed zero"]]
+        assert [len(results) for results in batch] == [2, 2, 2]
+        assert batch[0] == service.search("grappled", limit=2)  # Same text: served from cache
+        assert calls == [["grappled", "prone", "speed zero"]]
+
@@ -0,0 +1,129 @@
+"""
+Tests for the outbound Discord send queue.
+
+Tests cover:
+- Coalescing adjacent text payloads up to the message length limit
+- View and standalone payloads are never merged together
+- Token bucket pacing
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.discord.utils.send_queue import (
+    ChannelSendQueue,
+    OutboundDispatcher,
+    SendRateLimiter,
+)
+
+
+def make_channel(channel_id: int = 1):
+    """Create a fake channel recording (content, view) for each send."""
+    channel = Mock()
+    channel.id = channel_id
+    channel.sent = []
+
+    async def send(content, view=None):
+        channel.sent.append((content, view))
+        return Mock(content=content)
+
+    channel.send = AsyncMock(side_effect=send)
+    return channel
+
+
+class TestChannelSendQueue:
+    """Tests for per-channel coalescing and ordering."""
+
+    @pytest.mark.asyncio
+    async def test_adjacent_text_is_coalesced(self):
+        channel = make_channel()
+        queue = ChannelSendQueue(channel)
+
+        queue.enqueue("state changes applied")
+        queue.enqueue("warning")
+        queue.enqueue("It's your turn")
+        await queue.flush()
+
+        assert channel.sent == [("state changes applied\nwarning\nIt's your turn", None)]
+        assert queue.payloads_enqueued == 3
+        assert queue.messages_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_respects_max_length(self):
+        channel = make_channel()
+        queue = ChannelSendQueue(channel, max_length=10)
+
+        queue.enqueue("12345")
+        queue.enqueue("67890")
+        await queue.flush()
+
+        assert [c for c, _ in channel.sent] == ["12345", "67890"]
+
+    @pytest.mark.asyncio
+    async def test_only_one_view_per_message(self):
+        channel = make_channel()
+        queue = ChannelSendQueue(channel)
+        view_a, view_b = Mock(), Mock()
+
+        queue.enqueue("notice")
+        queue.enqueue("Roll for initiative!", view=view_a)
+        queue.enqueue("Make a save", view=view_b)
+        await queue.flush()
+
+        assert channel.sent == [
+            ("notice\nRoll for initiative!", view_a),
+            ("Make a save", view_b),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_standalone_payload_not_merged(self):
+        channel = make_channel()
+        dispatcher = OutboundDispatcher()
+
+        dispatcher.enqueue(channel, "before")
+        message = await dispatcher.send(channel, "placeholder")
+        dispatcher.enqueue(channel, "after")
+        await dispatcher.flush(channel)
+
+        assert message.content == "placeholder"
+        assert [c for c, _ in channel.sent] == ["before", "placeholder", "after"]
+
+    @pytest.mark.asyncio
+    async def test_send_failure_does_not_stop_queue(self):
+        channel = make_channel()
+        calls = []
+
+        async def send(content, view=None):
+            calls.append(content)
+            if content == "bad":
+                raise RuntimeError("boom")
+            return Mock(content=content)
+
+        channel.send = AsyncMock(side_effect=send)
+        queue = ChannelSendQueue(channel)
+
+        failed = queue.enqueue("bad", coalesce=False)
+        queue.enqueue("good")
+        await queue.flush()
+
+        assert calls == ["bad", "good"]
+        with pytest.raises(RuntimeError):
+            failed.result()
+
+
+class TestSendRateLimiter:
+    """Tests for the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_waits(self):
+        limiter = SendRateLimiter(rate=2, per=0.2)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await limiter.acquire()
+        await limiter.acquire()
+        assert loop.time() - start < 0.05
+
+        await limiter.acquire()
+        assert loop.time() - start >= 0.09
@@ -0,0 +1,256 @@
+"""
+Tests for session snapshots and SessionPool hibernation.
+
+Tests cover:
+- TurnContext / TurnManager serialization round trips
+- Capturing and restoring session state (characters, monsters, registry, coordinator)
+- SessionPool idle/LRU hibernation and lazy rehydration
+"""
+
+import shutil
+import time
+import uuid
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.characters.character_overlay import CharacterOverlay
+from src.memory.turn_manager import TurnManager, ActionDeclaration
+from src.memory.state_manager import StateManager
+from src.memory.player_character_registry import PlayerCharacterRegistry
+from src.memory.message_coordinator import create_message_coordinator
+from src.memory.session_snapshot import (
+    capture_session_state,
+    restore_session_state,
+    SessionSnapshotError,
+)
+from src.models.turn_context import TurnContext
+from src.models.response_expectation import ResponseExpectation, ResponseType
+from src.prompts.demo_combat_steps import GamePhase
+from src.discord.utils.session_pool import (
+    SessionContext,
+    SessionHibernationStore,
+    SessionPool,
+    SessionTimeouts,
+)
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+def make_session(tmp_path: Path, name: str = "session"):
+    """Create a lightweight session with real state components."""
+    char_dir = tmp_path / name
+    char_dir.mkdir()
+    shutil.copy(CHARACTERS_DIR / "fighter.json", char_dir / "fighter.json")
+
+    session_manager = Mock()
+    session_manager.turn_manager = TurnManager()
+    session_manager.state_manager = StateManager(character_data_path=str(char_dir) + "/")
+    session_manager.player_character_registry = PlayerCharacterRegistry(
+        registry_file_path=str(char_dir / "registry" / "registry.json")
+    )
+    session_manager._demo_step_index = 0
+    return session_manager, str(char_dir)
+
+
+def populate_session(session_manager):
+    """Put a session into a non-trivial state."""
+    turn_manager = session_manager.turn_manager
+    turn_manager.start_and_queue_turns(
+        actions=[ActionDeclaration(speaker="fighter", content="I attack the goblin")],
+        phase=GamePhase.EXPLORATION
+    )
+    turn_manager.update_processing_turn_to_current()
+    turn_manager.add_messages([{"content": "The goblin dodges.", "speaker": "DM"}], is_new=False)
+    turn_manager.add_messages([
+        {"content": "I shove it", "speaker": "fighter"},
+        {"content": "I cast Shield", "speaker": "wizard"},
+    ])
+
+    state_manager = session_manager.state_manager
+    fighter = state_manager.get_character("fighter")
+    fighter.hit_points.current = 3
+    state_manager.create_monster_from_template(
+        str(CHARACTERS_DIR / "monsters" / "goblin.json"), "goblin_1", "Goblin 1"
+    )
+
+    session_manager.player_character_registry.register_player_character("123", "fighter")
+    session_manager._demo_step_index = 2
+
+
+class TestTurnSerialization:
+    """Tests for TurnContext and TurnManager state round trips."""
+
+    def test_turn_context_round_trip(self):
+        turn = TurnContext(turn_id="1", turn_level=0, current_step_objective="Receive action",
+                           active_character="fighter", game_step_list=["a", "b"], current_step_index=1)
+        turn.add_live_message("I attack", "fighter")
+        turn.add_completed_subturn("Shield raised AC", "1.1")
+        turn.metadata["rules_cache"] = {"shield": {"name": "Shield"}}
+
+        restored = TurnContext.from_dict(turn.to_dict())
+
+        assert restored.to_dict() == turn.to_dict()
+        assert restored.to_xml_context() == turn.to_xml_context()
+
+    def test_turn_manager_round_trip(self, tmp_path):
+        session_manager, _ = make_session(tmp_path)
+        populate_session(session_manager)
+        original = session_manager.turn_manager
+
+        restored = TurnManager()
+        restored.import_state(original.export_state())
+
+        assert restored.export_state() == original.export_state()
+        assert restored.get_processing_turn() is restored.get_current_turn_context()
+        assert restored.get_current_phase() == original.get_current_phase()
+
+
+class TestSessionSnapshot:
+    """Tests for capture_session_state / restore_session_state."""
+
+    def test_capture_and_restore(self, tmp_path):
+        source, _ = make_session(tmp_path, "source")
+        populate_session(source)
+        coordinator = create_message_coordinator()
+        coordinator.enter_combat_mode()
+        coordinator.set_expectation(ResponseExpectation(characters=["fighter"], response_type=ResponseType.ACTION))
+
+        snapshot = capture_session_state(source, coordinator)
+
+        target, target_dir = make_session(tmp_path, "target")
+        target_coordinator = create_message_coordinator()
+        restore_session_state(target, snapshot, target_coordinator)
+
+        assert target.state_manager.get_character("fighter").hit_points.current == 3
+        assert target.state_manager.get_monster("goblin_1").name == "Goblin 1"
+        assert target.player_character_registry.get_character_id_by_player_id("123") == "fighter"
+        assert target._demo_step_index == 2
+        assert target.turn_manager.export_state() == source.turn_manager.export_state()
+        assert target_coordinator.combat_mode
+        assert target_coordinator.current_expectation.characters == ["fighter"]
+
+        # Restored sheets are written back to the session's storage
+        reloaded = StateManager(character_data_path=target_dir + "/").get_character("fighter")
+        assert reloaded.hit_points.current == 3
+
+    def test_uploaded_characters_restored_into_overlay(self, tmp_path):
+        source, target = (
+            Mock(turn_manager=None, player_character_registry=None, _demo_step_index=0,
+                 state_manager=StateManager(enable_logging=False, overlay=CharacterOverlay()))
+            for _ in range(2)
+        )
+        upload = source.state_manager.load_character("wizard")
+        upload.hit_points.current = 4
+        source.state_manager.add_uploaded_character("custom", upload)
+
+        snapshot = capture_session_state(source)
+        restore_session_state(target, snapshot)
+
+        assert snapshot["uploaded_characters"] == ["custom"]
+        assert target.state_manager.uploaded_character_ids() == ["custom"]
+        assert target.state_manager.load_character("custom").hit_points.current == 4
+
+    def test_unsupported_version_rejected(self, tmp_path):
+        session_manager, _ = make_session(tmp_path)
+        with pytest.raises(SessionSnapshotError):
+            restore_session_state(session_manager, {"version": 999})
+
+
+class TestSessionPoolHibernation:
+    """Tests for SessionPool eviction and rehydration."""
+
+    def make_pool(self, tmp_path, **kwargs):
+        pool = SessionPool(hibernation_store=SessionHibernationStore(str(tmp_path / "hibernated")), **kwargs)
+        pool._set_db_status = AsyncMock()
+        return pool
+
+    def add_context(self, pool, tmp_path, channel_id, last_activity=None):
+        session_manager, _ = make_session(tmp_path, f"channel_{channel_id}")
+        populate_session(session_manager)
+        context = SessionContext(
+            session_manager=session_manager,
+            guild_id=1,
+            channel_id=channel_id,
+            session_db_id=uuid.uuid4(),
+            message_coordinator=create_message_coordinator(),
+        )
+        if last_activity is not None:
+            context.last_activity = last_activity
+        pool._sessions[channel_id] = context
+        return context
+
+    @pytest.mark.asyncio
+    async def test_idle_session_hibernated_and_restored(self, tmp_path):
+        pool = self.make_pool(tmp_path, idle_timeout=60)
+        original = self.add_context(pool, tmp_path, 10, last_activity=time.monotonic() - 120)
+        expected_state = original.session_manager.turn_manager.export_state()
+
+        assert await pool.hibernate_idle() == 1
+        assert pool.get(10) is None
+        assert pool.is_hibernated(10)
+        assert pool.has_session(10)
+
+        fresh, _ = make_session(tmp_path, "fresh")
+        pool._build_session_components = Mock(
+            return_value=(fresh, None, create_message_coordinator())
+        )
+        with patch("src.services.byok_service.get_api_key_for_guild", AsyncMock(return_value="key")):
+            restored = await pool.get_or_restore(10)
+
+        assert restored.session_db_id == original.session_db_id
+        assert restored.session_manager.turn_manager.export_state() == expected_state
+        assert restored.session_manager.state_manager.get_monster("goblin_1") is not None
+        assert not pool.is_hibernated(10)
+        assert pool.hibernation_store.load(10) is None
+
+    @pytest.mark.asyncio
+    async def test_configured_timeouts_survive_hibernation(self, tmp_path):
+        pool = self.make_pool(tmp_path, idle_timeout=60)
+        original = self.add_context(pool, tmp_path, 10, last_activity=time.monotonic() - 120)
+        original.timeouts = SessionTimeouts(initiative=45.0, saving_throw=20.0, reaction=10.0, action=90.0)
+
+        assert await pool.hibernate_idle() == 1
+
+        fresh, _ = make_session(tmp_path, "fresh")
+        pool._build_session_components = Mock(
+            return_value=(fresh, None, create_message_coordinator())
+        )
+        with patch("src.services.byok_service.get_api_key_for_guild", AsyncMock(return_value="key")):
+            restored = await pool.get_or_restore(10)
+
+        assert restored.timeouts == SessionTimeouts(initiative=45.0, saving_throw=20.0, reaction=10.0, action=90.0)
+
+    @pytest.mark.asyncio
+    async def test_lru_beyond_capacity(self, tmp_path):
+        pool = self.make_pool(tmp_path, idle_timeout=3600, max_resident_sessions=1)
+        now = time.monotonic()
+        self.add_context(pool, tmp_path, 1, last_activity=now - 30)
+        self.add_context(pool, tmp_path, 2, last_activity=now)
+
+        assert await pool.hibernate_idle() == 1
+        assert pool.is_hibernated(1)
+        assert pool.get(2) is not None
+
+    @pytest.mark.asyncio
+    async def test_busy_and_pending_view_sessions_not_hibernated(self, tmp_path):
+        pool = self.make_pool(tmp_path, idle_timeout=0)
+        busy = self.add_context(pool, tmp_path, 1)
+        waiting = self.add_context(pool, tmp_path, 2)
+        waiting.message_coordinator.set_expectation(
+            ResponseExpectation(characters=["fighter"], response_type=ResponseType.INITIATIVE)
+        )
+
+        with busy.in_use():
+            assert await pool.hibernate_idle() == 0
+
+        assert pool.get(1) is busy and pool.get(2) is waiting
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_from_store(self, tmp_path):
+        pool = self.make_pool(tmp_path, idle_timeout=0)
+        self.add_context(pool, tmp_path, 5)
+        await pool.hibernate_idle()
+
+        reopened = SessionPool(hibernation_store=SessionHibernationStore(str(tmp_path / "hibernated")))
+        assert reopened.is_hibernated(5)
@@ -0,0 +1,319 @@
+"""
+Tests for incremental turn checkpointing.
+
+Tests cover:
+- Splitting a session snapshot into header + turn rows and joining it back
+- Delta computation (unchanged, appended messages, rewritten turns, deletions)
+- Reusing serialized completed turns and unchanged sheets between captures
+- Background batch writing and failure recovery
+- Startup recovery of checkpointed sessions into the SessionPool
+"""
+
+import shutil
+import threading
+import uuid
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.memory.turn_manager import TurnManager, ActionDeclaration
+from src.memory.state_manager import StateManager
+from src.memory.player_character_registry import PlayerCharacterRegistry
+from src.memory.session_snapshot import SnapshotCache, capture_session_state
+from src.persistence.turn_checkpointer import (
+    TurnCheckpointer,
+    CheckpointedSession,
+    split_snapshot,
+    join_snapshot,
+)
+from src.discord.utils.session_pool import SessionHibernationStore, SessionPool
+from src.prompts.demo_combat_steps import GamePhase
+
+CHARACTERS_DIR = Path(__file__).parent.parent / "src" / "characters"
+
+
+def make_session(tmp_path: Path):
+    """Create a lightweight session with one live turn."""
+    shutil.copy(CHARACTERS_DIR / "fighter.json", tmp_path / "fighter.json")
+
+    session_manager = Mock()
+    session_manager.turn_manager = TurnManager()
+    session_manager.state_manager = StateManager(character_data_path=str(tmp_path) + "/")
+    session_manager.player_character_registry = PlayerCharacterRegistry(
+        registry_file_path=str(tmp_path / "registry.json")
+    )
+    session_manager._demo_step_index = 0
+
+    turn_manager = session_manager.turn_manager
+    turn_manager.start_and_queue_turns(
+        actions=[ActionDeclaration(speaker="fighter", content="I open the door")],
+        phase=GamePhase.EXPLORATION
+    )
+    turn_manager.update_processing_turn_to_current()
+    return session_manager
+
+
+def rows_from_delta(store: dict, delta) -> None:
+    """Apply a delta to a dict standing in for the turn_contexts table."""
+    if delta.full_resync:
+        store.clear()
+    for turn_id in delta.deletes:
+        store.pop(turn_id, None)
+    for row in delta.upserts:
+        store[row["turn_id"]] = row
+    for turn_id, messages in delta.appends.items():
+        store[turn_id]["messages"] = store[turn_id]["messages"] + messages
+
+
+class TestSnapshotSplitting:
+    """Tests for split_snapshot / join_snapshot."""
+
+    def test_round_trip(self, tmp_path):
+        session_manager = make_session(tmp_path)
+        session_manager.turn_manager.start_and_queue_turns(
+            actions=[ActionDeclaration(speaker="wizard", content="I cast Shield")]
+        )
+        snapshot = capture_session_state(session_manager)
+
+        header, rows = split_snapshot(snapshot)
+
+        assert set(rows) == {"1", "1.1"}
+        assert header["turn_manager"]["turn_stack_ids"] == [["1"], ["1.1"]]
+        assert "turn_stack" not in header["turn_manager"]
+        assert join_snapshot(header, rows.values()) == snapshot
+
+    def test_missing_turn_raises(self, tmp_path):
+        header, _ = split_snapshot(capture_session_state(make_session(tmp_path)))
+        with pytest.raises(KeyError):
+            join_snapshot(header, [])
+
+
+class TestDeltaComputation:
+    """Tests for TurnCheckpointer.compute_delta."""
+
+    def test_first_checkpoint_is_full(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        delta = checkpointer.compute_delta(uuid.uuid4(), capture_session_state(session_manager))
+
+        assert delta.full_resync
+        assert delta.header is not None
+        assert [row["turn_id"] for row in delta.upserts] == ["1"]
+
+    def test_unchanged_session_writes_nothing(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+        checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        assert checkpointer.compute_delta(session_id, capture_session_state(session_manager)).is_empty
+
+    def test_new_messages_are_appended(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+        checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        session_manager.turn_manager.add_messages([{"content": "It creaks open.", "speaker": "DM"}], is_new=False)
+        delta = checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        assert delta.upserts == []
+        assert delta.header is None
+        assert [m["content"] for m in delta.appends["1"]] == ["It creaks open."]
+
+    def test_changed_messages_rewrite_turn(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+        checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        # Flips is_new_message on an already-written message
+        session_manager.turn_manager.mark_new_messages_as_responded()
+        delta = checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        assert [row["turn_id"] for row in delta.upserts] == ["1"]
+        assert delta.appends == {}
+
+    def test_header_and_deleted_turns(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+        session_manager.turn_manager.start_and_queue_turns(
+            actions=[ActionDeclaration(speaker="wizard", content="I cast Shield")]
+        )
+        checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        session_manager.turn_manager.turn_stack.pop()  # Subturn resolved
+        session_manager.state_manager.get_character("fighter").hit_points.current = 1
+        delta = checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+
+        assert delta.deletes == ["1.1"]
+        assert delta.header["characters"]["fighter"]["combat_stats"]["hit_points"]["current"] == 1
+
+    def test_applied_deltas_rebuild_latest_snapshot(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+        table, header = {}, None
+
+        for i in range(3):
+            session_manager.turn_manager.add_messages([{"content": f"msg {i}", "speaker": "fighter"}])
+            delta = checkpointer.compute_delta(session_id, capture_session_state(session_manager))
+            rows_from_delta(table, delta)
+            header = delta.header or header
+
+        assert join_snapshot(header, table.values()) == capture_session_state(session_manager)
+
+
+class TestSnapshotCache:
+    """Tests for capturing with a SnapshotCache."""
+
+    def test_unchanged_state_is_reused(self, tmp_path):
+        session_manager = make_session(tmp_path)
+        session_manager.turn_manager.end_turn_sync()
+        session_manager.state_manager.get_character("fighter")
+        cache = SnapshotCache()
+
+        first = capture_session_state(session_manager, cache=cache)
+        second = capture_session_state(session_manager, cache=cache)
+
+        assert second["turn_manager"]["completed_turns"][0] is first["turn_manager"]["completed_turns"][0]
+        assert second["characters"]["fighter"] is first["characters"]["fighter"]
+        assert second == capture_session_state(session_manager)
+
+    def test_changed_sheet_is_dumped_again(self, tmp_path):
+        session_manager = make_session(tmp_path)
+        cache = SnapshotCache()
+        capture_session_state(session_manager, cache=cache)
+
+        fighter = session_manager.state_manager.get_character("fighter")
+        fighter.hit_points.current = 1
+        fighter.bump_version()
+        snapshot = capture_session_state(session_manager, cache=cache)
+
+        assert snapshot["characters"]["fighter"]["combat_stats"]["hit_points"]["current"] == 1
+
+    def test_cached_turns_skip_delta_encoding(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        session_manager = make_session(tmp_path)
+        session_manager.turn_manager.end_turn_sync()
+        session_id = uuid.uuid4()
+        cache = SnapshotCache()
+        checkpointer.compute_delta(session_id, capture_session_state(session_manager, cache=cache))
+        tracked = checkpointer._tracked[session_id].turns["1"]
+
+        delta = checkpointer.compute_delta(session_id, capture_session_state(session_manager, cache=cache))
+
+        assert delta.is_empty
+        assert checkpointer._tracked[session_id].turns["1"] is tracked
+
+
+class TestBackgroundWrites:
+    """Tests for queued checkpoint writes."""
+
+    @pytest.mark.asyncio
+    async def test_pending_deltas_written_in_one_batch(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        checkpointer._write_batch = AsyncMock()
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        first = make_session(tmp_path / "a")
+        second = make_session(tmp_path / "b")
+
+        checkpointer.checkpoint(uuid.uuid4(), first)
+        checkpointer.checkpoint(uuid.uuid4(), second)
+        await checkpointer.flush()
+
+        checkpointer._write_batch.assert_awaited_once()
+        assert len(checkpointer._write_batch.await_args.args[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_write_forces_full_resync(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        checkpointer._write_batch = AsyncMock(side_effect=RuntimeError("db down"))
+        session_manager = make_session(tmp_path)
+        session_id = uuid.uuid4()
+
+        checkpointer.checkpoint(session_id, session_manager)
+        await checkpointer.flush()
+
+        checkpointer._write_batch = AsyncMock()
+        checkpointer.checkpoint(session_id, session_manager)
+        await checkpointer.flush()
+        assert checkpointer._write_batch.await_args.args[0][0].full_resync
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_keeps_configured_timeouts(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        checkpointer._write_batch = AsyncMock()
+
+        checkpointer.checkpoint(
+            uuid.uuid4(), make_session(tmp_path), timeouts={"initiative": 45.0, "action": 90.0}
+        )
+        await checkpointer.flush()
+
+        delta = checkpointer._write_batch.await_args.args[0][0]
+        assert delta.header["timeouts"] == {"initiative": 45.0, "action": 90.0}
+
+    @pytest.mark.asyncio
+    async def test_deltas_computed_off_the_event_loop(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        checkpointer._write_batch = AsyncMock()
+        compute_threads = []
+        compute_delta = checkpointer.compute_delta
+
+        def tracking_compute_delta(session_db_id, snapshot):
+            compute_threads.append(threading.get_ident())
+            return compute_delta(session_db_id, snapshot)
+
+        checkpointer.compute_delta = tracking_compute_delta
+        checkpointer.checkpoint(uuid.uuid4(), make_session(tmp_path))
+        await checkpointer.flush()
+
+        assert compute_threads and threading.get_ident() not in compute_threads
+        checkpointer._write_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_session_forgotten_while_queued_is_not_written(self, tmp_path):
+        checkpointer = TurnCheckpointer()
+        checkpointer._write_batch = AsyncMock()
+        session_id = uuid.uuid4()
+
+        checkpointer.checkpoint(session_id, make_session(tmp_path))
+        checkpointer.forget(session_id)
+        await checkpointer.flush()
+
+        checkpointer._write_batch.assert_not_awaited()
+        assert session_id not in checkpointer._tracked
+
+    def test_disabled_checkpointer_does_nothing(self, tmp_path):
+        checkpointer = TurnCheckpointer(enabled=False)
+        assert checkpointer.checkpoint(uuid.uuid4(), make_session(tmp_path)) is False
+
+
+class TestStartupRecovery:
+    """Tests for SessionPool.recover_from_checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_checkpointed_sessions_registered_as_hibernated(self, tmp_path):
+        session_dir = tmp_path / "session"
+        session_dir.mkdir()
+        snapshot = capture_session_state(make_session(session_dir))
+        pool = SessionPool(hibernation_store=SessionHibernationStore(str(tmp_path / "hibernated")))
+
+        recovered_id, orphan_id = uuid.uuid4(), uuid.uuid4()
+        checkpoints = [
+            CheckpointedSession(session_db_id=recovered_id, guild_id=1, channel_id=10, snapshot=snapshot),
+            CheckpointedSession(session_db_id=orphan_id, guild_id=1, channel_id=11, snapshot=None),
+        ]
+        with patch("src.persistence.turn_checkpointer.load_checkpointed_sessions",
+                   AsyncMock(return_value=checkpoints)), \
+             patch("src.persistence.database.get_session", side_effect=RuntimeError("no db")):
+            recovered = await pool.recover_from_checkpoints()
+
+        assert recovered == 1
+        assert pool.is_hibernated(10)
+        assert not pool.has_session(11)
+        record = pool.hibernation_store.load(10)
+        assert record["session_db_id"] == str(recovered_id)
+        assert record["state"] == snapshot